@@ -21,6 +21,9 @@ BACKUP_KIND = "user_full_backup"
 IMPORT_MODE_RESTORE = "restore"
 IMPORT_MODE_REPLACE = "replace_existing"
 IMPORT_MODE_CREATE_NEW = "create_new"
+# Recomputed from the restored expenses, so not part of the backup
+RESTAURANT_DERIVED_COLUMNS = {"visit_count", "total_spent", "last_visit", "avg_price_per_person"}
+USER_DERIVED_COLUMNS = {"expense_data_version", "receipt_data_version"}
 
 
 def _serialize_scalar(value: Any) -> Any:
@@ -131,13 +134,13 @@ def export_user_backup(
             "expense_tags": len(expense_tags),
             "receipts": len(receipts),
         },
-        "user": _serialize_model(user),
+        "user": _serialize_model(user, exclude=USER_DERIVED_COLUMNS),
         "merchants": [_serialize_model(merchant) for merchant in merchants],
         "categories": [_serialize_model(category) for category in categories],
         "tags": [_serialize_model(tag) for tag in tags],
-        "restaurants": [_serialize_model(restaurant) for restaurant in restaurants],
+        "restaurants": [_serialize_model(restaurant, exclude=RESTAURANT_DERIVED_COLUMNS) for restaurant in restaurants],
         "visits": [_serialize_model(visit) for visit in visits],
-        "expenses": [_serialize_model(expense) for expense in expenses],
+        "expenses": [_serialize_model(expense, exclude={"search_document"}) for expense in expenses],
         "expense_tags": [_serialize_model(expense_tag) for expense_tag in expense_tags],
         "receipts": [_serialize_model(receipt) for receipt in receipts],
     }
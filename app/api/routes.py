@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Optional, Tuple, cast
 
-from flask import Response, current_app, jsonify, request
+from flask import Response, current_app, jsonify, request, url_for
 from flask_login import current_user, login_required
 from marshmallow import ValidationError
 
@@ -22,6 +22,10 @@ from app.utils.url_utils import normalize_website_for_comparison
 from . import bp, validate_api_csrf
 from .schemas import CategorySchema, ExpenseSchema, RestaurantSchema, UserSchema
 
+# Page size bounds for cursor-paginated list endpoints
+DEFAULT_API_PAGE_SIZE = 50
+MAX_API_PAGE_SIZE = 200
+
 # Schema instances
 expense_schema = ExpenseSchema()
 expenses_schema = ExpenseSchema(many=True)
@@ -38,12 +42,18 @@ def _get_current_user() -> User:
 
 
 def _create_api_response(
-    data: Any = None, message: str = "Success", status: str = "success", code: int = 200
+    data: Any = None,
+    message: str = "Success",
+    status: str = "success",
+    code: int = 200,
+    meta: dict[str, Any] | None = None,
 ) -> tuple[Response, int]:
     """Create a standardized API response."""
-    response_data = {"status": status, "message": message}
+    response_data: dict[str, Any] = {"status": status, "message": message}
     if data is not None:
         response_data["data"] = data
+    if meta is not None:
+        response_data["meta"] = meta
     return jsonify(response_data), code
 
 
@@ -148,11 +158,29 @@ def get_cuisines() -> tuple[Response, int]:
 @bp.route("/expenses", methods=["GET"])
 @login_required
 def get_expenses() -> tuple[Response, int]:
-    """Get all expenses for the current user."""
+    """Get expenses for the current user.
+
+    Returns every expense by default. When ``cursor`` or ``limit`` is given, returns one
+    date-sorted page (honouring the list filters) plus ``meta.next_cursor`` for the next page.
+    """
     try:
         user = _get_current_user()
-        expenses = expense_services.get_expenses_for_user(user.id)
-        return _create_api_response(data=expenses_schema.dump(expenses), message="Expenses retrieved successfully")
+        if "cursor" not in request.args and "limit" not in request.args:
+            expenses = expense_services.get_expenses_for_user(user.id)
+            return _create_api_response(data=expenses_schema.dump(expenses), message="Expenses retrieved successfully")
+
+        limit = min(max(1, request.args.get("limit", DEFAULT_API_PAGE_SIZE, type=int)), MAX_API_PAGE_SIZE)
+        filters = expense_services.get_expense_filters(request)
+        expenses, next_cursor = expense_services.get_user_expenses_after_cursor(
+            user.id, filters, cursor=request.args.get("cursor", "").strip() or None, limit=limit
+        )
+        return _create_api_response(
+            data=expenses_schema.dump(expenses),
+            message="Expenses retrieved successfully",
+            meta={"next_cursor": next_cursor, "has_more": next_cursor is not None, "limit": limit},
+        )
+    except expense_services.InvalidCursorError:
+        return _create_api_response(message="Invalid cursor", status="error", code=400)
     except Exception as e:
         return _handle_service_error(e, "retrieve expenses")
 
@@ -1010,6 +1038,106 @@ def _apply_restaurant_field_fixes_api(restaurant: Restaurant, fixes_to_apply: di
             setattr(restaurant, restaurant_field, value)
 
 
+def _build_receipt_ocr_data(
+    receipt_data: Any, user_id: int, form_hints: dict[str, Any] | None, form_restaurant_id: int | None
+) -> dict[str, Any]:
+    """Build the JSON payload of an OCR result, with restaurant comparison and reconciliation data.
+
+    Args:
+        receipt_data: ReceiptData extracted from the receipt
+        user_id: Owner of the receipt
+        form_hints: Form values sent with the receipt, if any
+        form_restaurant_id: Restaurant selected in the form, if any
+
+    Returns:
+        JSON-serializable receipt data
+    """
+    # If restaurant ID provided, get restaurant address for comparison
+    restaurant_address_data = None
+    if form_restaurant_id:
+        try:
+            from app.restaurants.models import Restaurant
+
+            restaurant = Restaurant.query.filter_by(id=form_restaurant_id, user_id=user_id).first()
+            if restaurant:
+                restaurant_address_data = {
+                    "full_address": restaurant.full_address,
+                    "address_line_1": restaurant.address_line_1,
+                    "address_line_2": restaurant.address_line_2,
+                    "city": restaurant.city,
+                    "state": restaurant.state,
+                    "postal_code": restaurant.postal_code,
+                    "phone": restaurant.phone,
+                    "website": restaurant.website,
+                }
+        except Exception as e:
+            current_app.logger.warning(f"Failed to get restaurant address: {e}")
+
+    # Convert to JSON-serializable format
+    receipt_dict = {
+        "amount": str(receipt_data.amount) if receipt_data.amount else None,
+        "date": receipt_data.date.isoformat() if receipt_data.date else None,
+        "time": receipt_data.time,
+        "restaurant_name": receipt_data.restaurant_name,
+        "restaurant_address": receipt_data.restaurant_address,
+        "restaurant_phone": receipt_data.restaurant_phone,
+        "restaurant_website": receipt_data.restaurant_website,
+        "items": receipt_data.items,
+        "tax": str(receipt_data.tax) if receipt_data.tax else None,
+        "tip": str(receipt_data.tip) if receipt_data.tip else None,
+        "total": str(receipt_data.total) if receipt_data.total else None,
+        "confidence_scores": receipt_data.confidence_scores,
+        "field_sources": receipt_data.field_sources,
+        "raw_text": receipt_data.raw_text[:500],  # Limit raw text length
+        "restaurant_address_data": restaurant_address_data,  # For UI comparison
+    }
+
+    # Perform reconciliation if form data is available
+    reconciliation_data = None
+    if form_restaurant_id and form_hints:
+        try:
+            from datetime import datetime
+            from decimal import Decimal
+
+            from app.expenses.models import Expense
+            from app.expenses.services import reconcile_receipt_with_expense
+
+            # Get restaurant (already fetched above)
+            restaurant = Restaurant.query.filter_by(id=form_restaurant_id, user_id=user_id).first()
+            if restaurant:
+                # Parse form hints
+                form_amount = Decimal(form_hints.get("amount", "0"))
+                form_date_str = form_hints.get("date")
+                if form_date_str:
+                    try:
+                        # Parse date string (could be ISO format or YYYY-MM-DD)
+                        if "T" in form_date_str:
+                            form_date = datetime.fromisoformat(form_date_str.replace("Z", "+00:00"))
+                        else:
+                            form_date = datetime.strptime(form_date_str, "%Y-%m-%d")
+                    except (ValueError, TypeError):
+                        form_date = datetime.now()
+                else:
+                    form_date = datetime.now()
+
+                # Create minimal expense object for reconciliation
+                temp_expense = Expense()
+                temp_expense.user_id = user_id
+                temp_expense.restaurant_id = restaurant.id
+                temp_expense.restaurant = restaurant
+                temp_expense.amount = form_amount
+                temp_expense.date = form_date
+                reconciliation_data = reconcile_receipt_with_expense(temp_expense, receipt_dict)
+        except Exception as e:
+            current_app.logger.warning(f"Failed to perform reconciliation: {e}", exc_info=True)
+
+    data = receipt_dict
+    if reconciliation_data:
+        data["reconciliation"] = reconciliation_data
+
+    return data
+
+
 # Receipt OCR endpoint
 @bp.route("/receipts/ocr", methods=["POST"])
 @login_required
@@ -1017,6 +1145,11 @@ def _apply_restaurant_field_fixes_api(restaurant: Restaurant, fixes_to_apply: di
 def process_receipt_ocr() -> tuple[Response, int]:
     """Process receipt image/PDF with OCR to extract expense data.
 
+    With ``async=true`` (form field or query parameter) the receipt is queued instead, and the
+    response (202) holds the job id and the URL to poll, see ``get_receipt_ocr_job``. Where no
+    job queue can run in the background (e.g. on Lambda without one plugged in) the receipt is
+    processed synchronously as if ``async`` had not been given.
+
     Returns:
         JSON response with extracted receipt data
     """
@@ -1092,6 +1225,27 @@ def process_receipt_ocr() -> tuple[Response, int]:
                     code=503,
                 )
 
+            if _wants_async_ocr() and _async_ocr_available():
+                from app.services.ocr_jobs import STATUS_QUEUED, submit_ocr_job
+
+                receipt_file.seek(0)
+                job_id = submit_ocr_job(
+                    current_user.id,
+                    receipt_file.filename,
+                    receipt_file.read(),
+                    form_hints=form_hints,
+                    restaurant_id=form_restaurant_id,
+                )
+                return _create_api_response(
+                    data={
+                        "job_id": job_id,
+                        "status": STATUS_QUEUED,
+                        "status_url": url_for("api.get_receipt_ocr_job", job_id=job_id),
+                    },
+                    message="Receipt queued for processing",
+                    code=202,
+                )
+
             receipt_data = ocr_service.extract_receipt_data(receipt_file, form_hints=form_hints)
         except RuntimeError as e:
             # Handle Textract not available error
@@ -1101,88 +1255,7 @@ def process_receipt_ocr() -> tuple[Response, int]:
             current_app.logger.error(f"Unexpected OCR error: {e}", exc_info=True)
             return _create_api_response(message=f"Failed to process receipt: {str(e)}", status="error", code=500)
 
-        # If restaurant ID provided, get restaurant address for comparison
-        restaurant_address_data = None
-        if form_restaurant_id:
-            try:
-                from app.restaurants.models import Restaurant
-
-                restaurant = Restaurant.query.filter_by(id=form_restaurant_id, user_id=current_user.id).first()
-                if restaurant:
-                    restaurant_address_data = {
-                        "full_address": restaurant.full_address,
-                        "address_line_1": restaurant.address_line_1,
-                        "address_line_2": restaurant.address_line_2,
-                        "city": restaurant.city,
-                        "state": restaurant.state,
-                        "postal_code": restaurant.postal_code,
-                        "phone": restaurant.phone,
-                        "website": restaurant.website,
-                    }
-            except Exception as e:
-                current_app.logger.warning(f"Failed to get restaurant address: {e}")
-
-        # Convert to JSON-serializable format
-        receipt_dict = {
-            "amount": str(receipt_data.amount) if receipt_data.amount else None,
-            "date": receipt_data.date.isoformat() if receipt_data.date else None,
-            "time": receipt_data.time,
-            "restaurant_name": receipt_data.restaurant_name,
-            "restaurant_address": receipt_data.restaurant_address,
-            "restaurant_phone": receipt_data.restaurant_phone,
-            "restaurant_website": receipt_data.restaurant_website,
-            "items": receipt_data.items,
-            "tax": str(receipt_data.tax) if receipt_data.tax else None,
-            "tip": str(receipt_data.tip) if receipt_data.tip else None,
-            "total": str(receipt_data.total) if receipt_data.total else None,
-            "confidence_scores": receipt_data.confidence_scores,
-            "raw_text": receipt_data.raw_text[:500],  # Limit raw text length
-            "restaurant_address_data": restaurant_address_data,  # For UI comparison
-        }
-
-        # Perform reconciliation if form data is available
-        reconciliation_data = None
-        if form_restaurant_id and form_hints:
-            try:
-                from datetime import datetime
-                from decimal import Decimal
-
-                from app.expenses.models import Expense
-                from app.expenses.services import reconcile_receipt_with_expense
-
-                # Get restaurant (already fetched above)
-                restaurant = Restaurant.query.filter_by(id=form_restaurant_id, user_id=current_user.id).first()
-                if restaurant:
-                    # Parse form hints
-                    form_amount = Decimal(form_hints.get("amount", "0"))
-                    form_date_str = form_hints.get("date")
-                    if form_date_str:
-                        try:
-                            # Parse date string (could be ISO format or YYYY-MM-DD)
-                            if "T" in form_date_str:
-                                form_date = datetime.fromisoformat(form_date_str.replace("Z", "+00:00"))
-                            else:
-                                form_date = datetime.strptime(form_date_str, "%Y-%m-%d")
-                        except (ValueError, TypeError):
-                            form_date = datetime.now()
-                    else:
-                        form_date = datetime.now()
-
-                    # Create minimal expense object for reconciliation
-                    temp_expense = Expense()
-                    temp_expense.user_id = current_user.id
-                    temp_expense.restaurant_id = restaurant.id
-                    temp_expense.restaurant = restaurant
-                    temp_expense.amount = form_amount
-                    temp_expense.date = form_date
-                    reconciliation_data = reconcile_receipt_with_expense(temp_expense, receipt_dict)
-            except Exception as e:
-                current_app.logger.warning(f"Failed to perform reconciliation: {e}", exc_info=True)
-
-        data = receipt_dict
-        if reconciliation_data:
-            data["reconciliation"] = reconciliation_data
-
+        data = _build_receipt_ocr_data(receipt_data, current_user.id, form_hints, form_restaurant_id)
         return _create_api_response(data=data, message="Receipt processed successfully")
 
     except ValueError as e:
@@ -1194,6 +1267,55 @@ def process_receipt_ocr() -> tuple[Response, int]:
         return _handle_service_error(e, "process receipt OCR")
 
 
+def _wants_async_ocr() -> bool:
+    """Whether the client asked for the OCR to run as a background job."""
+    return request.values.get("async", "").lower() in ("1", "true", "yes")
+
+
+def _async_ocr_available() -> bool:
+    """Whether OCR jobs can run in the background in this deployment."""
+    from app.services.ocr_jobs import async_ocr_available
+
+    if async_ocr_available():
+        return True
+    current_app.logger.info("Async OCR requested but no job queue is available; processing synchronously")
+    return False
+
+
+@bp.route("/receipts/ocr/jobs/<job_id>", methods=["GET"])
+@login_required
+def get_receipt_ocr_job(job_id: str) -> tuple[Response, int]:
+    """Get the progress of an asynchronous receipt OCR job and, once done, its result.
+
+    Returns:
+        JSON response with the job status, stage, progress (0-100) and error, plus the extracted
+        receipt data under ``result`` once the job succeeded
+    """
+    try:
+        from app.services.ocr_jobs import STATUS_SUCCEEDED, get_ocr_job
+        from app.services.ocr_service import ReceiptData
+
+        job = get_ocr_job(job_id)
+        if job is None or job["user_id"] != current_user.id:
+            return _create_api_response(message="OCR job not found", status="error", code=404)
+
+        data: dict[str, Any] = {
+            "job_id": job_id,
+            "status": job["status"],
+            "stage": job["stage"],
+            "progress": job["progress"],
+            "error": job["error"],
+        }
+        if job["status"] == STATUS_SUCCEEDED:
+            receipt_data = ReceiptData.from_cache_dict(job["receipt"])
+            data["result"] = _build_receipt_ocr_data(
+                receipt_data, current_user.id, job["form_hints"], job["restaurant_id"]
+            )
+        return _create_api_response(data=data)
+    except Exception as e:
+        return _handle_service_error(e, "get receipt OCR job")
+
+
 # Generic CRUD operations for categories
 @bp.route("/categories", methods=["GET"])
 @login_required
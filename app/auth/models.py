@@ -114,6 +114,20 @@ class User(BaseModel, UserMixin):
         default="UTC",
         comment="User's timezone preference",
     )
+    expense_data_version: Mapped[int] = mapped_column(
+        db.Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Incremented on every expense or category write; validates cached per-user expense data",
+    )
+    receipt_data_version: Mapped[int] = mapped_column(
+        db.Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Incremented on every receipt or expense receipt link write; validates cached receipt data",
+    )
 
     # Relationships
     expenses: Mapped[list[Expense]] = relationship(
@@ -5,4 +5,4 @@ from flask import Blueprint
 bp = Blueprint("expenses", __name__)
 
 # Import routes after blueprint creation to avoid circular imports
-from . import routes, services  # noqa: E402
+from . import cache, rollup, routes, search, services  # noqa: E402
@@ -0,0 +1,276 @@
+"""Per-user caches of derived expense data, validated by version counters.
+
+The expense list filter dropdowns (categories with counts, years, months, meal types) only
+change when the user writes an expense or category or changes their timezone; the receipt
+reconciliation only changes when receipts, expense receipt links, or the expense and restaurant
+details shown next to a receipt do. Such writes bump
+``User.expense_data_version`` / ``User.receipt_data_version`` in the same transaction, so a
+cached entry is fresh exactly when its version still matches. Checking costs one
+primary-key read instead of recomputing, and processes that share nothing (e.g. Lambda
+containers) each validate their own cache without coordination.
+
+Writes that bypass the ORM do not bump the versions, and neither do merchant renames or
+receipt files disappearing from local storage; cached values then refresh on the user's next
+tracked write.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+import threading
+from typing import Any, cast
+
+from flask import current_app
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+
+from app.auth.models import User
+from app.expenses import services as expense_services
+from app.expenses.models import Category, Expense
+from app.extensions import db
+from app.receipts.models import Receipt
+from app.restaurants.models import Restaurant
+
+# Users whose values are kept per application and cache (least recently used are evicted)
+USER_CACHE_SIZE = 1024
+
+# Attributes the filter options are built from
+_EXPENSE_OPTION_FIELDS = ("category_id", "category", "meal_type", "date", "user_id")
+_CATEGORY_OPTION_FIELDS = ("name", "color", "icon", "user_id")
+# Year/month options are bucketed in the user's timezone (via the daily rollups)
+_USER_OPTION_FIELDS = ("timezone",)
+# Attributes the receipt reconciliation is built from
+_EXPENSE_RECEIPT_FIELDS = ("receipt_image", "user_id")
+_RECEIPT_FIELDS = ("file_uri", "expense_id", "expense", "user_id", "ocr_total", "ocr_tax", "ocr_tip", "ocr_confidence")
+# Attributes shown next to a receipt in the reconciliation rows
+_EXPENSE_RECEIPT_DISPLAY_FIELDS = ("amount", "date", "restaurant_id", "restaurant")
+_RESTAURANT_RECEIPT_DISPLAY_FIELDS = ("name", "location_name", "merchant_id")
+# session.info key holding the users whose versions the flush bumps
+_PENDING_USERS_KEY = "user_data_versions_pending"
+# app.extensions keys of the per-application caches
+_FILTER_OPTIONS_KEY = "expense_filter_options_cache"
+_RECEIPT_SUMMARY_KEY = "receipt_reconciliation_summary_cache"
+_RECEIPT_RECONCILIATION_KEY = "receipt_reconciliation_cache"
+
+_cache_lock = threading.Lock()
+
+
+def _get_cache(extension_key: str) -> OrderedDict[int, tuple[int, Any]]:
+    """Get one of this application's ``{user_id: (version, value)}`` caches."""
+    return cast(OrderedDict[int, tuple[int, Any]], current_app.extensions.setdefault(extension_key, OrderedDict()))
+
+
+def _read_cached(extension_key: str, user_id: int, version: int) -> Any | None:
+    """Get a copy of the cached value if it was stored at ``version``."""
+    cache = _get_cache(extension_key)
+    with _cache_lock:
+        entry = cache.get(user_id)
+        if entry is None or entry[0] != version:
+            return None
+        cache.move_to_end(user_id)
+        return copy.deepcopy(entry[1])
+
+
+def _store_cached(extension_key: str, user_id: int, version: int, value: Any) -> None:
+    """Cache a copy of ``value`` for the user at ``version``."""
+    cache = _get_cache(extension_key)
+    with _cache_lock:
+        cache[user_id] = (version, copy.deepcopy(value))
+        cache.move_to_end(user_id)
+        while len(cache) > USER_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _get_version(column: Any, user_id: int) -> int:
+    """Read one version column of a user (0 for unknown users)."""
+    version = db.session.execute(select(column).where(User.id == user_id)).scalar_one_or_none()
+    return int(version or 0)
+
+
+def get_expense_data_version(user_id: int) -> int:
+    """Get the current expense data version of a user from the database."""
+    return _get_version(User.expense_data_version, user_id)
+
+
+def get_receipt_data_version(user_id: int) -> int:
+    """Get the current receipt data version of a user from the database."""
+    return _get_version(User.receipt_data_version, user_id)
+
+
+def get_cached_filter_options(user_id: int) -> dict[str, Any]:
+    """Get the expense list filter options, recomputing them only after the user's data changed.
+
+    Combines ``get_filter_options`` and ``get_main_filter_options``.
+
+    Args:
+        user_id: ID of the current user
+
+    Returns:
+        Dictionary of filter options; callers may modify it freely
+    """
+    version = get_expense_data_version(user_id)
+    options = _read_cached(_FILTER_OPTIONS_KEY, user_id, version)
+    if options is None:
+        options = expense_services.get_filter_options(user_id)
+        try:
+            options.update(expense_services.get_main_filter_options(user_id))
+        except Exception as e:
+            current_app.logger.error(f"Error getting filter options: {str(e)}")
+            # Incomplete options are served but not cached, so the next request retries
+            return options
+        _store_cached(_FILTER_OPTIONS_KEY, user_id, version, options)
+    return options
+
+
+def get_cached_receipt_reconciliation_summary(user_id: int) -> dict[str, int] | None:
+    """Get the user's receipt reconciliation summary if it is cached and current.
+
+    Never computes the reconciliation; returns None when it has to be rebuilt (see
+    ``get_receipt_reconciliation``).
+    """
+    return _read_cached(_RECEIPT_SUMMARY_KEY, user_id, get_receipt_data_version(user_id))
+
+
+def _snapshot_reconciliation_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Replace the ORM objects in reconciliation rows with the plain values the template shows."""
+    return [
+        {
+            **row,
+            "receipt_rows": [
+                {"id": receipt.id, "expense_id": receipt.expense_id, "ocr_confidence": receipt.ocr_confidence}
+                for receipt in row["receipt_rows"]
+            ],
+            "linked_expenses": [
+                {
+                    "id": expense.id,
+                    "amount": expense.amount,
+                    "date": expense.date,
+                    "restaurant": {"display_name": expense.restaurant.display_name} if expense.restaurant else None,
+                }
+                for expense in row["linked_expenses"]
+            ],
+        }
+        for row in rows
+    ]
+
+
+def get_receipt_reconciliation(user_id: int) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Get the receipt reconciliation, rebuilding it only after the user's receipt data changed.
+
+    Args:
+        user_id: ID of the current user
+
+    Returns:
+        Tuple of (rows, summary) as returned by ``expense_services.get_receipt_reconciliation``,
+        with the receipts and expenses in each row reduced to plain dictionaries
+    """
+    # Read before building: a write that lands meanwhile leaves the cached entry stale
+    version = get_receipt_data_version(user_id)
+    cached = _read_cached(_RECEIPT_RECONCILIATION_KEY, user_id, version)
+    if cached is not None:
+        return cast(tuple[list[dict[str, Any]], dict[str, int]], cached)
+    rows, summary = expense_services.get_receipt_reconciliation(user_id)
+    rows = _snapshot_reconciliation_rows(rows)
+    _store_cached(_RECEIPT_RECONCILIATION_KEY, user_id, version, (rows, summary))
+    _store_cached(_RECEIPT_SUMMARY_KEY, user_id, version, summary)
+    return rows, summary
+
+
+def clear_user_caches() -> None:
+    """Drop every cached entry of the current application."""
+    with _cache_lock:
+        for extension_key in (_FILTER_OPTIONS_KEY, _RECEIPT_SUMMARY_KEY, _RECEIPT_RECONCILIATION_KEY):
+            _get_cache(extension_key).clear()
+
+
+def _has_changes(instance: Any, fields: tuple[str, ...]) -> bool:
+    """Return True if the pending flush changes any of ``fields`` on ``instance``."""
+    attrs = inspect(instance).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+def _has_receipt_image(expense: Expense) -> bool:
+    """Return True if the expense references a receipt image before or after the pending flush."""
+    return any(get_history(expense, "receipt_image").sum())
+
+
+def _owners(instances: list[Any]) -> set[int]:
+    """Get the current and (for reassigned rows) previous owners of ``instances``."""
+    user_ids = {instance.user_id for instance in instances}
+    for instance in instances:
+        user_ids.update(inspect(instance).attrs.user_id.history.deleted)
+    return user_ids
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_users(session: Session, flush_context: Any, instances: Any) -> None:
+    """Record the users whose cached expense or receipt data the upcoming flush changes."""
+    option_changes: list[Any] = []
+    receipt_changes: list[Any] = []
+    for instance in session.deleted:
+        if isinstance(instance, (Expense, Category)):
+            option_changes.append(instance)
+        # Deleting an expense also unlinks any receipt row pointing at it
+        if isinstance(instance, (Expense, Receipt)):
+            receipt_changes.append(instance)
+    for instance in session.dirty:
+        if isinstance(instance, Expense):
+            if _has_changes(instance, _EXPENSE_OPTION_FIELDS):
+                option_changes.append(instance)
+            if _has_changes(instance, _EXPENSE_RECEIPT_FIELDS) or (
+                _has_receipt_image(instance) and _has_changes(instance, _EXPENSE_RECEIPT_DISPLAY_FIELDS)
+            ):
+                receipt_changes.append(instance)
+        elif isinstance(instance, Category) and _has_changes(instance, _CATEGORY_OPTION_FIELDS):
+            option_changes.append(instance)
+        elif isinstance(instance, Receipt) and _has_changes(instance, _RECEIPT_FIELDS):
+            receipt_changes.append(instance)
+        elif isinstance(instance, Restaurant) and _has_changes(instance, _RESTAURANT_RECEIPT_DISPLAY_FIELDS):
+            receipt_changes.append(instance)
+
+    option_users = _owners(option_changes)
+    option_users.update(
+        instance.id
+        for instance in session.dirty
+        if isinstance(instance, User) and _has_changes(instance, _USER_OPTION_FIELDS)
+    )
+    session.info[_PENDING_USERS_KEY] = (
+        option_users,
+        _owners(receipt_changes),
+        [instance for instance in session.new if isinstance(instance, (Expense, Category, Receipt))],
+    )
+
+
+def _bump_versions(session: Session, column_name: str, user_ids: set[int]) -> None:
+    """Increment one version column of ``user_ids`` in a single UPDATE."""
+    user_table = User.__table__
+    session.connection().execute(
+        update(user_table)
+        .where(user_table.c.id.in_(user_ids))
+        .values(
+            {
+                column_name: user_table.c[column_name] + 1,
+                # Not a profile edit
+                "updated_at": user_table.c.updated_at,
+            }
+        )
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_user_data_versions(session: Session, flush_context: Any) -> None:
+    """Increment the data versions of the users recorded before the flush."""
+    option_users, receipt_users, new_instances = session.info.pop(_PENDING_USERS_KEY, (set(), set(), []))
+    for instance in new_instances:
+        if isinstance(instance, (Expense, Category)):
+            option_users.add(instance.user_id)
+        if isinstance(instance, Receipt) or (isinstance(instance, Expense) and instance.receipt_image):
+            receipt_users.add(instance.user_id)
+    option_users.discard(None)
+    receipt_users.discard(None)
+    if option_users:
+        _bump_versions(session, "expense_data_version", option_users)
+    if receipt_users:
+        _bump_versions(session, "receipt_data_version", receipt_users)
@@ -24,16 +24,24 @@ def receipt_cli() -> None:
     """Receipt maintenance commands."""
 
 
+@click.group("expense", context_settings={"help_option_names": ["-h", "--help"]})
+def expense_cli() -> None:
+    """Expense maintenance commands."""
+
+
 def register_commands(app: Flask) -> None:
     """Register CLI commands with the application."""
     # Register the category command group
     app.cli.add_command(category_cli)
     app.cli.add_command(receipt_cli)
+    app.cli.add_command(expense_cli)
 
     # Add commands to the category group
     category_cli.add_command(reinit_categories)
     category_cli.add_command(list_categories)
     receipt_cli.add_command(backfill_receipts)
+    receipt_cli.add_command(ocr_cache_command)
+    expense_cli.add_command(rebuild_rollups)
 
 
 def _sort_categories_by_default_order(categories: list[Category]) -> list[Category]:
@@ -281,3 +289,62 @@ def backfill_receipts(dry_run: bool) -> None:
         db.session.rollback()
         click.echo(f"Failed to backfill receipts: {exc}")
         raise
+
+
+@click.command("ocr-cache")
+@click.option("--clear-expired", is_flag=True, help="Delete cached OCR results past their maximum age")
+@click.option("--clear-all", is_flag=True, help="Delete every cached OCR result")
+@with_appcontext
+def ocr_cache_command(clear_expired: bool, clear_all: bool) -> None:
+    """Show receipt OCR cache statistics and optionally purge entries.
+
+    ``--clear-expired`` also deletes async OCR jobs that can no longer be polled. Counters cover
+    this process only.
+
+    Examples:
+        flask receipt ocr-cache
+        flask receipt ocr-cache --clear-expired
+    """
+    from app.services import ocr_cache, ocr_jobs
+
+    if clear_all:
+        deleted = ocr_cache.clear_ocr_cache()
+        click.echo(f"✅ Deleted {deleted} cached OCR results")
+    elif clear_expired:
+        deleted = ocr_cache.clear_expired_ocr_cache()
+        click.echo(f"✅ Deleted {deleted} expired OCR cache entries")
+        deleted = ocr_jobs.clear_expired_ocr_jobs()
+        click.echo(f"✅ Deleted {deleted} expired OCR jobs")
+
+    stats = ocr_cache.get_ocr_cache_stats()
+    click.echo(
+        f"OCR cache: hit ratio {stats['hit_ratio']:.1%} ({stats['hits']} hits, {stats['misses']} misses, "
+        f"{stats['reparses']} re-parses, {stats['writes']} writes, {stats['errors']} errors)"
+    )
+
+
+@click.command("rebuild-rollups")
+@click.option("--user-id", type=int, help="Specific user ID to rebuild rollups for")
+@click.option("--username", type=str, help="Specific username to rebuild rollups for")
+@click.option("--all-users", is_flag=True, help="Rebuild rollups for all users")
+@with_appcontext
+def rebuild_rollups(user_id: int | None, username: str | None, all_users: bool) -> None:
+    """Rebuild the daily expense rollups from scratch (repair command).
+
+    Expense writes keep the rollups behind the dashboard and reports up to date
+    incrementally; run this if they ever drift or after bulk data changes.
+
+    Examples:
+        flask expense rebuild-rollups --user-id 1
+        flask expense rebuild-rollups --all-users
+    """
+    from app.expenses.services import rebuild_expense_rollups
+
+    if not any([user_id, username, all_users]):
+        click.echo("❌ Error: Must specify --user-id, --username, or --all-users")
+        return
+
+    users = _get_target_users(user_id, username, all_users)
+    for user in users:
+        rows = rebuild_expense_rollups(user.id)
+        click.echo(f"✅ Rebuilt {rows} daily rollup rows for {user.username}")
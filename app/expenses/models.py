@@ -4,7 +4,7 @@ from datetime import UTC, date as date_cls, datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import ForeignKey, UniqueConstraint, event
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.extensions import db
@@ -249,7 +249,18 @@ class Expense(BaseModel):
     """
 
     __tablename__ = "expense"  # type: ignore[assignment]
-    __table_args__ = {"comment": "Track meal expenses with details about where and when they occurred"}
+    __table_args__ = (
+        # Serves the date-sorted expense list and its keyset (cursor) pagination seek
+        Index("ix_expense_user_date_created_id", "user_id", "date", "created_at", "id"),
+        # Trigram index serving substring search on PostgreSQL (SQLite uses an FTS5 table, see app.expenses.search)
+        Index(
+            "ix_expense_search_document_trgm",
+            "search_document",
+            postgresql_using="gin",
+            postgresql_ops={"search_document": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        {"comment": "Track meal expenses with details about where and when they occurred"},
+    )
 
     # Columns
     amount: Mapped[Decimal] = mapped_column(
@@ -301,6 +312,14 @@ class Expense(BaseModel):
         comment="Whether the receipt has been verified",
     )
 
+    # Search
+    search_document: Mapped[str | None] = mapped_column(
+        db.Text,
+        nullable=True,
+        deferred=True,
+        comment="Restaurant, notes, meal/order type and category text backing indexed expense search",
+    )
+
     # Foreign keys with proper cascading
     user_id: Mapped[int] = mapped_column(
         db.Integer,
@@ -653,3 +672,67 @@ def validate_category(mapper: object, connection: object, target: Category) -> N
     if icon_val is not None:
         stripped_icon = icon_val.strip()
         target.icon = stripped_icon if stripped_icon else None
+
+
+class ExpenseDailyRollup(BaseModel):
+    """Pre-aggregated expense totals per user, local day and expense dimensions.
+
+    Attributes:
+        user_id: ID of the user the expenses belong to
+        day: Calendar day of the expenses in the user's timezone
+        category_id: Category of the expenses (None if uncategorized)
+        restaurant_id: Restaurant of the expenses (None if not linked)
+        meal_type: Meal type of the expenses
+        order_type: Order type of the expenses
+        expense_count: Number of expenses in the group
+        total_amount: Sum of the expense amounts
+        party_size_total: Sum of the recorded party sizes
+
+    Notes:
+        - Derived data maintained by ``app.expenses.rollup``; never edit rows directly
+        - Rebuild with ``flask expense rebuild-rollups``
+    """
+
+    __tablename__ = "expense_daily_rollup"  # type: ignore[assignment]
+    __table_args__ = (
+        # Every reader scans one user's days, usually bounded by a start day
+        Index("ix_expense_daily_rollup_user_day", "user_id", "day"),
+        {"comment": "Daily expense totals per category, restaurant, meal type and order type"},
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        db.Integer,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Reference to the user who made the expenses",
+    )
+    day: Mapped[date_cls] = mapped_column(db.Date, nullable=False, comment="Day of the expenses in the user's timezone")
+    category_id: Mapped[int | None] = mapped_column(
+        db.Integer,
+        ForeignKey("category.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="Category of the expenses",
+    )
+    restaurant_id: Mapped[int | None] = mapped_column(
+        db.Integer,
+        ForeignKey("restaurant.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="Restaurant of the expenses",
+    )
+    meal_type: Mapped[str | None] = mapped_column(db.String(50), nullable=True, comment="Meal type of the expenses")
+    order_type: Mapped[str | None] = mapped_column(db.String(50), nullable=True, comment="Order type of the expenses")
+    expense_count: Mapped[int] = mapped_column(
+        db.Integer, nullable=False, default=0, comment="Number of expenses in the group"
+    )
+    total_amount: Mapped[Decimal] = mapped_column(
+        db.Numeric(12, 2, asdecimal=True),
+        nullable=False,
+        default=Decimal("0.00"),
+        comment="Sum of the expense amounts",
+    )
+    party_size_total: Mapped[int] = mapped_column(
+        db.Integer, nullable=False, default=0, comment="Sum of the recorded party sizes"
+    )
+
+    def __repr__(self) -> str:
+        return f"<ExpenseDailyRollup(user_id={self.user_id}, day={self.day}, count={self.expense_count})>"
@@ -0,0 +1,225 @@
+"""Daily expense rollups.
+
+``expense_daily_rollup`` holds one row per user, local day, category, restaurant, meal type
+and order type with the expense count, amount total and party size total. Dashboards and
+reports aggregate these rows (a few hundred per user and range) instead of the raw expenses.
+
+Rows are kept current by a session hook: every flush that inserts, deletes or changes an
+expense rebuilds only the (user, day) pairs it touched, including the old day of a moved
+expense. Days are calendar days in the user's stored timezone (UTC when unset), so changing
+a user's timezone rebuilds all of that user's rows.
+
+Writes that bypass the ORM (bulk Core statements, manual SQL) are not tracked;
+``flask expense rebuild-rollups`` rebuilds the rows from scratch.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Collection
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, cast
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import and_, delete, event, insert, inspect, or_, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import InstanceState, Session
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.orm.util import identity_key
+
+from app.auth.models import User
+from app.expenses.models import Expense, ExpenseDailyRollup
+from app.utils.timezone_utils import normalize_timezone
+
+# Expense attributes that feed the rollups
+_ROLLUP_FIELDS = (
+    "amount",
+    "date",
+    "party_size",
+    "category_id",
+    "category",
+    "restaurant_id",
+    "restaurant",
+    "meal_type",
+    "order_type",
+    "user_id",
+)
+# Expense columns a rollup row is grouped by (after the day)
+_DIMENSIONS = ("category_id", "restaurant_id", "meal_type", "order_type")
+# session.info keys holding the affected expenses and users between before_flush and after_flush
+_PENDING_DATES_KEY = "expense_rollup_pending_dates"
+_PENDING_EXPENSES_KEY = "expense_rollup_pending_expenses"
+_PENDING_USERS_KEY = "expense_rollup_pending_users"
+
+
+def resolve_timezone(timezone_name: str | None) -> ZoneInfo:
+    """Get the timezone rollup days are computed in (UTC when unset or invalid).
+
+    Unlike ``get_timezone`` this never falls back to the browser timezone of the current
+    request: the stored rows must not depend on who triggered the write.
+    """
+    return ZoneInfo(normalize_timezone(timezone_name) or "UTC")
+
+
+def local_day(value: datetime, zone: ZoneInfo) -> date:
+    """Get the calendar day of ``value`` in ``zone``; naive values are UTC (as read back from SQLite)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(zone).date()
+
+
+def _utc_bounds(first_day: date, last_day: date, zone: ZoneInfo) -> tuple[datetime, datetime]:
+    """Get the UTC ``[start, end)`` range covering local days ``first_day`` to ``last_day``."""
+    start = datetime.combine(first_day, time.min, tzinfo=zone).astimezone(UTC)
+    end = datetime.combine(last_day + timedelta(days=1), time.min, tzinfo=zone).astimezone(UTC)
+    return start, end
+
+
+def _day_runs(days: Collection[date]) -> list[tuple[date, date]]:
+    """Split days into runs of consecutive days, as ``(first_day, last_day)`` pairs."""
+    runs: list[tuple[date, date]] = []
+    for day in sorted(set(days)):
+        if runs and day == runs[-1][1] + timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+def rebuild_daily_rollups(
+    connection: Connection, user_id: int, zone: ZoneInfo, days: Collection[date] | None = None
+) -> int:
+    """Rebuild a user's rollup rows from their expenses.
+
+    Args:
+        connection: Connection to run the statements on
+        user_id: ID of the user whose rows are rebuilt
+        zone: The user's timezone (see ``resolve_timezone``)
+        days: Local days to rebuild; all of the user's rows when None
+
+    Returns:
+        Number of rollup rows written
+    """
+    expense_table = Expense.__table__
+    rollup_table = ExpenseDailyRollup.__table__
+    stmt = select(
+        expense_table.c.date,
+        *(expense_table.c[name] for name in _DIMENSIONS),
+        expense_table.c.amount,
+        expense_table.c.party_size,
+    ).where(expense_table.c.user_id == user_id)
+    clear = delete(rollup_table).where(rollup_table.c.user_id == user_id)
+    wanted: set[date] | None = None
+    if days is not None:
+        if not days:
+            return 0
+        wanted = set(days)
+        # One range per run of consecutive days, so a moved expense reads only its old and new day
+        ranges = [_utc_bounds(first_day, last_day, zone) for first_day, last_day in _day_runs(wanted)]
+        stmt = stmt.where(
+            or_(*(and_(expense_table.c.date >= start, expense_table.c.date < end) for start, end in ranges))
+        )
+        clear = clear.where(rollup_table.c.day.in_(sorted(wanted)))
+
+    groups: dict[tuple[Any, ...], list[Any]] = {}
+    for expense_date, *dimensions, amount, party_size in connection.execute(stmt):
+        day = local_day(expense_date, zone)
+        if wanted is not None and day not in wanted:
+            continue
+        totals = groups.setdefault((day, *dimensions), [0, Decimal("0.00"), 0])
+        totals[0] += 1
+        totals[1] += Decimal(str(amount or 0))
+        totals[2] += party_size or 0
+
+    connection.execute(clear)
+    if groups:
+        connection.execute(
+            insert(rollup_table),
+            [
+                {
+                    "user_id": user_id,
+                    "day": day,
+                    **dict(zip(_DIMENSIONS, dimensions, strict=True)),
+                    "expense_count": count,
+                    "total_amount": total,
+                    "party_size_total": party_size_total,
+                }
+                for (day, *dimensions), (count, total, party_size_total) in groups.items()
+            ],
+        )
+    return len(groups)
+
+
+def _user_zones(session: Session, user_ids: set[int]) -> dict[int, ZoneInfo]:
+    """Get the rollup timezone of each user, preferring users already loaded in the session."""
+    zones: dict[int, ZoneInfo] = {}
+    for user_id in user_ids:
+        user = session.identity_map.get(identity_key(User, user_id))
+        if user is not None and "timezone" in cast(InstanceState[Any], inspect(user)).dict:
+            zones[user_id] = resolve_timezone(user.timezone)
+    missing = user_ids - zones.keys()
+    if missing:
+        user_table = User.__table__
+        rows = session.connection().execute(
+            select(user_table.c.id, user_table.c.timezone).where(user_table.c.id.in_(missing))
+        )
+        zones.update((user_id, resolve_timezone(timezone_name)) for user_id, timezone_name in rows)
+    return zones
+
+
+def _has_rollup_changes(expense: Expense) -> bool:
+    """Return True if the pending flush changes an attribute the rollups depend on."""
+    return any(get_history(expense, field).has_changes() for field in _ROLLUP_FIELDS)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_affected_days(session: Session, flush_context: Any, instances: Any) -> None:
+    """Record which expenses and users the upcoming flush affects.
+
+    The user and date changed or deleted expenses had before the flush are read from the
+    database in one query; values of new and changed expenses are read after the flush.
+    """
+    expenses = [expense for expense in session.new if isinstance(expense, Expense)]
+    existing_ids = [expense.id for expense in session.deleted if isinstance(expense, Expense)]
+    for expense in session.dirty:
+        if isinstance(expense, Expense) and _has_rollup_changes(expense):
+            expenses.append(expense)
+            existing_ids.append(expense.id)
+
+    dates: list[tuple[int, datetime]] = []
+    if existing_ids:
+        expense_table = Expense.__table__
+        rows = session.connection().execute(
+            select(expense_table.c.user_id, expense_table.c.date).where(expense_table.c.id.in_(existing_ids))
+        )
+        dates.extend((int(user_id), expense_date) for user_id, expense_date in rows)
+    session.info[_PENDING_DATES_KEY] = dates
+    session.info[_PENDING_EXPENSES_KEY] = expenses
+    session.info[_PENDING_USERS_KEY] = {
+        user.id for user in session.dirty if isinstance(user, User) and get_history(user, "timezone").has_changes()
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_affected_days(session: Session, flush_context: Any) -> None:
+    """Rebuild the rollup rows of the days recorded before the flush."""
+    dates: list[tuple[int, datetime]] = session.info.pop(_PENDING_DATES_KEY, [])
+    expenses: list[Expense] = session.info.pop(_PENDING_EXPENSES_KEY, [])
+    rebuild_users: set[int] = session.info.pop(_PENDING_USERS_KEY, set())
+    dates.extend((expense.user_id, expense.date) for expense in expenses if expense.date is not None)
+    user_ids = {user_id for user_id, _ in dates} | rebuild_users
+    if not user_ids:
+        return
+
+    zones = _user_zones(session, user_ids)
+    connection = session.connection()
+    for user_id in rebuild_users & zones.keys():
+        rebuild_daily_rollups(connection, user_id, zones[user_id])
+
+    days_by_user: defaultdict[int, set[date]] = defaultdict(set)
+    for user_id, value in dates:
+        if user_id in zones and user_id not in rebuild_users:
+            days_by_user[user_id].add(local_day(value, zones[user_id]))
+    for user_id, days in days_by_user.items():
+        rebuild_daily_rollups(connection, user_id, zones[user_id], days)
@@ -37,12 +37,18 @@ from app.constants.categories import get_default_categories
 from app.constants.order_types import get_order_type_names
 
 # Local application imports
-from app.expenses import bp, models as expense_models, services as expense_services
+from app.expenses import (
+    bp,
+    cache as expense_cache,
+    models as expense_models,
+    services as expense_services,
+)
 from app.expenses.forms import ExpenseForm, ExpenseImportForm
 from app.expenses.models import Category, Expense
 from app.extensions import db
 from app.restaurants.models import Restaurant
 from app.utils.decorators import db_transaction
+from app.utils.export_utils import peek_rows, streaming_export_response, wants_streaming_export
 from app.utils.messages import FlashMessages
 from app.utils.timezone_utils import (
     get_browser_timezone_info,
@@ -777,23 +783,67 @@ def _render_expense_form(
     )
 
 
+def _render_expense_list_chunk(
+    expenses: list[Expense],
+    filters: dict[str, Any],
+    has_more: bool,
+    next_cursor: str | None = None,
+    next_offset: int = 0,
+) -> str:
+    """Render the infinite-scroll fragment for the next chunk of expenses."""
+    return render_template(
+        "expenses/_list_chunk.html",
+        expenses=expenses,
+        has_more=has_more,
+        next_cursor=next_cursor,
+        next_offset=next_offset,
+        search=filters["search"],
+        meal_type=filters["meal_type"],
+        order_type=filters.get("order_type", ""),
+        category=filters["category"],
+        tags=filters.get("tags", []),
+        start_date=filters["start_date"],
+        end_date=filters["end_date"],
+    )
+
+
 @bp.route("/")
 @login_required
 def list_expenses() -> str | Response:
     """List all expenses for the current user with optional filtering.
 
     Uses SQL-level pagination and infinite scroll: initial load returns the full
-    page with first chunk; HTMX requests with offset return only the next chunk fragment.
+    page with first chunk; HTMX requests with a cursor (or offset) return only the
+    next chunk fragment. Date-sorted lists page by keyset cursor so deep scrolls
+    cost the same as the first chunk; other sorts fall back to offset paging.
     """
     view_mode = request.args.get("view", "expenses")
     calendar_month = request.args.get("month")
     offset = max(0, request.args.get("offset", 0, type=int))
+    cursor = request.args.get("cursor", "").strip() or None
     limit = min(
         max(1, request.args.get("limit", DEFAULT_LIST_PAGE_SIZE, type=int)),
         MAX_LIST_PAGE_SIZE,
     )
 
     filters = expense_services.get_expense_filters(request)
+    use_cursor = filters["sort_by"] == "date"
+
+    # Chunk-only response for HTMX infinite scroll (append next fragment)
+    is_htmx = request.headers.get("HX-Request") == "true"
+    if is_htmx and use_cursor and cursor:
+        expenses_chunk: list[Expense] = []
+        next_cursor: str | None = None
+        try:
+            expenses_chunk, next_cursor = expense_services.get_user_expenses_after_cursor(
+                current_user.id, filters, cursor=cursor, limit=limit
+            )
+        except expense_services.InvalidCursorError:
+            # End the scroll rather than append the first page again
+            current_app.logger.warning(f"Invalid expense list cursor for user {current_user.id}")
+        except Exception as e:
+            current_app.logger.error(f"Error filtering expenses: {str(e)}")
+        return _render_expense_list_chunk(expenses_chunk, filters, next_cursor is not None, next_cursor=next_cursor)
 
     expenses_page: list[Expense] = []
     total_count = 0
@@ -812,53 +862,36 @@ def list_expenses() -> str | Response:
 
     has_more = (offset + len(expenses_page)) < total_count
     next_offset = offset + limit
+    next_cursor = (
+        expense_services.encode_expense_cursor(expenses_page[-1]) if use_cursor and has_more and expenses_page else None
+    )
 
-    # Chunk-only response for HTMX infinite scroll (append next fragment)
-    is_htmx = request.headers.get("HX-Request") == "true"
     if is_htmx and offset > 0:
-        return render_template(
-            "expenses/_list_chunk.html",
-            expenses=expenses_page,
-            has_more=has_more,
-            next_offset=next_offset,
-            total_expenses=total_count,
-            total_amount=total_amount,
-            search=filters["search"],
-            meal_type=filters["meal_type"],
-            order_type=filters.get("order_type", ""),
-            category=filters["category"],
-            tags=filters.get("tags", []),
-            start_date=filters["start_date"],
-            end_date=filters["end_date"],
+        return _render_expense_list_chunk(
+            expenses_page, filters, has_more, next_cursor=next_cursor, next_offset=next_offset
         )
 
     # Full page: first chunk + calendar data (limited)
     calendar_expenses = expense_services.get_calendar_expenses(current_user.id, filters)
 
-    filter_options = expense_services.get_filter_options(current_user.id)
-    try:
-        main_filter_options = expense_services.get_main_filter_options(current_user.id)
-        filter_options.update(main_filter_options)
-    except Exception as e:
-        current_app.logger.error(f"Error getting filter options: {str(e)}")
+    filter_options = expense_cache.get_cached_filter_options(current_user.id)
     filter_options["order_types"] = get_order_type_names()
 
     _, timezone_display = get_browser_timezone_info()
-    receipt_reconciliation_rows, receipt_reconciliation_summary = expense_services.get_receipt_reconciliation(
-        current_user.id
-    )
+    # The receipts tab loads its rows lazily; only a still-current cached summary is shown up front
+    receipt_reconciliation_summary = expense_cache.get_cached_receipt_reconciliation_summary(current_user.id)
 
     return render_template(
         "expenses/list.html",
         expenses=expenses_page,
         calendar_expenses=calendar_expenses,
-        receipt_reconciliation_rows=receipt_reconciliation_rows,
         receipt_reconciliation_summary=receipt_reconciliation_summary,
         total_amount=total_amount,
         avg_price_per_person=avg_price_per_person,
         total_expenses=total_count,
         has_more=has_more,
         next_offset=next_offset,
+        next_cursor=next_cursor,
         search=filters["search"],
         meal_type=filters["meal_type"],
         order_type=filters.get("order_type", ""),
@@ -873,6 +906,18 @@ def list_expenses() -> str | Response:
     )
 
 
+@bp.route("/receipts/reconciliation")
+@login_required
+def receipt_reconciliation() -> str:
+    """Render the receipt reconciliation fragment for the receipts tab (loaded lazily)."""
+    rows, summary = expense_cache.get_receipt_reconciliation(current_user.id)
+    return render_template(
+        "expenses/_receipt_reconciliation.html",
+        receipt_reconciliation_rows=rows,
+        receipt_reconciliation_summary=summary,
+    )
+
+
 @bp.route("/calendar")
 @login_required
 def calendar_view() -> ResponseReturnValue:
@@ -979,7 +1024,7 @@ def _parse_export_ids(raw_ids: list[str]) -> list[int]:
 @bp.route("/export")
 @login_required
 def export_expenses() -> ResponseReturnValue:
-    """Export expenses as CSV or JSON."""
+    """Export expenses as CSV or JSON, streamed with ``stream=true`` or ``format=ndjson``."""
     format_type = request.args.get("format", "csv").lower()
     is_sample = request.args.get("sample", "false").lower() == "true"
     raw_ids = request.args.getlist("ids")
@@ -1068,6 +1113,13 @@ def export_expenses() -> ResponseReturnValue:
         flash("No valid expenses selected for export.", "warning")
         return redirect(url_for("expenses.list_expenses"))  # type: ignore[return-value]
 
+    if wants_streaming_export(format_type):
+        rows = peek_rows(expense_services.iter_expenses_for_export(current_user.id, expense_ids if raw_ids else None))
+        if rows is None:
+            flash("No expenses found to export", "warning")
+            return redirect(url_for("expenses.list_expenses"))  # type: ignore[return-value]
+        return streaming_export_response(rows, format_type, "expenses")
+
     # Get the data from the service
     expenses = expense_services.export_expenses_for_user(
         current_user.id,
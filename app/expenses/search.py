@@ -0,0 +1,237 @@
+"""Indexed text search over expenses.
+
+Every expense carries a ``search_document`` column holding its restaurant name and address
+lines, notes, meal type, order type and category name. The document is computed in SQL as part
+of the expense INSERT/UPDATE (no extra round trip) and refreshed in bulk when a restaurant or
+category is renamed.
+
+PostgreSQL serves ``search_document ILIKE '%term%'`` from a pg_trgm GIN index. SQLite mirrors
+the column into an FTS5 table with the trigram tokenizer, kept in sync by triggers. Both keep
+the case-insensitive substring semantics of the original per-column ILIKE search; a tsvector
+index was not used because it would change matching to whole words/stems.
+"""
+
+from __future__ import annotations
+
+from functools import reduce
+import logging
+from typing import Any
+
+from sqlalchemy import Boolean, Integer, Text, event, inspect, literal, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from app.expenses.models import Category, Expense
+from app.extensions import db
+from app.restaurants.models import Restaurant
+
+logger = logging.getLogger(__name__)
+
+# FTS5 shadow table used on SQLite (external content: rows live in ``expense``)
+SQLITE_FTS_TABLE = "expense_search"
+# The trigram tokenizer cannot match terms shorter than three characters
+FTS_MIN_TERM_LENGTH = 3
+# Field separator inside the document; search terms never contain it, so matches cannot span fields
+DOCUMENT_SEPARATOR = "\n"
+
+_DOCUMENT_EXPENSE_FIELDS = (
+    "notes",
+    "meal_type",
+    "order_type",
+    "restaurant_id",
+    "category_id",
+    "restaurant",
+    "category",
+)
+_DOCUMENT_RESTAURANT_FIELDS = ("name", "address_line_1", "address_line_2")
+
+_SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    "search_document, content='expense', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai AFTER INSERT ON expense BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, search_document) VALUES (new.id, new.search_document); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad AFTER DELETE ON expense BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, search_document) "
+    "VALUES ('delete', old.id, old.search_document); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au AFTER UPDATE OF search_document ON expense BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, search_document) "
+    "VALUES ('delete', old.id, old.search_document); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, search_document) VALUES (new.id, new.search_document); END",
+)
+
+# Cleared if this SQLite build cannot create the FTS5 trigram table; search then scans search_document
+_sqlite_fts_enabled = True
+
+
+def build_search_document(
+    restaurant_id: ColumnElement[Any],
+    category_id: ColumnElement[Any],
+    notes: ColumnElement[Any],
+    meal_type: ColumnElement[Any],
+    order_type: ColumnElement[Any],
+) -> ColumnElement[str]:
+    """Build the SQL expression for an expense's search document.
+
+    Arguments are either columns of the ``expense`` table (bulk refresh) or literals holding a
+    pending row's values (INSERT/UPDATE), so the same expression serves both paths.
+    """
+    restaurant_text = (
+        select(
+            reduce(
+                lambda left, right: left + DOCUMENT_SEPARATOR + right,
+                [db.func.coalesce(getattr(Restaurant, field), "") for field in _DOCUMENT_RESTAURANT_FIELDS],
+            )
+        )
+        .where(Restaurant.id == restaurant_id)
+        .scalar_subquery()
+    )
+    category_text = select(Category.name).where(Category.id == category_id).scalar_subquery()
+    parts = [restaurant_text, notes, meal_type, order_type, category_text]
+    return reduce(
+        lambda left, right: left + DOCUMENT_SEPARATOR + right,
+        [db.func.coalesce(part, literal("", Text)) for part in parts],
+    )
+
+
+def _search_document_for(target: Expense) -> ColumnElement[str]:
+    """Build the search document expression from a pending expense's attribute values."""
+    return build_search_document(
+        literal(target.restaurant_id, Integer),
+        literal(target.category_id, Integer),
+        literal(target.notes, Text),
+        literal(target.meal_type, Text),
+        literal(target.order_type, Text),
+    )
+
+
+def refresh_search_documents(connection: Connection, condition: ColumnElement[bool]) -> None:
+    """Recompute search documents in one UPDATE for the expenses matching ``condition``.
+
+    ``updated_at`` is pinned to its current value: a restaurant rename is not an edit of the
+    user's expenses.
+    """
+    expense_table = Expense.__table__
+    connection.execute(
+        update(expense_table)
+        .where(condition)
+        .values(
+            search_document=build_search_document(
+                expense_table.c.restaurant_id,
+                expense_table.c.category_id,
+                expense_table.c.notes,
+                expense_table.c.meal_type,
+                expense_table.c.order_type,
+            ),
+            updated_at=expense_table.c.updated_at,
+        )
+    )
+
+
+def _has_changes(target: Any, fields: tuple[str, ...]) -> bool:
+    """Return True if any of the given attributes changed in the pending flush."""
+    attrs = inspect(target).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Expense, "before_insert")
+def _set_search_document_on_insert(mapper: object, connection: Connection, target: Expense) -> None:
+    """Compute the search document inline in the INSERT."""
+    target.search_document = _search_document_for(target)
+
+
+@event.listens_for(Expense, "before_update")
+def _set_search_document_on_update(mapper: object, connection: Connection, target: Expense) -> None:
+    """Recompute the search document inline in the UPDATE when a searched field changed."""
+    if _has_changes(target, _DOCUMENT_EXPENSE_FIELDS):
+        target.search_document = _search_document_for(target)
+
+
+@event.listens_for(Restaurant, "after_update")
+def _refresh_documents_for_restaurant(mapper: object, connection: Connection, target: Restaurant) -> None:
+    """Refresh the documents of a restaurant's expenses after its name or address changed."""
+    if _has_changes(target, _DOCUMENT_RESTAURANT_FIELDS):
+        refresh_search_documents(connection, Expense.__table__.c.restaurant_id == target.id)
+
+
+@event.listens_for(Category, "after_update")
+def _refresh_documents_for_category(mapper: object, connection: Connection, target: Category) -> None:
+    """Refresh the documents of a category's expenses after it was renamed."""
+    if _has_changes(target, ("name",)):
+        refresh_search_documents(connection, Expense.__table__.c.category_id == target.id)
+
+
+@event.listens_for(Expense.__table__, "before_create")
+def _create_postgresql_trigram_extension(target: Any, connection: Connection, **kw: Any) -> None:
+    """Ensure pg_trgm exists before create_all builds the trigram index."""
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+@event.listens_for(Expense.__table__, "after_create")
+def _create_sqlite_search_table(target: Any, connection: Connection, **kw: Any) -> None:
+    """Create the FTS5 shadow table and sync triggers when create_all runs on SQLite."""
+    if connection.dialect.name != "sqlite":
+        return
+    try:
+        for statement in _SQLITE_SEARCH_DDL:
+            connection.exec_driver_sql(statement)
+    except OperationalError as e:
+        global _sqlite_fts_enabled
+        _sqlite_fts_enabled = False
+        logger.warning("Expense full-text search table not created, falling back to scanning: %s", e)
+
+
+@event.listens_for(Expense.__table__, "after_drop")
+def _drop_sqlite_search_table(target: Any, connection: Connection, **kw: Any) -> None:
+    """Drop the FTS5 shadow table alongside the expense table on SQLite."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+
+
+def _fts_phrase(term: str) -> str:
+    """Quote a user search term as a single FTS5 phrase."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+class SearchDocumentMatch(ColumnElement[bool]):
+    """Predicate: the expense's search document contains a term (case-insensitive substring).
+
+    Compiled per dialect, so filters can be built without a database connection: SQLite
+    looks the term up in the FTS5 table, every other database (PostgreSQL) emits an ILIKE
+    that the trigram index serves.
+    """
+
+    inherit_cache = True
+    type = Boolean()
+    _traverse_internals = [
+        ("ilike_clause", InternalTraversal.dp_clauseelement),
+        ("fts_phrase", InternalTraversal.dp_clauseelement),
+        ("use_fts", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, term: str) -> None:
+        self.ilike_clause = Expense.__table__.c.search_document.ilike(f"%{term}%")
+        self.fts_phrase = literal(_fts_phrase(term), Text)
+        self.use_fts = len(term) >= FTS_MIN_TERM_LENGTH
+
+
+@compiles(SearchDocumentMatch)
+def _compile_search_match(element: SearchDocumentMatch, compiler: Any, **kw: Any) -> str:
+    return str(compiler.process(element.ilike_clause, **kw))
+
+
+@compiles(SearchDocumentMatch, "sqlite")
+def _compile_search_match_sqlite(element: SearchDocumentMatch, compiler: Any, **kw: Any) -> str:
+    if not element.use_fts or not _sqlite_fts_enabled:
+        return str(compiler.process(element.ilike_clause, **kw))
+    expense_id = compiler.process(Expense.__table__.c.id, **kw)
+    phrase = compiler.process(element.fts_phrase, **kw)
+    return f"{expense_id} IN (SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH {phrase})"
+
+
+def search_condition(term: str) -> ColumnElement[bool]:
+    """Return the WHERE condition matching expenses whose search document contains ``term``."""
+    return SearchDocumentMatch(term)
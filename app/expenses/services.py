@@ -1,5 +1,6 @@
 """Service functions for the expenses blueprint."""
 
+import base64
 from collections import defaultdict
 import csv
 from dataclasses import dataclass
@@ -9,22 +10,24 @@ import io
 import json
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 from flask import Request, current_app, url_for
 from flask_wtf import FlaskForm
-from sqlalchemy import extract, func, or_, select
+from sqlalchemy import and_, case, extract, func, literal, or_, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload, selectinload
 from sqlalchemy.sql import Select
 from werkzeug.datastructures import FileStorage
 
 from app.constants.categories import get_default_categories
+from app.expenses import search as expense_search
 from app.expenses.forms import ExpenseForm
-from app.expenses.models import Category, Expense, ExpenseTag, Tag
+from app.expenses.models import Category, Expense, ExpenseDailyRollup, ExpenseTag, Tag
 from app.extensions import db
 from app.receipts.models import Receipt
 from app.restaurants.models import Restaurant
+from app.utils.export_utils import EXPORT_YIELD_PER
 from app.utils.timezone_utils import get_timezone
 
 # =============================================================================
@@ -121,38 +124,31 @@ def get_user_expenses(user_id: int, filters: dict[str, Any]) -> tuple[list[Expen
     return expenses_list, total_amount, avg_price_per_person
 
 
-def _get_expense_aggregates(user_id: int, filters: dict[str, Any]) -> tuple[float, float | None]:
-    """Get total amount and average price per person over the filtered expense set.
+def _build_filtered_expense_statement(user_id: int, filters: dict[str, Any]) -> Select:
+    """Build the filtered (unsorted) expense statement shared by the list page and its header."""
+    return apply_filters(select(Expense).where(Expense.user_id == user_id), filters)
+
+
+def _get_expense_aggregates(filtered_stmt: Select) -> tuple[int, float, float | None]:
+    """Get count, total amount and average price per person in a single pass.
 
     Args:
-        user_id: The ID of the user
-        filters: Dictionary of filter parameters (same as apply_filters)
+        filtered_stmt: Statement from _build_filtered_expense_statement; its joins and
+            WHERE clause are reused as-is, only the selected columns change
 
     Returns:
-        Tuple of (total_amount, avg_price_per_person)
+        Tuple of (total_count, total_amount, avg_price_per_person)
     """
-    stmt = select(Expense).where(Expense.user_id == user_id)
-    stmt = apply_filters(stmt, filters)
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_count = db.session.execute(count_stmt).scalar_one() or 0
-    if total_count == 0:
-        return 0.0, None
-
-    sum_stmt = select(func.coalesce(func.sum(Expense.amount), 0)).where(Expense.user_id == user_id)
-    sum_stmt = apply_filters(sum_stmt, filters)
-    total_amount = float(db.session.execute(sum_stmt).scalar_one() or 0)
-
-    # Avg price per person: average of (amount/party_size) for expenses with party_size > 0
-    avg_stmt = (
-        select(func.avg(Expense.amount / func.nullif(Expense.party_size, 0)))
-        .where(Expense.user_id == user_id)
-        .where(Expense.party_size.isnot(None))
-        .where(Expense.party_size > 0)
-    )
-    avg_stmt = apply_filters(avg_stmt, filters)
-    avg_result = db.session.execute(avg_stmt).scalar_one()
+    # Average of amount/party_size over expenses with a positive party size; others are NULL and skipped
+    price_per_person = case((Expense.party_size > 0, Expense.amount / Expense.party_size), else_=None)
+    aggregate_stmt = filtered_stmt.with_only_columns(
+        func.count(Expense.id),
+        func.coalesce(func.sum(Expense.amount), 0),
+        func.avg(price_per_person),
+    ).order_by(None)
+    total_count, total_amount, avg_result = db.session.execute(aggregate_stmt).one()
     avg_price_per_person = float(avg_result) if avg_result is not None else None
-    return total_amount, avg_price_per_person
+    return int(total_count or 0), float(total_amount or 0), avg_price_per_person
 
 
 def get_user_expenses_paginated(
@@ -163,6 +159,10 @@ def get_user_expenses_paginated(
 ) -> tuple[list[Expense], int, float, float | None]:
     """Get a page of expenses for a user with the given filters (SQL-level pagination).
 
+    The list header (count, total, average per person) comes from one aggregate query over
+    the same filtered statement as the page, run first so a page past the end skips the
+    page query.
+
     Args:
         user_id: The ID of the user
         filters: Dictionary of filter parameters
@@ -172,27 +172,151 @@ def get_user_expenses_paginated(
     Returns:
         Tuple of (expenses_page, total_count, total_amount, avg_price_per_person)
     """
-    stmt = (
-        select(Expense)
-        .options(
-            joinedload(Expense.expense_tags).joinedload(ExpenseTag.tag),
-            joinedload(Expense.receipt),
+    filtered_stmt = _build_filtered_expense_statement(user_id, filters)
+    page_stmt = filtered_stmt.options(
+        joinedload(Expense.expense_tags).joinedload(ExpenseTag.tag),
+        joinedload(Expense.receipt),
+    )
+    page_stmt = apply_sorting(page_stmt, filters["sort_by"], filters["sort_order"])
+    page_stmt = page_stmt.limit(limit).offset(offset)
+
+    total_count, total_amount, avg_price_per_person = _get_expense_aggregates(filtered_stmt)
+    if offset >= total_count:
+        return [], total_count, total_amount, avg_price_per_person
+    expenses_page = list(db.session.execute(page_stmt).scalars().unique().all())
+
+    return expenses_page, total_count, total_amount, avg_price_per_person
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor from the client cannot be decoded."""
+
+
+def encode_expense_cursor(expense: Expense) -> str:
+    """Encode an expense's position in the date sort as an opaque keyset cursor.
+
+    Args:
+        expense: The last expense on the current page
+
+    Returns:
+        URL-safe cursor string identifying the (date, created_at, id) sort position
+    """
+    payload = json.dumps([expense.date.isoformat(), expense.created_at.isoformat(), expense.id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_expense_cursor(cursor: str | None) -> tuple[datetime, datetime, int] | None:
+    """Decode a keyset cursor produced by encode_expense_cursor.
+
+    Args:
+        cursor: Cursor string from the client
+
+    Returns:
+        Tuple of (date, created_at, expense_id), or None if the cursor is missing or malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date_value, created_at_value, expense_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(date_value), datetime.fromisoformat(created_at_value), int(expense_id)
+    except (ValueError, TypeError, UnicodeError):
+        return None
+
+
+def _apply_expense_cursor(
+    stmt: Select, user_id: int, position: tuple[datetime, datetime, int], sort_order: str
+) -> Select:
+    """Restrict a date-sorted statement to the rows that follow a cursor position.
+
+    The seek compares against the anchor row's stored date/created_at (a primary key lookup), so
+    it is exact even where the database serialises timestamps differently from bound parameters
+    (SQLite's CURRENT_TIMESTAMP). The cursor's own values are used if the anchor was deleted.
+    """
+    cursor_date, cursor_created_at, cursor_id = position
+    anchor = aliased(Expense)
+    anchor_filter = (anchor.id == cursor_id, anchor.user_id == user_id)
+    date_key = func.coalesce(
+        select(anchor.date).where(*anchor_filter).scalar_subquery(),
+        literal(cursor_date, Expense.date.type),
+    )
+    created_at_key = func.coalesce(
+        select(anchor.created_at).where(*anchor_filter).scalar_subquery(),
+        literal(cursor_created_at, Expense.created_at.type),
+    )
+
+    if sort_order.lower() == "desc":
+        return stmt.where(
+            or_(
+                Expense.date < date_key,
+                and_(
+                    Expense.date == date_key,
+                    or_(
+                        Expense.created_at < created_at_key,
+                        and_(Expense.created_at == created_at_key, Expense.id < cursor_id),
+                    ),
+                ),
+            )
+        )
+    return stmt.where(
+        or_(
+            Expense.date > date_key,
+            and_(
+                Expense.date == date_key,
+                or_(
+                    Expense.created_at > created_at_key,
+                    and_(Expense.created_at == created_at_key, Expense.id > cursor_id),
+                ),
+            ),
         )
-        .where(Expense.user_id == user_id)
     )
-    stmt = apply_filters(stmt, filters)
-    stmt = apply_sorting(stmt, filters["sort_by"], filters["sort_order"])
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_count = db.session.execute(count_stmt).scalar_one() or 0
 
-    total_amount, avg_price_per_person = _get_expense_aggregates(user_id, filters)
+def get_user_expenses_after_cursor(
+    user_id: int,
+    filters: dict[str, Any],
+    cursor: str | None = None,
+    limit: int = 25,
+) -> tuple[list[Expense], str | None]:
+    """Get a page of date-sorted expenses using keyset (cursor) pagination.
+
+    Seeks straight to the cursor position instead of discarding OFFSET rows, so deep pages cost
+    the same as the first one. Counts and aggregates are not computed here; the full list page
+    gets those from get_user_expenses_paginated.
+
+    Args:
+        user_id: The ID of the user
+        filters: Dictionary of filter parameters (sort_by is ignored; rows are sorted by date)
+        cursor: Cursor from a previous page, or None for the first page
+        limit: Maximum number of rows to return
 
-    stmt = stmt.limit(limit).offset(offset)
-    result = db.session.execute(stmt)
+    Returns:
+        Tuple of (expenses_page, next_cursor); next_cursor is None when there are no more rows
+
+    Raises:
+        InvalidCursorError: If the cursor is given but malformed; restarting from the first
+            page instead would hand the client rows it already has
+    """
+    position = decode_expense_cursor(cursor)
+    if cursor and position is None:
+        raise InvalidCursorError("Invalid cursor")
+
+    stmt = _build_filtered_expense_statement(user_id, filters).options(
+        joinedload(Expense.expense_tags).joinedload(ExpenseTag.tag),
+        joinedload(Expense.receipt),
+    )
+    if position is not None:
+        stmt = _apply_expense_cursor(stmt, user_id, position, filters["sort_order"])
+    stmt = apply_sorting(stmt, "date", filters["sort_order"])
+
+    # Fetch one extra row to learn whether another page exists without a COUNT
+    result = db.session.execute(stmt.limit(limit + 1))
     expenses_page = list(result.scalars().unique().all())
+    if len(expenses_page) <= limit:
+        return expenses_page, None
 
-    return expenses_page, total_count, total_amount, avg_price_per_person
+    expenses_page = expenses_page[:limit]
+    return expenses_page, encode_expense_cursor(expenses_page[-1])
 
 
 # Maximum number of expenses to load for calendar JSON (avoids huge payloads)
@@ -262,23 +386,10 @@ def apply_filters(stmt: Select, filters: dict[str, Any]) -> Select:
     # Always join restaurant and category tables for search (using outer joins to include expenses without these)
     stmt = stmt.join(Expense.restaurant, isouter=True)
     stmt = stmt.join(Expense.category, isouter=True)
-    # Apply search filter across all text-based fields
+    # Apply search filter across restaurant name/address, notes, meal/order type and category
+    # through the indexed search document (see app.expenses.search)
     if filters["search"]:
-        search_term = f"%{filters['search']}%"
-        stmt = stmt.where(
-            or_(
-                # Restaurant fields (handle NULL values from outer join)
-                func.coalesce(Restaurant.name, "").ilike(search_term),
-                func.coalesce(Restaurant.address_line_1, "").ilike(search_term),
-                func.coalesce(Restaurant.address_line_2, "").ilike(search_term),
-                # Expense fields
-                func.coalesce(Expense.notes, "").ilike(search_term),
-                func.coalesce(Expense.meal_type, "").ilike(search_term),
-                func.coalesce(Expense.order_type, "").ilike(search_term),
-                # Category fields (handle NULL values from outer join)
-                func.coalesce(Category.name, "").ilike(search_term),
-            )
-        )
+        stmt = stmt.where(expense_search.search_condition(filters["search"]))
 
     # Apply meal type filter
     if filters["meal_type"]:
@@ -332,12 +443,14 @@ def apply_sorting(stmt: Select, sort_by: str, sort_order: str) -> Select:
     sort_fields: list[Any] = []
 
     if sort_by == "date":
-        # Primary sort by date, secondary sort by created_at for recently entered expenses
+        # Primary sort by date, secondary sort by created_at for recently entered expenses,
+        # then id so the order is total and matches the keyset cursor
         date_col = Expense.date
         created_at_col = Expense.created_at
         primary_field = date_col.desc() if is_desc else date_col.asc()
         secondary_field = created_at_col.desc() if is_desc else created_at_col.asc()
-        sort_fields = [primary_field, secondary_field]
+        id_field = Expense.id.desc() if is_desc else Expense.id.asc()
+        sort_fields = [primary_field, secondary_field, id_field]
     elif sort_by == "amount":
         sort_field: Any = Expense.amount.desc() if is_desc else Expense.amount.asc()
         sort_fields = [sort_field]
@@ -374,16 +487,19 @@ def get_main_filter_options(user_id: int) -> dict[str, list[str]]:
     Returns:
         Dictionary containing filter options
     """
-    # Get unique meal types and categories for filter dropdowns
+    # Get unique meal types and categories for filter dropdowns (from the daily rollups)
     meal_types = (
-        db.session.query(Expense.meal_type).filter(Expense.user_id == user_id, Expense.meal_type != "").distinct().all()
+        db.session.query(ExpenseDailyRollup.meal_type)
+        .filter(ExpenseDailyRollup.user_id == user_id, ExpenseDailyRollup.meal_type != "")
+        .distinct()
+        .all()
     )
 
     # Get unique categories through the relationship
     categories = (
         db.session.query(Category.name)
-        .join(Expense, Expense.category_id == Category.id)
-        .filter(Expense.user_id == user_id)
+        .join(ExpenseDailyRollup, ExpenseDailyRollup.category_id == Category.id)
+        .filter(ExpenseDailyRollup.user_id == user_id)
         .distinct()
         .all()
     )
@@ -985,11 +1101,6 @@ def create_expense(
         if tags:
             _add_tags_to_expense(expense.id, user_id, tags)
 
-        # Recalculate restaurant statistics since we added a new expense
-        from app.restaurants.services import recalculate_restaurant_statistics
-
-        recalculate_restaurant_statistics(user_id)
-
         return expense, None
 
     except Exception as e:
@@ -1258,11 +1369,6 @@ def update_expense(
         if tags is not None:  # Allow empty list to clear tags
             _add_tags_to_expense(expense.id, expense.user_id, tags)
 
-        # Recalculate restaurant statistics since we updated an expense
-        from app.restaurants.services import recalculate_restaurant_statistics
-
-        recalculate_restaurant_statistics(expense.user_id)
-
         return expense, None
 
     except Exception as e:
@@ -1277,16 +1383,10 @@ def delete_expense(expense: Expense) -> None:
     Args:
         expense: The expense to delete
     """
-    user_id = expense.user_id
     _delete_receipt_records_for_expense(expense)
     db.session.delete(expense)
     db.session.commit()
 
-    # Recalculate restaurant statistics since we deleted an expense
-    from app.restaurants.services import recalculate_restaurant_statistics
-
-    recalculate_restaurant_statistics(user_id)
-
 
 def get_expense_by_id(expense_id: int, user_id: int) -> Expense | None:
     """Get an expense by ID, ensuring it belongs to the user.
@@ -1407,11 +1507,6 @@ def update_expense_for_user(expense: Expense, data: dict[str, Any]) -> Expense:
 
     db.session.commit()
 
-    # Recalculate restaurant statistics since we updated an expense
-    from app.restaurants.services import recalculate_restaurant_statistics
-
-    recalculate_restaurant_statistics(expense.user_id)
-
     return expense
 
 
@@ -1422,14 +1517,30 @@ def delete_expense_for_user(expense: Expense) -> None:
     Args:
         expense: The expense to delete
     """
-    user_id = expense.user_id
     db.session.delete(expense)
     db.session.commit()
 
-    # Recalculate restaurant statistics since we deleted an expense
-    from app.restaurants.services import recalculate_restaurant_statistics
 
-    recalculate_restaurant_statistics(user_id)
+def rebuild_expense_rollups(user_id: int) -> int:
+    """Rebuild all daily expense rollups of a user.
+
+    Expense writes keep the rollups current for the days they touch (see
+    ``app.expenses.rollup``); this full pass is the repair path behind
+    ``flask expense rebuild-rollups``.
+
+    Args:
+        user_id: The ID of the user whose rollups should be rebuilt
+
+    Returns:
+        Number of rollup rows written
+    """
+    from app.auth.models import User
+    from app.expenses.rollup import rebuild_daily_rollups, resolve_timezone
+
+    timezone_name = db.session.execute(select(User.timezone).where(User.id == user_id)).scalar_one_or_none()
+    rows = rebuild_daily_rollups(db.session.connection(), user_id, resolve_timezone(timezone_name))
+    db.session.commit()
+    return rows
 
 
 def get_filter_options(user_id: int) -> dict[str, Any]:
@@ -1447,9 +1558,11 @@ def get_filter_options(user_id: int) -> dict[str, Any]:
     """
     # Get unique categories with counts, colors, and icons
     categories_with_counts = (
-        db.session.query(Category.name, Category.color, Category.icon, func.count(Expense.id).label("count"))
-        .join(Expense, Expense.category_id == Category.id)
-        .filter(Expense.user_id == user_id)
+        db.session.query(
+            Category.name, Category.color, Category.icon, func.sum(ExpenseDailyRollup.expense_count).label("count")
+        )
+        .join(ExpenseDailyRollup, ExpenseDailyRollup.category_id == Category.id)
+        .filter(ExpenseDailyRollup.user_id == user_id)
         .group_by(Category.name, Category.color, Category.icon)
         .all()
     )
@@ -1468,13 +1581,13 @@ def get_filter_options(user_id: int) -> dict[str, Any]:
 
     categories = sorted(categories_with_counts, key=sort_key)
 
-    # Get unique years and months with expenses
+    # Get unique years and months with expenses (local days from the daily rollups)
     date_parts = (
         db.session.query(
-            extract("year", Expense.date).label("year"),
-            extract("month", Expense.date).label("month"),
+            extract("year", ExpenseDailyRollup.day).label("year"),
+            extract("month", ExpenseDailyRollup.day).label("month"),
         )
-        .filter(Expense.user_id == user_id)
+        .filter(ExpenseDailyRollup.user_id == user_id)
         .distinct()
         .order_by("year", "month")
         .all()
@@ -1515,95 +1628,114 @@ def get_filter_options(user_id: int) -> dict[str, Any]:
     }
 
 
-def export_expenses_for_user(user_id: int, expense_ids: list[int] | None = None) -> list[dict[str, Any]]:
-    """Get all expenses for a user in a format suitable for export.
+def _export_float(value: Any) -> float | None:
+    """Safely convert value to float."""
+    try:
+        return float(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _export_tag_names(expense: Expense) -> str:
+    """Format tag names as a comma-separated string."""
+    tag_names = [tag.name for tag in expense.tags if tag and tag.name]
+    return ", ".join(tag_names) if tag_names else ""
+
+
+def _export_utc_datetime_strings(expense: Expense) -> tuple[str, str, str]:
+    """Return (date, time_utc, datetime_utc) strings for export."""
+    expense_dt = expense.date
+    if not expense_dt:
+        return "", "", ""
+
+    # Expense.date is expected to be a datetime; keep a single code path for type-checkers.
+    dt_val = expense_dt
+
+    if dt_val.tzinfo is None:
+        dt_val = dt_val.replace(tzinfo=UTC)
+
+    dt_utc = dt_val.astimezone(UTC).replace(microsecond=0)
+    date_str = dt_utc.date().isoformat()
+    time_str = dt_utc.time().isoformat()
+    datetime_str = dt_utc.isoformat().replace("+00:00", "Z")
+    return date_str, time_str, datetime_str
+
+
+def _expense_export_row(expense: Expense) -> dict[str, Any]:
+    """Convert an expense into an export row."""
+    date_str, time_str, datetime_str = _export_utc_datetime_strings(expense)
+    return {
+        # Backup-friendly: include both a human-friendly date and full UTC timestamp.
+        "date": date_str,
+        "cleared_date": expense.cleared_date.isoformat() if isinstance(expense.cleared_date, date) else "",
+        "time_utc": time_str,
+        "datetime_utc": datetime_str,
+        "amount": _export_float(expense.amount) if expense.amount is not None else "",
+        "meal_type": expense.meal_type or "",
+        "order_type": expense.order_type or "",
+        "party_size": expense.party_size if expense.party_size is not None else "",
+        "notes": expense.notes or "",
+        "category_name": expense.category.name if expense.category else "",
+        "restaurant_name": expense.restaurant.display_name if expense.restaurant else "",
+        "restaurant_address": expense.restaurant.address if expense.restaurant else "",
+        "restaurant_city": expense.restaurant.city if expense.restaurant else "",
+        "restaurant_state": expense.restaurant.state if expense.restaurant else "",
+        "restaurant_postal_code": expense.restaurant.postal_code if expense.restaurant else "",
+        "restaurant_country": expense.restaurant.country if expense.restaurant else "",
+        "restaurant_google_place_id": expense.restaurant.google_place_id if expense.restaurant else "",
+        "tags": _export_tag_names(expense),
+        "created_at": expense.created_at.isoformat() if expense.created_at else "",
+        "updated_at": expense.updated_at.isoformat() if expense.updated_at else "",
+    }
+
+
+def iter_expenses_for_export(user_id: int, expense_ids: list[int] | None = None) -> Iterator[dict[str, Any]]:
+    """Stream a user's expenses as export rows.
+
+    Expenses are read through a server-side cursor in batches of ``EXPORT_YIELD_PER``, so
+    memory use does not grow with the number of expenses.
 
     Args:
         user_id: The ID of the user whose expenses to export
         expense_ids: Optional list of expense IDs to export
 
-    Returns:
-        A list of dictionaries containing expense data
+    Yields:
+        One dictionary of expense data per expense, newest first
     """
     if expense_ids is not None and not expense_ids:
-        return []
+        return
 
     query = (
         select(Expense)
         .options(
+            # Joined eager loads only for many-to-one; yield_per cannot batch joined collections
             joinedload(Expense.restaurant),
             joinedload(Expense.category),
-            joinedload(Expense.expense_tags).joinedload(ExpenseTag.tag),
+            selectinload(Expense.expense_tags).joinedload(ExpenseTag.tag),
         )
         .where(Expense.user_id == user_id)
-        .order_by(Expense.date.desc())
+        .order_by(Expense.date.desc(), Expense.id.desc())
+        .execution_options(yield_per=EXPORT_YIELD_PER)
     )
 
     if expense_ids:
         query = query.where(Expense.id.in_(expense_ids))
 
-    expenses = db.session.execute(query).unique().scalars().all()
+    for expense in db.session.scalars(query):
+        yield _expense_export_row(expense)
 
-    def safe_float(value: Any) -> float | None:
-        """Safely convert value to float."""
-        try:
-            return float(value) if value is not None else None
-        except (ValueError, TypeError):
-            return None
 
-    def format_tag_names(expense: Expense) -> str:
-        """Format tag names as a comma-separated string."""
-        tag_names = [tag.name for tag in expense.tags if tag and tag.name]
-        return ", ".join(tag_names) if tag_names else ""
-
-    def to_utc_datetime_string(expense: Expense) -> tuple[str, str, str]:
-        """Return (date, time_utc, datetime_utc) strings for export."""
-        expense_dt = expense.date
-        if not expense_dt:
-            return "", "", ""
-
-        # Expense.date is expected to be a datetime; keep a single code path for type-checkers.
-        dt_val = expense_dt
-
-        if dt_val.tzinfo is None:
-            dt_val = dt_val.replace(tzinfo=UTC)
-
-        dt_utc = dt_val.astimezone(UTC).replace(microsecond=0)
-        date_str = dt_utc.date().isoformat()
-        time_str = dt_utc.time().isoformat()
-        datetime_str = dt_utc.isoformat().replace("+00:00", "Z")
-        return date_str, time_str, datetime_str
-
-    export_rows: list[dict[str, Any]] = []
-    for expense in expenses:
-        date_str, time_str, datetime_str = to_utc_datetime_string(expense)
-        export_rows.append(
-            {
-                # Backup-friendly: include both a human-friendly date and full UTC timestamp.
-                "date": date_str,
-                "cleared_date": expense.cleared_date.isoformat() if isinstance(expense.cleared_date, date) else "",
-                "time_utc": time_str,
-                "datetime_utc": datetime_str,
-                "amount": safe_float(expense.amount) if expense.amount is not None else "",
-                "meal_type": expense.meal_type or "",
-                "order_type": expense.order_type or "",
-                "party_size": expense.party_size if expense.party_size is not None else "",
-                "notes": expense.notes or "",
-                "category_name": expense.category.name if expense.category else "",
-                "restaurant_name": expense.restaurant.display_name if expense.restaurant else "",
-                "restaurant_address": expense.restaurant.address if expense.restaurant else "",
-                "restaurant_city": expense.restaurant.city if expense.restaurant else "",
-                "restaurant_state": expense.restaurant.state if expense.restaurant else "",
-                "restaurant_postal_code": expense.restaurant.postal_code if expense.restaurant else "",
-                "restaurant_country": expense.restaurant.country if expense.restaurant else "",
-                "restaurant_google_place_id": expense.restaurant.google_place_id if expense.restaurant else "",
-                "tags": format_tag_names(expense),
-                "created_at": expense.created_at.isoformat() if expense.created_at else "",
-                "updated_at": expense.updated_at.isoformat() if expense.updated_at else "",
-            }
-        )
+def export_expenses_for_user(user_id: int, expense_ids: list[int] | None = None) -> list[dict[str, Any]]:
+    """Get all expenses for a user in a format suitable for export.
 
-    return export_rows
+    Args:
+        user_id: The ID of the user whose expenses to export
+        expense_ids: Optional list of expense IDs to export
+
+    Returns:
+        A list of dictionaries containing expense data
+    """
+    return list(iter_expenses_for_export(user_id, expense_ids))
 
 
 def _validate_import_file(file: FileStorage) -> bool:
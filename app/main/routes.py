@@ -21,9 +21,9 @@ from flask import (
     url_for,
 )
 from flask_login import current_user, login_required
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 
-from app.expenses.models import Expense, Tag
+from app.expenses.models import Expense, ExpenseDailyRollup, Tag
 from app.extensions import db
 from app.restaurants.models import Restaurant
 
@@ -239,14 +239,16 @@ def index() -> str:
     user_id = current_user.id
     merchant_dashboard_stats = None
 
-    # Get expense statistics
+    # Get expense statistics from the daily rollups
+    total_expenses = func.coalesce(func.sum(ExpenseDailyRollup.expense_count), 0)
+    total_spent = func.coalesce(func.sum(ExpenseDailyRollup.total_amount), 0)
     expense_stats = db.session.execute(
         select(
-            func.coalesce(func.count(Expense.id), 0).label("total_expenses"),
-            func.coalesce(func.sum(Expense.amount), 0).label("total_spent"),
-            func.coalesce(func.avg(Expense.amount), 0).label("avg_expense"),
-            func.max(Expense.date).label("last_expense_date"),
-        ).where(Expense.user_id == user_id)
+            total_expenses.label("total_expenses"),
+            total_spent.label("total_spent"),
+            case((total_expenses > 0, total_spent / total_expenses), else_=0).label("avg_expense"),
+            func.max(ExpenseDailyRollup.day).label("last_expense_date"),
+        ).where(ExpenseDailyRollup.user_id == user_id)
     ).first()
 
     # Get restaurant statistics
@@ -265,17 +267,11 @@ def index() -> str:
         .limit(5)
     ).all()
 
-    # Get top restaurants by expense count (top 5)
+    # Get top restaurants by expense count (top 5) from their stored statistics
     top_restaurants = db.session.execute(
-        select(
-            Restaurant,
-            func.count(Expense.id).label("visit_count"),
-            func.coalesce(func.sum(Expense.amount), 0).label("total_spent"),
-        )
-        .join(Expense, Restaurant.id == Expense.restaurant_id)
-        .where(Restaurant.user_id == user_id)
-        .group_by(Restaurant.id)
-        .order_by(func.count(Expense.id).desc())
+        select(Restaurant, Restaurant.visit_count, Restaurant.total_spent)
+        .where(Restaurant.user_id == user_id, Restaurant.visit_count > 0)
+        .order_by(Restaurant.visit_count.desc(), Restaurant.id)
         .limit(5)
     ).all()
 
@@ -0,0 +1,239 @@
+"""In-memory index matching restaurant names to merchants.
+
+``find_merchant_for_restaurant_name`` accepts a merchant whose normalized name or short name
+equals the normalized restaurant name or one of its leading word sequences ("joe s pizza"
+matches "joe s pizza downtown"). The index maps every normalized merchant name and short name
+to its merchants, so a lookup is one dictionary probe per word of the restaurant name instead
+of a scan of the merchant table. (Websites are matched through the indexed
+``Merchant.website_host`` column instead.)
+
+Merchants are shared by all users, so there is no per-user version to validate against (see
+``app.expenses.cache``). Lookups use the index as is for ``INDEX_RECHECK_SECONDS``; after that
+the next lookup reads a fingerprint of the table (row count, highest id, latest ``updated_at``)
+in one aggregate query. When only new rows were added, the index is extended with them; any
+other change rebuilds it. Merchant writes made by this process do not wait for the recheck:
+inserts and deletes expire the index, and name or short name edits drop it, both when they are
+flushed and when they commit. Writes by other processes show up within the recheck interval.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+import threading
+import time
+from typing import Any, cast
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import get_history
+
+from app.extensions import db
+from app.merchants.models import Merchant
+
+# app.extensions key of the per-application index
+_INDEX_KEY = "merchant_match_index"
+# Attributes the index is built from
+_INDEXED_FIELDS = ("name", "short_name")
+# session.info key marking sessions that flushed merchant changes the index depends on
+_FLUSHED_CHANGES_KEY = "merchant_match_index_changes"
+
+# How long lookups trust the index before checking the merchant table for changes
+INDEX_RECHECK_SECONDS = 30.0
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+_index_lock = threading.Lock()
+
+
+def normalize_for_name_match(value: str | None) -> str:
+    """Normalize names for resilient brand matching: lowercase alphanumeric words separated by one space."""
+    if not value:
+        return ""
+    return " ".join(_NON_ALPHANUMERIC.sub(" ", value.lower()).split())
+
+
+@dataclass(frozen=True)
+class _Fingerprint:
+    count: int
+    max_id: int | None
+    max_updated_at: Any
+
+
+@dataclass(frozen=True)
+class _CachedIndex:
+    fingerprint: _Fingerprint
+    index: MerchantMatchIndex
+    # time.monotonic() value after which the fingerprint is read again
+    recheck_at: float
+
+
+class MerchantMatchIndex:
+    """Normalized name map of the merchant table."""
+
+    def __init__(self) -> None:
+        # normalized name or short name -> [(is_short_name, merchant_id)]
+        self._names: dict[str, list[tuple[bool, int]]] = {}
+
+    def add(self, merchant_id: int, name: str | None, short_name: str | None) -> None:
+        """Index one merchant."""
+        for is_short_name, raw_value in ((True, short_name), (False, name)):
+            value = normalize_for_name_match(raw_value)
+            if value:
+                self._names.setdefault(value, []).append((is_short_name, merchant_id))
+
+    def copy(self) -> MerchantMatchIndex:
+        """Get an independent copy, to extend without affecting readers of this one."""
+        index = MerchantMatchIndex()
+        index._names = {value: list(entries) for value, entries in self._names.items()}
+        return index
+
+    def match_name(self, restaurant_name: str) -> int | None:
+        """Get the ID of the merchant best matching a restaurant name.
+
+        Short name matches rank before name matches, exact matches before prefix matches, and
+        longer matches before shorter ones. A tie between different merchants is ambiguous and
+        matches nothing.
+        """
+        words = normalize_for_name_match(restaurant_name).split(" ")
+        if words == [""]:
+            return None
+
+        best_score: tuple[int, int, int] | None = None
+        best_merchants: set[int] = set()
+        for word_count in range(1, len(words) + 1):
+            value = " ".join(words[:word_count])
+            is_exact = word_count == len(words)
+            for is_short_name, merchant_id in self._names.get(value, ()):
+                score = (0 if is_short_name else 1, 0 if is_exact else 1, -len(value))
+                if best_score is None or score < best_score:
+                    best_score = score
+                    best_merchants = {merchant_id}
+                elif score == best_score:
+                    best_merchants.add(merchant_id)
+
+        if len(best_merchants) != 1:
+            return None
+        return next(iter(best_merchants))
+
+
+def _read_fingerprint() -> _Fingerprint:
+    count, max_id, max_updated_at = db.session.execute(
+        select(func.count(Merchant.id), func.max(Merchant.id), func.max(Merchant.updated_at))
+    ).one()
+    return _Fingerprint(int(count or 0), max_id, max_updated_at)
+
+
+def _select_rows(min_id: int | None = None) -> Any:
+    stmt = select(Merchant.id, Merchant.name, Merchant.short_name, Merchant.updated_at)
+    if min_id is not None:
+        stmt = stmt.where(Merchant.id > min_id)
+    return db.session.execute(stmt).all()
+
+
+def _extend_index(cached: _CachedIndex, fingerprint: _Fingerprint) -> MerchantMatchIndex | None:
+    """Add merchants created since ``cached`` was built, or None if other rows changed too."""
+    cached_fingerprint = cached.fingerprint
+    if cached_fingerprint.max_id is None or fingerprint.count <= cached_fingerprint.count:
+        return None
+
+    rows = _select_rows(min_id=cached_fingerprint.max_id)
+    latest_update = max(
+        (value for value in [cached_fingerprint.max_updated_at, *(row.updated_at for row in rows)] if value),
+        default=None,
+    )
+    if cached_fingerprint.count + len(rows) != fingerprint.count or latest_update != fingerprint.max_updated_at:
+        return None
+
+    index = cached.index.copy()
+    for row in rows:
+        index.add(row.id, row.name, row.short_name)
+    return index
+
+
+def _get_cached() -> _CachedIndex | None:
+    return cast(_CachedIndex | None, current_app.extensions.get(_INDEX_KEY))
+
+
+def get_merchant_match_index() -> MerchantMatchIndex:
+    """Get the merchant match index of this application, refreshing it if the table changed."""
+    cached = _get_cached()
+    if cached is not None and time.monotonic() < cached.recheck_at:
+        return cached.index
+
+    with _index_lock:
+        cached = _get_cached()
+        if cached is not None and time.monotonic() < cached.recheck_at:
+            return cached.index
+
+        fingerprint = _read_fingerprint()
+        index = cached.index if cached is not None and cached.fingerprint == fingerprint else None
+        if index is None and cached is not None:
+            index = _extend_index(cached, fingerprint)
+        if index is None:
+            index = MerchantMatchIndex()
+            for row in _select_rows():
+                index.add(row.id, row.name, row.short_name)
+        current_app.extensions[_INDEX_KEY] = _CachedIndex(fingerprint, index, time.monotonic() + INDEX_RECHECK_SECONDS)
+        return index
+
+
+def clear_merchant_match_index() -> None:
+    """Drop this application's index; the next lookup rebuilds it."""
+    if has_app_context():
+        current_app.extensions.pop(_INDEX_KEY, None)
+
+
+def _expire_merchant_match_index() -> None:
+    """Make the next lookup check the merchant table, keeping the index to extend."""
+    if not has_app_context():
+        return
+    with _index_lock:
+        cached = _get_cached()
+        if cached is not None:
+            current_app.extensions[_INDEX_KEY] = _CachedIndex(cached.fingerprint, cached.index, 0.0)
+
+
+def _mark_session(target: Merchant, rebuild: bool) -> None:
+    """Record on the target's session that the index must be refreshed once it commits."""
+    session = object_session(target)
+    if session is not None:
+        session.info[_FLUSHED_CHANGES_KEY] = session.info.get(_FLUSHED_CHANGES_KEY, False) or rebuild
+
+
+@event.listens_for(Merchant, "after_insert")
+@event.listens_for(Merchant, "after_delete")
+def _expire_index_on_insert_or_delete(mapper: Any, connection: Any, target: Merchant) -> None:
+    """Expire the index when merchants are added or removed."""
+    _expire_merchant_match_index()
+    _mark_session(target, rebuild=False)
+
+
+@event.listens_for(Merchant, "after_update")
+def _drop_index_on_indexed_change(mapper: Any, connection: Any, target: Merchant) -> None:
+    """Drop the index when a merchant's name or short name changes.
+
+    Dropped rather than expired: the edit may land within the timestamp resolution of the
+    database and leave the fingerprint unchanged.
+    """
+    if any(get_history(target, field).has_changes() for field in _INDEXED_FIELDS):
+        clear_merchant_match_index()
+        _mark_session(target, rebuild=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_index_on_commit(session: Session) -> None:
+    """Refresh an index built before this session's merchant changes were visible to others."""
+    rebuild = session.info.pop(_FLUSHED_CHANGES_KEY, None)
+    if rebuild:
+        clear_merchant_match_index()
+    elif rebuild is not None:
+        _expire_merchant_match_index()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_index_on_rollback(session: Session, previous_transaction: Any) -> None:
+    """Drop an index that may have been rebuilt from merchant changes that were rolled back."""
+    if session.info.pop(_FLUSHED_CHANGES_KEY, None) is not None:
+        clear_merchant_match_index()
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm.attributes import get_history
 
 from app.extensions import db
 from app.models.base import BaseModel
+from app.utils.url_utils import extract_comparable_website_host
 
 if TYPE_CHECKING:
     from app.loyalty.models import MerchantRewardsLink
@@ -52,6 +56,7 @@ class Merchant(BaseModel):
         name: Name of the merchant/brand
         short_name: Optional short display name used in restaurant display names
         website: Optional merchant website URL
+        website_host: Comparable host of ``website`` (lowercase, no ``www.``), kept in sync on write
         category: Optional physical/operational format classification
         menu_focus: Optional primary menu/product focus classification
         cuisine: Optional cuisine classification aligned with restaurants
@@ -79,6 +84,12 @@ class Merchant(BaseModel):
         nullable=True,
         comment="Merchant website URL",
     )
+    website_host: Mapped[str | None] = mapped_column(
+        db.String(255),
+        nullable=True,
+        index=True,
+        comment="Comparable website host (lowercase, without www.) used for merchant matching",
+    )
     description: Mapped[str | None] = mapped_column(
         db.Text,
         nullable=True,
@@ -203,3 +214,16 @@ class Merchant(BaseModel):
 
     def __repr__(self) -> str:
         return f"<Merchant(id={self.id}, name='{self.name}')>"
+
+
+@event.listens_for(Merchant, "before_insert")
+def _set_website_host_on_insert(mapper: object, connection: Connection, target: Merchant) -> None:
+    """Derive the comparable website host inline in the INSERT."""
+    target.website_host = extract_comparable_website_host(target.website) or None
+
+
+@event.listens_for(Merchant, "before_update")
+def _set_website_host_on_update(mapper: object, connection: Connection, target: Merchant) -> None:
+    """Re-derive the comparable website host inline in the UPDATE when the website changed."""
+    if get_history(target, "website").has_changes():
+        target.website_host = extract_comparable_website_host(target.website) or None
@@ -17,6 +17,22 @@ from app.loyalty import services as loyalty_services
 from app.merchants import bp, services as merchant_services
 from app.merchants.forms import MerchantImportForm
 from app.restaurants.models import Restaurant
+from app.utils.export_utils import peek_rows, streaming_export_response, wants_streaming_export
+
+# Columns of the merchant CSV export
+MERCHANT_EXPORT_FIELDS = [
+    "name",
+    "short_name",
+    "website",
+    "description",
+    "category",
+    "service_level",
+    "cuisine",
+    "menu_focus",
+    "restaurant_count",
+    "created_at",
+    "updated_at",
+]
 
 
 def _check_merchant_access() -> bool:
@@ -505,7 +521,7 @@ def _parse_export_ids(raw_ids: list[str]) -> list[int]:
 @bp.route("/export")
 @login_required
 def export_merchants() -> Response:
-    """Export merchants as CSV or JSON."""
+    """Export merchants as CSV or JSON, streamed with ``stream=true`` or ``format=ndjson``."""
     if not _check_merchant_access():
         flash("Merchants is an advanced feature", "warning")
         return redirect(url_for("restaurants.list_restaurants", tab="restaurants"))  # type: ignore[return-value]
@@ -572,6 +588,15 @@ def export_merchants() -> Response:
         flash("No valid merchants selected for export", "warning")
         return redirect(url_for("merchants.list_merchants"))  # type: ignore[return-value]
 
+    if wants_streaming_export(format_type):
+        rows = peek_rows(
+            merchant_services.iter_merchants_for_export(current_user.id, merchant_ids if raw_ids else None)
+        )
+        if rows is None:
+            flash("No merchants found to export", "warning")
+            return redirect(url_for("merchants.list_merchants"))  # type: ignore[return-value]
+        return streaming_export_response(rows, format_type, "merchants", MERCHANT_EXPORT_FIELDS)
+
     merchants = merchant_services.export_merchants_for_user(current_user.id, merchant_ids if raw_ids else None)
     if not merchants:
         flash("No merchants found to export", "warning")
@@ -584,20 +609,9 @@ def export_merchants() -> Response:
         return response
 
     output = io.StringIO()
-    fieldnames = [
-        "name",
-        "short_name",
-        "website",
-        "description",
-        "category",
-        "service_level",
-        "cuisine",
-        "menu_focus",
-        "restaurant_count",
-        "created_at",
-        "updated_at",
-    ]
-    writer = csv.DictWriter(output, fieldnames=fieldnames, quoting=csv.QUOTE_NONNUMERIC, extrasaction="ignore")
+    writer = csv.DictWriter(
+        output, fieldnames=MERCHANT_EXPORT_FIELDS, quoting=csv.QUOTE_NONNUMERIC, extrasaction="ignore"
+    )
     writer.writeheader()
     writer.writerows(merchants)
 
@@ -1,5 +1,6 @@
 """Service layer for merchant-related operations."""
 
+from collections.abc import Iterator
 import csv
 from decimal import Decimal
 import json
@@ -13,8 +14,10 @@ from werkzeug.datastructures import FileStorage
 from app.constants.cuisines import get_cuisine_names
 from app.expenses.models import Expense
 from app.extensions import db
+from app.merchants.match_index import get_merchant_match_index, normalize_for_name_match
 from app.merchants.models import Merchant
 from app.restaurants.models import Restaurant
+from app.utils.export_utils import EXPORT_YIELD_PER
 from app.utils.url_utils import (
     canonicalize_website_for_storage,
     extract_base_website_url,
@@ -585,22 +588,24 @@ def get_merchants_with_detailed_stats(
 
     if user_id is not None:
         join_restaurant: ColumnElement[bool] = (Merchant.id == Restaurant.merchant_id) & (Restaurant.user_id == user_id)
-        join_expense: ColumnElement[bool] = (Restaurant.id == Expense.restaurant_id) & (Expense.user_id == user_id)
     else:
         join_restaurant = Merchant.id == Restaurant.merchant_id
-        join_expense = Restaurant.id == Expense.restaurant_id
 
+    # Expense figures come from the restaurants' stored statistics (see app.restaurants.stats),
+    # so no expense rows are joined
+    expense_count_expr = func.coalesce(func.sum(Restaurant.visit_count), 0)
+    total_amount_expr = func.coalesce(func.sum(Restaurant.total_spent), Decimal("0"))
+    last_expense_expr = func.max(Restaurant.last_visit)
     stmt = (
         select(
             Merchant,
             func.count(distinct(Restaurant.id)).label("restaurant_count"),
-            func.count(Expense.id).label("expense_count"),
-            func.coalesce(func.sum(Expense.amount), Decimal("0")).label("total_amount"),
-            func.max(Expense.date).label("last_expense_date"),
+            expense_count_expr.label("expense_count"),
+            total_amount_expr.label("total_amount"),
+            last_expense_expr.label("last_expense_date"),
         )
         .select_from(Merchant)
         .outerjoin(Restaurant, join_restaurant)
-        .outerjoin(Expense, join_expense)
         .group_by(Merchant.id)
     )
 
@@ -653,9 +658,9 @@ def get_merchants_with_detailed_stats(
     sort_mapping = {
         "name": Merchant.name,
         "restaurants": func.count(distinct(Restaurant.id)),
-        "expenses": func.count(Expense.id),
-        "spend": func.coalesce(func.sum(Expense.amount), Decimal("0")),
-        "last_activity": func.max(Expense.date),
+        "expenses": expense_count_expr,
+        "spend": total_amount_expr,
+        "last_activity": last_expense_expr,
     }
     sort_column = sort_mapping.get(sort_by, Merchant.name)
     stmt = stmt.order_by(sort_column.desc() if is_desc else sort_column.asc(), Merchant.name.asc())
@@ -950,14 +955,6 @@ def find_conflicting_merchant(
     return None
 
 
-def _normalize_for_name_match(value: str | None) -> str:
-    """Normalize names for resilient brand matching."""
-    if not value:
-        return ""
-    normalized = re.sub(r"[^a-z0-9]+", " ", value.lower()).strip()
-    return re.sub(r"\s+", " ", normalized)
-
-
 def find_merchant_for_restaurant_name(restaurant_name: str) -> Merchant | None:
     """Find best merchant match from a restaurant name.
 
@@ -965,62 +962,20 @@ def find_merchant_for_restaurant_name(restaurant_name: str) -> Merchant | None:
     - Compare against merchant short_name and full name
     - Accept exact match or prefix match with common separators
     - Prefer short_name matches, then longer/more specific match text
-    """
-    normalized_restaurant_name = _normalize_for_name_match(restaurant_name)
-    if not normalized_restaurant_name:
-        return None
-
-    merchants = db.session.execute(select(Merchant)).scalars().all()
-    candidates: list[tuple[int, int, int, Merchant]] = []
-    # tuple fields:
-    # 0: match type rank (0=short_name exact/prefix, 1=name exact/prefix)
-    # 1: exact match rank (0=exact, 1=prefix)
-    # 2: negative length for longest-first sorting
-    # 3: merchant
-
-    for merchant in merchants:
-        for is_short_name, raw_value in ((True, merchant.short_name), (False, merchant.name)):
-            value = _normalize_for_name_match(raw_value)
-            if not value:
-                continue
-
-            is_exact = normalized_restaurant_name == value
-            is_prefix = normalized_restaurant_name.startswith(f"{value} ")
-            if not (is_exact or is_prefix):
-                continue
-
-            candidates.append(
-                (
-                    0 if is_short_name else 1,
-                    0 if is_exact else 1,
-                    -len(value),
-                    merchant,
-                )
-            )
 
-    if not candidates:
-        return None
-
-    candidates.sort(key=lambda item: (item[0], item[1], item[2]))
-    best = candidates[0][3]
-    # Avoid ambiguous association when top-ranked matches tie on score but point to different merchants.
-    best_score = candidates[0][:3]
-    tied_merchants = {candidate[3].id for candidate in candidates if candidate[:3] == best_score}
-    if len(tied_merchants) > 1:
-        return None
-    return best
+    Lookups go through the in-memory ``MerchantMatchIndex``.
+    """
+    merchant_id = get_merchant_match_index().match_name(restaurant_name)
+    return get_merchant(merchant_id) if merchant_id is not None else None
 
 
 def find_merchant_for_website(website: str | None) -> Merchant | None:
-    """Find merchant by normalized website host."""
+    """Find merchant by normalized website host (indexed ``Merchant.website_host``)."""
     comparable_host = extract_comparable_website_host(website)
     if not comparable_host:
         return None
 
-    merchants = db.session.execute(select(Merchant)).scalars().all()
-    matches = [
-        merchant for merchant in merchants if extract_comparable_website_host(merchant.website) == comparable_host
-    ]
+    matches = db.session.scalars(select(Merchant).where(Merchant.website_host == comparable_host).limit(2)).all()
     if len(matches) != 1:
         return None
     return matches[0]
@@ -1036,12 +991,12 @@ def find_merchant_for_restaurant(*, restaurant_name: str, website: str | None =
 
 def _restaurant_matches_merchant(restaurant_name: str, merchant: Merchant) -> bool:
     """Check whether a restaurant name matches a merchant name/short_name rule."""
-    normalized_restaurant_name = _normalize_for_name_match(restaurant_name)
+    normalized_restaurant_name = normalize_for_name_match(restaurant_name)
     if not normalized_restaurant_name:
         return False
 
     for raw_value in (merchant.short_name, merchant.name):
-        normalized_merchant_value = _normalize_for_name_match(raw_value)
+        normalized_merchant_value = normalize_for_name_match(raw_value)
         if not normalized_merchant_value:
             continue
         if normalized_restaurant_name == normalized_merchant_value:
@@ -1249,18 +1204,18 @@ def delete_merchant(merchant_id: int) -> bool:
     return True
 
 
-def export_merchants_for_user(user_id: int, merchant_ids: list[int] | None = None) -> list[dict[str, Any]]:
-    """Get merchants for export with per-user restaurant counts.
+def iter_merchants_for_export(user_id: int, merchant_ids: list[int] | None = None) -> Iterator[dict[str, Any]]:
+    """Stream merchant export rows with per-user restaurant counts, reading them in batches.
 
     Args:
         user_id: Current user ID used for restaurant count scoping
         merchant_ids: Optional list of merchant IDs to export
 
-    Returns:
-        List of merchant export rows
+    Yields:
+        One merchant export row per merchant, ordered by name
     """
     if merchant_ids is not None and not merchant_ids:
-        return []
+        return
 
     stmt = (
         select(
@@ -1269,15 +1224,15 @@ def export_merchants_for_user(user_id: int, merchant_ids: list[int] | None = Non
         )
         .outerjoin(Restaurant, (Merchant.id == Restaurant.merchant_id) & (Restaurant.user_id == user_id))
         .group_by(Merchant.id)
-        .order_by(Merchant.name.asc())
+        .order_by(Merchant.name.asc(), Merchant.id.asc())
+        .execution_options(yield_per=EXPORT_YIELD_PER)
     )
 
     if merchant_ids:
         stmt = stmt.where(Merchant.id.in_(merchant_ids))
 
-    results = db.session.execute(stmt).all()
-    return [
-        {
+    for merchant, restaurant_count in db.session.execute(stmt):
+        yield {
             "name": merchant.name or "",
             "short_name": merchant.short_name or "",
             "website": merchant.website or "",
@@ -1291,8 +1246,19 @@ def export_merchants_for_user(user_id: int, merchant_ids: list[int] | None = Non
             "created_at": merchant.created_at.isoformat() if merchant.created_at else "",
             "updated_at": merchant.updated_at.isoformat() if merchant.updated_at else "",
         }
-        for merchant, restaurant_count in results
-    ]
+
+
+def export_merchants_for_user(user_id: int, merchant_ids: list[int] | None = None) -> list[dict[str, Any]]:
+    """Get merchants for export with per-user restaurant counts.
+
+    Args:
+        user_id: Current user ID used for restaurant count scoping
+        merchant_ids: Optional list of merchant IDs to export
+
+    Returns:
+        List of merchant export rows
+    """
+    return list(iter_merchants_for_export(user_id, merchant_ids))
 
 
 def _coerce_import_bool(value: Any) -> bool:
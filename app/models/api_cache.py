@@ -13,9 +13,9 @@ Following TIGER principles:
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional, cast
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, delete, insert, select, update
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.extensions import db
@@ -60,20 +60,53 @@ class APICache(BaseModel):
         return result
 
     @classmethod
-    def clear_expired(cls, ttl_seconds: int) -> int:
-        """Clear expired cache entries."""
+    def upsert(cls, key: str, data: str) -> None:
+        """Insert or replace a cache entry, refreshing its ``updated_at``.
+
+        Runs on its own connection and transaction, so it never commits or rolls back the
+        caller's session.
+        """
         import time
 
-        cutoff_time = time.time() - ttl_seconds
-        stmt = select(cls).where(cls.updated_at < cutoff_time)
-        expired_entries = list(db.session.scalars(stmt).all())
+        current_time = time.time()
+        with db.engine.begin() as connection:
+            result = connection.execute(update(cls).where(cls.key == key).values(data=data, updated_at=current_time))
+            if result.rowcount == 0:
+                connection.execute(
+                    insert(cls).values(key=key, data=data, created_at=current_time, updated_at=current_time)
+                )
 
-        count = len(expired_entries)
-        for entry in expired_entries:
-            db.session.delete(entry)
+    @classmethod
+    def clear_expired(cls, ttl_seconds: int, key_prefix: str | None = None, batch_size: int = 1000) -> int:
+        """Clear expired cache entries.
 
-        db.session.commit()
-        return count
+        Deletes in batches of ``batch_size`` rows, each one DELETE committed on its own, so large
+        purges neither load the rows nor hold locks for long.
+
+        Args:
+            ttl_seconds: Age after which an entry is expired
+            key_prefix: Only clear entries whose key starts with this prefix
+            batch_size: Rows deleted per statement
+
+        Returns:
+            Number of entries cleared
+        """
+        import time
+
+        cutoff_time = time.time() - ttl_seconds
+        expired_ids = select(cls.id).where(cls.updated_at < cutoff_time)
+        if key_prefix:
+            expired_ids = expired_ids.where(cls.key.startswith(key_prefix, autoescape=True))
+
+        count = 0
+        while True:
+            stmt = delete(cls).where(cls.id.in_(expired_ids.limit(batch_size).scalar_subquery()))
+            result = cast(CursorResult[Any], db.session.execute(stmt.execution_options(synchronize_session=False)))
+            db.session.commit()
+            deleted = result.rowcount
+            count += deleted
+            if deleted < batch_size:
+                return count
 
     @classmethod
     def clear_all(cls) -> int:
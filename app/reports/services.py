@@ -0,0 +1,220 @@
+"""Service layer for report aggregations.
+
+Every helper runs a GROUP BY over the user's daily expense rollups (see
+``app.expenses.rollup``) in the reporting window and returns only the aggregated rows, so
+report pages read a few rows per day instead of the individual expenses. Windows start on a
+local day of the user.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from sqlalchemy import Select, and_, case, extract, func, select
+from sqlalchemy.orm import joinedload
+
+from app.expenses.models import Category, Expense, ExpenseDailyRollup
+from app.extensions import db
+from app.restaurants.models import Restaurant
+
+UNCATEGORIZED_LABEL = "Uncategorized"
+UNKNOWN_MEAL_TYPE_LABEL = "Unknown"
+
+
+class GroupTotal(NamedTuple):
+    """Expense count and total for one group (category, restaurant, meal type)."""
+
+    name: str
+    expense_count: int
+    total: Decimal
+
+
+def _window_filter(stmt: Select, user_id: int, start_date: datetime | None) -> Select:
+    """Restrict a rollup statement to the user's days on or after ``start_date``."""
+    stmt = stmt.where(ExpenseDailyRollup.user_id == user_id)
+    if start_date:
+        stmt = stmt.where(ExpenseDailyRollup.day >= start_date.date())
+    return stmt
+
+
+def _expense_count() -> Any:
+    """Number of expenses across the grouped rollup rows."""
+    return func.coalesce(func.sum(ExpenseDailyRollup.expense_count), 0)
+
+
+def _expense_total() -> Any:
+    """Amount total across the grouped rollup rows."""
+    return func.coalesce(func.sum(ExpenseDailyRollup.total_amount), 0)
+
+
+def _group_totals(stmt: Select) -> list[GroupTotal]:
+    """Execute a ``(name, count, total)`` statement into group totals."""
+    return [
+        GroupTotal(name=name, expense_count=int(count), total=Decimal(str(total or 0)))
+        for name, count, total in db.session.execute(stmt).all()
+    ]
+
+
+def get_expense_summary(user_id: int, start_date: datetime | None = None) -> tuple[int, Decimal]:
+    """Get the expense count and total amount for a reporting window.
+
+    Args:
+        user_id: ID of the user
+        start_date: Optional start of the window
+
+    Returns:
+        Tuple of (expense_count, total_amount)
+    """
+    stmt = _window_filter(select(_expense_count(), _expense_total()), user_id, start_date)
+    count, total = db.session.execute(stmt).one()
+    return int(count), Decimal(str(total))
+
+
+def get_category_totals(user_id: int, start_date: datetime | None = None) -> list[GroupTotal]:
+    """Get expense count and total per category, largest total first.
+
+    Args:
+        user_id: ID of the user
+        start_date: Optional start of the window
+
+    Returns:
+        Totals per category name; expenses without a category are grouped as "Uncategorized"
+    """
+    name = func.coalesce(Category.name, UNCATEGORIZED_LABEL)
+    total = _expense_total()
+    stmt = _window_filter(
+        select(name, _expense_count(), total)
+        .select_from(ExpenseDailyRollup)
+        .outerjoin(Category, ExpenseDailyRollup.category_id == Category.id),
+        user_id,
+        start_date,
+    )
+    return _group_totals(stmt.group_by(name).order_by(total.desc(), name))
+
+
+def get_restaurant_totals(
+    user_id: int, start_date: datetime | None = None, order_by: str = "total", limit: int | None = None
+) -> list[GroupTotal]:
+    """Get expense count and total per restaurant name.
+
+    Args:
+        user_id: ID of the user
+        start_date: Optional start of the window
+        order_by: ``"total"`` or ``"count"`` (descending)
+        limit: Optional maximum number of restaurants to return
+
+    Returns:
+        Totals per restaurant name; expenses without a restaurant are skipped
+    """
+    count = _expense_count()
+    total = _expense_total()
+    stmt = _window_filter(
+        select(Restaurant.name, count, total)
+        .select_from(ExpenseDailyRollup)
+        .join(Restaurant, ExpenseDailyRollup.restaurant_id == Restaurant.id),
+        user_id,
+        start_date,
+    )
+    primary = count if order_by == "count" else total
+    stmt = stmt.group_by(Restaurant.name).order_by(primary.desc(), Restaurant.name)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return _group_totals(stmt)
+
+
+def get_meal_type_totals(user_id: int, start_date: datetime | None = None) -> list[GroupTotal]:
+    """Get expense count and total per meal type, largest total first.
+
+    Args:
+        user_id: ID of the user
+        start_date: Optional start of the window
+
+    Returns:
+        Totals per meal type; expenses without one are grouped as "Unknown"
+    """
+    meal_type = func.coalesce(func.nullif(ExpenseDailyRollup.meal_type, ""), UNKNOWN_MEAL_TYPE_LABEL)
+    total = _expense_total()
+    stmt = _window_filter(select(meal_type, _expense_count(), total), user_id, start_date)
+    return _group_totals(stmt.group_by(meal_type).order_by(total.desc(), meal_type))
+
+
+def get_monthly_totals(user_id: int, start_date: datetime | None = None) -> dict[str, Decimal]:
+    """Get the expense total per calendar month.
+
+    Args:
+        user_id: ID of the user
+        start_date: Optional start of the window
+
+    Returns:
+        Dict of ``"YYYY-MM"`` to total amount, in month order
+    """
+    year = extract("year", ExpenseDailyRollup.day)
+    month = extract("month", ExpenseDailyRollup.day)
+    stmt = _window_filter(select(year, month, _expense_total()), user_id, start_date)
+    rows = db.session.execute(stmt.group_by(year, month).order_by(year, month)).all()
+    return {f"{int(y):04d}-{int(m):02d}": Decimal(str(total or 0)) for y, m, total in rows}
+
+
+def get_rolling_month_totals(
+    user_id: int, start_date: datetime | None = None, months: int = 6, now: datetime | None = None
+) -> dict[str, float]:
+    """Get totals for consecutive 30-day buckets starting at the first of this month.
+
+    All buckets are summed in a single query with conditional aggregates.
+
+    Args:
+        user_id: ID of the user
+        start_date: Optional start of the window
+        months: Number of buckets, newest first
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Dict of ``"YYYY-MM"`` (bucket start) to total amount
+    """
+    month_start = (now or datetime.now()).replace(day=1).date()
+    buckets = [month_start - timedelta(days=30 * i) for i in range(months)]
+    day = ExpenseDailyRollup.day
+    sums = [
+        func.coalesce(
+            func.sum(
+                case(
+                    (
+                        and_(day >= bucket, day <= bucket + timedelta(days=30)),
+                        ExpenseDailyRollup.total_amount,
+                    ),
+                    else_=0,
+                )
+            ),
+            0,
+        )
+        for bucket in buckets
+    ]
+    row = db.session.execute(_window_filter(select(*sums), user_id, start_date)).one()
+    return {bucket.strftime("%Y-%m"): float(total) for bucket, total in zip(buckets, row, strict=True)}
+
+
+def get_top_expenses(user_id: int, start_date: datetime | None = None, limit: int = 10) -> list[Expense]:
+    """Get the largest expenses in the window with their category loaded.
+
+    Args:
+        user_id: ID of the user
+        start_date: Optional start of the window
+        limit: Maximum number of expenses
+
+    Returns:
+        Expenses ordered by amount, largest first
+    """
+    stmt = select(Expense).options(joinedload(Expense.category)).where(Expense.user_id == user_id)
+    if start_date:
+        stmt = stmt.where(Expense.date >= start_date.date())
+    return list(db.session.scalars(stmt.order_by(Expense.amount.desc(), Expense.id.desc()).limit(limit)).all())
+
+
+def count_restaurants(user_id: int) -> int:
+    """Count the restaurants a user has added."""
+    return int(db.session.scalar(select(func.count(Restaurant.id)).where(Restaurant.user_id == user_id)) or 0)
+
+
+def group_totals_to_dict(totals: list[GroupTotal]) -> dict[str, dict[str, Any]]:
+    """Convert group totals to the ``{name: {"count", "total"}}`` shape used by templates."""
+    return {group.name: {"count": group.expense_count, "total": group.total} for group in totals}
@@ -42,4 +42,4 @@ def nl2br_filter(s: str) -> str:
 
 
 # Import routes after blueprint creation to avoid circular imports
-from . import routes, services  # noqa: E402
+from . import routes, services, stats  # noqa: E402
@@ -2,24 +2,43 @@
 
 from __future__ import annotations
 
-import math
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+import hashlib
+import json
+import threading
+import time
 from typing import Any, Callable, Optional, cast
 
 import click
 from flask import Flask, current_app
 from flask.cli import with_appcontext
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.auth.models import User
 from app.extensions import db
-from app.restaurants.models import Restaurant
+from app.restaurants.models import Restaurant, RestaurantValidationCheckpoint
 from app.utils.address_utils import (
     compare_addresses_semantic,
     normalize_country_to_iso2,
     normalize_state_to_usps,
 )
+from app.utils.geo_utils import calculate_distances_km, nearest_indexes
 from app.utils.phone_utils import normalize_phone_for_comparison
 from app.utils.url_utils import normalize_website_for_comparison
 
+# Google place detail requests per second during concurrent validation
+DEFAULT_VALIDATION_RATE_LIMIT = 10.0
+# Restaurants whose place details are fetched ahead, per validation worker
+PREFETCH_WINDOW_PER_WORKER = 4
+# Age after which --resume validates a restaurant again
+DEFAULT_VALIDATION_STALE_DAYS = 30
+# Restaurant IDs per checkpoint lookup query
+CHECKPOINT_LOOKUP_BATCH_SIZE = 500
+
 
 @click.group("restaurant", context_settings={"help_option_names": ["-h", "--help"]})
 def restaurant_cli() -> None:
@@ -34,6 +53,8 @@ def register_commands(app: Flask) -> None:
     # Add commands to the restaurant group
     restaurant_cli.add_command(list_restaurants)
     restaurant_cli.add_command(validate_restaurants)
+    restaurant_cli.add_command(recalculate_stats)
+    restaurant_cli.add_command(places_cache_command)
 
 
 def _search_google_places_by_name_and_address(name: str, address: str | None = None) -> list[dict]:
@@ -99,28 +120,34 @@ def _find_google_place_match(restaurant: Restaurant) -> tuple[str | None, list[d
     return None, places
 
 
-def _calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two coordinates using Haversine formula.
+def _score_match_address(match: dict, restaurant_city: str, restaurant_state: str) -> int:
+    """Score how well a Google Places match's address agrees with the restaurant's city and state."""
+    match_address = match.get("formattedAddress", "").lower()
+    score = 0
 
-    Args:
-        lat1, lon1: First coordinate (latitude, longitude)
-        lat2, lon2: Second coordinate (latitude, longitude)
+    # Check for city match
+    if restaurant_city.lower() in match_address:
+        score += 2
 
-    Returns:
-        Distance in miles
-    """
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    # Check for state match
+    if restaurant_state.lower() in match_address:
+        score += 1
 
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
+    # Check for exact city, state combination
+    city_state_combo = f"{restaurant_city.lower()}, {restaurant_state.lower()}"
+    if city_state_combo in match_address:
+        score += 3
 
-    # Earth's radius in miles
-    earth_radius_miles = 3959
-    return earth_radius_miles * c
+    return score
+
+
+def _match_coordinates(match: dict) -> tuple[float, float] | None:
+    """Get the (latitude, longitude) of a Google Places match, if it has one."""
+    location = match.get("location") or {}
+    try:
+        return float(location["latitude"]), float(location["longitude"])
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
 def _find_closest_match(restaurant: Restaurant, matches: list[dict]) -> dict | None:
@@ -141,32 +168,20 @@ def _find_closest_match(restaurant: Restaurant, matches: list[dict]) -> dict | N
         return matches[0]
 
     # Score matches based on address similarity
-    best_match = None
-    best_score = -1
-
-    for match in matches:
-        match_address = match.get("formattedAddress", "").lower()
-        score = 0
-
-        # Check for city match
-        if restaurant_city.lower() in match_address:
-            score += 2
-
-        # Check for state match
-        if restaurant_state.lower() in match_address:
-            score += 1
-
-        # Check for exact city, state combination
-        city_state_combo = f"{restaurant_city.lower()}, {restaurant_state.lower()}"
-        if city_state_combo in match_address:
-            score += 3
-
-        if score > best_score:
-            best_score = score
-            best_match = match
+    scores = [_score_match_address(match, restaurant_city, restaurant_state) for match in matches]
+    best_score = max(scores)
+    best_matches = [match for match, score in zip(matches, scores, strict=True) if score == best_score]
+
+    # Break ties by distance from the restaurant's coordinates
+    if len(best_matches) > 1 and restaurant.latitude is not None and restaurant.longitude is not None:
+        located = [(match, coordinates) for match in best_matches if (coordinates := _match_coordinates(match))]
+        if located:
+            distances = calculate_distances_km(
+                restaurant.latitude, restaurant.longitude, [coordinates for _, coordinates in located]
+            )
+            return located[nearest_indexes(distances, 1)[0]][0]
 
-    # Return best match or first match if no scoring worked
-    return best_match if best_match else matches[0]
+    return best_matches[0]
 
 
 def _get_restaurants_without_google_id(
@@ -282,11 +297,32 @@ def _validation_requests_enterprise_fields(sections: frozenset[str] | None) -> b
     return "phone" in sections or "price_level" in sections
 
 
-def _validate_restaurant_with_google(restaurant: Restaurant, sections: frozenset[str] | None = None) -> dict:
+def _validation_field_mask(places_service: Any, restaurant: Restaurant, sections: frozenset[str] | None) -> str:
+    """Get the place details field mask used to validate a restaurant."""
+    requested_enterprise = _validation_requests_enterprise_fields(sections)
+    owner_has_advanced_features = bool(getattr(restaurant.user, "has_advanced_features", False))
+    return cast(
+        str,
+        places_service.get_place_details_field_mask(
+            use_case="cli_validation",
+            include_enterprise=requested_enterprise,
+            user_has_advanced_features=owner_has_advanced_features,
+        ),
+    )
+
+
+def _validate_restaurant_with_google(
+    restaurant: Restaurant,
+    sections: frozenset[str] | None = None,
+    place_data_loader: Callable[[], dict | None] | None = None,
+) -> dict:
     """Validate restaurant information using new Google Places API service.
 
     Args:
         restaurant: Restaurant instance to validate
+        sections: Validation sections; decide whether Enterprise fields are requested
+        place_data_loader: Returns place details fetched ahead of time (see
+            ``_iter_with_prefetched_place_details``); fetched here when not given
 
     Returns:
         Dictionary with validation results
@@ -305,14 +341,12 @@ def _validate_restaurant_with_google(restaurant: Restaurant, sections: frozenset
                     }
                 raise
 
-            requested_enterprise = _validation_requests_enterprise_fields(sections)
             owner_has_advanced_features = bool(getattr(restaurant.user, "has_advanced_features", False))
-            field_mask = places_service.get_place_details_field_mask(
-                use_case="cli_validation",
-                include_enterprise=requested_enterprise,
-                user_has_advanced_features=owner_has_advanced_features,
-            )
-            place_data = places_service.get_place_details(restaurant.google_place_id, field_mask=field_mask)
+            field_mask = _validation_field_mask(places_service, restaurant, sections)
+            if place_data_loader is not None:
+                place_data = place_data_loader()
+            else:
+                place_data = places_service.get_place_details(restaurant.google_place_id, field_mask=field_mask)
 
             if not place_data:
                 return {
@@ -517,6 +551,65 @@ def list_restaurants(
         _display_summary(total_restaurants, restaurants_with_google_id)
 
 
+@click.command("recalculate-stats")
+@click.option("--user-id", type=int, help="Specific user ID to recalculate statistics for")
+@click.option("--username", type=str, help="Specific username to recalculate statistics for")
+@click.option("--all-users", is_flag=True, help="Recalculate statistics for all users")
+@with_appcontext
+def recalculate_stats(user_id: int | None, username: str | None, all_users: bool) -> None:
+    """Rebuild restaurant statistics from scratch (repair command).
+
+    Expense writes keep visit counts, totals, last visit and average price per person
+    up to date incrementally; run this if they ever drift or after bulk data changes.
+
+    Examples:
+        flask restaurant recalculate-stats --user-id 1
+        flask restaurant recalculate-stats --all-users
+    """
+    from app.restaurants.services import recalculate_restaurant_statistics
+
+    if not any([user_id, username, all_users]):
+        click.echo("❌ Error: Must specify --user-id, --username, or --all-users")
+        return
+
+    users = _get_target_users(user_id, username, all_users)
+    for user in users:
+        recalculate_restaurant_statistics(user.id)
+        click.echo(f"✅ Recalculated restaurant statistics for {user.username}")
+
+
+@click.command("places-cache")
+@click.option("--clear-expired", is_flag=True, help="Delete cached Places responses past their maximum age")
+@with_appcontext
+def places_cache_command(clear_expired: bool) -> None:
+    """Show Google Places cache statistics and optionally purge expired entries.
+
+    L1 is this process's in-memory cache; L2 is the api_cache table shared by all processes.
+    Counters cover this process only.
+
+    Examples:
+        flask restaurant places-cache
+        flask restaurant places-cache --clear-expired
+    """
+    from app.services import places_cache
+
+    if clear_expired:
+        deleted = places_cache.clear_expired_places_cache()
+        click.echo(f"✅ Deleted {deleted} expired Places cache entries")
+
+    stats = places_cache.get_places_cache_stats()
+    l1, l2 = stats["l1"], stats["l2"]
+    click.echo(
+        f"L1: {l1['total_entries']} entries, {l1['total_bytes']} bytes, "
+        f"hit ratio {l1['hit_ratio']:.1%} ({l1['hits']} hits, {l1['misses']} misses, {l1['evictions']} evictions)"
+    )
+    click.echo(
+        f"L2: hit ratio {l2['hit_ratio']:.1%} ({l2['hits']} hits, {l2['stale_hits']} stale hits, "
+        f"{l2['misses']} misses, {l2['errors']} errors)"
+    )
+    click.echo(f"Overall hit ratio: {stats['overall_hit_ratio']:.1%}")
+
+
 def _get_restaurants_to_validate(
     user_id: int | None, username: str | None, all_users: bool, restaurant_id: int | None
 ) -> tuple[list[Restaurant], dict[str, int]]:
@@ -1405,9 +1498,46 @@ def _process_restaurant_validation_with_meta(
     quiet: bool = False,
     show_mismatches_only: bool = False,
     interactive: bool = False,
+    place_data_loader: Callable[[], dict | None] | None = None,
+    record_checkpoint: bool = False,
 ) -> tuple[str, bool, bool]:
-    """Process validation for a single restaurant and return status and fix success."""
-    validation_result = _validate_restaurant_with_google(restaurant, sections=validation_sections)
+    """Process validation for a single restaurant and return status and fix success.
+
+    With ``record_checkpoint``, the outcome is saved as the restaurant's validation checkpoint
+    (see ``--resume``) once any fixes have been applied.
+    """
+    validation_result = _validate_restaurant_with_google(
+        restaurant, sections=validation_sections, place_data_loader=place_data_loader
+    )
+
+    status, fixed, has_mismatch = _process_validation_result(
+        restaurant,
+        validation_result,
+        fix_mismatches,
+        dry_run,
+        validation_sections=validation_sections,
+        quiet=quiet,
+        show_mismatches_only=show_mismatches_only,
+        interactive=interactive,
+    )
+    if record_checkpoint:
+        _record_validation_checkpoint(
+            restaurant, validation_result, status, has_mismatch and not fixed, validation_sections
+        )
+    return status, fixed, has_mismatch
+
+
+def _process_validation_result(
+    restaurant: Restaurant,
+    validation_result: dict,
+    fix_mismatches: bool,
+    dry_run: bool,
+    validation_sections: frozenset[str] | None = None,
+    quiet: bool = False,
+    show_mismatches_only: bool = False,
+    interactive: bool = False,
+) -> tuple[str, bool, bool]:
+    """Report a validation result, fixing mismatches if requested; return status, fix success and mismatch."""
     valid = validation_result["valid"]
 
     if valid is True:
@@ -1493,6 +1623,161 @@ def _handle_service_level_updates(
         return 0, 0
 
 
+def _checkpoint_sections_key(validation_sections: frozenset[str] | None) -> str:
+    """Get the checkpoint representation of the validated sections; empty for all."""
+    return ",".join(sorted(validation_sections)) if validation_sections else ""
+
+
+def _fingerprint_google_data(validation_result: dict) -> str | None:
+    """Hash the Google data a restaurant was compared with."""
+    google_data = {key: value for key, value in validation_result.items() if key.startswith("google_")}
+    if not google_data:
+        return None
+    return hashlib.sha256(json.dumps(google_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _record_validation_checkpoint(
+    restaurant: Restaurant,
+    validation_result: dict,
+    status: str,
+    has_mismatches: bool,
+    validation_sections: frozenset[str] | None,
+) -> None:
+    """Save the outcome of validating a restaurant, committing it so an interrupted run keeps it."""
+    try:
+        checkpoint = db.session.scalar(
+            select(RestaurantValidationCheckpoint).where(RestaurantValidationCheckpoint.restaurant_id == restaurant.id)
+        )
+        if checkpoint is None:
+            checkpoint = RestaurantValidationCheckpoint(restaurant_id=restaurant.id)
+            db.session.add(checkpoint)
+        checkpoint.status = status
+        checkpoint.has_mismatches = has_mismatches
+        checkpoint.sections = _checkpoint_sections_key(validation_sections)
+        checkpoint.restaurant_fingerprint = RestaurantValidationCheckpoint.fingerprint_restaurant(restaurant)
+        checkpoint.google_fingerprint = _fingerprint_google_data(validation_result)
+        checkpoint.validated_at = datetime.now(UTC)
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        current_app.logger.warning(f"Could not save validation checkpoint of restaurant {restaurant.id}: {e}")
+
+
+def _filter_restaurants_to_resume(
+    restaurants: list[Restaurant],
+    validation_sections: frozenset[str] | None,
+    stale_after_days: int,
+    fix_mismatches: bool,
+) -> tuple[list[Restaurant], int]:
+    """Drop restaurants whose checkpoint shows they need no validation; return them and the skipped count.
+
+    A restaurant is skipped when it was validated successfully for the same sections within
+    ``stale_after_days`` and its validated fields have not changed since. Invalid and failed
+    validations are always retried, and so are unfixed mismatches when fixing.
+    """
+    sections_key = _checkpoint_sections_key(validation_sections)
+    cutoff = datetime.now(UTC) - timedelta(days=stale_after_days)
+    restaurant_ids = [restaurant.id for restaurant in restaurants]
+
+    checkpoints: dict[int, RestaurantValidationCheckpoint] = {}
+    for start in range(0, len(restaurant_ids), CHECKPOINT_LOOKUP_BATCH_SIZE):
+        batch_ids = restaurant_ids[start : start + CHECKPOINT_LOOKUP_BATCH_SIZE]
+        for checkpoint in db.session.scalars(
+            select(RestaurantValidationCheckpoint).where(RestaurantValidationCheckpoint.restaurant_id.in_(batch_ids))
+        ):
+            checkpoints[checkpoint.restaurant_id] = checkpoint
+
+    def is_up_to_date(restaurant: Restaurant) -> bool:
+        checkpoint = checkpoints.get(restaurant.id)
+        if checkpoint is None or checkpoint.status != "valid" or checkpoint.sections != sections_key:
+            return False
+        if fix_mismatches and checkpoint.has_mismatches:
+            return False
+        validated_at = checkpoint.validated_at
+        if validated_at.tzinfo is None:
+            # SQLite returns naive datetimes
+            validated_at = validated_at.replace(tzinfo=UTC)
+        if validated_at < cutoff:
+            return False
+        return checkpoint.restaurant_fingerprint == RestaurantValidationCheckpoint.fingerprint_restaurant(restaurant)
+
+    remaining = [restaurant for restaurant in restaurants if not is_up_to_date(restaurant)]
+    return remaining, len(restaurants) - len(remaining)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` acquisitions per second, in bursts of up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+def _iter_with_prefetched_place_details(
+    restaurants: list[Restaurant],
+    validation_sections: frozenset[str] | None,
+    concurrency: int,
+    rate_limit: float,
+) -> Iterator[tuple[Restaurant, Callable[[], dict | None] | None]]:
+    """Yield restaurants in order with loaders of their place details, fetched ahead by a thread pool.
+
+    Up to ``concurrency * PREFETCH_WINDOW_PER_WORKER`` restaurants are fetched ahead of the one
+    being yielded, and Google is called at most ``rate_limit`` times per second. Only the API calls
+    run in worker threads; database access (field masks, fixes) and output stay with the caller.
+    Restaurants without a Google Place ID get no loader.
+    """
+    from app.services.google_places_service import get_google_places_service
+
+    places_service = get_google_places_service()
+    app = current_app._get_current_object()
+    bucket = _TokenBucket(rate_limit)
+
+    def fetch(place_id: str, field_mask: str) -> dict | None:
+        bucket.acquire()
+        with app.app_context():
+            return cast(dict | None, places_service.get_place_details(place_id, field_mask=field_mask))
+
+    remaining = iter(restaurants)
+    pending: deque[tuple[Restaurant, Future | None]] = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="restaurant-validate")
+
+    def submit_next() -> None:
+        restaurant = next(remaining, None)
+        if restaurant is None:
+            return
+        future = None
+        if restaurant.google_place_id:
+            field_mask = _validation_field_mask(places_service, restaurant, validation_sections)
+            future = executor.submit(fetch, restaurant.google_place_id, field_mask)
+        pending.append((restaurant, future))
+
+    try:
+        for _ in range(concurrency * PREFETCH_WINDOW_PER_WORKER):
+            submit_next()
+        while pending:
+            restaurant, future = pending.popleft()
+            submit_next()
+            yield restaurant, future.result if future is not None else None
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def _run_validation_loop(
     restaurants_to_validate: list[Restaurant],
     fix_mismatches: bool,
@@ -1501,11 +1786,27 @@ def _run_validation_loop(
     quiet: bool,
     show_mismatches_only: bool,
     interactive: bool,
+    concurrency: int = 1,
+    rate_limit: float = DEFAULT_VALIDATION_RATE_LIMIT,
+    record_checkpoints: bool = False,
 ) -> tuple[int, int, int, int, int]:
-    """Run validation loop and return (valid_count, invalid_count, error_count, fixed_count, mismatch_count)."""
+    """Run validation loop and return (valid_count, invalid_count, error_count, fixed_count, mismatch_count).
+
+    With ``concurrency`` above 1, place details are prefetched by a thread pool; restaurants are
+    still processed (and reported) one by one in their original order. With ``record_checkpoints``,
+    each outcome is saved as it completes.
+    """
     valid_count = invalid_count = error_count = fixed_count = mismatch_count = 0
 
-    for restaurant in restaurants_to_validate:
+    restaurants_with_loaders: Iterable[tuple[Restaurant, Callable[[], dict | None] | None]]
+    if concurrency > 1:
+        restaurants_with_loaders = _iter_with_prefetched_place_details(
+            restaurants_to_validate, validation_sections, concurrency, rate_limit
+        )
+    else:
+        restaurants_with_loaders = ((restaurant, None) for restaurant in restaurants_to_validate)
+
+    for restaurant, place_data_loader in restaurants_with_loaders:
         status, fixed, has_mismatch = _process_restaurant_validation_with_meta(
             restaurant,
             fix_mismatches,
@@ -1514,6 +1815,8 @@ def _run_validation_loop(
             quiet=quiet,
             show_mismatches_only=show_mismatches_only,
             interactive=interactive,
+            place_data_loader=place_data_loader,
+            record_checkpoint=record_checkpoints,
         )
 
         if status == "valid":
@@ -1545,8 +1848,25 @@ def _handle_restaurant_validation(
     place_id_found_count: int = 0,
     place_id_warning_count: int = 0,
     place_id_error_count: int = 0,
+    concurrency: int = 1,
+    rate_limit: float = DEFAULT_VALIDATION_RATE_LIMIT,
+    resume: bool = False,
+    stale_after_days: int = DEFAULT_VALIDATION_STALE_DAYS,
 ) -> None:
-    """Handle restaurant validation with Google Places API."""
+    """Handle restaurant validation with Google Places API.
+
+    Outside of dry runs, every outcome is saved as a checkpoint; with ``resume``, restaurants
+    whose checkpoint is still current are skipped.
+    """
+    if resume and restaurants_to_validate:
+        restaurants_to_validate, skipped_count = _filter_restaurants_to_resume(
+            restaurants_to_validate, validation_sections, stale_after_days, fix_mismatches
+        )
+        click.echo(
+            f"⏭️  Resuming: skipped {skipped_count} restaurants validated in the last {stale_after_days} days, "
+            f"{len(restaurants_to_validate)} left to validate"
+        )
+
     if not restaurants_to_validate:
         click.echo("⚠️  No restaurants with Google Place IDs found to validate")
         _display_validation_summary(
@@ -1583,6 +1903,9 @@ def _handle_restaurant_validation(
         quiet,
         show_mismatches_only,
         interactive,
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+        record_checkpoints=not dry_run,
     )
 
     _display_validation_summary(
@@ -1915,6 +2238,33 @@ def _build_validation_sections(
 @click.option("--cuisine", is_flag=True, help="Only validate cuisine")
 @click.option("--phone", is_flag=True, help="Only validate phone")
 @click.option("--coordinates", is_flag=True, help="Only validate latitude/longitude")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Fetch Google place details with this many parallel requests",
+)
+@click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_VALIDATION_RATE_LIMIT,
+    show_default=True,
+    help="Maximum Google requests per second when --concurrency is above 1",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip restaurants validated successfully since --stale-after days that have not changed since",
+)
+@click.option(
+    "--stale-after",
+    "stale_after_days",
+    type=click.IntRange(min=0),
+    default=DEFAULT_VALIDATION_STALE_DAYS,
+    show_default=True,
+    help="With --resume, validate restaurants again once their last validation is this many days old",
+)
 @with_appcontext
 def validate_restaurants(
     user_id: int | None,
@@ -1941,6 +2291,10 @@ def validate_restaurants(
     basic: bool,
     advanced: bool,
     all_fields: bool,
+    concurrency: int,
+    rate_limit: float,
+    resume: bool,
+    stale_after_days: int,
 ) -> None:
     """Validate restaurant information using Google Places API.
 
@@ -1965,6 +2319,8 @@ def validate_restaurants(
         flask restaurant validate --mismatches --all-users
         flask restaurant validate -m -q --all-users
         flask restaurant validate -f -i --user-id 1
+        flask restaurant validate --all-users --concurrency 8 --rate-limit 20
+        flask restaurant validate --all-users --resume --stale-after 14
 
         # Basic validation only (no advanced fields)
         flask restaurant validate --username mtd37 --basic
@@ -1978,6 +2334,9 @@ def validate_restaurants(
         flask restaurant validate --username mtd37 --all-fields
         flask restaurant validate --username mtd37 --all-fields --fix-mismatches
     """
+    if rate_limit <= 0:
+        raise click.BadParameter("must be greater than 0", param_hint="'--rate-limit'")
+
     validation_sections = _build_validation_sections(
         address,
         type_section,
@@ -2028,4 +2387,8 @@ def validate_restaurants(
         place_id_found_count=place_id_found_count,
         place_id_warning_count=place_id_warning_count,
         place_id_error_count=place_id_error_count,
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+        resume=resume,
+        stale_after_days=stale_after_days,
     )
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
+from decimal import Decimal
+import hashlib
+import json
 import re
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from flask import current_app
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.extensions import db
@@ -54,6 +58,8 @@ class Restaurant(BaseModel):
             name="uix_restaurant_google_place_id_user",
             comment="Ensure unique Google Place ID per user (excludes NULL values)",
         ),
+        # Serves the bounding-box prefilter of location search
+        Index("ix_restaurant_user_lat_lon", "user_id", "latitude", "longitude"),
         {"comment": "Restaurants where expenses were incurred"},
     )
 
@@ -107,6 +113,28 @@ class Restaurant(BaseModel):
     longitude: Mapped[float | None] = mapped_column(db.Float, comment="Restaurant longitude coordinate")
     notes: Mapped[str | None] = mapped_column(db.Text, comment="Additional notes")
 
+    # Expense statistics (maintained by app.restaurants.stats on every expense write)
+    visit_count: Mapped[int] = mapped_column(
+        db.Integer, nullable=False, default=0, server_default="0", comment="Number of expenses at this restaurant"
+    )
+    total_spent: Mapped[Decimal] = mapped_column(
+        db.Numeric(12, 2, asdecimal=True),
+        nullable=False,
+        default=Decimal("0.00"),
+        server_default="0",
+        comment="Sum of expense amounts at this restaurant",
+    )
+    last_visit: Mapped[datetime | None] = mapped_column(
+        db.DateTime(timezone=True), nullable=True, comment="Date of the most recent expense at this restaurant"
+    )
+    avg_price_per_person: Mapped[Decimal] = mapped_column(
+        db.Numeric(10, 2, asdecimal=True),
+        nullable=False,
+        default=Decimal("0.00"),
+        server_default="0",
+        comment="Total spent divided by total party size (0 when no party sizes are recorded)",
+    )
+
     # Foreign Keys
     user_id: Mapped[int] = mapped_column(
         db.Integer,
@@ -139,6 +167,13 @@ class Restaurant(BaseModel):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+    validation_checkpoint: Mapped[RestaurantValidationCheckpoint | None] = relationship(
+        "RestaurantValidationCheckpoint",
+        back_populates="restaurant",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        uselist=False,
+    )
 
     @property
     def display_name(self) -> str:
@@ -635,3 +670,73 @@ class Restaurant(BaseModel):
 
     def __repr__(self) -> str:
         return f"<Restaurant {self.name}>"
+
+
+class RestaurantValidationCheckpoint(BaseModel):
+    """Outcome of the last Google validation of a restaurant.
+
+    Written by ``flask restaurant validate`` after each restaurant, so ``--resume`` can skip
+    restaurants whose last validation is recent and that have not changed since.
+
+    Attributes:
+        status: Validation status: valid, invalid or error
+        has_mismatches: Whether the restaurant differed from Google and was left unfixed
+        sections: Comma-separated validation sections checked, empty for all
+        restaurant_fingerprint: Hash of the validated restaurant fields, see ``fingerprint_restaurant``
+        google_fingerprint: Hash of the Google data the restaurant was compared with
+        validated_at: When the validation ran
+    """
+
+    __tablename__ = "restaurant_validation_checkpoint"  # type: ignore[assignment]
+    __table_args__ = ({"comment": "Last Google validation result per restaurant, for resumable validation runs"},)
+
+    # Fields compared with Google; a change to any of them invalidates the checkpoint
+    FINGERPRINT_FIELDS = (
+        "name",
+        "address_line_1",
+        "address_line_2",
+        "city",
+        "state",
+        "postal_code",
+        "country",
+        "phone",
+        "website",
+        "google_place_id",
+        "cuisine",
+        "service_level",
+        "price_level",
+        "primary_type",
+        "latitude",
+        "longitude",
+    )
+
+    restaurant_id: Mapped[int] = mapped_column(
+        ForeignKey("restaurant.id", ondelete="CASCADE"), nullable=False, unique=True, index=True
+    )
+    status: Mapped[str] = mapped_column(db.String(20), nullable=False, comment="valid, invalid or error")
+    has_mismatches: Mapped[bool] = mapped_column(
+        db.Boolean, nullable=False, default=False, comment="Mismatches with Google left unfixed"
+    )
+    sections: Mapped[str] = mapped_column(
+        db.String(255), nullable=False, default="", comment="Validation sections checked, empty for all"
+    )
+    restaurant_fingerprint: Mapped[str] = mapped_column(
+        db.String(64), nullable=False, comment="SHA-256 of the validated restaurant fields"
+    )
+    google_fingerprint: Mapped[str | None] = mapped_column(
+        db.String(64), nullable=True, comment="SHA-256 of the Google data compared"
+    )
+    validated_at: Mapped[datetime] = mapped_column(
+        db.DateTime(timezone=True), nullable=False, index=True, comment="When the validation ran"
+    )
+
+    restaurant: Mapped[Restaurant] = relationship("Restaurant", back_populates="validation_checkpoint")
+
+    @classmethod
+    def fingerprint_restaurant(cls, restaurant: Restaurant) -> str:
+        """Hash the restaurant fields that validation compares with Google."""
+        values = {field: getattr(restaurant, field, None) for field in cls.FINGERPRINT_FIELDS}
+        return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def __repr__(self) -> str:
+        return f"<RestaurantValidationCheckpoint restaurant={self.restaurant_id} {self.status}>"
@@ -63,6 +63,8 @@ from app.restaurants.services import (
 )
 from app.utils.address_utils import normalize_state_to_usps
 from app.utils.decorators import admin_required
+from app.utils.export_utils import peek_rows, streaming_export_response, wants_streaming_export
+from app.utils.geo_utils import MILES_PER_KM, calculate_distances_km
 
 # Constants
 DEFAULT_LIST_PAGE_SIZE = 25
@@ -534,18 +536,6 @@ def _perform_places_search(
     return places
 
 
-def _haversine_miles(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Calculate distance between two points in miles."""
-    import math
-
-    radius_miles = 3959.0
-    dlat = math.radians(lat2 - lat1)
-    dlng = math.radians(lng2 - lng1)
-    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlng / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return radius_miles * c
-
-
 def _filter_results_by_radius(
     results: list[dict[str, Any]],
     location: tuple[float, float] | None,
@@ -555,8 +545,8 @@ def _filter_results_by_radius(
     if not location or radius_miles is None:
         return results
 
-    center_lat, center_lng = location
-    filtered: list[dict[str, Any]] = []
+    located: list[dict[str, Any]] = []
+    points: list[tuple[float, float]] = []
     for result in results:
         lat = result.get("latitude")
         lng = result.get("longitude")
@@ -564,14 +554,16 @@ def _filter_results_by_radius(
             continue
 
         try:
-            distance = _haversine_miles(center_lat, center_lng, float(lat), float(lng))
+            points.append((float(lat), float(lng)))
         except (TypeError, ValueError):
             continue
+        located.append(result)
 
-        if distance <= radius_miles:
-            filtered.append(result)
-
-    return filtered
+    center_lat, center_lng = location
+    distances = calculate_distances_km(center_lat, center_lng, points)
+    return [
+        result for result, distance in zip(located, distances, strict=True) if distance * MILES_PER_KM <= radius_miles
+    ]
 
 
 def _format_search_response(results: list[dict[str, Any]], params: dict[str, Any]) -> Response:
@@ -1378,7 +1370,7 @@ def _parse_export_ids(raw_ids: list[str]) -> list[int]:
 @bp.route("/export")
 @login_required
 def export_restaurants() -> Response:
-    """Export restaurants as CSV or JSON."""
+    """Export restaurants as CSV or JSON, streamed with ``stream=true`` or ``format=ndjson``."""
     format_type = request.args.get("format", "csv").lower()
     is_sample = request.args.get("sample", "false").lower() == "true"
     raw_ids = request.args.getlist("ids")
@@ -1446,6 +1438,13 @@ def export_restaurants() -> Response:
         flash("No valid restaurants selected for export", "warning")
         return redirect(url_for("restaurants.list_restaurants"))  # type: ignore[return-value]
 
+    if wants_streaming_export(format_type):
+        rows = peek_rows(services.iter_restaurants_for_export(current_user.id, restaurant_ids if raw_ids else None))
+        if rows is None:
+            flash("No restaurants found to export", "warning")
+            return redirect(url_for("restaurants.list_restaurants"))  # type: ignore[return-value]
+        return streaming_export_response(rows, format_type, "restaurants")
+
     # Get the data from the service
     restaurants = services.export_restaurants_for_user(
         current_user.id,
@@ -2,7 +2,7 @@
 
 import csv
 import io
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from sqlalchemy import and_, case, func, not_, or_, select
 from sqlalchemy.exc import IntegrityError
@@ -19,7 +19,8 @@ from app.restaurants.exceptions import (
     DuplicateRestaurantError,
 )
 from app.restaurants.models import Restaurant
-from app.utils.geo_utils import calculate_distance_km, validate_coordinates
+from app.utils.export_utils import EXPORT_YIELD_PER
+from app.utils.geo_utils import bounding_box, calculate_distances_km, nearest_indexes, validate_coordinates
 from app.utils.phone_utils import normalize_phone_for_storage
 from app.utils.service_level_detector import ServiceLevel, ServiceLevelDetector
 from app.utils.url_utils import canonicalize_website_for_storage
@@ -93,50 +94,18 @@ def _normalize_google_place_id(value: Any) -> str | None:
 
 
 def recalculate_restaurant_statistics(user_id: int) -> None:
-    """Recalculate statistics for all restaurants belonging to a user.
+    """Recalculate stored statistics for all restaurants belonging to a user.
 
-    This function should be called whenever expenses are created, updated, or deleted
-    to ensure restaurant statistics are up to date.
+    Expense writes keep the statistics current for the restaurants they touch (see
+    ``app.restaurants.stats``); this full pass is the repair path behind
+    ``flask restaurant recalculate-stats``.
 
     Args:
         user_id: The ID of the user whose restaurant statistics should be recalculated
     """
-    # Get all restaurants for the user with their current statistics
-    stmt = (
-        select(
-            Restaurant,
-            func.count(Expense.id).label("visit_count"),
-            func.coalesce(func.sum(Expense.amount), 0).label("total_spent"),
-            func.max(Expense.date).label("last_visit"),
-            func.coalesce(
-                case(
-                    (
-                        func.sum(Expense.party_size).isnot(None) & (func.sum(Expense.party_size) > 0),
-                        func.sum(Expense.amount) / func.sum(Expense.party_size),
-                    ),
-                    else_=None,
-                ),
-                0,
-            ).label("avg_price_per_person"),
-        )
-        .outerjoin(
-            Expense,
-            (Expense.restaurant_id == Restaurant.id) & (Expense.user_id == user_id),
-        )
-        .where(Restaurant.user_id == user_id)
-        .group_by(Restaurant.id)
-    )
-
-    result = db.session.execute(stmt).all()
-
-    # Update each restaurant with new statistics
-    for row in result:
-        restaurant = row.Restaurant
-        restaurant.visit_count = row.visit_count
-        restaurant.total_spent = float(row.total_spent) if row.total_spent else 0.0
-        restaurant.last_visit = row.last_visit
-        restaurant.avg_price_per_person = float(row.avg_price_per_person) if row.avg_price_per_person else 0.0
+    from app.restaurants.stats import refresh_restaurant_statistics
 
+    refresh_restaurant_statistics(db.session.connection(), Restaurant.__table__.c.user_id == user_id)
     db.session.commit()
 
 
@@ -207,24 +176,8 @@ def get_restaurants_with_stats(user_id: int, args: dict[str, Any]) -> tuple[list
             func.max(Merchant.category).label("merchant_category"),
             func.max(Merchant.website).label("merchant_website"),
             func.max(Merchant.favicon_url).label("merchant_favicon_url"),
+            func.max(case((Merchant.is_chain.is_(True), 1), else_=0)).label("merchant_is_chain_flag"),
             func.max(case((_needs_location_name_expression(), 1), else_=0)).label("needs_location_name_flag"),
-            func.count(Expense.id).label("visit_count"),
-            func.coalesce(func.sum(Expense.amount), 0).label("total_spent"),
-            func.max(Expense.date).label("last_visit"),
-            func.coalesce(
-                case(
-                    (
-                        func.sum(Expense.party_size).isnot(None) & (func.sum(Expense.party_size) > 0),
-                        func.sum(Expense.amount) / func.sum(Expense.party_size),
-                    ),
-                    else_=None,
-                ),
-                0,
-            ).label("avg_price_per_person"),
-        )
-        .outerjoin(
-            Expense,
-            (Expense.restaurant_id == Restaurant.id) & (Expense.user_id == user_id),
         )
         .outerjoin(Merchant, Merchant.id == Restaurant.merchant_id)
         .where(Restaurant.user_id == user_id)
@@ -257,15 +210,17 @@ def get_restaurants_with_stats(user_id: int, args: dict[str, Any]) -> tuple[list
         restaurant["merchant_category"] = row.merchant_category
         restaurant["merchant_website"] = row.merchant_website
         restaurant["merchant_favicon_url"] = row.merchant_favicon_url
-        restaurant["merchant_is_chain"] = bool(restaurant_obj.merchant.is_chain) if restaurant_obj.merchant else False
+        restaurant["merchant_is_chain"] = bool(row.merchant_is_chain_flag)
         restaurant["needs_location_name_cta"] = bool(row.needs_location_name_flag)
-        # Add the aggregated fields
+        # Add the stored expense statistics
         restaurant.update(
             {
-                "visit_count": row.visit_count,
-                "total_spent": float(row.total_spent) if row.total_spent else 0.0,
-                "last_visit": row.last_visit,
-                "avg_price_per_person": (float(row.avg_price_per_person) if row.avg_price_per_person else 0.0),
+                "visit_count": restaurant_obj.visit_count,
+                "total_spent": float(restaurant_obj.total_spent) if restaurant_obj.total_spent else 0.0,
+                "last_visit": restaurant_obj.last_visit,
+                "avg_price_per_person": (
+                    float(restaurant_obj.avg_price_per_person) if restaurant_obj.avg_price_per_person else 0.0
+                ),
             }
         )
         restaurants.append(restaurant)
@@ -319,25 +274,9 @@ def get_restaurants_with_stats_paginated(
             func.max(Merchant.category).label("merchant_category"),
             func.max(Merchant.website).label("merchant_website"),
             func.max(Merchant.favicon_url).label("merchant_favicon_url"),
+            func.max(case((Merchant.is_chain.is_(True), 1), else_=0)).label("merchant_is_chain_flag"),
             func.max(Restaurant.merchant_id).label("merchant_id_for_stats"),
             func.max(case((_needs_location_name_expression(), 1), else_=0)).label("needs_location_name_flag"),
-            func.count(Expense.id).label("visit_count"),
-            func.coalesce(func.sum(Expense.amount), 0).label("total_spent"),
-            func.max(Expense.date).label("last_visit"),
-            func.coalesce(
-                case(
-                    (
-                        func.sum(Expense.party_size).isnot(None) & (func.sum(Expense.party_size) > 0),
-                        func.sum(Expense.amount) / func.sum(Expense.party_size),
-                    ),
-                    else_=None,
-                ),
-                0,
-            ).label("avg_price_per_person"),
-        )
-        .outerjoin(
-            Expense,
-            (Expense.restaurant_id == Restaurant.id) & (Expense.user_id == user_id),
         )
         .outerjoin(Merchant, Merchant.id == Restaurant.merchant_id)
         .where(Restaurant.user_id == user_id)
@@ -401,14 +340,16 @@ def get_restaurants_with_stats_paginated(
         restaurant["merchant_category"] = row.merchant_category
         restaurant["merchant_website"] = row.merchant_website
         restaurant["merchant_favicon_url"] = row.merchant_favicon_url
-        restaurant["merchant_is_chain"] = bool(restaurant_obj.merchant.is_chain) if restaurant_obj.merchant else False
+        restaurant["merchant_is_chain"] = bool(row.merchant_is_chain_flag)
         restaurant["needs_location_name_cta"] = bool(row.needs_location_name_flag)
         restaurant.update(
             {
-                "visit_count": row.visit_count,
-                "total_spent": float(row.total_spent) if row.total_spent else 0.0,
-                "last_visit": row.last_visit,
-                "avg_price_per_person": (float(row.avg_price_per_person) if row.avg_price_per_person else 0.0),
+                "visit_count": restaurant_obj.visit_count,
+                "total_spent": float(restaurant_obj.total_spent) if restaurant_obj.total_spent else 0.0,
+                "last_visit": restaurant_obj.last_visit,
+                "avg_price_per_person": (
+                    float(restaurant_obj.avg_price_per_person) if restaurant_obj.avg_price_per_person else 0.0
+                ),
             }
         )
         restaurants.append(restaurant)
@@ -510,21 +451,10 @@ def _get_sort_field(sort_by: str) -> Any | None:
         "city": Restaurant.city,
         "cuisine": Restaurant.cuisine,
         "rating": Restaurant.rating,
-        "visits": func.count(Expense.id),
-        "spent": func.coalesce(func.sum(Expense.amount), 0),
-        "last_visit": func.max(Expense.date),
-        "avg_price_per_person": func.coalesce(
-            func.avg(
-                case(
-                    (
-                        Expense.party_size.isnot(None) & (Expense.party_size > 1),
-                        Expense.amount / Expense.party_size,
-                    ),
-                    else_=None,
-                )
-            ),
-            0,
-        ),
+        "visits": Restaurant.visit_count,
+        "spent": Restaurant.total_spent,
+        "last_visit": Restaurant.last_visit,
+        "avg_price_per_person": Restaurant.avg_price_per_person,
         "created_at": Restaurant.created_at,
     }
     return sort_mapping.get(sort_by)
@@ -546,7 +476,8 @@ def apply_restaurant_sorting(stmt: Select, sort_by: str, sort_order: str) -> Sel
         return stmt
 
     is_desc = sort_order.lower() == "desc"
-    return stmt.order_by(sort_field.desc() if is_desc else sort_field.asc())
+    # Tie-break on id so offset pages are stable when sort values repeat
+    return stmt.order_by(sort_field.desc() if is_desc else sort_field.asc(), Restaurant.id)
 
 
 def get_unique_cuisines(user_id: int) -> list[str]:
@@ -1354,61 +1285,85 @@ def import_restaurants_from_csv(file: FileStorage, user_id: int) -> tuple[bool,
         return False, {"message": error_msg, "has_errors": True, "error_details": [error_msg]}
 
 
-def export_restaurants_for_user(
+def _export_float(value: Any) -> float | None:
+    """Safely convert value to float."""
+    try:
+        return float(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _restaurant_export_row(r: Restaurant) -> dict[str, Any]:
+    """Convert a restaurant into an export row."""
+    return {
+        "name": r.name or "",
+        "location_name": r.location_name or "",
+        "located_within": r.located_within or "",
+        "address": r.address or "",
+        "city": r.city or "",
+        "state": r.state or "",
+        "postal_code": r.postal_code or "",
+        "country": r.country or "",
+        "phone": r.phone or "",
+        "email": r.email or "",
+        "cuisine": r.cuisine or "",
+        "service_level": r.service_level or "",
+        "website": r.website or "",
+        "rating": _export_float(r.rating) if r.rating is not None else "",
+        "price_level": r.price_level if r.price_level is not None else "",
+        "primary_type": r.primary_type or "",
+        "latitude": _export_float(r.latitude) if r.latitude is not None else "",
+        "longitude": _export_float(r.longitude) if r.longitude is not None else "",
+        "google_place_id": r.google_place_id or "",
+        "notes": r.notes or "",
+        "created_at": r.created_at.isoformat() if r.created_at else "",
+        "updated_at": r.updated_at.isoformat() if r.updated_at else "",
+    }
+
+
+def iter_restaurants_for_export(
     user_id: int,
     restaurant_ids: list[int] | None = None,
-) -> list[dict[str, Any]]:
-    """Get all restaurants for a user in a format suitable for export.
+) -> Iterator[dict[str, Any]]:
+    """Stream a user's restaurants as export rows, reading them in batches.
 
     Args:
         user_id: The ID of the user whose restaurants to export
         restaurant_ids: Optional list of restaurant IDs to export
 
-    Returns:
-        A list of dictionaries containing restaurant data
+    Yields:
+        One dictionary of restaurant data per restaurant, ordered by name
     """
     if restaurant_ids is not None and not restaurant_ids:
-        return []
+        return
 
-    query = select(Restaurant).where(Restaurant.user_id == user_id).order_by(Restaurant.name)
+    query = (
+        select(Restaurant)
+        .where(Restaurant.user_id == user_id)
+        .order_by(Restaurant.name, Restaurant.id)
+        .execution_options(yield_per=EXPORT_YIELD_PER)
+    )
     if restaurant_ids:
         query = query.where(Restaurant.id.in_(restaurant_ids))
 
-    restaurants = db.session.scalars(query).all()
+    for restaurant in db.session.scalars(query):
+        yield _restaurant_export_row(restaurant)
 
-    def safe_float(value: Any) -> float | None:
-        try:
-            return float(value) if value is not None else None
-        except (ValueError, TypeError):
-            return None
 
-    return [
-        {
-            "name": r.name or "",
-            "location_name": r.location_name or "",
-            "located_within": r.located_within or "",
-            "address": r.address or "",
-            "city": r.city or "",
-            "state": r.state or "",
-            "postal_code": r.postal_code or "",
-            "country": r.country or "",
-            "phone": r.phone or "",
-            "email": r.email or "",
-            "cuisine": r.cuisine or "",
-            "service_level": r.service_level or "",
-            "website": r.website or "",
-            "rating": safe_float(r.rating) if r.rating is not None else "",
-            "price_level": r.price_level if r.price_level is not None else "",
-            "primary_type": r.primary_type or "",
-            "latitude": safe_float(r.latitude) if r.latitude is not None else "",
-            "longitude": safe_float(r.longitude) if r.longitude is not None else "",
-            "google_place_id": r.google_place_id or "",
-            "notes": r.notes or "",
-            "created_at": r.created_at.isoformat() if r.created_at else "",
-            "updated_at": r.updated_at.isoformat() if r.updated_at else "",
-        }
-        for r in restaurants
-    ]
+def export_restaurants_for_user(
+    user_id: int,
+    restaurant_ids: list[int] | None = None,
+) -> list[dict[str, Any]]:
+    """Get all restaurants for a user in a format suitable for export.
+
+    Args:
+        user_id: The ID of the user whose restaurants to export
+        restaurant_ids: Optional list of restaurant IDs to export
+
+    Returns:
+        A list of dictionaries containing restaurant data
+    """
+    return list(iter_restaurants_for_export(user_id, restaurant_ids))
 
 
 def get_restaurants_for_user(user_id: int) -> list[Restaurant]:
@@ -1858,26 +1813,6 @@ def _create_restaurant_dict_with_distance(restaurant: Restaurant, distance_km: f
     }
 
 
-def _get_distance_for_sorting(restaurant_dict: dict[str, Any]) -> float:
-    """Extract distance value for sorting.
-
-    Args:
-        restaurant_dict: Restaurant dictionary with distance_km key
-
-    Returns:
-        Distance as float, or 0.0 if invalid
-    """
-    distance_val = restaurant_dict.get("distance_km")
-    if isinstance(distance_val, (int, float)):
-        return float(distance_val)
-    if isinstance(distance_val, str):
-        try:
-            return float(distance_val)
-        except (ValueError, TypeError):
-            return 0.0
-    return 0.0
-
-
 def search_restaurants_by_location(
     user_id: int, latitude: float, longitude: float, radius_km: float = 10.0, limit: int = 50
 ) -> list[dict[str, Any]]:
@@ -1896,33 +1831,28 @@ def search_restaurants_by_location(
     """
     _validate_location_search_params(latitude, longitude, radius_km, limit)
 
-    # Get all restaurants for the user that have coordinates
+    # Only fetch restaurants inside the bounding box of the search circle (indexed on
+    # user_id, latitude, longitude), then keep those actually within the radius
+    min_lat, max_lat, lon_ranges = bounding_box(latitude, longitude, radius_km)
     restaurants = db.session.scalars(
         select(Restaurant).where(
             Restaurant.user_id == user_id,
-            Restaurant.latitude.isnot(None),
-            Restaurant.longitude.isnot(None),
+            Restaurant.latitude.between(min_lat, max_lat),
+            or_(*(Restaurant.longitude.between(min_lon, max_lon) for min_lon, max_lon in lon_ranges)),
         )
     ).all()
 
-    results = []
-
-    for restaurant in restaurants:
-        # Calculate distance (skip if coordinates are missing)
-        if restaurant.latitude is None or restaurant.longitude is None:
-            continue
-        distance = calculate_distance_km(latitude, longitude, restaurant.latitude, restaurant.longitude)
-
-        # Check if within radius
-        if distance <= radius_km:
-            restaurant_dict = _create_restaurant_dict_with_distance(restaurant, distance)
-            results.append(restaurant_dict)
-
-    # Sort by distance (closest first)
-    results.sort(key=_get_distance_for_sorting)
-
-    # Apply limit
-    return results[:limit]
+    # BETWEEN already excludes missing coordinates; pairing them here narrows the types
+    located = [
+        (restaurant, (restaurant.latitude, restaurant.longitude))
+        for restaurant in restaurants
+        if restaurant.latitude is not None and restaurant.longitude is not None
+    ]
+    distances = calculate_distances_km(latitude, longitude, [point for _, point in located])
+    return [
+        _create_restaurant_dict_with_distance(located[index][0], distances[index])
+        for index in nearest_indexes(distances, limit, max_distance=radius_km)
+    ]
 
 
 def get_restaurants_with_coordinates(user_id: int) -> list[Restaurant]:
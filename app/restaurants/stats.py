@@ -0,0 +1,122 @@
+"""Stored per-restaurant expense statistics.
+
+``Restaurant.visit_count``, ``total_spent``, ``last_visit`` and ``avg_price_per_person`` are
+kept current by a session hook: every flush that inserts, deletes or changes an expense
+re-aggregates only the restaurants it touched (old and new restaurant when an expense is
+moved) in one UPDATE. The restaurant list reads the stored values instead of joining and
+grouping the user's whole expense history.
+
+Writes that bypass the ORM (bulk Core statements, manual SQL) are not tracked;
+``flask restaurant recalculate-stats`` rebuilds the values from scratch.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Float, case, cast, event, func, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.expenses.models import Expense
+from app.restaurants.models import Restaurant
+
+# Expense attributes that feed the statistics
+_STATISTICS_FIELDS = ("amount", "date", "party_size", "restaurant_id", "restaurant", "user_id")
+# session.info keys holding the affected restaurants between before_flush and after_flush
+_PENDING_IDS_KEY = "restaurant_stats_pending_ids"
+_PENDING_EXPENSES_KEY = "restaurant_stats_pending_expenses"
+
+
+def _restaurant_expense_aggregate(aggregate: ColumnElement[Any]) -> ColumnElement[Any]:
+    """Correlated subquery aggregating the expenses of the restaurant row being updated."""
+    restaurant_table = Restaurant.__table__
+    expense_table = Expense.__table__
+    return (
+        select(aggregate)
+        .where(
+            expense_table.c.restaurant_id == restaurant_table.c.id,
+            expense_table.c.user_id == restaurant_table.c.user_id,
+        )
+        .scalar_subquery()
+    )
+
+
+def refresh_restaurant_statistics(connection: Connection, condition: ColumnElement[bool]) -> None:
+    """Recompute stored statistics in one UPDATE for the restaurants matching ``condition``.
+
+    ``updated_at`` is pinned to its current value: a new expense is not an edit of the
+    restaurant.
+    """
+    restaurant_table = Restaurant.__table__
+    expense_table = Expense.__table__
+    party_size_total = func.sum(expense_table.c.party_size)
+    connection.execute(
+        update(restaurant_table)
+        .where(condition)
+        .values(
+            visit_count=_restaurant_expense_aggregate(func.count(expense_table.c.id)),
+            total_spent=_restaurant_expense_aggregate(func.coalesce(func.sum(expense_table.c.amount), 0)),
+            last_visit=_restaurant_expense_aggregate(func.max(expense_table.c.date)),
+            avg_price_per_person=_restaurant_expense_aggregate(
+                func.coalesce(
+                    case(
+                        (
+                            party_size_total > 0,
+                            cast(func.sum(expense_table.c.amount), Float) / party_size_total,
+                        ),
+                        else_=None,
+                    ),
+                    0,
+                )
+            ),
+            updated_at=restaurant_table.c.updated_at,
+        )
+    )
+
+
+def _has_statistics_changes(expense: Expense) -> bool:
+    """Return True if the pending flush changes an attribute the statistics depend on."""
+    return any(get_history(expense, field).has_changes() for field in _STATISTICS_FIELDS)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_affected_restaurants(session: Session, flush_context: Any, instances: Any) -> None:
+    """Record which restaurants the upcoming flush affects.
+
+    Restaurants that changed or deleted expenses belong to before the flush are read from
+    the database in one query (the old value is often expired and not in attribute
+    history). Current restaurant IDs of new and changed expenses are read after the flush,
+    once relationship-only assignments have been synced to ``restaurant_id``.
+    """
+    expenses = [expense for expense in session.new if isinstance(expense, Expense)]
+    existing_ids = [expense.id for expense in session.deleted if isinstance(expense, Expense)]
+    for expense in session.dirty:
+        if isinstance(expense, Expense) and _has_statistics_changes(expense):
+            expenses.append(expense)
+            existing_ids.append(expense.id)
+
+    ids: set[int] = set()
+    if existing_ids:
+        expense_table = Expense.__table__
+        ids.update(
+            session.connection().scalars(
+                select(expense_table.c.restaurant_id).where(
+                    expense_table.c.id.in_(existing_ids), expense_table.c.restaurant_id.is_not(None)
+                )
+            )
+        )
+    session.info[_PENDING_IDS_KEY] = ids
+    session.info[_PENDING_EXPENSES_KEY] = expenses
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_affected_restaurants(session: Session, flush_context: Any) -> None:
+    """Refresh the statistics of the restaurants recorded before the flush."""
+    ids: set[int] = session.info.pop(_PENDING_IDS_KEY, set())
+    expenses: list[Expense] = session.info.pop(_PENDING_EXPENSES_KEY, [])
+    ids.update(expense.restaurant_id for expense in expenses if expense.restaurant_id is not None)
+    if ids:
+        refresh_restaurant_statistics(session.connection(), Restaurant.__table__.c.id.in_(ids))
@@ -0,0 +1,92 @@
+"""Process-wide registry of boto3 clients.
+
+Building a boto3 client loads the service model and sets up a connection pool, which costs tens
+of milliseconds and a few megabytes every time. Clients are thread-safe once built, so the
+registry builds each one lazily on first use and hands the same instance to every request and
+thread of the process. Building itself is not thread-safe in boto3, so it happens under a lock
+from one session owned by the registry.
+
+Clients are keyed by service, region and configuration; changing a setting builds a new client
+instead of reusing a stale one. Connection pooling, retries and timeouts come from the app
+config (``AWS_MAX_POOL_CONNECTIONS``, ``AWS_RETRY_MODE``, ``AWS_MAX_ATTEMPTS``,
+``AWS_CONNECT_TIMEOUT``, ``AWS_READ_TIMEOUT``).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Literal
+
+import boto3
+from botocore.config import Config
+from flask import current_app, has_app_context
+
+# botocore settings used when the app config does not set them
+CLIENT_SETTING_DEFAULTS: dict[str, Any] = {
+    "AWS_MAX_POOL_CONNECTIONS": 10,
+    "AWS_RETRY_MODE": "standard",
+    "AWS_MAX_ATTEMPTS": 3,
+    "AWS_CONNECT_TIMEOUT": 5,
+    "AWS_READ_TIMEOUT": 60,
+}
+
+# Services built through the registry; boto3-stubs types clients by literal service name
+ServiceName = Literal["s3", "textract"]
+
+_clients: dict[tuple[Any, ...], Any] = {}
+_lock = threading.Lock()
+_session: boto3.session.Session | None = None
+
+
+def _client_settings() -> tuple[Any, ...]:
+    config = current_app.config if has_app_context() else {}
+    return tuple(config.get(name, default) for name, default in CLIENT_SETTING_DEFAULTS.items())
+
+
+def _build_config(settings: tuple[Any, ...], options: dict[str, Any]) -> Config:
+    max_pool_connections, retry_mode, max_attempts, connect_timeout, read_timeout = settings
+    return Config(
+        max_pool_connections=int(max_pool_connections),
+        retries={"mode": retry_mode, "max_attempts": int(max_attempts)},
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        **options,
+    )
+
+
+def get_client(service_name: ServiceName, region_name: str, **config_options: Any) -> Any:
+    """Get the shared client of an AWS service, building it on first use.
+
+    Args:
+        service_name: boto3 service name (``"s3"`` or ``"textract"``; add others to ``ServiceName``)
+        region_name: AWS region of the client
+        **config_options: Extra botocore ``Config`` options of this client (e.g. ``signature_version``)
+
+    Returns:
+        The boto3 client
+    """
+    global _session
+
+    key = (service_name, region_name, _client_settings(), tuple(sorted(config_options.items())))
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            if _session is None:
+                _session = boto3.session.Session()
+            config = _build_config(key[2], config_options)
+            client = _session.client(service_name, region_name=region_name, config=config)
+            _clients[key] = client
+        return client
+
+
+def clear_clients() -> None:
+    """Drop every shared client, e.g. after rotating credentials; they are rebuilt on next use."""
+    global _session
+
+    with _lock:
+        _clients.clear()
+        _session = None
@@ -13,13 +13,20 @@ Following TIGER principles:
 
 import logging
 import os
+import random
 import re
-from typing import Any, Dict, List, Optional, Tuple, cast
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
 
 from flask import current_app
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from app.services import places_cache
 from app.services.simple_cache import (
+    PLACE_NAMESPACE,
+    SEARCH_NAMESPACE,
     cache_place_details as shared_cache_place_details,
     cache_search_results as shared_cache_search_results,
     get_place_details as shared_get_place_details,
@@ -29,9 +36,21 @@ from app.utils.address_utils import normalize_country_to_iso2, normalize_state_t
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Google Places API configuration
 PLACES_API_BASE = "https://places.googleapis.com/v1/places"
 
+# HTTP client configuration: keep-alive connections per process and retries on throttling/server errors
+HTTP_POOL_MAXSIZE = 10
+HTTP_TIMEOUT_SECONDS = 10
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_BACKOFF_JITTER = 0.5
+# Longest Retry-After wait honoured; requests run on web workers, including search-as-you-type
+HTTP_RETRY_AFTER_MAX_SECONDS = 2.0
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 # Field masks with tier documentation for cost tracking
 # For searchText endpoint, use "places.fieldName" format
 # For individual place details, use "fieldName" format
@@ -105,6 +124,133 @@ FOOD_TYPES = [
 ]
 
 
+class _Call:
+    """An upstream lookup in flight and the outcome its waiters share."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one.
+
+    The first caller for a key runs the function; callers arriving while it runs wait for it and
+    get the same result (or exception) instead of making their own upstream request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call with the same key is already in flight, then share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.result)
+
+        try:
+            call.result = fn()
+            return cast(T, call.result)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+# Places lookups in flight in this process, keyed by their cache keys
+_in_flight = SingleFlight()
+
+
+def _is_cacheable_place_details(result: dict[str, Any]) -> bool:
+    """Return True for place details worth caching (not empty and not an error marker)."""
+    return bool(result) and "error" not in result
+
+
+def _resolve_api_key() -> str | None:
+    """Get API key from Flask configuration or environment variable."""
+    try:
+        api_key = current_app.config.get("GOOGLE_MAPS_API_KEY")
+        if api_key:
+            return str(api_key) if api_key else None
+    except RuntimeError:
+        pass
+    env_key = os.getenv("GOOGLE_MAPS_API_KEY")
+    return str(env_key) if env_key else None
+
+
+def _resolve_referrer() -> str:
+    """Get the referrer domain the API key is restricted to."""
+    # Check for explicit referrer configuration first
+    referrer: str | None = os.getenv("GOOGLE_API_REFERRER_DOMAIN")
+
+    if not referrer:
+        # Try to get from Flask config
+        try:
+            referrer = current_app.config.get("GOOGLE_API_REFERRER_DOMAIN")
+        except RuntimeError:
+            pass
+
+    # Default to a common development domain that API keys often allow
+    # This can be overridden with GOOGLE_API_REFERRER_DOMAIN environment variable
+    return referrer or "localhost:5000"
+
+
+class _PlacesRetry(Retry):
+    """Retry policy with jittered backoff and a capped ``Retry-After`` wait."""
+
+    def get_backoff_time(self) -> float:
+        """Add up to ``HTTP_RETRY_BACKOFF_JITTER`` seconds to the exponential backoff."""
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, HTTP_RETRY_BACKOFF_JITTER) if backoff > 0 else backoff  # nosec B311
+
+    def get_retry_after(self, response: Any) -> float | None:
+        """Honour ``Retry-After`` for at most ``HTTP_RETRY_AFTER_MAX_SECONDS``."""
+        retry_after = super().get_retry_after(response)
+        return min(retry_after, HTTP_RETRY_AFTER_MAX_SECONDS) if retry_after is not None else None
+
+
+def _create_http_session() -> requests.Session:
+    """Create a keep-alive HTTP session that retries throttled and failed Places calls.
+
+    Retries back off exponentially with jitter and honour ``Retry-After`` up to a short cap,
+    so one throttled call cannot hold a web worker for the server's full interval; the last
+    response is returned rather than raised so ``_make_request`` handles it like any other
+    failure.
+    """
+    retry = _PlacesRetry(
+        total=HTTP_RETRY_TOTAL,
+        connect=HTTP_RETRY_TOTAL,
+        read=0,
+        status=HTTP_RETRY_TOTAL,
+        backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUS_CODES,
+        # searchText/searchNearby are read-only POSTs and safe to repeat
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
 class GooglePlacesService:
     """Simplified service for Google Places API interactions."""
 
@@ -114,22 +260,16 @@ class GooglePlacesService:
         if not self.api_key:
             logger.warning("Google Maps API key not configured - Google Places features will not work")
 
-        # Simple in-memory cache
-        self._cache: dict[str, Any] = {}
+        self.referrer = _resolve_referrer()
+        self._headers = self._build_headers()
+        self._session = _create_http_session()
 
     def _get_api_key(self) -> str | None:
         """Get API key from Flask configuration or environment variable."""
-        try:
-            api_key = current_app.config.get("GOOGLE_MAPS_API_KEY")
-            if api_key:
-                return str(api_key) if api_key else None
-        except RuntimeError:
-            pass
-        env_key = os.getenv("GOOGLE_MAPS_API_KEY")
-        return str(env_key) if env_key else None
+        return _resolve_api_key()
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get headers for API requests."""
+    def _build_headers(self) -> dict[str, str]:
+        """Build the headers shared by every API request."""
         api_key_str = str(self.api_key) if self.api_key else ""
         headers: dict[str, str] = {
             "Content-Type": "application/json",
@@ -138,26 +278,15 @@ class GooglePlacesService:
         }
 
         # Set referrer based on API key restrictions
-        # Check for explicit referrer configuration first
-        referrer: str | None = os.getenv("GOOGLE_API_REFERRER_DOMAIN")
-
-        if not referrer:
-            # Try to get from Flask config
-            try:
-                referrer = current_app.config.get("GOOGLE_API_REFERRER_DOMAIN")
-            except RuntimeError:
-                pass
-
-        if not referrer:
-            # Default to a common development domain that API keys often allow
-            # This can be overridden with GOOGLE_API_REFERRER_DOMAIN environment variable
-            referrer = "localhost:5000"
-
-        if referrer:
-            headers["Referer"] = f"https://{referrer}"
+        if self.referrer:
+            headers["Referer"] = f"https://{self.referrer}"
 
         return headers
 
+    def _get_headers(self) -> dict[str, str]:
+        """Get headers for API requests (a copy callers may extend)."""
+        return dict(self._headers)
+
     def _make_request(
         self, url: str, payload: dict[str, Any] | None = None, headers: dict[str, str] | None = None
     ) -> dict[str, Any]:
@@ -172,10 +301,10 @@ class GooglePlacesService:
         try:
             if payload:
                 logger.debug(f"Making POST request to {url} with payload: {payload}")
-                response = requests.post(url, headers=headers, json=payload, timeout=10)
+                response = self._session.post(url, headers=headers, json=payload, timeout=HTTP_TIMEOUT_SECONDS)
             else:
                 logger.debug(f"Making GET request to {url}")
-                response = requests.get(url, headers=headers, timeout=10)
+                response = self._session.get(url, headers=headers, timeout=HTTP_TIMEOUT_SECONDS)
 
             logger.debug(f"Response status: {response.status_code}")
 
@@ -252,15 +381,10 @@ class GooglePlacesService:
         if not query or not isinstance(query, str):
             return []
 
-        # Check per-process cache
+        # Check shared cache across requests
         cache_key = f"text_search:{query}:{location_bias}:{radius_meters}:{max_results}"
-        if cache_key in self._cache:
-            return cast(list[dict[str, Any]], self._cache[cache_key])
-
-        # Check shared cache across requests/processes
         shared_cached = shared_get_search_results(cache_key, location_bias, float(radius_meters))
         if isinstance(shared_cached, list):
-            self._cache[cache_key] = shared_cached
             return cast(list[dict[str, Any]], shared_cached)
 
         url = f"{PLACES_API_BASE}:searchText"
@@ -281,18 +405,25 @@ class GooglePlacesService:
                 }
             }
 
-        result = self._make_request(url, payload, headers)
+        def fetch() -> list[dict[str, Any]] | None:
+            result = self._make_request(url, payload, headers)
 
-        # Handle API key referrer restrictions gracefully
-        if result.get("error") == "API_KEY_REFERRER_RESTRICTED":
-            logger.info("Google Places API search skipped due to referrer restrictions")
-            return []
+            # Handle API key referrer restrictions gracefully
+            if result.get("error") == "API_KEY_REFERRER_RESTRICTED":
+                logger.info("Google Places API search skipped due to referrer restrictions")
+                return None
+
+            places = cast(list[dict[str, Any]], result.get("places", []))
+            logger.info(f"Google Places API returned {len(places)} places")
+            return places
 
-        places = cast(list[dict[str, Any]], result.get("places", []))
-        logger.info(f"Google Places API returned {len(places)} places")
+        # Check the database cache shared by all processes; concurrent identical searches share one lookup
+        l2_key = f"{cache_key}|{FIELD_MASKS['search']}"
+        places = _in_flight.do(l2_key, lambda: places_cache.fetch_through(SEARCH_NAMESPACE, l2_key, fetch))
+        if places is None:
+            return []
 
         # Cache result
-        self._cache[cache_key] = places
         shared_cache_search_results(cache_key, location_bias, float(radius_meters), places)
         return places
 
@@ -304,14 +435,10 @@ class GooglePlacesService:
         max_results: int = 20,
     ) -> list[dict[str, Any]]:
         """Search for places nearby a location."""
+        # Check shared cache across requests
         cache_key = f"nearby:{location}:{radius_meters}:{included_type}:{max_results}"
-        if cache_key in self._cache:
-            return cast(list[dict[str, Any]], self._cache[cache_key])
-
-        # Check shared cache across requests/processes
         shared_cached = shared_get_search_results(cache_key, location, float(radius_meters))
         if isinstance(shared_cached, list):
-            self._cache[cache_key] = shared_cached
             return cast(list[dict[str, Any]], shared_cached)
 
         url = f"{PLACES_API_BASE}:searchNearby"
@@ -330,16 +457,22 @@ class GooglePlacesService:
             },
         }
 
-        result = self._make_request(url, payload, headers)
+        def fetch() -> list[dict[str, Any]] | None:
+            result = self._make_request(url, payload, headers)
 
-        # Handle API key referrer restrictions gracefully
-        if result.get("error") == "API_KEY_REFERRER_RESTRICTED":
-            logger.info("Google Places API nearby search skipped due to referrer restrictions")
-            return []
+            # Handle API key referrer restrictions gracefully
+            if result.get("error") == "API_KEY_REFERRER_RESTRICTED":
+                logger.info("Google Places API nearby search skipped due to referrer restrictions")
+                return None
+
+            return cast(list[dict[str, Any]], result.get("places", []))
 
-        places = cast(list[dict[str, Any]], result.get("places", []))
+        # Check the database cache shared by all processes; concurrent identical searches share one lookup
+        l2_key = f"{cache_key}|{FIELD_MASKS['search']}"
+        places = _in_flight.do(l2_key, lambda: places_cache.fetch_through(SEARCH_NAMESPACE, l2_key, fetch))
+        if places is None:
+            return []
 
-        self._cache[cache_key] = places
         shared_cache_search_results(cache_key, location, float(radius_meters), places)
         return places
 
@@ -359,27 +492,30 @@ class GooglePlacesService:
 
         mask = field_mask or FIELD_MASKS["place_details"]
 
-        # Use field mask in cache key to avoid cache collisions
-        cache_key = f"details:{place_id}:{mask}"
-        if cache_key in self._cache:
-            logger.debug(f"Cache hit for place details: {place_id}")
-            return cast(dict[str, Any] | None, self._cache[cache_key])
-
         # Shared cache key must include field mask to avoid collisions between cost tiers
         shared_key = f"{place_id}|{mask}"
         shared_cached = shared_get_place_details(shared_key)
         if isinstance(shared_cached, dict) and shared_cached:
-            self._cache[cache_key] = shared_cached
+            logger.debug(f"Cache hit for place details: {place_id}")
             return cast(dict[str, Any], shared_cached)
 
         url = f"{PLACES_API_BASE}/{place_id}"
         headers = self._get_headers()
         headers["X-Goog-FieldMask"] = mask
 
-        result = self._make_request(url, headers=headers)
+        # Check the database cache shared by all processes; failed lookups are not cached and
+        # concurrent lookups of the same place share one request
+        result = _in_flight.do(
+            shared_key,
+            lambda: places_cache.fetch_through(
+                PLACE_NAMESPACE,
+                shared_key,
+                lambda: self._make_request(url, headers=headers),
+                should_store=_is_cacheable_place_details,
+            ),
+        )
 
-        if result:
-            self._cache[cache_key] = result
+        if _is_cacheable_place_details(result):
             shared_cache_place_details(shared_key, result)
 
         return result
@@ -1102,6 +1238,22 @@ class GooglePlacesService:
         return replacements.get(formatted, formatted)
 
 
+_shared_service: GooglePlacesService | None = None
+_shared_service_lock = threading.Lock()
+
+
 def get_google_places_service() -> GooglePlacesService:
-    """Get a GooglePlacesService instance."""
-    return GooglePlacesService()
+    """Get the process-wide GooglePlacesService instance.
+
+    The instance and its pooled HTTP connections are reused across requests; it is only
+    rebuilt when the configured API key or referrer changes.
+    """
+    global _shared_service
+
+    api_key, referrer = _resolve_api_key(), _resolve_referrer()
+    with _shared_service_lock:
+        service = _shared_service
+        if service is None or service.api_key != api_key or service.referrer != referrer:
+            service = GooglePlacesService(api_key)
+            _shared_service = service
+        return service
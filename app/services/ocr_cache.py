@@ -0,0 +1,154 @@
+"""Database-backed cache of receipt OCR results, keyed by the content of the uploaded file.
+
+Users often upload the same receipt again, when they edit an expense or retry after a
+validation error, and each upload used to cost a Textract call. Entries live in the
+``api_cache`` table under ``ocr:<sha256 of the file bytes>`` and hold the raw Textract text
+together with the receipt parsed from it and the ``PARSER_VERSION`` that parsed it. A repeat
+upload is then served without calling Textract; after a parser upgrade the cached raw text is
+parsed again and the entry replaced, still without calling Textract.
+
+Entries expire ``OCR_CACHE_MAX_AGE_SECONDS`` after they were last written; expired entries are
+ignored on read and deleted by ``clear_expired_ocr_cache`` (``flask receipt ocr-cache``).
+
+The cache is best effort: a failed read counts as a miss and a failed write is logged and
+dropped, so the upload goes on either way. Writes go through ``APICache.upsert`` and reads use
+a connection of their own, leaving the request session alone.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any
+
+from flask import has_app_context
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.extensions import db
+from app.models.api_cache import APICache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "ocr:"
+# How long an OCR result is kept after it was last written
+OCR_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600  # 30 days
+
+_api_cache = APICache.__table__
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "reparses": 0, "misses": 0, "writes": 0, "errors": 0}
+
+
+@dataclass(frozen=True)
+class CachedOCR:
+    """An OCR result read from the cache."""
+
+    raw_text: str
+    parser_version: int
+    receipt: dict[str, Any]
+
+
+def _count(counter: str) -> None:
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def count_reparse() -> None:
+    """Record that a cached entry was parsed again by a newer parser."""
+    _count("reparses")
+
+
+def file_digest(file_bytes: bytes) -> str:
+    """Get the content address of an uploaded file."""
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def make_cache_key(digest: str) -> str:
+    """Build the ``api_cache`` key of a file digest."""
+    return f"{KEY_PREFIX}{digest}"
+
+
+def load(digest: str) -> CachedOCR | None:
+    """Get the cached OCR result of a file, or None if it is missing, expired or unreadable."""
+    if not has_app_context():
+        return None
+
+    try:
+        with db.engine.connect() as connection:
+            row = connection.execute(
+                select(_api_cache.c.data, _api_cache.c.updated_at).where(_api_cache.c.key == make_cache_key(digest))
+            ).first()
+    except SQLAlchemyError as e:
+        _count("errors")
+        logger.warning(f"OCR cache read failed: {e}")
+        return None
+
+    if row is None or time.time() - float(row.updated_at) >= OCR_CACHE_MAX_AGE_SECONDS:
+        _count("misses")
+        return None
+    try:
+        data = json.loads(row.data)
+        entry = CachedOCR(data["raw_text"], int(data["parser_version"]), data["receipt"])
+    except (TypeError, ValueError, KeyError):
+        _count("misses")
+        return None
+    _count("hits")
+    return entry
+
+
+def store(digest: str, raw_text: str, parser_version: int, receipt: dict[str, Any]) -> None:
+    """Insert or replace the OCR result of a file.
+
+    Args:
+        digest: ``file_digest`` of the uploaded file
+        raw_text: Text returned by Textract
+        parser_version: ``PARSER_VERSION`` of the parser that produced ``receipt``
+        receipt: JSON-serializable parsed receipt
+    """
+    if not has_app_context():
+        return
+
+    data = json.dumps({"raw_text": raw_text, "parser_version": parser_version, "receipt": receipt})
+    try:
+        APICache.upsert(make_cache_key(digest), data)
+    except SQLAlchemyError as e:
+        _count("errors")
+        logger.warning(f"OCR cache write failed: {e}")
+        return
+    _count("writes")
+
+
+def get_ocr_cache_stats() -> dict[str, Any]:
+    """Get the counters of this process and the share of uploads served without Textract."""
+    with _stats_lock:
+        stats: dict[str, Any] = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    return stats
+
+
+def reset_ocr_cache_stats() -> None:
+    """Reset the counters of this process."""
+    with _stats_lock:
+        for counter in _stats:
+            _stats[counter] = 0
+
+
+def clear_expired_ocr_cache() -> int:
+    """Delete OCR results that are past their maximum age.
+
+    Returns:
+        Number of entries deleted
+    """
+    return APICache.clear_expired(OCR_CACHE_MAX_AGE_SECONDS, key_prefix=KEY_PREFIX)
+
+
+def clear_ocr_cache() -> int:
+    """Delete every cached OCR result."""
+    with db.engine.begin() as connection:
+        result = connection.execute(delete(_api_cache).where(_api_cache.c.key.like(f"{KEY_PREFIX}%")))
+    return int(result.rowcount or 0)
@@ -0,0 +1,264 @@
+"""Asynchronous receipt OCR jobs.
+
+Textract, and the PDF-to-image fallback for PDFs it rejects, can take long enough to tie up a
+worker and run into the API Gateway timeout. In async mode ``/api/v1/receipts/ocr`` only
+validates the upload, records a job and hands it to the job queue; a worker runs OCR and parsing
+while the client polls ``/api/v1/receipts/ocr/jobs/<job_id>`` for progress and the result.
+
+Job state lives in the ``api_cache`` table under ``ocr-job:<job_id>``, so any process can answer
+a poll, and expires ``JOB_MAX_AGE_SECONDS`` after its last update. The queue is pluggable
+(``set_job_queue``): ``ThreadPoolJobQueue`` runs jobs on a per-process thread pool, and
+``InlineJobQueue`` is a stand-in that runs them right away in the caller (``OCR_JOB_QUEUE``
+selects between the two, or ``"sync"`` for no queue). The thread pool suits long-running
+servers only: a Lambda container is frozen once the response is sent, so its jobs would sit in
+``queued``/``running`` until they expire. On Lambda the thread pool is therefore never built and
+async requests are processed synchronously, unless a queue that hands the job to another
+invocation (which then calls ``run_ocr_job``) is plugged in with ``set_job_queue``.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Protocol
+import uuid
+
+from flask import Flask, current_app
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.datastructures import FileStorage
+
+from app.extensions import db
+from app.models.api_cache import APICache
+from app.services.ocr_service import STAGE_EXTRACTING_TEXT, STAGE_PARSING, get_ocr_service
+
+logger = logging.getLogger(__name__)
+
+JOB_KEY_PREFIX = "ocr-job:"
+# How long a job can be polled after its last update
+JOB_MAX_AGE_SECONDS = 24 * 3600  # 1 day
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+# Share of the work done (percent) when each OCR stage starts
+STAGE_PROGRESS = {STAGE_EXTRACTING_TEXT: 10, STAGE_PARSING: 80}
+
+_api_cache = APICache.__table__
+
+
+@dataclass(frozen=True)
+class OCRJobRequest:
+    """Everything a worker needs to run one OCR job."""
+
+    job_id: str
+    filename: str
+    file_bytes: bytes
+    form_hints: dict[str, Any] | None = None
+
+
+class JobQueue(Protocol):
+    """Hands OCR jobs to whatever runs them."""
+
+    def submit(self, job: OCRJobRequest) -> None:
+        """Schedule ``run_ocr_job(job)``; must not block on the OCR itself (except as a stand-in)."""
+
+
+class InlineJobQueue:
+    """Stand-in queue that runs each job immediately in the calling thread."""
+
+    def submit(self, job: OCRJobRequest) -> None:
+        run_ocr_job(job)
+
+
+class ThreadPoolJobQueue:
+    """Runs jobs on a pool of worker threads of this process."""
+
+    def __init__(self, max_workers: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocr-job")
+
+    def submit(self, job: OCRJobRequest) -> None:
+        app = current_app._get_current_object()
+        self._executor.submit(self._run, app, job)
+
+    @staticmethod
+    def _run(app: Flask, job: OCRJobRequest) -> None:
+        with app.app_context():
+            try:
+                run_ocr_job(job)
+            except Exception:
+                logger.exception(f"OCR job {job.job_id} crashed")
+
+
+_queue: JobQueue | None = None
+_queue_built = False
+_queue_lock = threading.Lock()
+
+
+def _is_lambda() -> bool:
+    return os.getenv("AWS_LAMBDA_FUNCTION_NAME") is not None
+
+
+def _build_job_queue() -> JobQueue | None:
+    kind = current_app.config.get("OCR_JOB_QUEUE", "threads")
+    if kind == "sync":
+        return None
+    if kind == "inline":
+        return InlineJobQueue()
+    if kind == "threads":
+        if _is_lambda():
+            # Work left on a thread after the response never runs in a frozen Lambda container
+            logger.warning("OCR_JOB_QUEUE=threads is not supported on Lambda; async OCR runs synchronously")
+            return None
+        return ThreadPoolJobQueue(max_workers=int(current_app.config.get("OCR_JOB_WORKERS", 2)))
+    raise ValueError(f"Unknown OCR_JOB_QUEUE: {kind!r} (expected 'threads', 'inline' or 'sync')")
+
+
+def get_job_queue() -> JobQueue | None:
+    """Get the job queue of this process, building it from the app config on first use.
+
+    Returns:
+        The queue, or None if jobs cannot run in the background here and OCR must run in the request
+    """
+    global _queue, _queue_built
+
+    with _queue_lock:
+        if not _queue_built:
+            _queue = _build_job_queue()
+            _queue_built = True
+        return _queue
+
+
+def async_ocr_available() -> bool:
+    """Whether OCR jobs can be queued in this process (see ``get_job_queue``)."""
+    return get_job_queue() is not None
+
+
+def set_job_queue(queue: JobQueue | None) -> None:
+    """Replace the job queue of this process; None rebuilds it from the config on next use."""
+    global _queue, _queue_built
+
+    with _queue_lock:
+        _queue = queue
+        _queue_built = queue is not None
+
+
+def _job_key(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}{job_id}"
+
+
+def _save_job(job_id: str, state: dict[str, Any]) -> None:
+    """Insert or replace the state of a job."""
+    APICache.upsert(_job_key(job_id), json.dumps(state))
+
+
+def get_ocr_job(job_id: str) -> dict[str, Any] | None:
+    """Get the state of a job, or None if it does not exist or has expired.
+
+    The state holds ``user_id``, ``status`` (``STATUS_*``), ``stage``, ``progress`` (0-100),
+    ``error``, the submitted ``form_hints`` and ``restaurant_id``, and once the job succeeded,
+    ``receipt`` (``ReceiptData.to_cache_dict`` output).
+    """
+    with db.engine.connect() as connection:
+        row = connection.execute(
+            select(_api_cache.c.data, _api_cache.c.updated_at).where(_api_cache.c.key == _job_key(job_id))
+        ).first()
+    if row is None or time.time() - float(row.updated_at) >= JOB_MAX_AGE_SECONDS:
+        return None
+    try:
+        state: dict[str, Any] = json.loads(row.data)
+    except (TypeError, ValueError):
+        return None
+    return state
+
+
+def submit_ocr_job(
+    user_id: int,
+    filename: str,
+    file_bytes: bytes,
+    form_hints: dict[str, Any] | None = None,
+    restaurant_id: int | None = None,
+) -> str:
+    """Record an OCR job for an uploaded receipt and queue it.
+
+    Args:
+        user_id: Owner of the job; only they can poll it
+        filename: Original filename, used for format detection
+        file_bytes: Content of the uploaded file
+        form_hints: Optional form values used as hints (see ``OCRService.extract_receipt_data``)
+        restaurant_id: Optional restaurant selected in the form, kept for the result
+
+    Returns:
+        The job id
+
+    Raises:
+        RuntimeError: If no job queue is available (see ``async_ocr_available``)
+    """
+    queue = get_job_queue()
+    if queue is None:
+        raise RuntimeError("Asynchronous OCR is not available in this deployment")
+    job = OCRJobRequest(job_id=uuid.uuid4().hex, filename=filename, file_bytes=file_bytes, form_hints=form_hints)
+    _save_job(
+        job.job_id,
+        {
+            "user_id": user_id,
+            "status": STATUS_QUEUED,
+            "stage": None,
+            "progress": 0,
+            "error": None,
+            "form_hints": form_hints,
+            "restaurant_id": restaurant_id,
+            "receipt": None,
+        },
+    )
+    queue.submit(job)
+    return job.job_id
+
+
+def run_ocr_job(job: OCRJobRequest) -> None:
+    """Run OCR and parsing for a queued job, recording progress and the outcome in its state."""
+    state = get_ocr_job(job.job_id)
+    if state is None:
+        logger.warning(f"OCR job {job.job_id} no longer exists, skipping it")
+        return
+
+    def save(**changes: Any) -> None:
+        state.update(changes)
+        try:
+            _save_job(job.job_id, state)
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to save state of OCR job {job.job_id}: {e}")
+
+    def on_stage(stage: str) -> None:
+        save(stage=stage, progress=STAGE_PROGRESS.get(stage, state["progress"]))
+
+    save(status=STATUS_RUNNING)
+    try:
+        ocr_service = get_ocr_service()
+        if not ocr_service:
+            raise RuntimeError("OCR service not available. AWS Textract is not configured.")
+        upload = FileStorage(stream=BytesIO(job.file_bytes), filename=job.filename)
+        receipt_data = ocr_service.extract_receipt_data(upload, form_hints=job.form_hints, progress=on_stage)
+    except Exception as e:
+        logger.error(f"OCR job {job.job_id} failed: {e}")
+        save(status=STATUS_FAILED, stage=None, progress=100, error=str(e))
+        return
+
+    save(status=STATUS_SUCCEEDED, stage=None, progress=100, receipt=receipt_data.to_cache_dict())
+
+
+def clear_expired_ocr_jobs() -> int:
+    """Delete jobs that can no longer be polled.
+
+    Returns:
+        Number of jobs deleted
+    """
+    return APICache.clear_expired(JOB_MAX_AGE_SECONDS, key_prefix=JOB_KEY_PREFIX)
@@ -1,21 +1,28 @@
 """OCR service for extracting data from receipt images using AWS Textract."""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from io import BytesIO
 import re
 import shutil
+import threading
 from typing import Any, Callable, cast
 
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from flask import current_app
 from pdf2image import convert_from_bytes
 from PIL import Image
 from werkzeug.datastructures import FileStorage
 
-from app.services.receipt_parser import ReceiptParser
+from app.services import aws_clients, ocr_cache
+from app.services.receipt_parser import PARSER_VERSION, ReceiptParser
+
+_DECIMAL_FIELDS = ("amount", "subtotal", "tax", "tip", "total")
+
+# Stages reported to the ``progress`` callback of ``OCRService.extract_receipt_data``
+STAGE_EXTRACTING_TEXT = "extracting_text"
+STAGE_PARSING = "parsing"
 
 
 @dataclass
@@ -40,6 +47,7 @@ class ReceiptData:
     tip: Decimal | None = None
     total: Decimal | None = None
     confidence_scores: dict[str, float] | None = None
+    field_sources: dict[str, str] | None = None  # Parser path ("section", "legacy", ...) per field
     raw_text: str = ""
 
     def __post_init__(self) -> None:
@@ -48,6 +56,30 @@ class ReceiptData:
             self.items = []
         if self.confidence_scores is None:
             self.confidence_scores = {}
+        if self.field_sources is None:
+            self.field_sources = {}
+
+    def to_cache_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict (see ``from_cache_dict``)."""
+        data = asdict(self)
+        for name in _DECIMAL_FIELDS:
+            if data[name] is not None:
+                data[name] = str(data[name])
+        if self.date is not None:
+            data["date"] = self.date.isoformat()
+        return data
+
+    @classmethod
+    def from_cache_dict(cls, data: dict[str, Any]) -> "ReceiptData":
+        """Rebuild ReceiptData from ``to_cache_dict`` output, ignoring unknown keys."""
+        known = {field.name for field in fields(cls)}
+        values = {name: value for name, value in data.items() if name in known}
+        for name in _DECIMAL_FIELDS:
+            if values.get(name) is not None:
+                values[name] = Decimal(values[name])
+        if values.get("date"):
+            values["date"] = datetime.fromisoformat(values["date"])
+        return cls(**values)
 
 
 class OCRService:
@@ -55,6 +87,7 @@ class OCRService:
 
     def __init__(self) -> None:
         """Initialize OCR service with configuration."""
+        self.settings = _ocr_settings()
         self.enabled = current_app.config.get("OCR_ENABLED", True)
         self.confidence_threshold = current_app.config.get("OCR_CONFIDENCE_THRESHOLD", 0.7)
         self.region = current_app.config.get("TEXTRACT_REGION", "us-east-1")
@@ -64,7 +97,7 @@ class OCRService:
         # Verify Textract is available
         if self.enabled:
             try:
-                self.textract_client = boto3.client("textract", region_name=self.region)
+                self.textract_client = aws_clients.get_client("textract", self.region)
                 # Test connection with a simple call (will fail if credentials are missing)
                 current_app.logger.info("AWS Textract initialized successfully")
             except NoCredentialsError:
@@ -86,15 +119,20 @@ class OCRService:
         self,
         file_storage: FileStorage,
         form_hints: dict[str, Any] | None = None,
+        progress: Callable[[str], None] | None = None,
     ) -> ReceiptData:
         """Extract structured data from a receipt image or PDF.
 
+        Results are cached by file content (see ``ocr_cache``), so uploading the same file again
+        does not call Textract; form hints are applied on top of the cached result.
+
         Args:
             file_storage: The uploaded receipt file
             form_hints: Optional dictionary with form values to use as hints for matching:
                 - amount: Expected amount (Decimal or str)
                 - date: Expected date (datetime or str)
                 - restaurant_name: Expected restaurant name (str)
+            progress: Optional callback receiving each stage (``STAGE_*``) as it starts
 
         Returns:
             ReceiptData object with extracted fields
@@ -123,39 +161,29 @@ class OCRService:
         current_app.logger.debug(f"File size: {len(file_bytes)} bytes")
         current_app.logger.debug(f"File type detection: {file_storage.filename}")
 
-        # Check if file is a PDF
-        is_pdf = file_storage.filename.lower().endswith(".pdf") or file_bytes[:4] == b"%PDF"
-        current_app.logger.debug(f"Is PDF: {is_pdf}")
-
-        # Extract text using AWS Textract (handles both images and PDFs natively)
-        # Note: _extract_text_with_textract handles PDF fallback automatically
-        try:
-            raw_text = self._extract_text_with_textract(file_bytes, file_storage.filename)
-        except ValueError as e:
-            # ValueError indicates unsupported format or invalid parameters
-            # Re-raise as-is (already user-friendly)
-            current_app.logger.error(f"OCR text extraction failed: {e}")
-            raise
-        except Exception as e:
-            # Other errors (RuntimeError, ClientError, etc.)
-            current_app.logger.error(f"OCR text extraction failed: {e}")
-            raise RuntimeError(f"Failed to extract text: {e}") from e
-
-        # Log raw OCR text for debugging - show ALL text
-        current_app.logger.debug("=" * 60)
-        current_app.logger.debug("RAW OCR TEXT (full text):")
-        current_app.logger.debug("=" * 60)
-        if raw_text:
-            # Log in chunks of 1000 chars to avoid overwhelming logs
-            chunk_size = 1000
-            for i in range(0, len(raw_text), chunk_size):
-                chunk = raw_text[i : i + chunk_size]
-                current_app.logger.debug(f"Chunk {i//chunk_size + 1} (chars {i}-{min(i+chunk_size, len(raw_text))}):")
-                current_app.logger.debug(chunk)
-            current_app.logger.debug(f"\nTotal characters extracted: {len(raw_text)}")
+        # Repeat uploads of the same file are served from the cache without calling Textract
+        digest = ocr_cache.file_digest(file_bytes)
+        cached = ocr_cache.load(digest)
+        if cached is not None and cached.parser_version == PARSER_VERSION:
+            current_app.logger.debug(f"OCR cache hit for {digest}")
+            receipt_data = ReceiptData.from_cache_dict({**cached.receipt, "raw_text": cached.raw_text})
         else:
-            current_app.logger.debug("No text extracted from OCR")
-        current_app.logger.debug("=" * 60)
+            if cached is not None:
+                # Parsed by an older parser: parse the cached text again
+                current_app.logger.debug(f"OCR cache entry for {digest} is from parser {cached.parser_version}")
+                ocr_cache.count_reparse()
+                raw_text = cached.raw_text
+            else:
+                if progress:
+                    progress(STAGE_EXTRACTING_TEXT)
+                raw_text = self._extract_text(file_bytes, file_storage.filename)
+
+            if progress:
+                progress(STAGE_PARSING)
+            receipt_data = self._parse_raw_text(raw_text)
+            receipt = receipt_data.to_cache_dict()
+            del receipt["raw_text"]
+            ocr_cache.store(digest, raw_text, PARSER_VERSION, receipt)
 
         # Log form hints if provided
         if form_hints:
@@ -165,8 +193,8 @@ class OCRService:
         else:
             current_app.logger.debug("No form hints provided")
 
-        # Parse receipt data from extracted text, using form hints if provided
-        receipt_data = self._parse_receipt_data(raw_text, form_hints=form_hints)
+        # Use form hints, if provided, to pick the amount
+        self._apply_form_hints(receipt_data, form_hints)
 
         # Log final parsed results
         current_app.logger.debug("=" * 60)
@@ -188,40 +216,20 @@ class OCRService:
 
         return receipt_data
 
-    def _parse_receipt_data(
-        self,
-        raw_text: str,
-        form_hints: dict[str, Any] | None = None,
-    ) -> ReceiptData:
-        """Parse receipt data from extracted text using unified ReceiptParser.
+    def _parse_raw_text(self, raw_text: str) -> ReceiptData:
+        """Parse extracted text with the unified ReceiptParser, independently of any form hints.
 
         Args:
             raw_text: Raw text extracted from OCR
-            form_hints: Optional dictionary with form values to use as hints for matching
 
         Returns:
-            ReceiptData object with parsed fields
+            ReceiptData object with parsed fields and item names
         """
         receipt_data = ReceiptData(raw_text=raw_text)
 
         # Use unified parser to extract data (modifies receipt_data in place)
         self.parser.parse_receipt_data(raw_text, receipt_data)
 
-        # Apply form hints if provided (for amount matching)
-        if form_hints and form_hints.get("amount"):
-            try:
-                expected_amount = Decimal(str(form_hints["amount"]))
-                # If we found amounts, pick the one closest to expected
-                found_amounts = [v for v in [receipt_data.total, receipt_data.amount] if v is not None]
-                if found_amounts:
-                    closest = min(found_amounts, key=lambda x: abs(x - expected_amount))
-                    # If close match (within $5), use it
-                    if abs(closest - expected_amount) <= Decimal("5.00"):
-                        receipt_data.total = closest
-                        receipt_data.amount = closest
-            except (InvalidOperation, ValueError):
-                pass  # Use extracted amounts as-is
-
         # Convert dict items to strings for backward compatibility (web app expects list[str])
         # Parser returns list[dict] but web app expects list[str]
         if receipt_data.items:
@@ -249,6 +257,78 @@ class OCRService:
 
         return receipt_data
 
+    def _apply_form_hints(self, receipt_data: ReceiptData, form_hints: dict[str, Any] | None) -> None:
+        """Prefer the extracted amount closest to the amount entered in the form.
+
+        Args:
+            receipt_data: Parsed receipt data, updated in place
+            form_hints: Optional dictionary with form values to use as hints for matching
+        """
+        if not form_hints or not form_hints.get("amount"):
+            return
+        try:
+            expected_amount = Decimal(str(form_hints["amount"]))
+            # If we found amounts, pick the one closest to expected
+            found_amounts = [v for v in [receipt_data.total, receipt_data.amount] if v is not None]
+            if found_amounts:
+                closest = min(found_amounts, key=lambda x: abs(x - expected_amount))
+                # If close match (within $5), use it
+                if abs(closest - expected_amount) <= Decimal("5.00"):
+                    receipt_data.total = closest
+                    receipt_data.amount = closest
+        except (InvalidOperation, ValueError):
+            pass  # Use extracted amounts as-is
+
+    def _extract_text(self, file_bytes: bytes, filename: str) -> str:
+        """Run Textract on an uploaded file and log the text it returns.
+
+        Args:
+            file_bytes: Raw file bytes (image or PDF)
+            filename: Original filename for format detection
+
+        Returns:
+            Raw text extracted from the file
+
+        Raises:
+            ValueError: If the file format is not supported
+            RuntimeError: If OCR processing fails
+        """
+        # Check if file is a PDF
+        is_pdf = filename.lower().endswith(".pdf") or file_bytes[:4] == b"%PDF"
+        current_app.logger.debug(f"Is PDF: {is_pdf}")
+
+        # Extract text using AWS Textract (handles both images and PDFs natively)
+        # Note: _extract_text_with_textract handles PDF fallback automatically
+        try:
+            raw_text = self._extract_text_with_textract(file_bytes, filename)
+        except ValueError as e:
+            # ValueError indicates unsupported format or invalid parameters
+            # Re-raise as-is (already user-friendly)
+            current_app.logger.error(f"OCR text extraction failed: {e}")
+            raise
+        except Exception as e:
+            # Other errors (RuntimeError, ClientError, etc.)
+            current_app.logger.error(f"OCR text extraction failed: {e}")
+            raise RuntimeError(f"Failed to extract text: {e}") from e
+
+        # Log raw OCR text for debugging - show ALL text
+        current_app.logger.debug("=" * 60)
+        current_app.logger.debug("RAW OCR TEXT (full text):")
+        current_app.logger.debug("=" * 60)
+        if raw_text:
+            # Log in chunks of 1000 chars to avoid overwhelming logs
+            chunk_size = 1000
+            for i in range(0, len(raw_text), chunk_size):
+                chunk = raw_text[i : i + chunk_size]
+                current_app.logger.debug(f"Chunk {i//chunk_size + 1} (chars {i}-{min(i+chunk_size, len(raw_text))}):")
+                current_app.logger.debug(chunk)
+            current_app.logger.debug(f"\nTotal characters extracted: {len(raw_text)}")
+        else:
+            current_app.logger.debug("No text extracted from OCR")
+        current_app.logger.debug("=" * 60)
+
+        return raw_text
+
     def _extract_text_with_textract(self, file_bytes: bytes, filename: str) -> str:
         """Extract text using AWS Textract with automatic PDF fallback.
 
@@ -560,14 +640,43 @@ class OCRService:
             current_app.logger.warning(f"Could not verify poppler installation: {e}")
 
 
+_shared_service: OCRService | None = None
+_shared_service_lock = threading.Lock()
+
+
+def _ocr_settings() -> tuple[Any, ...]:
+    """OCR settings an OCRService is built from."""
+    config = current_app.config
+    return (
+        config.get("OCR_ENABLED", True),
+        config.get("OCR_CONFIDENCE_THRESHOLD", 0.7),
+        config.get("TEXTRACT_REGION", "us-east-1"),
+        config.get("TEXTRACT_ROLE_ARN"),
+    )
+
+
 def get_ocr_service() -> OCRService | None:
-    """Get OCR service instance.
+    """Get the process-wide OCR service instance.
+
+    The service and its Textract client are reused across requests and threads; the service is
+    only rebuilt when the OCR settings change. A service that came out disabled although
+    ``OCR_ENABLED`` is set (Textract client failed to build) is returned but not kept, so the
+    next call tries again.
 
     Returns:
         OCRService instance or None if OCR is disabled
     """
-    try:
-        return OCRService()
-    except Exception as e:
-        current_app.logger.error(f"Failed to initialize OCR service: {e}")
-        return None
+    global _shared_service
+
+    settings = _ocr_settings()
+    with _shared_service_lock:
+        service = _shared_service
+        if service is None or service.settings != settings:
+            try:
+                service = OCRService()
+            except Exception as e:
+                current_app.logger.error(f"Failed to initialize OCR service: {e}")
+                return None
+            if service.enabled or not current_app.config.get("OCR_ENABLED", True):
+                _shared_service = service
+        return service
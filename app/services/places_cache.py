@@ -0,0 +1,206 @@
+"""Database-backed second-level cache for Google Places API responses.
+
+``simple_cache`` (L1) lives in process memory, so every gunicorn worker and Lambda container
+starts empty. This L2 layer keeps responses in the ``api_cache`` table, where they survive cold
+starts and are shared by every process.
+
+Entries are served as-is while fresh. Once stale they are still served (stale-while-revalidate)
+until their maximum age: the first caller to see a stale entry takes a short refresh lease by
+moving its timestamp forward and refetches it, while everyone else keeps getting the stale copy
+without waiting. The refresh happens in the request that took the lease rather than in a
+background thread, which would be frozen between Lambda invocations.
+
+Cache reads and writes use their own connection and transaction, so they never commit or roll
+back the caller's session, and a database error only costs a cache miss.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, TypeVar
+
+from flask import has_app_context
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.extensions import db
+from app.models.api_cache import APICache
+from app.services import simple_cache
+from app.services.simple_cache import PLACE_NAMESPACE, SEARCH_NAMESPACE
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How long entries are served without refetching
+L2_FRESH_SECONDS = {
+    SEARCH_NAMESPACE: 24 * 3600,  # 1 day
+    PLACE_NAMESPACE: 7 * 24 * 3600,  # 7 days
+}
+# How long stale entries are still served while they are refreshed
+L2_MAX_AGE_SECONDS = {
+    SEARCH_NAMESPACE: 7 * 24 * 3600,  # 7 days
+    PLACE_NAMESPACE: 30 * 24 * 3600,  # 30 days
+}
+# How long one caller may take to refresh a stale entry before another one tries
+REFRESH_LEASE_SECONDS = 60
+
+_api_cache = APICache.__table__
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "stale_hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+
+def _count(counter: str) -> None:
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def make_cache_key(namespace: str, raw_key: str) -> str:
+    """Build the ``api_cache`` key of a response.
+
+    ``raw_key`` must include everything the response depends on (query, location, field
+    mask...); it is hashed to fit the key column.
+    """
+    digest = hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+    return f"places:{namespace}:{digest}"
+
+
+def _load(key: str) -> tuple[Any, float] | None:
+    """Get the cached value and its fetch time."""
+    with db.engine.connect() as connection:
+        row = connection.execute(
+            select(_api_cache.c.data, _api_cache.c.updated_at).where(_api_cache.c.key == key)
+        ).first()
+    if row is None:
+        return None
+    try:
+        return json.loads(row.data), float(row.updated_at)
+    except (TypeError, ValueError):
+        return None
+
+
+def _claim_refresh(key: str, fetched_at: float, fresh_seconds: int) -> bool:
+    """Take the refresh lease of a stale entry; False if another caller already has it."""
+    # Make the entry look fresh to everyone else until the lease runs out
+    leased_at = time.time() - fresh_seconds + REFRESH_LEASE_SECONDS
+    with db.engine.begin() as connection:
+        result = connection.execute(
+            update(_api_cache)
+            .where(_api_cache.c.key == key, _api_cache.c.updated_at == fetched_at)
+            .values(updated_at=leased_at)
+        )
+    return result.rowcount == 1
+
+
+def _store(key: str, value: Any) -> None:
+    """Insert or replace a cached value."""
+    APICache.upsert(key, json.dumps(value))
+
+
+def fetch_through(
+    namespace: str,
+    raw_key: str,
+    fetch: Callable[[], T],
+    should_store: Callable[[T], bool] = bool,
+) -> T:
+    """Get a response from the L2 cache, fetching and storing it when missing or stale.
+
+    Args:
+        namespace: ``SEARCH_NAMESPACE`` or ``PLACE_NAMESPACE``; selects the freshness windows
+        raw_key: Unhashed cache key, see ``make_cache_key``
+        fetch: Calls the API; its result is returned (and stored if ``should_store`` accepts it)
+        should_store: Whether a fetched result is worth caching; empty or error results are not
+
+    Returns:
+        The cached or fetched value. If refetching a stale entry fails, the stale value.
+    """
+    if not has_app_context():
+        return fetch()
+
+    key = make_cache_key(namespace, raw_key)
+    fresh_seconds = L2_FRESH_SECONDS[namespace]
+
+    stale: tuple[Any, float] | None = None
+    try:
+        entry = _load(key)
+        if entry is not None:
+            value, fetched_at = entry
+            age = time.time() - fetched_at
+            if age < fresh_seconds:
+                _count("hits")
+                return value  # type: ignore[no-any-return]
+            if age < L2_MAX_AGE_SECONDS[namespace]:
+                stale = entry
+                if not _claim_refresh(key, fetched_at, fresh_seconds):
+                    _count("stale_hits")
+                    return value  # type: ignore[no-any-return]
+    except SQLAlchemyError as e:
+        _count("errors")
+        logger.warning(f"Places L2 cache read failed: {e}")
+
+    _count("misses")
+    result = fetch()
+    if should_store(result):
+        try:
+            _store(key, result)
+            _count("writes")
+        except SQLAlchemyError as e:
+            _count("errors")
+            logger.warning(f"Places L2 cache write failed: {e}")
+        return result
+
+    if stale is not None:
+        # Keep serving the old response; the lease lets another caller retry later
+        return stale[0]  # type: ignore[no-any-return]
+    return result
+
+
+def _hit_ratio(hits: int, total: int) -> float:
+    return round(hits / total, 4) if total else 0.0
+
+
+def get_places_cache_stats() -> dict[str, Any]:
+    """Get L1 and L2 statistics of this process, including hit ratios."""
+    l1 = simple_cache.get_cache_stats()
+    l1["hit_ratio"] = _hit_ratio(l1["hits"], l1["hits"] + l1["misses"])
+
+    with _stats_lock:
+        l2: dict[str, Any] = dict(_stats)
+    served = l2["hits"] + l2["stale_hits"]
+    l2["hit_ratio"] = _hit_ratio(served, served + l2["misses"])
+
+    # Share of lookups answered without calling Google
+    api_calls = l2["misses"]
+    lookups = l1["hits"] + l1["misses"]
+    return {"l1": l1, "l2": l2, "overall_hit_ratio": _hit_ratio(max(lookups - api_calls, 0), lookups)}
+
+
+def reset_places_cache_stats() -> None:
+    """Reset the L2 counters of this process."""
+    with _stats_lock:
+        for counter in _stats:
+            _stats[counter] = 0
+
+
+def clear_expired_places_cache() -> int:
+    """Delete Places responses that are past their maximum age.
+
+    Returns:
+        Number of entries deleted
+    """
+    deleted = 0
+    for namespace, max_age in L2_MAX_AGE_SECONDS.items():
+        deleted += APICache.clear_expired(max_age, key_prefix=f"places:{namespace}:")
+    return deleted
+
+
+def clear_places_cache() -> int:
+    """Delete every cached Places response."""
+    with db.engine.begin() as connection:
+        result = connection.execute(delete(_api_cache).where(_api_cache.c.key.like("places:%")))
+    return int(result.rowcount or 0)
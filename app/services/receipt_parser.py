@@ -3,16 +3,633 @@
 This module provides a shared ReceiptParser class that contains all receipt parsing logic
 used by both the web application and standalone scripts. It has no dependencies on Flask
 or AWS services, making it reusable across different contexts.
+
+The extractors each walk the receipt lines looking for different things, and the same line is
+typically inspected by several of them (sections, header, legacy fallback). Patterns are
+therefore compiled once at import, and the per-line tests they share (amount, date, time,
+phone, URL, separator, section keywords) are computed once per line by ``classify_line``,
+whose results are memoized, as are the restaurant name candidates of header lines.
+
+Parsing is section-based first; the legacy line-by-line extractors only run for the fields the
+sections left empty, and never repeat a header scan the section pass already did on the same
+lines. Which path produced each field is recorded in ``receipt_data.field_sources``.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 import logging
 import re
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Version of the parsed output; bump it whenever a change alters what is extracted from the same
+# text, so receipts cached by the OCR service are re-parsed (without re-running OCR)
+PARSER_VERSION = 1
+
+# Lines classified per process; a receipt has a few dozen, so this covers many receipts in flight
+LINE_CACHE_SIZE = 4096
+
+# Provenance recorded in ``field_sources`` for each field the parser filled
+FIELD_SOURCE_SECTION = "section"
+FIELD_SOURCE_LEGACY = "legacy"
+FIELD_SOURCE_BANK_STATEMENT = "bank_statement"
+
+_PARSED_FIELDS = (
+    "amount",
+    "date",
+    "time",
+    "restaurant_name",
+    "restaurant_location_number",
+    "restaurant_address",
+    "restaurant_phone",
+    "restaurant_website",
+    "server_name",
+    "customer_name",
+    "check_number",
+    "table_number",
+    "items",
+    "subtotal",
+    "tax",
+    "tip",
+    "total",
+)
+
+# Leading lines read by the header extractors (name, address/phone/website)
+_NAME_WINDOW = 10
+_HEADER_WINDOW = 20
+
+_MONEY = r"(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)"
+
+# Line shapes
+_PRICE_ONLY_RE = re.compile(rf"^\$?\s*{_MONEY}\s*$")
+_AMOUNT_ONLY_RE = re.compile(r"^\$?\s*\d+\.\d{2}$")
+_DOLLAR_AMOUNT_RE = re.compile(r"\$\d+\.\d{2}")
+_ITEM_NAME_RE = re.compile(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+-\s+[A-Z])?")
+_CAPITALIZED_TEXT_RE = re.compile(r"[A-Z][a-zA-Z\s\-']+")
+_ITEM_WITH_PRICE_RE = re.compile(rf"^(.+?)\s+\$?\s*{_MONEY}\s*$")
+_ITEM_WITH_BARE_PRICE_RE = re.compile(rf"^(.+?)\s+{_MONEY}\s*$")
+_TIME_ONLY_RE = re.compile(r"^\d{1,2}:\d{2}\s*(AM|PM|am|pm)?$", re.IGNORECASE)
+_DATE_ONLY_RE = re.compile(r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$")
+_DATE_TIME_RE = re.compile(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}")
+_PHONE_NUMBER_RE = re.compile(r"\(\d{3}\)\s*\d{3}[-.]?\d{4}|\d{3}[-.]?\d{3}[-.]?\d{4}")
+_SEPARATOR_RE = re.compile(r"^[—\-=_·•|]+\s*[A-Za-z\s]*\s*[—\-=_·•|]+$")
+_STATE_ZIP_RE = re.compile(r"[A-Z]{2}\s+\d{5}")
+_LETTERS_RE = re.compile(r"[a-zA-Z]{2,}")
+_WORD_RE = re.compile(r"\b\w+\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+_WEBSITE_RES = (
+    re.compile(r"https?://(?:www\.)?([a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}", re.IGNORECASE),
+    re.compile(r"www\.([a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}", re.IGNORECASE),
+)
+
+# Section keywords (substring matches on the lowercased line)
+_ORDER_INFO_KEYWORDS = ("check", "table", "server", "date", "time", "ordered", "customer", "guest")
+_ITEMS_KEYWORDS = ("description", "qty", "quantity", "item", "price", "menu")
+_TOTALS_KEYWORDS = ("subtotal", "sub total", "tax", "tip", "gratuity", "total", "amount", "paid", "due", "balance")
+_PAYMENT_KEYWORDS = (
+    "visa",
+    "mastercard",
+    "amex",
+    "credit",
+    "debit",
+    "card",
+    "payment",
+    "transaction",
+    "authorization",
+    "approval",
+    "emv",
+    "chip",
+    "tap",
+)
+_FOOTER_KEYWORDS = ("thank", "visit", "gracias", "join", "club", "sign up", "automatically generated")
+# Email client and header artifacts skipped at the top of a receipt
+_EMAIL_HEADER_MARKERS = (
+    "outlook",
+    "from",
+    "to",
+    "subject",
+    "sent",
+    "reply",
+    "no-reply",
+    "receipt for",
+    "receipt from",
+    "thank you for your order",
+)
+
+
+def _keyword_re(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a search for any of ``keywords`` as a substring."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+_ORDER_INFO_KEYWORD_RE = _keyword_re(_ORDER_INFO_KEYWORDS)
+_ITEMS_KEYWORD_RE = _keyword_re(_ITEMS_KEYWORDS)
+_TOTALS_KEYWORD_RE = _keyword_re(_TOTALS_KEYWORDS)
+_PAYMENT_KEYWORD_RE = _keyword_re(_PAYMENT_KEYWORDS)
+_FOOTER_KEYWORD_RE = _keyword_re(_FOOTER_KEYWORDS)
+_EMAIL_HEADER_RE = _keyword_re(_EMAIL_HEADER_MARKERS)
+
+
+@dataclass(frozen=True, slots=True)
+class LineFeatures:
+    """What a receipt line looks like, as tested by the extractors."""
+
+    text: str  # stripped line
+    lower: str
+    words: frozenset[str]
+    is_separator: bool
+    is_price_only: bool  # "$12.50", "12", "1,200.00"
+    is_amount_only: bool  # "$12.50"
+    has_dollar_amount: bool
+    starts_like_item_name: bool  # "Chicken Katsu", "Classic - M..."
+    has_capitalized_text: bool
+    is_date: bool
+    is_time: bool
+    has_date_time: bool
+    has_phone_number: bool
+    website: str | None  # first URL-like match, as written
+    has_order_info_keyword: bool
+    has_items_keyword: bool
+    has_totals_keyword: bool
+    has_payment_keyword: bool
+    has_footer_keyword: bool
+    has_email_header_marker: bool
+
+
+def _is_separator(text: str) -> bool:
+    """Whether a stripped line is a separator: mostly punctuation, or text framed by dashes."""
+    if not text:
+        return False
+
+    # Check for separator patterns: mostly repeating characters
+    # Examples: "———", "---", "===", "___", "— ISLAND GRILL —"
+    # Count non-whitespace, non-alphanumeric characters
+    non_alnum = sum(1 for c in text if not c.isalpha() and not c.isspace())
+    total_chars = len([c for c in text if not c.isspace()])
+
+    if total_chars == 0:
+        return False
+
+    # If >70% of characters are separator characters, it's likely a separator
+    if non_alnum / total_chars > 0.7:
+        return True
+
+    # Check for patterns like "— TEXT —" or "--- TEXT ---"
+    return bool(_SEPARATOR_RE.match(text))
+
+
+def _find_website(text: str) -> str | None:
+    for pattern in _WEBSITE_RES:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+
+@lru_cache(maxsize=LINE_CACHE_SIZE)
+def classify_line(line: str) -> LineFeatures:
+    """Tokenize and classify one receipt line (memoized)."""
+    text = line.strip()
+    lower = text.lower()
+    return LineFeatures(
+        text=text,
+        lower=lower,
+        words=frozenset(_WORD_RE.findall(lower)),
+        is_separator=_is_separator(text),
+        is_price_only=bool(_PRICE_ONLY_RE.match(text)),
+        is_amount_only=bool(_AMOUNT_ONLY_RE.match(text)),
+        has_dollar_amount=bool(_DOLLAR_AMOUNT_RE.search(text)),
+        starts_like_item_name=bool(_ITEM_NAME_RE.match(text)),
+        has_capitalized_text=bool(_CAPITALIZED_TEXT_RE.search(text)),
+        is_date=bool(_DATE_ONLY_RE.match(text)),
+        is_time=bool(_TIME_ONLY_RE.match(text)),
+        has_date_time=bool(_DATE_TIME_RE.search(text)),
+        has_phone_number=bool(_PHONE_NUMBER_RE.search(text)),
+        website=_find_website(text),
+        has_order_info_keyword=bool(_ORDER_INFO_KEYWORD_RE.search(lower)),
+        has_items_keyword=bool(_ITEMS_KEYWORD_RE.search(lower)),
+        has_totals_keyword=bool(_TOTALS_KEYWORD_RE.search(lower)),
+        has_payment_keyword=bool(_PAYMENT_KEYWORD_RE.search(lower)),
+        has_footer_keyword=bool(_FOOTER_KEYWORD_RE.search(lower)),
+        has_email_header_marker=bool(_EMAIL_HEADER_RE.search(lower)),
+    )
+
+
+# Restaurant names that are really a date and/or time: "07/23/2022 07:27 PM", "07:27 PM", "07/23/2022"
+_DATE_TIME_NAME_RE = re.compile(
+    r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}\s*(AM|PM|am|pm)"
+    r"|^\d{1,2}:\d{2}\s*(AM|PM|am|pm)$"
+    r"|^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$",
+    re.IGNORECASE,
+)
+# Bank statement rows: a date followed by a dollar amount
+_DATED_AMOUNT_RE = re.compile(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}.*\$\d+")
+
+# Restaurant name candidates
+_NAME_SKIP_WORDS = frozenset(
+    {
+        "receipt",
+        "invoice",
+        "thank",
+        "you",
+        "visit",
+        "us",
+        "again",
+        "outlook",
+        "gmail",
+        "yahoo",
+        "hotmail",
+        "from",
+        "to",
+        "date",
+        "subject",
+        "sent",
+        "reply",
+        "no-reply",
+        "order",
+        "check",
+        "served",  # "Served by" indicates server name, not restaurant name
+    }
+)
+# Times, dates, amounts, email addresses, addresses, etc. (anchored at the start of the line)
+_NAME_EXCLUDE_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"^\d{1,2}:\d{2}\s*(AM|PM|am|pm)$",  # Time: "12:55 PM"
+            r"^\d{1,2}:\d{2}$",  # Time without AM/PM: "12:55"
+            r"^\d+[\s\d:/-]*$",  # Just numbers with separators
+            r"^\$?\s*\d+\.\d{2}$",  # Just an amount: "$10.00"
+            r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$",  # Date: "10/05/2025"
+            r"^\d{4}[/-]\d{1,2}[/-]\d{1,2}$",  # Date: "2025-10-05"
+            r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}\s*(AM|PM|am|pm)",  # Date + Time
+            r"^total|tax|tip|subtotal",  # Common receipt labels
+            r"^\d+\s*x\s*\$?\d+",  # Quantity x price
+            r"^\d+\s*x\s+[A-Z]",  # Quantity x Item (e.g., "1x DR PEPPER", "2x SALMON")
+            r"^table\s+\d+|server\s+\d+|check\s+\d+",  # Table/server/check numbers
+            r"^served\s+by\s+",  # "Served by Name" - server information, not restaurant name
+            r".*@.*",  # Email addresses
+            r"^from\s+|^to\s+|^subject\s+",  # Email headers
+            r"^\d+\s+[A-Z]\s+FM\s+\d+",  # Address pattern: "3300 W FM 544"
+            r"^\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Circle|Cir|Place|Pl|FM)\s*\d*",  # Street addresses
+            r"^[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}",  # City, State ZIP (address line)
+        )
+    ),
+    re.IGNORECASE,
+)
+_RESTAURANT_INDICATORS = (
+    "bros",
+    "restaurant",
+    "cafe",
+    "grill",
+    "diner",
+    "kitchen",
+    "pizza",
+    "bar",
+    "tavern",
+    "bistro",
+    "eatery",
+    "deli",
+)
+_LEADING_AMOUNT_RE = re.compile(r"^\$?\s*\d+\.\d{2}")
+_AMOUNT_CHARS_RE = re.compile(r"[\d\s\$\.]")
+_EDGE_PUNCTUATION_RE = re.compile(r"^\W+|\W+$")
+# (pattern, whether the number is written with "#")
+_LOCATION_NUMBER_RES = (
+    (re.compile(r"\s*#\s*(\d+)\s*$", re.IGNORECASE), True),  # "#41" or " #41"
+    (re.compile(r"\s*[-–—]\s*#\s*(\d+)\s*$", re.IGNORECASE), True),  # " - #41" or " – #41"
+    (re.compile(r"\s+#\s*(\d+)\s*$", re.IGNORECASE), True),  # " #41"
+    (re.compile(r"\s+(\d{2,4})\s*$", re.IGNORECASE), False),  # " 0033" or " 41"
+)
+_HASH_LOCATION_RES = (
+    re.compile(r"\s*#\s*\d+\s*$", re.IGNORECASE),
+    re.compile(r"\s*[-–—]\s*#\s*\d+\s*$", re.IGNORECASE),
+    re.compile(r"\s+#\s*\d+\s*$", re.IGNORECASE),
+)
+_TRAILING_NUMBER_RE = re.compile(r"\s+(\d{2,4})\s*$")
+_TRAILING_DASH_RE = re.compile(r"\s*[-–—]\s*$")
+
+
+@lru_cache(maxsize=LINE_CACHE_SIZE)
+def restaurant_name_candidate(line: str) -> tuple[str, str | None, bool] | None:
+    """Clean a header line into a restaurant name candidate (memoized).
+
+    Returns:
+        Tuple of (name, location number, has restaurant indicator), or None if the line
+        cannot be a restaurant name (dates, amounts, addresses, email headers, ...)
+    """
+    features = classify_line(line)
+    line_stripped = features.text
+    if len(line_stripped) < 3:
+        return None
+
+    # Whole words only, so "to" does not match "COTTON"
+    if features.words & _NAME_SKIP_WORDS:
+        return None
+    if _NAME_EXCLUDE_RE.match(line_stripped):
+        return None
+    # Mostly numbers or amounts
+    if _LEADING_AMOUNT_RE.search(line_stripped) and len(_AMOUNT_CHARS_RE.sub("", line_stripped)) < 3:
+        return None
+    if not _LETTERS_RE.search(line_stripped):
+        return None
+
+    name = _EDGE_PUNCTUATION_RE.sub("", line_stripped)
+    name = _WHITESPACE_RE.sub(" ", name).strip()
+
+    # Extract location/store number before removing it
+    location_number = None
+    for pattern, has_hash in _LOCATION_NUMBER_RES:
+        match = pattern.search(name)
+        if match:
+            matched_number = match.group(1)
+            # Location numbers are 2-4 digits: not single digits, zip codes or years
+            if len(matched_number) <= 4:
+                num_val = int(matched_number)
+                if 1900 <= num_val <= 2100 or len(matched_number) == 1:
+                    continue
+                location_number = f"#{matched_number}" if has_hash else matched_number
+                break
+
+    for pattern in _HASH_LOCATION_RES:
+        name = pattern.sub("", name)
+    # Remove trailing numbers (2-4 digits) that could be location numbers, but not years
+    trailing_num_match = _TRAILING_NUMBER_RE.search(name)
+    if trailing_num_match and not 1900 <= int(trailing_num_match.group(1)) <= 2100:
+        name = _TRAILING_NUMBER_RE.sub("", name)
+
+    name = _TRAILING_DASH_RE.sub("", name).strip()
+    if len(name) <= 2:
+        return None
+
+    has_restaurant_indicator = any(indicator in features.lower for indicator in _RESTAURANT_INDICATORS)
+    return name, location_number, has_restaurant_indicator
+
+
+# Restaurant addresses
+_ADDRESS_SKIP_RE = _keyword_re(
+    (
+        "receipt",
+        "invoice",
+        "thank",
+        "you",
+        "visit",
+        "us",
+        "again",
+        "outlook",
+        "gmail",
+        "yahoo",
+        "hotmail",
+        "from",
+        "to",
+        "date",
+        "subject",
+        "sent",
+        "reply",
+        "no-reply",
+        "order",
+        "check",
+        "phone",
+        "tel",
+        "call",
+        "email",
+        "web",
+        "www",
+    )
+)
+# Menu items end the address block: "Classic - Mixed Plate", "Item - Description"
+_MENU_ITEM_RE = re.compile(
+    r"^\s*[A-Z][a-z]+(?:\s+-\s+[A-Z][a-z]+)+|^\s*[A-Z][a-z]+\s+-\s+[A-Z]|^\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+-\s+[A-Z]"
+)
+_DASHED_ITEM_NAME_RE = re.compile(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+-\s+[A-Z]")
+_QUANTITY_ITEM_RE = re.compile(r"^\d+x\s+[A-Z]", re.IGNORECASE)
+_TRAILING_DOLLAR_AMOUNT_RE = re.compile(r"\$\d+\.\d{2}\s*$")
+# Street number + street name, numbered routes, city/state/zip, or a bare ZIP code
+_ADDRESS_RE = re.compile(
+    "|".join(
+        (
+            r"\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Circle|Cir|Place|Pl)",
+            r"\d+\s+[A-Z]\s+FM\s+\d+",  # Farm to Market Road: "3300 W FM 544"
+            r"\d+\s+[A-Za-z\s]+FM\s+\d+",
+            r"\d+\s+[A-Za-z0-9\s]+",
+            r"[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?",  # City, State ZIP
+            r"[A-Za-z\s]+,\s*[A-Za-z\s]+,\s*[A-Z]{2}",  # City, State
+            r"\d{5}(?:-\d{4})?",  # ZIP code
+        )
+    ),
+    re.IGNORECASE,
+)
+_FM_ROAD_RE = re.compile(r"\bFM\s+\d+\b", re.IGNORECASE)
+_FM_ADDRESS_RE = re.compile(r"\d+\s+[A-Z]?\s*FM\s+\d+", re.IGNORECASE)
+_ADDRESS_INDICATOR_RE = _keyword_re(
+    (
+        "street",
+        "st",
+        "avenue",
+        "ave",
+        "road",
+        "rd",
+        "boulevard",
+        "blvd",
+        "drive",
+        "dr",
+        "lane",
+        "ln",
+        "court",
+        "ct",
+        "way",
+        "circle",
+        "cir",
+        "place",
+        "pl",
+        "suite",
+        "ste",
+        "unit",
+        "apt",
+        "apartment",
+        "fm",  # Farm to Market Road abbreviation
+    )
+)
+_CITY_STATE_ZIP_RE = re.compile(r"[A-Za-z\s]{3,},\s*[A-Z]{2}\s+\d{5}|[A-Za-z\s]{3,}\s+[A-Z]{2}\s+\d{5}")
+
+
+# Phone numbers in various formats; bare digit runs last to avoid false positives
+_PHONE_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\(?\d{3}\)?\s*-?\s*\d{3}\s*-?\s*\d{4}",  # (XXX) XXX-XXXX or XXX-XXX-XXXX
+        r"\d{3}\.\d{3}\.\d{4}",  # XXX.XXX.XXXX
+        r"\d{3}\s+\d{3}\s+\d{4}",  # XXX XXX XXXX
+        r"\d{3}-\d{3}-\d{4}",  # XXX-XXX-XXXX (explicit dashes)
+        r"\(\d{3}\)\s*\d{3}-\d{4}",  # (XXX) XXX-XXXX
+        r"\(\d{3}\)\s*\d{3}\.\d{4}",  # (XXX) XXX.XXXX
+        r"\d{10}",  # XXXXXXXXXX (10 digits)
+    )
+)
+_NON_DIGIT_RE = re.compile(r"\D")
+_FULL_DATE_RE = re.compile(r"\d{1,2}[/-]\d{1,2}[/-]\d{4}")
+_DECIMAL_AMOUNT_RE = re.compile(r"(\d+)\.(\d{2})")
+
+
+# Items
+_TABLE_HEADER_RE = re.compile(r"description|qty|quantity|price", re.IGNORECASE)
+_TABLE_SEPARATOR_RE = re.compile(r"^[\s\|:\-]+$")
+_CELL_PRICE_RE = re.compile(r"\$?(\d+\.\d{2})")
+_TOTALS_LABEL_RE = re.compile(r"subtotal|tax|tip|total|amount", re.IGNORECASE)
+# Lines in the items section that are not items: dates, addresses, server info, etc.
+_SECTION_ITEM_SKIP_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",  # Date patterns
+            r"\d{1,2}:\d{2}\s*(AM|PM|am|pm)",  # Time patterns
+            r"date\s+",  # "Date Sun..." patterns
+            r"server\s*:|check\s*#|ordered\s*:",  # Server/check info
+            r"[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}",  # City, State ZIP
+            r"\d+\s+[A-Z]\s+FM\s+\d+",  # FM road addresses
+            r"\(?\d{3}\)?\s*-?\s*\d{3}\s*-?\s*\d{4}",  # Phone numbers
+            r"[A-Z][a-z]+\s+Bros\s+\d+$",  # "Hawaiian Bros 0033" pattern
+            r"[A-Z][a-z]+$",  # Single capitalized word (likely a name like "Morgan")
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+_ITEM_SKIP_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"^total",
+            r"^tax",
+            r"^tip",
+            r"^subtotal",
+            r"^\$?\s*\d+\.\d{2}$",  # Just an amount
+            r"^\d+[/-]\d+[/-]\d+",  # Date
+            r"^from\s+|^to\s+|^subject\s+",  # Email headers
+            r".*@.*",  # Email addresses
+            r"^server\s*:|^check\s*#|^ordered\s*:",  # Receipt metadata
+            r"^thank\s+you",  # Footer text
+            r"^trouble\s+viewing",  # Email footer text
+            r"^—+\s*$",  # Separator lines (e.g., "———")
+            r"^[-=_]+\s*$",  # Separator lines with dashes/equals/underscores
+        )
+    ),
+    re.IGNORECASE,
+)
+_ITEM_SKIP_WORDS = frozenset(
+    {
+        "receipt",
+        "invoice",
+        "thank",
+        "you",
+        "visit",
+        "us",
+        "again",
+        "server",
+        "check",
+        "ordered",
+        "from",
+        "to",
+        "date",
+        "subject",
+        "outlook",
+        "gmail",
+        "yahoo",
+        "hotmail",
+        "no-reply",
+        "trouble",
+        "viewing",
+        "email",
+    }
+)
+_METADATA_MARKER_RE = re.compile(r"server\s*:|check\s*#|ordered\s*:", re.IGNORECASE)
+_SERVED_BY_RE = re.compile(r"served\s+by")
+_PAREN_PHONE_RE = re.compile(r"\(\d{3}\)\s*\d{3}[-.]?\d{4}")
+_NAME_WITH_NUMBER_RE = re.compile(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+\d+$")
+# Payment and transaction info ends the items
+_ITEM_PAYMENT_KEYWORD_RE = _keyword_re(
+    (
+        "input type",
+        "emv",
+        "chip",
+        "read",
+        "visa",
+        "credit",
+        "debit",
+        "mastercard",
+        "amex",
+        "transaction",
+        "authorization",
+        "approved",
+        "payment",
+        "card",
+        "terminal",
+        "approval code",
+        "payment id",
+    )
+)
+_LEADING_NUMBER_RE = re.compile(r"^\d+\s*")
+_LEADING_X_RE = re.compile(r"^x\s+", re.IGNORECASE)
+_DASHED_WORD_RE = re.compile(r"^[A-Z][a-z]+\s+-\s+")
+
+
+# Amounts, allowing for OCR errors and fragmentation: "25.50", "25,50", "870 .16"
+_AMOUNT_PATTERNS = (
+    r"\$?\s*(\d{1,3}(?:[,\s]\d{3})*(?:[.,]\d{2})?)",  # Standard: $25.50, 25.50
+    r"\$?\s*(\d+[.,]\d{2})",  # Simple: 25.50 or 25,50
+    r"(\d{1,3}(?:[,\s]\d{3})*[.,]\d{2})",  # Without $: 25.50
+    r"(\d+[.,]\d{1,2})",  # Allow 1 or 2 decimal places
+    r"(\d{2,3})\s+[.,]\s*(\d{2})",  # OCR error: "870 .16" or "75 .95"
+)
+_AMOUNT_RES = tuple(re.compile(pattern) for pattern in _AMOUNT_PATTERNS)
+_AMOUNT_LABELS = {
+    "total": ("total", "amount due", "grand total", "final total", "balance", "amount", "charge"),
+    "tax": ("tax", "sales tax", "gst", "vat", "hst"),
+    "tip": ("tip", "gratuity", "service"),
+    "subtotal": ("subtotal", "sub-total", "total before tax", "sub total"),
+}
+# keyword -> searches for "Total: $17.06" and "$17.06 Total", for each amount pattern
+_LABELED_AMOUNT_RES = {
+    keyword: tuple(
+        re.compile(search_pattern, re.IGNORECASE)
+        for pattern in _AMOUNT_PATTERNS
+        for search_pattern in (rf"{keyword}\s*[:=]?\s*{pattern}", rf"{pattern}\s+{keyword}")
+    )
+    for keywords in _AMOUNT_LABELS.values()
+    for keyword in keywords
+}
+# keyword -> "Total: $17.06" as a whole line
+_KEYWORD_LINE_AMOUNT_RES = {
+    keyword: re.compile(rf"^\s*{keyword}\s*[:=]?\s*\$?\s*(\d{1,3}(?:[,\s]\d{3})*(?:[.,]\d{2})?)\s*$", re.IGNORECASE)
+    for keyword in _LABELED_AMOUNT_RES
+}
+_CELL_AMOUNT_RE = re.compile(rf"\$?{_MONEY}")
+_TOTALS_SECTION_LABELS = {
+    "subtotal": ("subtotal", "sub total", "sub-total"),
+    "tax": ("tax", "sales tax", "gst", "vat", "hst"),
+    "tip": ("tip", "gratuity", "service"),
+    "total": ("total", "grand total", "final total"),
+    "amount": ("amount paid", "amount", "paid", "charge", "due", "balance"),
+}
+# keyword -> "Subtotal $72.30" or "Subtotal: $72.30"
+_TOTALS_SECTION_AMOUNT_RES = {
+    keyword: re.compile(rf"{keyword}\s*:?\s*\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)", re.IGNORECASE)
+    for keywords in _TOTALS_SECTION_LABELS.values()
+    for keyword in keywords
+}
+_FRAGMENT_DOLLARS_RE = re.compile(r"^\$?(\d+)(?:\.\d{2})?$")
+_FRAGMENT_CENTS_RE = re.compile(r"^(\d{2})$")
+_THREE_DIGITS_RE = re.compile(r"^\d{3}$")
+_DECIMAL_CENTS_RE = re.compile(r"^\.\d{2}$")
+_PHONE_PUNCTUATION_RE = re.compile(r"[()\-\.]")
+_DIGIT_RUN_RE = re.compile(r"\d{3,}")
+_PHONE_CONTEXT_RE = re.compile(r"phone|tel|call", re.IGNORECASE)
+_PRICE_CONTEXT_RE = re.compile(r"\$|price|cost|amount|total|tax|tip", re.IGNORECASE)
+
 
 class ReceiptParser:
     """Unified receipt parser with all extraction methods."""
@@ -67,12 +684,19 @@ class ReceiptParser:
 
         # Map extracted section data to ReceiptData fields
         receipt_data = self._map_section_data_to_receipt(extracted_data, receipt_data)
+        section_values = self._parsed_field_values(receipt_data)
+        field_sources = dict.fromkeys(section_values, FIELD_SOURCE_SECTION)
 
         # Fallback: If section-based parsing didn't extract key fields, use legacy parsing
         # Run legacy parser if restaurant_name is missing, OR if items/total are missing
         if not receipt_data.restaurant_name or not receipt_data.items or not receipt_data.total:
             logger.warning("Section-based parsing produced incomplete results, falling back to legacy parsing")
-            receipt_data = self._parse_receipt_data_legacy(raw_text, lines, receipt_data)
+            receipt_data = self._parse_receipt_data_legacy(raw_text, lines, receipt_data, sections)
+            for field, value in self._parsed_field_values(receipt_data).items():
+                if section_values.get(field) != value:
+                    field_sources[field] = FIELD_SOURCE_LEGACY
+
+        receipt_data.field_sources = field_sources
 
         # Calculate confidence scores
         receipt_data.confidence_scores = self._calculate_confidence_scores(receipt_data)
@@ -102,49 +726,58 @@ class ReceiptParser:
 
         return receipt_data
 
-    def _parse_receipt_data_legacy(self, raw_text: str, lines: list[str], receipt_data: Any) -> Any:
+    def _parse_receipt_data_legacy(
+        self,
+        raw_text: str,
+        lines: list[str],
+        receipt_data: Any,
+        sections: dict[str, list[str]] | None = None,
+    ) -> Any:
         """Legacy parsing method as fallback when section-based parsing fails.
 
-        This uses the original line-by-line extraction approach.
+        This uses the original line-by-line extraction approach, but only for the fields that
+        are still missing. Header extractors are skipped when the section pass already ran
+        them over the same leading lines, since they would find the same nothing again.
 
         Args:
             raw_text: Raw text extracted from OCR
             lines: List of text lines
             receipt_data: Partially populated ReceiptData object
+            sections: Sections from ``_identify_sections`` that produced receipt_data, if any
 
         Returns:
             ReceiptData object with parsed fields
         """
+        header = (sections or {}).get("header") or []
+
+        def header_scanned(window: int) -> bool:
+            return bool(header) and header[:window] == lines[:window]
+
         # Extract restaurant name - overwrite if current value looks incorrect (e.g., date/time)
         current_name = receipt_data.restaurant_name
         # Check if current name looks like a date/time (common mistake)
         is_incorrect_name = False
         if current_name:
             # Check if it matches date/time patterns
-            date_time_patterns = [
-                r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}\s*(AM|PM|am|pm)",  # "07/23/2022 07:27 PM"
-                r"^\d{1,2}:\d{2}\s*(AM|PM|am|pm)$",  # "07:27 PM"
-                r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$",  # "07/23/2022"
-            ]
-            for pattern in date_time_patterns:
-                if re.match(pattern, current_name, re.IGNORECASE):
-                    is_incorrect_name = True
-                    logger.debug(f"Current restaurant name '{current_name}' looks like date/time, will overwrite")
-                    break
+            if _DATE_TIME_NAME_RE.match(current_name):
+                is_incorrect_name = True
+                logger.debug(f"Current restaurant name '{current_name}' looks like date/time, will overwrite")
 
-        if not receipt_data.restaurant_name or is_incorrect_name:
+        if (not receipt_data.restaurant_name or is_incorrect_name) and not header_scanned(_NAME_WINDOW):
             name_result = self._extract_restaurant_name(lines)
             receipt_data.restaurant_name, receipt_data.restaurant_location_number = name_result
 
-        if not receipt_data.restaurant_address:
+        if not receipt_data.restaurant_address and not header_scanned(_HEADER_WINDOW):
             receipt_data.restaurant_address = self._extract_restaurant_address(lines)
 
         if not receipt_data.restaurant_phone:
-            receipt_data.restaurant_phone = self._extract_restaurant_phone(lines)
-            if not receipt_data.restaurant_phone:
+            if not header_scanned(_HEADER_WINDOW):
+                receipt_data.restaurant_phone = self._extract_restaurant_phone(lines)
+            # The header section already searched the full text when it found no phone
+            if not receipt_data.restaurant_phone and not header:
                 receipt_data.restaurant_phone = self._extract_restaurant_phone_from_text(raw_text)
 
-        if not receipt_data.restaurant_website:
+        if not receipt_data.restaurant_website and not header_scanned(_HEADER_WINDOW):
             receipt_data.restaurant_website = self._extract_restaurant_website(lines)
 
         if not receipt_data.date:
@@ -187,6 +820,12 @@ class ReceiptParser:
 
         return receipt_data
 
+    @staticmethod
+    def _parsed_field_values(receipt_data: Any) -> dict[str, Any]:
+        """Return the parsed fields of receipt_data that currently hold a value."""
+        values = {field: getattr(receipt_data, field, None) for field in _PARSED_FIELDS}
+        return {field: value for field, value in values.items() if value}
+
     def _identify_sections(self, lines: list[str]) -> dict[str, list[str]]:
         """Identify sections in the receipt and group lines by section.
 
@@ -216,76 +855,29 @@ class ReceiptParser:
         if not lines:
             return sections
 
-        # Keywords to identify section boundaries
-        order_info_keywords = ["check", "table", "server", "date", "time", "ordered", "customer", "guest"]
-        items_keywords = ["description", "qty", "quantity", "item", "price", "menu"]
-        totals_keywords = [
-            "subtotal",
-            "sub total",
-            "tax",
-            "tip",
-            "gratuity",
-            "total",
-            "amount",
-            "paid",
-            "due",
-            "balance",
-        ]
-        payment_keywords = [
-            "visa",
-            "mastercard",
-            "amex",
-            "credit",
-            "debit",
-            "card",
-            "payment",
-            "transaction",
-            "authorization",
-            "approval",
-            "emv",
-            "chip",
-            "tap",
-        ]
-        footer_keywords = ["thank", "visit", "gracias", "join", "club", "sign up", "automatically generated"]
-
         current_section = "header"
         header_end_idx = min(15, len(lines))  # Header typically first 15 lines
         items_started = False
         totals_started = False
         payment_started = False
+        previous: LineFeatures | None = None
 
         for idx, line in enumerate(lines):
-            line_lower = line.lower()
+            features = classify_line(line)
+            prev_features, previous = previous, features
 
             # Skip email headers and common receipt artifacts at the very beginning
-            if idx < 10:
-                skip_patterns = [
-                    "outlook",
-                    "from",
-                    "to",
-                    "subject",
-                    "sent",
-                    "reply",
-                    "no-reply",
-                    "receipt for",
-                    "receipt from",
-                    "thank you for your order",
-                ]
-                if any(pattern in line_lower for pattern in skip_patterns):
-                    continue  # Skip this line entirely
+            if idx < 10 and features.has_email_header_marker:
+                continue  # Skip this line entirely
 
             # Special handling: If this is a price-only line and previous line was an item name,
             # keep it in the items section (prices can be on separate lines from item names)
-            is_price_only = bool(re.match(r"^\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$", line.strip()))
-            if is_price_only and items_started and idx > 0:
-                prev_line = lines[idx - 1].strip()
-                # Check if previous line looks like an item name (not a totals label)
+            if features.is_price_only and items_started and prev_features is not None:
+                # Check if previous line looks like an item name (not a totals label, not also a price)
                 prev_looks_like_item = (
-                    re.search(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+-\s+[A-Z])?", prev_line)
-                    and not any(keyword in prev_line.lower() for keyword in totals_keywords)
-                    and not re.match(
-                        r"^\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$", prev_line
-                    )  # Previous line is not also a price
+                    prev_features.starts_like_item_name
+                    and not prev_features.has_totals_keyword
+                    and not prev_features.is_price_only
                 )
                 if prev_looks_like_item:
                     # This price belongs to the previous item, keep it in items section
@@ -295,46 +887,45 @@ class ReceiptParser:
 
             # Identify section transitions (simplified logic)
             # Check for totals keywords first (highest priority after items started)
-            if items_started and not totals_started and any(keyword in line_lower for keyword in totals_keywords):
+            if items_started and not totals_started and features.has_totals_keyword:
                 totals_started = True
                 current_section = "totals"
             # Check for payment keywords (after totals)
-            elif totals_started and not payment_started and any(keyword in line_lower for keyword in payment_keywords):
+            elif totals_started and not payment_started and features.has_payment_keyword:
                 payment_started = True
                 current_section = "payment"
             # Check for footer keywords
-            elif any(keyword in line_lower for keyword in footer_keywords):
+            elif features.has_footer_keyword:
                 current_section = "footer"
             # Check for items (before totals)
             elif not totals_started:
+                line_lower = features.lower
                 # Check for table structure (markdown-style tables with |)
                 if "|" in line and ("description" in line_lower or "qty" in line_lower or "price" in line_lower):
                     items_started = True
                     current_section = "items"
                 # Check for item-like patterns (text followed by price) - more flexible
-                elif re.search(r"[A-Z][a-zA-Z\s\-']+", line) and re.search(r"\$\d+\.\d{2}", line):
+                elif features.has_capitalized_text and features.has_dollar_amount:
                     # Make sure it's not a totals line
-                    if not any(keyword in line_lower for keyword in totals_keywords):
+                    if not features.has_totals_keyword:
                         items_started = True
                         current_section = "items"
                     else:
                         totals_started = True
                         current_section = "totals"
                 # Check for item keywords
-                elif any(keyword in line_lower for keyword in items_keywords):
+                elif features.has_items_keyword:
                     items_started = True
                     current_section = "items"
                 # Check for item name patterns (even without price on same line)
-                elif re.search(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+-\s+[A-Z])?", line) and not any(
-                    keyword in line_lower for keyword in totals_keywords
-                ):
+                elif features.starts_like_item_name and not features.has_totals_keyword:
                     items_started = True
                     current_section = "items"
                 # If we've already started items, continue in items section
                 elif items_started:
                     current_section = "items"
                 # Check for order info keywords
-                elif any(keyword in line_lower for keyword in order_info_keywords):
+                elif features.has_order_info_keyword:
                     current_section = "order_info"
                 # Default: if we're in first 15 lines, it's header, otherwise order_info
                 elif idx < header_end_idx:
@@ -343,7 +934,7 @@ class ReceiptParser:
                     current_section = "order_info"
             # After totals started, continue in totals or payment
             elif totals_started and not payment_started:
-                if any(keyword in line_lower for keyword in payment_keywords):
+                if features.has_payment_keyword:
                     payment_started = True
                     current_section = "payment"
                 else:
@@ -407,11 +998,9 @@ class ReceiptParser:
             # Extract menu items with prices
             # Get restaurant name from header section if available
             restaurant_name = None
-            for line in all_lines[:15]:
-                name_result = self._extract_restaurant_name([line])
-                if name_result[0]:
-                    restaurant_name = name_result[0]
-                    break
+            candidate = next(filter(None, map(restaurant_name_candidate, all_lines[:15])), None)
+            if candidate:
+                restaurant_name = self._to_proper_case(candidate[0])
             extracted["items"] = self._extract_items_from_section(section_lines, restaurant_name)
 
         elif section_name == "totals":
@@ -482,422 +1071,28 @@ class ReceiptParser:
     def _extract_restaurant_name(self, lines: list[str]) -> tuple[str | None, str | None]:
         """Extract restaurant name from receipt lines.
 
+        Prefers the first of the first 10 lines with a restaurant indicator (cafe, grill, ...),
+        so names are found even when they appear after other lines, and otherwise falls back
+        to the first line that could be a name.
+
         Args:
             lines: List of text lines from receipt
 
         Returns:
             Tuple of (restaurant name, location number) or (None, None)
         """
-        if not lines:
+        candidates = [candidate for candidate in map(restaurant_name_candidate, lines[:10]) if candidate]
+        if not candidates:
+            logger.debug("No restaurant name found in first 10 lines")
             return None, None
 
-        # Skip email headers and common receipt words
-        skip_words = {
-            "receipt",
-            "invoice",
-            "thank",
-            "you",
-            "visit",
-            "us",
-            "again",
-            "outlook",
-            "gmail",
-            "yahoo",
-            "hotmail",
-            "from",
-            "to",
-            "date",
-            "subject",
-            "sent",
-            "reply",
-            "no-reply",
-            "order",
-            "check",
-            "served",  # "Served by" indicates server name, not restaurant name
-        }
-
-        # Patterns to exclude (times, dates, amounts, email addresses, addresses, etc.)
-        exclude_patterns = [
-            r"^\d{1,2}:\d{2}\s*(AM|PM|am|pm)$",  # Time: "12:55 PM"
-            r"^\d{1,2}:\d{2}$",  # Time without AM/PM: "12:55"
-            r"^\d+[\s\d:/-]*$",  # Just numbers with separators
-            r"^\$?\s*\d+\.\d{2}$",  # Just an amount: "$10.00"
-            r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$",  # Date: "10/05/2025"
-            r"^\d{4}[/-]\d{1,2}[/-]\d{1,2}$",  # Date: "2025-10-05"
-            r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}\s*(AM|PM|am|pm)",  # Date + Time: "07/23/2022 07:27 PM"
-            r"^total|tax|tip|subtotal",  # Common receipt labels
-            r"^\d+\s*x\s*\$?\d+",  # Quantity x price
-            r"^\d+\s*x\s+[A-Z]",  # Quantity x Item (e.g., "1x DR PEPPER", "2x SALMON")
-            r"^table\s+\d+|server\s+\d+|check\s+\d+",  # Table/server/check numbers
-            r"^served\s+by\s+",  # "Served by Name" - server information, not restaurant name
-            r".*@.*",  # Email addresses
-            r"^from\s+|^to\s+|^subject\s+",  # Email headers
-            r"^\d+\s+[A-Z]\s+FM\s+\d+",  # Address pattern: "3300 W FM 544"
-            r"^\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Circle|Cir|Place|Pl|FM)\s*\d*",  # Street addresses
-            r"^[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}",  # City, State ZIP (address line)
-        ]
-
-        # Restaurant name indicators (prioritize lines with these)
-        restaurant_indicators = [
-            "bros",
-            "restaurant",
-            "cafe",
-            "grill",
-            "diner",
-            "kitchen",
-            "pizza",
-            "bar",
-            "tavern",
-            "bistro",
-            "eatery",
-            "deli",
-        ]
-
-        # First pass: prioritize lines with restaurant indicators (cafe, restaurant, etc.)
-        # This ensures we find restaurant names even if they appear after other lines
-        for line in lines[:10]:
-            line_lower = line.lower().strip()
-            line_stripped = line.strip()
-
-            # Skip empty lines
-            if not line_stripped or len(line_stripped) < 3:
-                continue
-
-            # Check if this line has restaurant indicators first
-            has_restaurant_indicator = any(indicator in line_lower for indicator in restaurant_indicators)
-            if not has_restaurant_indicator:
-                continue  # Skip lines without indicators in first pass
-
-            # Skip lines with skip words (email clients, headers, etc.)
-            # Use word boundaries to avoid false positives (e.g., "to" matching "COTTON")
-            line_words = set(re.findall(r"\b\w+\b", line_lower))
-            skip_words_set = set(skip_words)
-            if line_words & skip_words_set:  # Check for whole word matches only
-                matched_words = line_words & skip_words_set
-                logger.debug(f"Skipping line '{line_stripped}' (contains skip word: {matched_words})")
-                continue
-
-            # Skip lines matching exclude patterns
-            if any(re.match(pattern, line_stripped, re.IGNORECASE) for pattern in exclude_patterns):
-                logger.debug(f"Skipping line '{line_stripped}' (matches exclude pattern)")
-                continue
-
-            # Skip lines that are mostly numbers or amounts
-            if re.search(r"^\$?\s*\d+\.\d{2}", line_stripped) and len(re.sub(r"[\d\s\$\.]", "", line_stripped)) < 3:
-                logger.debug(f"Skipping line '{line_stripped}' (mostly numbers/amount)")
-                continue
-
-            # Must have at least some letters (restaurant names have letters)
-            if not re.search(r"[a-zA-Z]{2,}", line_stripped):
-                logger.debug(f"Skipping line '{line_stripped}' (no letters found)")
-                continue
-
-            # Skip lines that look like addresses (street addresses, city/state/zip)
-            # Check for address patterns: starts with number + street type, or city/state/zip pattern
-            if re.match(r"^\d+\s+[A-Z]\s+FM\s+\d+", line_stripped, re.IGNORECASE):
-                logger.debug(f"Skipping line '{line_stripped}' (address pattern: FM road)")
-                continue
-            if re.match(
-                r"^\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Circle|Cir|Place|Pl|FM)\s*\d*",
-                line_stripped,
-                re.IGNORECASE,
-            ):
-                logger.debug(f"Skipping line '{line_stripped}' (address pattern: street address)")
-                continue
-            if re.match(r"^[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}", line_stripped):
-                logger.debug(f"Skipping line '{line_stripped}' (address pattern: city/state/zip)")
-                continue
-
-            # Clean up common receipt artifacts
-            name = re.sub(r"^\W+|\W+$", "", line_stripped)  # Remove leading/trailing punctuation
-            name = re.sub(r"\s+", " ", name).strip()  # Normalize whitespace
-
-            # Extract location/store number before removing it
-            location_number = None
-            location_patterns = [
-                r"\s*#\s*(\d+)\s*$",  # "#41" or " #41"
-                r"\s*[-–—]\s*#\s*(\d+)\s*$",  # " - #41" or " – #41"
-                r"\s+#\s*(\d+)\s*$",  # " #41"
-                r"\s+(\d{2,4})\s*$",  # " 0033" or " 41" (2-4 digits, likely location number)
-            ]
-            for pattern in location_patterns:
-                match = re.search(pattern, name, re.IGNORECASE)
-                if match:
-                    matched_number = match.group(1)
-                    # Check if it's a location number pattern (not a zip code or year)
-                    # Location numbers are typically 2-4 digits, not 5 digits (zip codes)
-                    # and not years (1900-2100 range)
-                    if len(matched_number) <= 4:
-                        try:
-                            num_val = int(matched_number)
-                            # Skip if it looks like a year (1900-2100)
-                            if 1900 <= num_val <= 2100:
-                                continue
-                            # Skip if it's a single digit (likely not a location number)
-                            if len(matched_number) == 1:
-                                continue
-                            # Use "#" prefix if pattern had "#", otherwise use as-is
-                            if "#" in pattern:
-                                location_number = f"#{matched_number}"
-                            else:
-                                location_number = matched_number
-                            break
-                        except ValueError:
-                            continue
-
-            # Remove location numbers like "#41", "#123", "0033", etc. at the end
-            name = re.sub(r"\s*#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            name = re.sub(r"\s*[-–—]\s*#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            name = re.sub(r"\s+#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            # Remove trailing numbers (2-4 digits) that could be location numbers
-            # But be careful not to remove years or zip codes
-            trailing_num_match = re.search(r"\s+(\d{2,4})\s*$", name)
-            if trailing_num_match:
-                num_str = trailing_num_match.group(1)
-                try:
-                    num_val = int(num_str)
-                    # Only remove if it's not a year (1900-2100) and not a zip code (5 digits)
-                    if not (1900 <= num_val <= 2100) and len(num_str) <= 4:
-                        name = re.sub(r"\s+\d{2,4}\s*$", "", name)
-                except ValueError:
-                    pass
-
-            # Clean up any trailing dashes or spaces left after removal
-            name = re.sub(r"\s*[-–—]\s*$", "", name)
-            name = name.strip()
-
-            # If it has restaurant indicators, prioritize it
-            if len(name) > 2:
-                # Convert all caps to proper case
-                name = self._to_proper_case(name)
-                logger.debug(f"Extracted restaurant name (with indicator): '{name}' from line '{line_stripped}'")
-                logger.debug(f"Location number extracted: '{location_number}'")
-                return name, location_number
-
-        # Second pass: check all lines (up to 10) to find restaurant name past email headers
-        for line in lines[:10]:
-            line_lower = line.lower().strip()
-            line_stripped = line.strip()
-
-            # Skip empty lines
-            if not line_stripped or len(line_stripped) < 3:
-                continue
-
-            # Skip lines with skip words (email clients, headers, etc.)
-            # Use word boundaries to avoid false positives (e.g., "to" matching "COTTON")
-            line_words = set(re.findall(r"\b\w+\b", line_lower))
-            skip_words_set = set(skip_words)
-            if line_words & skip_words_set:  # Check for whole word matches only
-                matched_words = line_words & skip_words_set
-                logger.debug(f"Skipping line '{line_stripped}' (contains skip word: {matched_words})")
-                continue
-
-            # Skip lines matching exclude patterns
-            if any(re.match(pattern, line_stripped, re.IGNORECASE) for pattern in exclude_patterns):
-                logger.debug(f"Skipping line '{line_stripped}' (matches exclude pattern)")
-                continue
-
-            # Skip lines that are mostly numbers or amounts
-            if re.search(r"^\$?\s*\d+\.\d{2}", line_stripped) and len(re.sub(r"[\d\s\$\.]", "", line_stripped)) < 3:
-                logger.debug(f"Skipping line '{line_stripped}' (mostly numbers/amount)")
-                continue
-
-            # Must have at least some letters (restaurant names have letters)
-            if not re.search(r"[a-zA-Z]{2,}", line_stripped):
-                logger.debug(f"Skipping line '{line_stripped}' (no letters found)")
-                continue
-
-            # Skip lines that look like addresses (street addresses, city/state/zip)
-            # Check for address patterns: starts with number + street type, or city/state/zip pattern
-            if re.match(r"^\d+\s+[A-Z]\s+FM\s+\d+", line_stripped, re.IGNORECASE):
-                logger.debug(f"Skipping line '{line_stripped}' (address pattern: FM road)")
-                continue
-            if re.match(
-                r"^\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Circle|Cir|Place|Pl|FM)\s*\d*",
-                line_stripped,
-                re.IGNORECASE,
-            ):
-                logger.debug(f"Skipping line '{line_stripped}' (address pattern: street address)")
-                continue
-            if re.match(r"^[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}", line_stripped):
-                logger.debug(f"Skipping line '{line_stripped}' (address pattern: city/state/zip)")
-                continue
-
-            # Clean up common receipt artifacts
-            name = re.sub(r"^\W+|\W+$", "", line_stripped)  # Remove leading/trailing punctuation
-            name = re.sub(r"\s+", " ", name).strip()  # Normalize whitespace
-
-            # Extract location/store number before removing it
-            location_number = None
-            location_patterns = [
-                r"\s*#\s*(\d+)\s*$",  # "#41" or " #41"
-                r"\s*[-–—]\s*#\s*(\d+)\s*$",  # " - #41" or " – #41"
-                r"\s+#\s*(\d+)\s*$",  # " #41"
-                r"\s+(\d{2,4})\s*$",  # " 0033" or " 41" (2-4 digits, likely location number)
-            ]
-            for pattern in location_patterns:
-                match = re.search(pattern, name, re.IGNORECASE)
-                if match:
-                    matched_number = match.group(1)
-                    # Check if it's a location number pattern (not a zip code or year)
-                    # Location numbers are typically 2-4 digits, not 5 digits (zip codes)
-                    # and not years (1900-2100 range)
-                    if len(matched_number) <= 4:
-                        try:
-                            num_val = int(matched_number)
-                            # Skip if it looks like a year (1900-2100)
-                            if 1900 <= num_val <= 2100:
-                                continue
-                            # Skip if it's a single digit (likely not a location number)
-                            if len(matched_number) == 1:
-                                continue
-                            # Use "#" prefix if pattern had "#", otherwise use as-is
-                            if "#" in pattern:
-                                location_number = f"#{matched_number}"
-                            else:
-                                location_number = matched_number
-                            break
-                        except ValueError:
-                            continue
-
-            # Remove location numbers like "#41", "#123", "0033", etc. at the end
-            name = re.sub(r"\s*#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            name = re.sub(r"\s*[-–—]\s*#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            name = re.sub(r"\s+#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            # Remove trailing numbers (2-4 digits) that could be location numbers
-            # But be careful not to remove years or zip codes
-            trailing_num_match = re.search(r"\s+(\d{2,4})\s*$", name)
-            if trailing_num_match:
-                num_str = trailing_num_match.group(1)
-                try:
-                    num_val = int(num_str)
-                    # Only remove if it's not a year (1900-2100) and not a zip code (5 digits)
-                    if not (1900 <= num_val <= 2100) and len(num_str) <= 4:
-                        name = re.sub(r"\s+\d{2,4}\s*$", "", name)
-                except ValueError:
-                    pass
-
-            # Clean up any trailing dashes or spaces left after removal
-            name = re.sub(r"\s*[-–—]\s*$", "", name)
-            name = name.strip()
-
-            # Check if this looks like a restaurant name
-            has_restaurant_indicator = any(indicator in line_lower for indicator in restaurant_indicators)
-
-            # If it has restaurant indicators, prioritize it
-            if len(name) > 2:
-                if has_restaurant_indicator:
-                    # Convert all caps to proper case
-                    name = self._to_proper_case(name)
-                    logger.debug(f"Extracted restaurant name (with indicator): '{name}' from line '{line_stripped}'")
-                    logger.debug(f"Location number extracted: '{location_number}'")
-                    return name, location_number
-                # Otherwise, continue searching for one with indicators
-
-        # If no restaurant indicator found, return the first valid name found
-        for line in lines[:10]:
-            line_lower = line.lower().strip()
-            line_stripped = line.strip()
-
-            if not line_stripped or len(line_stripped) < 3:
-                continue
-
-            # Use word boundaries to avoid false positives
-            line_words = set(re.findall(r"\b\w+\b", line_lower))
-            skip_words_set = set(skip_words)
-            if line_words & skip_words_set:  # Check for whole word matches only
-                continue
-
-            if any(re.match(pattern, line_stripped, re.IGNORECASE) for pattern in exclude_patterns):
-                continue
-
-            if re.search(r"^\$?\s*\d+\.\d{2}", line_stripped) and len(re.sub(r"[\d\s\$\.]", "", line_stripped)) < 3:
-                continue
-
-            if not re.search(r"[a-zA-Z]{2,}", line_stripped):
-                continue
-
-            # Skip lines that look like addresses in fallback too
-            if re.match(r"^\d+\s+[A-Z]\s+FM\s+\d+", line_stripped, re.IGNORECASE):
-                logger.debug(f"Skipping line '{line_stripped}' (fallback: address pattern: FM road)")
-                continue
-            if re.match(
-                r"^\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Circle|Cir|Place|Pl|FM)\s*\d*",
-                line_stripped,
-                re.IGNORECASE,
-            ):
-                logger.debug(f"Skipping line '{line_stripped}' (fallback: address pattern: street address)")
-                continue
-            if re.match(r"^[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}", line_stripped):
-                logger.debug(f"Skipping line '{line_stripped}' (fallback: address pattern: city/state/zip)")
-                continue
-
-            name = re.sub(r"^\W+|\W+$", "", line_stripped)
-            name = re.sub(r"\s+", " ", name).strip()
-
-            # Extract location/store number before removing it
-            location_number = None
-            location_patterns = [
-                r"\s*#\s*(\d+)\s*$",  # "#41" or " #41"
-                r"\s*[-–—]\s*#\s*(\d+)\s*$",  # " - #41" or " – #41"
-                r"\s+#\s*(\d+)\s*$",  # " #41"
-                r"\s+(\d{2,4})\s*$",  # " 0033" or " 41" (2-4 digits, likely location number)
-            ]
-            for pattern in location_patterns:
-                match = re.search(pattern, name, re.IGNORECASE)
-                if match:
-                    matched_number = match.group(1)
-                    # Check if it's a location number pattern (not a zip code or year)
-                    # Location numbers are typically 2-4 digits, not 5 digits (zip codes)
-                    # and not years (1900-2100 range)
-                    if len(matched_number) <= 4:
-                        try:
-                            num_val = int(matched_number)
-                            # Skip if it looks like a year (1900-2100)
-                            if 1900 <= num_val <= 2100:
-                                continue
-                            # Skip if it's a single digit (likely not a location number)
-                            if len(matched_number) == 1:
-                                continue
-                            # Use "#" prefix if pattern had "#", otherwise use as-is
-                            if "#" in pattern:
-                                location_number = f"#{matched_number}"
-                            else:
-                                location_number = matched_number
-                            break
-                        except ValueError:
-                            continue
-
-            # Remove location numbers like "#41", "#123", "0033", etc. at the end
-            name = re.sub(r"\s*#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            name = re.sub(r"\s*[-–—]\s*#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            name = re.sub(r"\s+#\s*\d+\s*$", "", name, flags=re.IGNORECASE)
-            # Remove trailing numbers (2-4 digits) that could be location numbers
-            # But be careful not to remove years or zip codes
-            trailing_num_match = re.search(r"\s+(\d{2,4})\s*$", name)
-            if trailing_num_match:
-                num_str = trailing_num_match.group(1)
-                try:
-                    num_val = int(num_str)
-                    # Only remove if it's not a year (1900-2100) and not a zip code (5 digits)
-                    if not (1900 <= num_val <= 2100) and len(num_str) <= 4:
-                        name = re.sub(r"\s+\d{2,4}\s*$", "", name)
-                except ValueError:
-                    pass
-
-            # Clean up any trailing dashes or spaces left after removal
-            name = re.sub(r"\s*[-–—]\s*$", "", name)
-            name = name.strip()
-
-            if len(name) > 2:
-                # Convert all caps to proper case
-                name = self._to_proper_case(name)
-                logger.debug(f"Extracted restaurant name (fallback): '{name}' from line '{line_stripped}'")
-                logger.debug(f"Location number extracted (fallback): '{location_number}'")
-                return name, location_number
-
-        logger.debug("No restaurant name found in first 10 lines")
-        return None, None
+        name, location_number, _ = next(
+            (candidate for candidate in candidates if candidate[2]),
+            candidates[0],
+        )
+        name = self._to_proper_case(name)
+        logger.debug(f"Extracted restaurant name: '{name}', location number: '{location_number}'")
+        return name, location_number
 
     def _extract_restaurant_address(self, lines: list[str]) -> str | None:
         """Extract restaurant address from receipt lines.
@@ -914,135 +1109,72 @@ class ReceiptParser:
         if not lines:
             return None
 
-        # Skip email headers and common receipt words
-        skip_words = {
-            "receipt",
-            "invoice",
-            "thank",
-            "you",
-            "visit",
-            "us",
-            "again",
-            "outlook",
-            "gmail",
-            "yahoo",
-            "hotmail",
-            "from",
-            "to",
-            "date",
-            "subject",
-            "sent",
-            "reply",
-            "no-reply",
-            "order",
-            "check",
-            "phone",
-            "tel",
-            "call",
-            "email",
-            "web",
-            "www",
-        }
-
-        # Menu item indicators - if we see these, we've moved past the address section
-        menu_item_indicators = [
-            r"^\s*[A-Z][a-z]+(?:\s+-\s+[A-Z][a-z]+)+",  # "Classic - Mixed Plate" pattern
-            r"^\s*[A-Z][a-z]+\s+-\s+[A-Z]",  # "Item - Description" pattern
-            r"^\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+-\s+[A-Z]",  # Multi-word items with dash
-        ]
-
-        # Patterns to identify address lines
-        # Address patterns: street number + street name, or city/state/zip
-        address_patterns = [
-            r"\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Circle|Cir|Place|Pl)",  # Street address
-            r"\d+\s+[A-Z]\s+FM\s+\d+",  # Farm to Market Road pattern: "3300 W FM 544"
-            r"\d+\s+[A-Za-z\s]+FM\s+\d+",  # FM Road pattern without directional
-            r"\d+\s+[A-Za-z0-9\s]+",  # Number + words/numbers (potential street address, includes numbered routes)
-            r"[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?",  # City, State ZIP
-            r"[A-Za-z\s]+,\s*[A-Za-z\s]+,\s*[A-Z]{2}",  # City, State
-            r"\d{5}(?:-\d{4})?",  # ZIP code
-        ]
-
         # Look for address in lines after restaurant name (typically lines 2-15)
         # Addresses usually appear within a few lines of the restaurant name
         address_lines: list[str] = []
         found_complete_address = False  # Track if we found city/state/zip
 
         for idx, line in enumerate(lines[:20]):  # Check first 20 lines
-            line_stripped = line.strip()
-            line_lower = line_stripped.lower()
+            features = classify_line(line)
+            line_stripped = features.text
 
             # Skip empty lines
-            if not line_stripped or len(line_stripped) < 5:
+            if len(line_stripped) < 5:
                 logger.debug(f"Skipping line {idx} (empty or too short): '{line_stripped}'")
                 continue
 
             # Skip lines with skip words
-            skip_word_found = any(word in line_lower for word in skip_words)
-            if skip_word_found:
+            if _ADDRESS_SKIP_RE.search(features.lower):
                 logger.debug(f"Skipping line {idx} (contains skip word): '{line_stripped}'")
                 continue
 
-            # Skip time patterns
-            if re.match(r"^\d{1,2}:\d{2}\s*(AM|PM|am|pm)?$", line_stripped, re.IGNORECASE):
-                continue
-
-            # Skip date patterns (MM/DD/YY, MM/DD/YYYY, etc.)
-            if re.match(r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$", line_stripped):
+            # Skip time and date patterns (MM/DD/YY, MM/DD/YYYY, etc.)
+            if features.is_time or features.is_date:
                 continue
 
             # Extract address part before date/time if present
-            date_time_match = re.search(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}", line_stripped)
-            if date_time_match:
-                address_part = line_stripped[: date_time_match.start()].strip()
-                if len(address_part) >= 5:
-                    line_stripped = address_part
-                else:
+            if features.has_date_time:
+                date_time_match = _DATE_TIME_RE.search(line_stripped)
+                address_part = line_stripped[: date_time_match.start()].strip() if date_time_match else ""
+                if len(address_part) < 5:
                     continue
+                features = classify_line(address_part)
+                line_stripped = features.text
 
             # Skip email addresses
             if "@" in line_stripped:
                 continue
 
             # Skip lines that are just amounts
-            if re.match(r"^\$?\s*\d+\.\d{2}$", line_stripped):
+            if features.is_amount_only:
                 continue
 
+            has_state_zip = bool(_STATE_ZIP_RE.search(line_stripped))
+
             # Check if this looks like a menu item (stop collecting address if so)
             is_menu_item = False
 
             # Check for menu item patterns: lines with "1x", "2x", etc. followed by item name
-            if re.match(r"^\d+x\s+[A-Z]", line_stripped, re.IGNORECASE):
+            if _QUANTITY_ITEM_RE.match(line_stripped):
                 is_menu_item = True
                 logger.debug(f"Stopping address extraction at line {idx} (menu item with quantity): '{line_stripped}'")
 
             # Check for lines with amounts at the end (menu items with prices)
-            if not is_menu_item and re.search(r"\$\d+\.\d{2}\s*$", line_stripped):
-                # But exclude if it's clearly an address (has state abbreviation and zip)
-                if not re.search(r"[A-Z]{2}\s+\d{5}", line_stripped):
-                    is_menu_item = True
-                    logger.debug(f"Stopping address extraction at line {idx} (menu item with price): '{line_stripped}'")
+            # But exclude if it's clearly an address (has state abbreviation and zip)
+            if not is_menu_item and _TRAILING_DOLLAR_AMOUNT_RE.search(line_stripped) and not has_state_zip:
+                is_menu_item = True
+                logger.debug(f"Stopping address extraction at line {idx} (menu item with price): '{line_stripped}'")
 
             # Check menu item indicator patterns
-            if not is_menu_item:
-                for pattern in menu_item_indicators:
-                    if re.match(pattern, line_stripped):
-                        is_menu_item = True
-                        logger.debug(
-                            f"Stopping address extraction at line {idx} (menu item detected): '{line_stripped}'"
-                        )
-                        break
-
-            # Also check for common menu item patterns
-            if not is_menu_item:
-                # Lines with dashes that look like menu items (e.g., "Classic - Mixed Plate")
-                if re.search(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+-\s+[A-Z]", line_stripped):
-                    # But exclude if it's clearly an address (has state abbreviation and zip)
-                    if not re.search(r"[A-Z]{2}\s+\d{5}", line_stripped):
-                        is_menu_item = True
-                        logger.debug(
-                            f"Stopping address extraction at line {idx} (menu item pattern): '{line_stripped}'"
-                        )
+            if not is_menu_item and _MENU_ITEM_RE.match(line_stripped):
+                is_menu_item = True
+                logger.debug(f"Stopping address extraction at line {idx} (menu item detected): '{line_stripped}'")
+
+            # Lines with dashes that look like menu items (e.g., "Classic - Mixed Plate"), unless
+            # it's clearly an address
+            if not is_menu_item and _DASHED_ITEM_NAME_RE.search(line_stripped) and not has_state_zip:
+                is_menu_item = True
+                logger.debug(f"Stopping address extraction at line {idx} (menu item pattern): '{line_stripped}'")
 
             # If we found a complete address (city, state, zip), stop collecting more lines
             if found_complete_address:
@@ -1050,79 +1182,33 @@ class ReceiptParser:
                 if is_menu_item:
                     break
                 # Also stop if we've collected enough lines (2 lines before city/state/zip)
-                if address_lines:
-                    city_state_zip_idx = None
-                    for i, addr_line in enumerate(address_lines):
-                        if re.search(r"[A-Z]{2}\s+\d{5}", addr_line):
-                            city_state_zip_idx = i
-                            break
-                    if city_state_zip_idx is not None and idx > city_state_zip_idx:
-                        break
+                city_state_zip_idx = next(
+                    (i for i, addr_line in enumerate(address_lines) if _STATE_ZIP_RE.search(addr_line)), None
+                )
+                if city_state_zip_idx is not None and idx > city_state_zip_idx:
+                    break
 
             # If we've already collected address lines and see a menu item, stop
             if address_lines and is_menu_item:
                 break
 
             # Check if this looks like an address line
-            is_address_line = False
-            for pattern in address_patterns:
-                if re.search(pattern, line_stripped, re.IGNORECASE):
-                    is_address_line = True
-                    break
+            is_address_line = bool(_ADDRESS_RE.search(line_stripped))
 
-            # Also check for common address indicators
-            address_indicators = [
-                "street",
-                "st",
-                "avenue",
-                "ave",
-                "road",
-                "rd",
-                "boulevard",
-                "blvd",
-                "drive",
-                "dr",
-                "lane",
-                "ln",
-                "court",
-                "ct",
-                "way",
-                "circle",
-                "cir",
-                "place",
-                "pl",
-                "suite",
-                "ste",
-                "unit",
-                "apt",
-                "apartment",
-                "fm",  # Farm to Market Road abbreviation
-            ]
+            # Check for FM (Farm to Market Road) pattern specifically, preceded by a street
+            # number and optional directional
+            if not is_address_line and _FM_ROAD_RE.search(line_stripped) and _FM_ADDRESS_RE.search(line_stripped):
+                is_address_line = True
+                logger.debug(f"Found FM address pattern at line {idx}: '{line_stripped}'")
 
-            # Check for FM (Farm to Market Road) pattern specifically
-            if not is_address_line:
-                if re.search(r"\bFM\s+\d+\b", line_stripped, re.IGNORECASE):
-                    # Check if it's preceded by a number (street number) and optional directional
-                    if re.search(r"\d+\s+[A-Z]?\s*FM\s+\d+", line_stripped, re.IGNORECASE):
-                        is_address_line = True
-                        logger.debug(f"Found FM address pattern at line {idx}: '{line_stripped}'")
-
-            if not is_address_line:
-                # Check if line contains address indicators (including "fm")
-                if any(indicator in line_lower for indicator in address_indicators):
-                    is_address_line = True
-                    if "fm" in line_lower:
-                        logger.debug(f"Found address via FM indicator at line {idx}: '{line_stripped}'")
-
-            # Check for city/state/zip pattern (complete address)
-            if not is_address_line:
-                # Pattern: City, State ZIP or City State ZIP
-                if re.search(r"[A-Za-z\s]{3,},\s*[A-Z]{2}\s+\d{5}", line_stripped):
-                    is_address_line = True
-                    found_complete_address = True
-                elif re.search(r"[A-Za-z\s]{3,}\s+[A-Z]{2}\s+\d{5}", line_stripped):
-                    is_address_line = True
-                    found_complete_address = True
+            # Check if line contains address indicators (including "fm")
+            if not is_address_line and _ADDRESS_INDICATOR_RE.search(features.lower):
+                is_address_line = True
+
+            # Check for city/state/zip pattern (complete address): City, State ZIP or City State ZIP
+            if not is_address_line and _CITY_STATE_ZIP_RE.search(line_stripped):
+                is_address_line = True
+                found_complete_address = True
 
             if is_address_line:
                 address_lines.append(line_stripped)
@@ -1131,11 +1217,9 @@ class ReceiptParser:
         # Combine address lines (at most 2 lines before city/state/zip, or 3 total)
         if address_lines:
             # Find the line with city/state/zip if present
-            city_state_zip_idx = None
-            for i, addr_line in enumerate(address_lines):
-                if re.search(r"[A-Z]{2}\s+\d{5}", addr_line):
-                    city_state_zip_idx = i
-                    break
+            city_state_zip_idx = next(
+                (i for i, addr_line in enumerate(address_lines) if _STATE_ZIP_RE.search(addr_line)), None
+            )
 
             if city_state_zip_idx is not None:
                 # Found city/state/zip - take up to 2 lines before it, plus the city/state/zip line
@@ -1144,9 +1228,7 @@ class ReceiptParser:
                 # No city/state/zip found - take at most 2 lines
                 max_lines = min(2, len(address_lines))
 
-            combined_address = " ".join(address_lines[:max_lines])
-            # Clean up extra whitespace
-            combined_address = re.sub(r"\s+", " ", combined_address).strip()
+            combined_address = _WHITESPACE_RE.sub(" ", " ".join(address_lines[:max_lines])).strip()
             logger.debug(f"Extracted restaurant address: '{combined_address}'")
             return combined_address
 
@@ -1168,58 +1250,21 @@ class ReceiptParser:
         if not lines:
             return None
 
-        # Phone number patterns (various formats) - more flexible patterns
-        phone_patterns = [
-            r"\(?\d{3}\)?\s*-?\s*\d{3}\s*-?\s*\d{4}",  # (XXX) XXX-XXXX or XXX-XXX-XXXX
-            r"\d{3}\.\d{3}\.\d{4}",  # XXX.XXX.XXXX
-            r"\d{3}\s+\d{3}\s+\d{4}",  # XXX XXX XXXX
-            r"\d{3}-\d{3}-\d{4}",  # XXX-XXX-XXXX (explicit dashes)
-            r"\(\d{3}\)\s*\d{3}-\d{4}",  # (XXX) XXX-XXXX
-            r"\(\d{3}\)\s*\d{3}\.\d{4}",  # (XXX) XXX.XXXX
-            r"\d{10}",  # XXXXXXXXXX (10 digits) - check this last to avoid false positives
-        ]
-
-        # Skip words that indicate non-phone lines (but NOT phone-related words)
-        skip_words = {
-            "receipt",
-            "invoice",
-            "thank",
-            "you",
-            "visit",
-            "us",
-            "again",
-            "outlook",
-            "gmail",
-            "yahoo",
-            "hotmail",
-            "from",
-            "to",
-            "date",
-            "subject",
-            "sent",
-            "reply",
-            "no-reply",
-            "order",
-            "check",
-        }
-
         # Look for phone number in first 20 lines
         for idx, line in enumerate(lines[:20]):
             line_stripped = line.strip()
-            line_lower = line_stripped.lower()
 
             # Skip empty lines (but allow shorter lines for phone numbers)
-            if not line_stripped or len(line_stripped) < 7:
+            if len(line_stripped) < 7:
                 continue
 
-            # FIRST: Try to find phone pattern - if found, extract it regardless of skip words
-            # This prioritizes phone number detection
-            for pattern_idx, pattern in enumerate(phone_patterns):
-                match = re.search(pattern, line_stripped)
+            # Try to find phone pattern - if found, extract it regardless of skip words
+            for pattern_idx, pattern in enumerate(_PHONE_RES):
+                match = pattern.search(line_stripped)
                 if match:
                     phone = match.group(0).strip()
                     # Extract all digits from the match
-                    digits_only = re.sub(r"\D", "", phone)
+                    digits_only = _NON_DIGIT_RE.sub("", phone)
 
                     # Skip if it's clearly not a phone number
                     # - All same digits (e.g., 0000000000, 1111111111)
@@ -1228,16 +1273,14 @@ class ReceiptParser:
                         continue
 
                     # - If it's the 10-digit pattern and looks like a date or amount
-                    if pattern_idx == len(phone_patterns) - 1:  # Last pattern (10 digits)
+                    if pattern_idx == len(_PHONE_RES) - 1:  # Last pattern (10 digits)
                         # Check if it's part of a date pattern (e.g., 10/05/2025)
-                        if re.search(r"\d{1,2}[/-]\d{1,2}[/-]\d{4}", line_stripped):
+                        if _FULL_DATE_RE.search(line_stripped):
+                            continue
+                        # Only skip if the 10 digits are part of an amount
+                        amount_match = _DECIMAL_AMOUNT_RE.search(line_stripped)
+                        if amount_match and digits_only in amount_match.group(0):
                             continue
-                        # Check if it's part of an amount (has $ or .XX pattern nearby)
-                        if re.search(r"\$\s*\d+\.\d{2}", line_stripped) or re.search(r"\d+\.\d{2}", line_stripped):
-                            # Only skip if the 10 digits are part of the amount
-                            amount_match = re.search(r"(\d+)\.(\d{2})", line_stripped)
-                            if amount_match and digits_only in amount_match.group(0):
-                                continue
 
                     # Validate: should have 10 digits (US phone number)
                     # Also check for 11 digits starting with 1 (country code)
@@ -1265,24 +1308,6 @@ class ReceiptParser:
                         )
                         return formatted_phone
 
-            # SECOND: If no phone pattern found, apply skip filters
-            # Skip lines with skip words (but allow lines with phone-related keywords)
-            phone_keywords = ["phone", "tel", "call", "contact"]
-            has_phone_keyword = any(keyword in line_lower for keyword in phone_keywords)
-
-            if not has_phone_keyword:
-                # Only skip if it doesn't have phone keywords
-                if any(word in line_lower for word in skip_words):
-                    continue
-
-            # Skip lines that are just amounts
-            if re.match(r"^\$?\s*\d+\.\d{2}$", line_stripped):
-                continue
-
-            # Skip date patterns (but not if they're part of a phone number)
-            if re.match(r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$", line_stripped):
-                continue
-
         logger.debug("No restaurant phone found in first 30 lines")
         return None
 
@@ -1301,23 +1326,12 @@ class ReceiptParser:
         if not text:
             return None
 
-        # Phone number patterns (same as line-based extraction)
-        phone_patterns = [
-            r"\(?\d{3}\)?\s*-?\s*\d{3}\s*-?\s*\d{4}",  # (XXX) XXX-XXXX or XXX-XXX-XXXX
-            r"\d{3}\.\d{3}\.\d{4}",  # XXX.XXX.XXXX
-            r"\d{3}\s+\d{3}\s+\d{4}",  # XXX XXX XXXX
-            r"\d{3}-\d{3}-\d{4}",  # XXX-XXX-XXXX (explicit dashes)
-            r"\(\d{3}\)\s*\d{3}-\d{4}",  # (XXX) XXX-XXXX
-            r"\(\d{3}\)\s*\d{3}\.\d{4}",  # (XXX) XXX.XXXX
-        ]
-
-        # Try each phone pattern on the full text
-        for pattern in phone_patterns:
-            matches = list(re.finditer(pattern, text))
-            for match in matches:
+        # Try each phone pattern on the full text (not the bare 10 digits, too ambiguous here)
+        for pattern in _PHONE_RES[:-1]:
+            for match in pattern.finditer(text):
                 phone = match.group(0).strip()
                 # Extract all digits from the match
-                digits_only = re.sub(r"\D", "", phone)
+                digits_only = _NON_DIGIT_RE.sub("", phone)
 
                 # Skip if it's clearly not a phone number
                 # - All same digits
@@ -1328,7 +1342,7 @@ class ReceiptParser:
                 context_start = max(0, match.start() - 10)
                 context_end = min(len(text), match.end() + 10)
                 context = text[context_start:context_end]
-                if re.search(r"\d{1,2}[/-]\d{1,2}[/-]\d{4}", context):
+                if _FULL_DATE_RE.search(context):
                     continue
 
                 # Validate: should have 10 digits (US phone number)
@@ -1357,23 +1371,16 @@ class ReceiptParser:
         if not lines:
             return None
 
-        website_patterns = [
-            r"https?://(?:www\.)?([a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}",
-            r"www\.([a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}",
-        ]
-
         for line in lines[:20]:
-            line_stripped = line.strip()
-            if "@" in line_stripped and "www" not in line_stripped.lower():
+            features = classify_line(line)
+            if "@" in features.text and "www" not in features.lower:
                 continue
 
-            for pattern in website_patterns:
-                match = re.search(pattern, line_stripped, re.IGNORECASE)
-                if match:
-                    website = match.group(0).strip()
-                    if not website.startswith(("http://", "https://")):
-                        website = "https://" + website
-                    return website.lower()
+            if features.website:
+                website = features.website.strip()
+                if not website.startswith(("http://", "https://")):
+                    website = "https://" + website
+                return website.lower()
 
         return None
 
@@ -1668,10 +1675,10 @@ class ReceiptParser:
                 if "|" not in line:
                     continue
                 # Skip header rows
-                if re.search(r"description|qty|quantity|price", line, re.IGNORECASE):
+                if _TABLE_HEADER_RE.search(line):
                     continue
                 # Skip separator rows
-                if re.search(r"^[\s\|:\-]+$", line):
+                if _TABLE_SEPARATOR_RE.search(line):
                     continue
 
                 # Split by | and extract columns
@@ -1682,7 +1689,7 @@ class ReceiptParser:
                     # Find price (last column with $ or number)
                     item_price = None
                     for part in reversed(parts):
-                        price_match = re.search(r"\$?(\d+\.\d{2})", part)
+                        price_match = _CELL_PRICE_RE.search(part)
                         if price_match:
                             try:
                                 item_price = Decimal(price_match.group(1))
@@ -1692,7 +1699,7 @@ class ReceiptParser:
 
                     if item_name and len(item_name) > 2:
                         # Skip if it's a totals row
-                        if re.search(r"subtotal|tax|tip|total|amount", item_name, re.IGNORECASE):
+                        if _TOTALS_LABEL_RE.search(item_name):
                             continue
                         items.append({"name": item_name, "price": item_price or Decimal("0.00")})
         else:
@@ -1704,43 +1711,27 @@ class ReceiptParser:
             for idx, line in enumerate(section_lines):
                 # Preserve original line to check indentation
                 original_line = line
-                line_clean = line.strip()
+                features = classify_line(line)
+                line_clean = features.text
                 if not line_clean:
                     continue
 
                 # Skip separator lines
-                if self._is_separator_line(line_clean):
+                if features.is_separator:
                     continue
 
                 # Skip totals rows
-                if re.search(r"^subtotal|^tax|^tip|^total|^amount", line_clean, re.IGNORECASE):
+                if _TOTALS_LABEL_RE.match(line_clean):
                     # Reset parent when we hit totals
                     current_parent_item = None
                     continue
 
                 # Skip lines that are just prices (likely from previous item)
-                if re.match(r"^\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$", line_clean):
+                if features.is_price_only:
                     continue
 
                 # Skip non-item lines: dates, addresses, server info, etc.
-                skip_patterns = [
-                    r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",  # Date patterns
-                    r"^\d{1,2}:\d{2}\s*(AM|PM|am|pm)",  # Time patterns
-                    r"^date\s+",  # "Date Sun..." patterns
-                    r"^server\s*:|^check\s*#|^ordered\s*:",  # Server/check info
-                    r"^[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}",  # City, State ZIP
-                    r"^\d+\s+[A-Z]\s+FM\s+\d+",  # FM road addresses
-                    r"^\(?\d{3}\)?\s*-?\s*\d{3}\s*-?\s*\d{4}",  # Phone numbers
-                    r"^[A-Z][a-z]+\s+Bros\s+\d+$",  # "Hawaiian Bros 0033" pattern
-                    r"^[A-Z][a-z]+$",  # Single capitalized word (likely a name like "Morgan")
-                ]
-                if any(re.search(pattern, line_clean, re.IGNORECASE) for pattern in skip_patterns):
-                    # Additional check: skip if line contains date/time together
-                    if re.search(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}", line_clean):
-                        continue
-                    # Skip single word names (unless they're item-like with dashes)
-                    if not re.search(r"-", line_clean) and len(line_clean.split()) == 1 and line_clean[0].isupper():
-                        continue
+                if _SECTION_ITEM_SKIP_RE.match(line_clean):
                     continue
 
                 # Check for indentation (leading spaces) to identify sub-items/modifiers
@@ -1748,7 +1739,7 @@ class ReceiptParser:
                 is_indented = leading_spaces > 0
 
                 # Extract item name and price
-                item_match = re.match(r"^(.+?)\s+\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$", line_clean)
+                item_match = _ITEM_WITH_PRICE_RE.match(line_clean)
                 item_name = None
                 item_price = None
 
@@ -1764,13 +1755,13 @@ class ReceiptParser:
                         item_price = None
                 else:
                     # Check if this looks like an item name (check next line for price)
-                    if re.search(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+-\s+[A-Z])?", line_clean):
+                    if features.starts_like_item_name:
                         item_name = line_clean
                         # Check next line for price
                         if idx + 1 < len(section_lines):
                             next_line = section_lines[idx + 1].strip()
                             logger.debug(f"Checking next line for price: '{next_line}' (after item: '{item_name}')")
-                            price_match = re.match(r"^\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$", next_line)
+                            price_match = _PRICE_ONLY_RE.match(next_line)
                             if price_match:
                                 logger.debug(f"Found price match: {price_match.group(0)}")
                                 try:
@@ -1862,47 +1853,6 @@ class ReceiptParser:
             List of item dictionaries with 'name' and 'price' keys
         """
         items: list[dict[str, Any]] = []
-        skip_patterns = [
-            r"^total",
-            r"^tax",
-            r"^tip",
-            r"^subtotal",
-            r"^\$?\s*\d+\.\d{2}$",  # Just an amount
-            r"^\d+[/-]\d+[/-]\d+",  # Date
-            r"^from\s+|^to\s+|^subject\s+",  # Email headers
-            r".*@.*",  # Email addresses
-            r"^server\s*:|^check\s*#|^ordered\s*:",  # Receipt metadata
-            r"^thank\s+you",  # Footer text
-            r"^trouble\s+viewing",  # Email footer text
-            r"^—+\s*$",  # Separator lines (e.g., "———")
-            r"^[-=_]+\s*$",  # Separator lines with dashes/equals/underscores
-        ]
-
-        # Skip words that indicate non-item lines
-        skip_words = {
-            "receipt",
-            "invoice",
-            "thank",
-            "you",
-            "visit",
-            "us",
-            "again",
-            "server",
-            "check",
-            "ordered",
-            "from",
-            "to",
-            "date",
-            "subject",
-            "outlook",
-            "gmail",
-            "yahoo",
-            "hotmail",
-            "no-reply",
-            "trouble",
-            "viewing",
-            "email",
-        }
 
         # Track if we're in a metadata section (after "Check #", "Server:", "Ordered:")
         in_metadata_section = False
@@ -1913,19 +1863,20 @@ class ReceiptParser:
         logger.debug(f"Extracting items from lines {start_idx} to {end_idx} (out of {len(lines)} total lines)")
 
         for line in lines[start_idx:end_idx]:
-            line_clean = line.strip()
+            features = classify_line(line)
+            line_clean = features.text
             if not line_clean:
                 continue
 
-            line_lower = line_clean.lower()
+            line_lower = features.lower
 
             # Skip separator lines
-            if self._is_separator_line(line_clean):
+            if features.is_separator:
                 logger.debug(f"Skipping item line (separator): '{line_clean[:60]}'")
                 continue
 
             # Detect metadata section markers
-            if re.search(r"server\s*:|check\s*#|ordered\s*:", line_clean, re.IGNORECASE):
+            if _METADATA_MARKER_RE.search(line_clean):
                 in_metadata_section = True
                 logger.debug(f"Entering metadata section: '{line_clean[:60]}'")
                 # Skip the metadata line itself
@@ -1934,10 +1885,7 @@ class ReceiptParser:
             # If we're in metadata section, skip until we see an item indicator
             if in_metadata_section:
                 # Check if this looks like an item (has price or item-like pattern)
-                has_price = re.search(r"\$\d+\.\d{2}", line_clean)
-                has_item_pattern = re.search(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+-\s+[A-Z])?", line_clean)
-
-                if has_price or has_item_pattern:
+                if features.has_dollar_amount or features.starts_like_item_name:
                     # We've found an item, exit metadata section
                     in_metadata_section = False
                     logger.debug(f"Exiting metadata section, found item: '{line_clean[:60]}'")
@@ -1948,63 +1896,42 @@ class ReceiptParser:
                     continue
 
             # Skip "Served by" lines
-            if re.search(r"served\s+by", line_lower):
+            if _SERVED_BY_RE.search(line_lower):
                 logger.debug(f"Skipping item line (served by): '{line_clean[:60]}'")
                 continue
 
             # Skip if matches skip patterns
-            if any(re.match(pattern, line_clean, re.IGNORECASE) for pattern in skip_patterns):
+            if _ITEM_SKIP_RE.match(line_clean):
                 logger.debug(f"Skipping item line (matches skip pattern): '{line_clean[:60]}'")
                 continue
 
             # Skip if contains skip words (use word boundaries to avoid false positives)
-            line_words = set(re.findall(r"\b\w+\b", line_lower))
-            skip_words_set = set(skip_words)
-            if line_words & skip_words_set:
+            if features.words & _ITEM_SKIP_WORDS:
                 logger.debug(f"Skipping item line (contains skip word): '{line_clean[:60]}'")
                 continue
 
             # Skip time patterns
-            if re.match(r"^\d{1,2}:\d{2}\s*(AM|PM|am|pm)?$", line_clean, re.IGNORECASE):
+            if features.is_time:
                 continue
 
             # Skip phone numbers
-            if re.search(r"\(\d{3}\)\s*\d{3}[-.]?\d{4}", line_clean):
+            if _PAREN_PHONE_RE.search(line_clean):
                 logger.debug(f"Skipping item line (phone number): '{line_clean[:60]}'")
                 continue
 
             # Skip addresses (city, state, zip pattern)
-            if re.search(r"[A-Z]{2}\s+\d{5}", line_clean):
+            if _STATE_ZIP_RE.search(line_clean):
                 logger.debug(f"Skipping item line (address): '{line_clean[:60]}'")
                 continue
 
             # Skip restaurant name patterns (if we already extracted it)
             # Lines that are just restaurant names or location numbers
-            if re.match(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+\d+$", line_clean):  # "Hawaiian Bros 0033"
+            if _NAME_WITH_NUMBER_RE.match(line_clean):  # "Hawaiian Bros 0033"
                 logger.debug(f"Skipping item line (restaurant name with number): '{line_clean[:60]}'")
                 continue
 
             # Stop extracting items when we hit payment/transaction info
-            payment_keywords = [
-                "input type",
-                "emv",
-                "chip",
-                "read",
-                "visa",
-                "credit",
-                "debit",
-                "mastercard",
-                "amex",
-                "transaction",
-                "authorization",
-                "approved",
-                "payment",
-                "card",
-                "terminal",
-                "approval code",
-                "payment id",
-            ]
-            if any(keyword in line_lower for keyword in payment_keywords):
+            if _ITEM_PAYMENT_KEYWORD_RE.search(line_lower):
                 logger.debug(f"Stopping item extraction at payment info: '{line_clean[:60]}'")
                 break
 
@@ -2013,7 +1940,7 @@ class ReceiptParser:
             item_price = None
 
             # Pattern 1: item name followed by price (e.g., "Classic - Mixed Plate $12.50")
-            item_match = re.match(r"^(.+?)\s+\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$", line_clean)
+            item_match = _ITEM_WITH_PRICE_RE.match(line_clean)
             if item_match:
                 item_name = item_match.group(1).strip()
                 price_str = item_match.group(2)
@@ -2026,7 +1953,7 @@ class ReceiptParser:
                     pass
             else:
                 # Pattern 2: Try without dollar sign
-                item_match = re.match(r"^(.+?)\s+(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*$", line_clean)
+                item_match = _ITEM_WITH_BARE_PRICE_RE.match(line_clean)
                 if item_match:
                     item_name = item_match.group(1).strip()
                     price_str = item_match.group(2)
@@ -2039,7 +1966,7 @@ class ReceiptParser:
                 else:
                     # Pattern 3: Item without explicit price (might be $0.00 or free item)
                     # Check if line looks like an item (has dashes, multiple words, etc.)
-                    if re.search(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+-\s+[A-Z])?", line_clean):
+                    if features.starts_like_item_name:
                         item_name = line_clean
                         item_price = Decimal("0.00")  # Default to $0.00 for items without prices
 
@@ -2047,9 +1974,9 @@ class ReceiptParser:
                 continue
 
             # Clean up item name
-            item_name = re.sub(r"^\d+\s*", "", item_name)  # Remove leading numbers
-            item_name = re.sub(r"^x\s+", "", item_name, flags=re.IGNORECASE)  # Remove leading "x" prefix
-            item_name = re.sub(r"\s+", " ", item_name).strip()  # Normalize whitespace
+            item_name = _LEADING_NUMBER_RE.sub("", item_name)  # Remove leading numbers
+            item_name = _LEADING_X_RE.sub("", item_name)  # Remove leading "x" prefix
+            item_name = _WHITESPACE_RE.sub(" ", item_name).strip()  # Normalize whitespace
 
             # Skip if matches restaurant name (exact or partial match)
             if restaurant_name:
@@ -2063,8 +1990,8 @@ class ReceiptParser:
                     continue
 
                 # Check if line contains restaurant name words (e.g., "HAWAIIAN BROS" or "ISLAND GRILL")
-                restaurant_words = set(re.findall(r"\b\w+\b", restaurant_lower))
-                item_words = set(re.findall(r"\b\w+\b", item_lower))
+                restaurant_words = set(_WORD_RE.findall(restaurant_lower))
+                item_words = set(_WORD_RE.findall(item_lower))
                 # If more than 50% of words match, likely the restaurant name
                 if restaurant_words and len(item_words & restaurant_words) >= min(2, len(restaurant_words)):
                     logger.debug(f"Skipping item line (contains restaurant name words): '{item_name}'")
@@ -2074,7 +2001,7 @@ class ReceiptParser:
             # But only if they're very short (≤3 words, <30 chars) and don't have prices
             if line_clean.isupper() and len(line_clean.split()) <= 3 and len(line_clean) < 30:
                 # Check if it has a price - if so, it might be an item
-                if not re.search(r"\$\d+\.\d{2}", line_clean):
+                if not features.has_dollar_amount:
                     logger.debug(f"Skipping item line (all caps, short, likely header): '{line_clean}'")
                     continue
 
@@ -2084,14 +2011,14 @@ class ReceiptParser:
                 len(line_clean.split()) == 1
                 and line_clean[0].isupper()
                 and line_clean.isalpha()
-                and not re.search(r"\$\d+\.\d{2}", line_clean)
-                and not re.search(r"^[A-Z][a-z]+\s+-\s+", line_clean)
+                and not features.has_dollar_amount
+                and not _DASHED_WORD_RE.match(line_clean)
             ):  # Not an item pattern like "Classic - Mixed Plate"
                 logger.debug(f"Skipping item line (looks like a name): '{line_clean}'")
                 continue
 
             # Must have at least 3 characters and some letters
-            if len(item_name) >= 3 and re.search(r"[a-zA-Z]{2,}", item_name):
+            if len(item_name) >= 3 and _LETTERS_RE.search(item_name):
                 if item_name.lower() not in ["item", "description", "qty", "quantity", "price", "served", "by"]:
                     items.append({"name": item_name, "price": item_price})
                     logger.debug(f"Extracted item: '{item_name}' ${item_price} from line '{line_clean[:60]}'")
@@ -2116,15 +2043,6 @@ class ReceiptParser:
             "amount": None,
         }
 
-        # Labels for each amount type
-        labels = {
-            "subtotal": ["subtotal", "sub total", "sub-total"],
-            "tax": ["tax", "sales tax", "gst", "vat", "hst"],
-            "tip": ["tip", "gratuity", "service"],
-            "total": ["total", "grand total", "final total"],
-            "amount": ["amount paid", "amount", "paid", "charge", "due", "balance"],
-        }
-
         for line in section_lines:
             line_lower = line.lower()
             # Check for table format
@@ -2134,12 +2052,12 @@ class ReceiptParser:
                     label = parts[0].lower()
                     amount_str = parts[-1].strip()  # Last column is usually the amount
                     # Extract amount from string
-                    amount_match = re.search(r"\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)", amount_str)
+                    amount_match = _CELL_AMOUNT_RE.search(amount_str)
                     if amount_match:
                         try:
                             amount = Decimal(amount_match.group(1).replace(",", ""))
                             # Match label to amount type
-                            for amount_type, keywords in labels.items():
+                            for amount_type, keywords in _TOTALS_SECTION_LABELS.items():
                                 if any(keyword in label for keyword in keywords):
                                     current = amounts[amount_type]
                                     if current is None or amount > current:
@@ -2149,10 +2067,11 @@ class ReceiptParser:
                             continue
             else:
                 # Line format: "Subtotal $72.30" or "Subtotal: $72.30"
-                for amount_type, keywords in labels.items():
+                for amount_type, keywords in _TOTALS_SECTION_LABELS.items():
                     for keyword in keywords:
-                        pattern = rf"{keyword}\s*:?\s*\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)"
-                        match = re.search(pattern, line_lower, re.IGNORECASE)
+                        if keyword not in line_lower:
+                            continue
+                        match = _TOTALS_SECTION_AMOUNT_RES[keyword].search(line_lower)
                         if match:
                             try:
                                 amount = Decimal(match.group(1).replace(",", ""))
@@ -2187,63 +2106,40 @@ class ReceiptParser:
             "subtotal": None,
         }
 
-        # More flexible amount patterns to handle OCR errors and fragmentation
-        # Common OCR mistakes: O instead of 0, S instead of 5, I instead of 1
-        # Also handle split amounts like "$3" and "29" → "$3.29"
-        # And handle spaces instead of decimal points: "870 .16" → "$70.16"
-        amount_patterns = [
-            r"\$?\s*(\d{1,3}(?:[,\s]\d{3})*(?:[.,]\d{2})?)",  # Standard: $25.50, 25.50
-            r"\$?\s*(\d+[.,]\d{2})",  # Simple: 25.50 or 25,50
-            r"(\d{1,3}(?:[,\s]\d{3})*[.,]\d{2})",  # Without $: 25.50
-            r"(\d+[.,]\d{1,2})",  # Allow 1 or 2 decimal places
-            r"(\d{2,3})\s+[.,]\s*(\d{2})",  # OCR error: "870 .16" or "75 .95"
-        ]
-
-        # Look for labeled amounts (TOTAL, TAX, TIP, SUBTOTAL)
-        labels = {
-            "total": ["total", "amount due", "grand total", "final total", "balance", "amount", "charge"],
-            "tax": ["tax", "sales tax", "gst", "vat", "hst"],
-            "tip": ["tip", "gratuity", "service"],
-            "subtotal": ["subtotal", "sub-total", "total before tax", "sub total"],
-        }
-
         text_lower = text.lower()
+        line_features = [classify_line(line) for line in lines]
 
         # Strategy 1: Find labeled amounts (prioritize these - they're most accurate)
         # Check both same-line and next-line patterns (some receipts put label and amount on separate lines)
-        for amount_type, keywords in labels.items():
-            # Pattern 1: keyword and amount on same line
+        for amount_type, keywords in _AMOUNT_LABELS.items():
+            # Pattern 1: keyword and amount on same line ("Total: $17.06", "$17.06 Total")
             for keyword in keywords:
-                for pattern in amount_patterns:
-                    search_patterns = [
-                        rf"{keyword}\s*[:=]?\s*{pattern}",  # "Total: $17.06" or "Total $17.06"
-                        rf"{pattern}\s+{keyword}",  # "$17.06 Total"
-                    ]
-                    for search_pattern in search_patterns:
-                        matches = re.finditer(search_pattern, text_lower, re.IGNORECASE)
-                        for match in matches:
-                            try:
-                                amount_str = match.group(1).replace(",", "").replace(" ", "").replace(",", ".")
-                                # Handle European decimal format (comma instead of period)
-                                if "," in amount_str and "." not in amount_str:
-                                    amount_str = amount_str.replace(",", ".")
-                                amount = Decimal(amount_str)
-
-                                # Filter out phone numbers (3-digit numbers without decimals)
-                                if amount >= 100 and amount < 1000 and "." not in match.group(0):
-                                    continue
-
-                                # Filter reasonable amounts
-                                if 0.01 <= amount <= 10000:
-                                    current_amount = amounts[amount_type]
-                                    if current_amount is None or amount > current_amount:
-                                        amounts[amount_type] = amount
-                                        logger.debug(
-                                            f"Found labeled {amount_type}: ${amount} (same-line pattern: {search_pattern})"
-                                        )
-                            except (InvalidOperation, ValueError):
+                if keyword not in text_lower:
+                    continue
+                for search_pattern in _LABELED_AMOUNT_RES[keyword]:
+                    for match in search_pattern.finditer(text_lower):
+                        try:
+                            amount_str = match.group(1).replace(",", "").replace(" ", "").replace(",", ".")
+                            # Handle European decimal format (comma instead of period)
+                            if "," in amount_str and "." not in amount_str:
+                                amount_str = amount_str.replace(",", ".")
+                            amount = Decimal(amount_str)
+
+                            # Filter out phone numbers (3-digit numbers without decimals)
+                            if amount >= 100 and amount < 1000 and "." not in match.group(0):
                                 continue
 
+                            # Filter reasonable amounts
+                            if 0.01 <= amount <= 10000:
+                                current_amount = amounts[amount_type]
+                                if current_amount is None or amount > current_amount:
+                                    amounts[amount_type] = amount
+                                    logger.debug(
+                                        f"Found labeled {amount_type}: ${amount} (same-line pattern: {search_pattern.pattern})"
+                                    )
+                        except (InvalidOperation, ValueError):
+                            continue
+
             # Pattern 2: keyword on one line, amount on next line (common receipt format)
             # IMPORTANT: Pattern 2 always overrides Pattern 1 when it finds a labeled amount
             # because next-line matching is more accurate than same-line pattern matching
@@ -2257,16 +2153,15 @@ class ReceiptParser:
                     amounts[amount_type] = None
 
             for keyword in keywords:
-                keyword_pattern = rf"^\s*{keyword}\s*$"
-                keyword_with_amount_pattern = (
-                    rf"^\s*{keyword}\s*[:=]?\s*\$?\s*(\d{1,3}(?:[,\s]\d{3})*(?:[.,]\d{2})?)\s*$"
-                )
-                for idx, line in enumerate(lines):
-                    line_stripped = line.strip()
-                    line_lower = line_stripped.lower()
+                keyword_with_amount_re = _KEYWORD_LINE_AMOUNT_RES[keyword]
+                for idx, features in enumerate(line_features):
+                    line_stripped = features.text
+                    line_lower = features.lower
+                    if not line_lower.startswith(keyword):
+                        continue
 
                     # First, check for same-line pattern: "Keyword: $amount" or "Keyword $amount"
-                    same_line_match = re.match(keyword_with_amount_pattern, line_lower, re.IGNORECASE)
+                    same_line_match = keyword_with_amount_re.match(line_lower)
                     if same_line_match:
                         logger.debug(f"Found keyword '{keyword}' with amount on same line {idx}: '{line_stripped}'")
                         try:
@@ -2298,15 +2193,15 @@ class ReceiptParser:
                             continue
 
                     # Second, check for keyword-only line, then check next line for amount
-                    if re.match(keyword_pattern, line_lower, re.IGNORECASE):
+                    if line_lower == keyword:
                         logger.debug(f"Found keyword '{keyword}' on line {idx}: '{line_stripped}'")
                         # Found keyword-only line, check next line for amount
                         if idx + 1 < len(lines):
                             next_line = lines[idx + 1]
                             logger.debug(f"  Checking next line {idx + 1} for amount: '{next_line.strip()}'")
                             # Try all amount patterns on the next line
-                            for pattern_idx, pattern_check in enumerate(amount_patterns):
-                                amount_match = re.search(pattern_check, next_line)
+                            for pattern_idx, pattern_check in enumerate(_AMOUNT_RES):
+                                amount_match = pattern_check.search(next_line)
                                 if amount_match:
                                     logger.debug(f"    Pattern {pattern_idx} matched: {amount_match.group(0)}")
                                     try:
@@ -2357,17 +2252,10 @@ class ReceiptParser:
         # Strategy 2: Extract ALL amounts and score them
         all_amounts: list[tuple[Decimal, int, str]] = []  # (amount, line_index, line_text)
 
-        # Phone number patterns to exclude (common false positives)
-        phone_patterns = [
-            r"\(\d{3}\)\s*\d{3}[-.]?\d{4}",  # (972) 437-8440
-            r"\d{3}[-.]?\d{3}[-.]?\d{4}",  # 972-437-8440
-            r"\d{10}",  # 9724378440
-        ]
-
-        logger.debug(f"Scanning {len(lines)} lines for amounts using {len(amount_patterns)} patterns")
+        logger.debug(f"Scanning {len(lines)} lines for amounts using {len(_AMOUNT_RES)} patterns")
         for idx, line in enumerate(lines):
             # Skip lines that are clearly phone numbers
-            if any(re.search(pattern, line) for pattern in phone_patterns):
+            if line_features[idx].has_phone_number:
                 logger.debug(f"  Line {idx}: Skipping line with phone number pattern: '{line[:80]}'")
                 continue
 
@@ -2377,8 +2265,8 @@ class ReceiptParser:
                 next_line = lines[idx + 1].strip()
 
                 # Pattern 1: "$3" followed by "29" (fragmented price)
-                dollars_match = re.search(r"^\$?(\d+)(?:\.\d{2})?$", current_line)
-                cents_match = re.search(r"^(\d{2})$", next_line)
+                dollars_match = _FRAGMENT_DOLLARS_RE.search(current_line)
+                cents_match = _FRAGMENT_CENTS_RE.search(next_line)
 
                 if dollars_match and cents_match and not current_line.endswith(".00"):
                     try:
@@ -2395,7 +2283,7 @@ class ReceiptParser:
                         pass
 
                 # Pattern 2: "870" followed by ".16" (OCR error with space instead of decimal)
-                if re.match(r"^\d{3}$", current_line) and re.match(r"^\.\d{2}$", next_line):
+                if _THREE_DIGITS_RE.match(current_line) and _DECIMAL_CENTS_RE.match(next_line):
                     try:
                         dollars = int(current_line)
                         cents_str = next_line[1:]  # Remove the "."
@@ -2407,8 +2295,8 @@ class ReceiptParser:
                     except (InvalidOperation, ValueError):
                         pass
 
-            for pattern_idx, pattern in enumerate(amount_patterns):
-                matches_list = list(re.finditer(pattern, line))
+            for pattern_idx, pattern in enumerate(_AMOUNT_RES):
+                matches_list = list(pattern.finditer(line))
                 if matches_list:
                     logger.debug(
                         f"  Line {idx} (pattern {pattern_idx}): Found {len(matches_list)} matches in '{line[:80]}'"
@@ -2434,15 +2322,15 @@ class ReceiptParser:
                             line_context = line[max(0, match.start() - 10) : min(len(line), match.end() + 10)]
                             # Skip if near phone number indicators: parentheses, dashes, or other digits
                             if (
-                                re.search(r"[()\-\.]", line_context)
-                                or re.search(r"\d{3,}", line_context)
-                                or re.search(r"phone|tel|call", line_context, re.IGNORECASE)
+                                _PHONE_PUNCTUATION_RE.search(line_context)
+                                or _DIGIT_RUN_RE.search(line_context)
+                                or _PHONE_CONTEXT_RE.search(line_context)
                             ):
                                 logger.debug(f"    -> Skipped ${amount} (likely phone number part) from '{line[:60]}'")
                                 continue
                             # Also skip standalone 3-digit numbers (very likely phone area codes)
                             # unless they're clearly part of a price (have $ sign or are near price keywords)
-                            if not re.search(r"\$|price|cost|amount|total|tax|tip", line_context, re.IGNORECASE):
+                            if not _PRICE_CONTEXT_RE.search(line_context):
                                 logger.debug(
                                     f"    -> Skipped ${amount} (standalone 3-digit number, likely phone) from '{line[:60]}'"
                                 )
@@ -2631,7 +2519,7 @@ class ReceiptParser:
         has_tabular_structure = False
         for line in lines[:20]:  # Check first 20 lines
             # Look for lines with multiple amounts or date patterns separated by spaces/tabs
-            if re.search(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}.*\$\d+", line):
+            if _DATED_AMOUNT_RE.search(line):
                 has_tabular_structure = True
                 break
 
@@ -2679,6 +2567,8 @@ class ReceiptParser:
             receipt_data.total = receipt_data.amount
             receipt_data.restaurant_name = self._extract_merchant_name(text, lines)
 
+        receipt_data.field_sources = dict.fromkeys(self._parsed_field_values(receipt_data), FIELD_SOURCE_BANK_STATEMENT)
+
         # Calculate confidence scores
         receipt_data.confidence_scores = self._calculate_confidence_scores(receipt_data)
 
@@ -2980,29 +2870,7 @@ class ReceiptParser:
         Returns:
             True if line appears to be a separator
         """
-        line_clean = line.strip()
-        if not line_clean:
-            return False
-
-        # Check for separator patterns: mostly repeating characters
-        # Examples: "———", "---", "===", "___", "— ISLAND GRILL —"
-        # Count non-whitespace, non-alphanumeric characters
-        non_alnum = sum(1 for c in line_clean if not c.isalpha() and not c.isspace())
-        total_chars = len([c for c in line_clean if not c.isspace()])
-
-        if total_chars == 0:
-            return False
-
-        # If >70% of characters are separator characters, it's likely a separator
-        separator_ratio = non_alnum / total_chars if total_chars > 0 else 0
-        if separator_ratio > 0.7:
-            return True
-
-        # Check for patterns like "— TEXT —" or "--- TEXT ---"
-        if re.match(r"^[—\-=_·•|]+\s*[A-Za-z\s]*\s*[—\-=_·•|]+$", line_clean):
-            return True
-
-        return False
+        return classify_line(line).is_separator
 
     def _to_proper_case(self, text: str) -> str:
         """Convert ALL CAPS text to Proper Case (Title Case).
@@ -3069,7 +2937,7 @@ class ReceiptParser:
         # Find separator lines
         separator_indices: list[int] = []
         for idx, line in enumerate(lines):
-            if self._is_separator_line(line):
+            if classify_line(line).is_separator:
                 separator_indices.append(idx)
 
         logger.debug(f"Found {len(separator_indices)} separator lines at indices: {separator_indices}")
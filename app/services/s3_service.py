@@ -2,31 +2,42 @@
 
 from datetime import datetime
 import os
-from typing import Optional, Tuple
+import threading
+from typing import Any, Optional, Tuple
 import uuid
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from flask import current_app
 from werkzeug.datastructures import FileStorage
 
+from app.services import aws_clients
+
+
+def _s3_settings() -> tuple[Any, ...]:
+    """S3 settings an S3Service is built from."""
+    return (
+        current_app.config.get("S3_RECEIPTS_BUCKET"),
+        current_app.config.get("S3_REGION", "us-east-1"),
+        current_app.config.get("S3_RECEIPTS_PREFIX", "receipts/"),
+        current_app.config.get("S3_URL_EXPIRY", 3600),
+    )
+
 
 class S3Service:
     """Service for S3 file operations."""
 
     def __init__(self) -> None:
         """Initialize S3 service with configuration."""
-        self.bucket_name: str | None = current_app.config.get("S3_RECEIPTS_BUCKET")
-        self.region: str = current_app.config.get("S3_REGION", "us-east-1")
-        self.prefix: str = current_app.config.get("S3_RECEIPTS_PREFIX", "receipts/")
-        self.url_expiry: int = current_app.config.get("S3_URL_EXPIRY", 3600)
+        self.settings = _s3_settings()
+        self.bucket_name: str | None = self.settings[0]
+        self.region: str = self.settings[1]
+        self.prefix: str = self.settings[2]
+        self.url_expiry: int = self.settings[3]
 
         # Initialize S3 client with Signature Version 4
         # Required for KMS-encrypted objects
         try:
-            s3_config = Config(signature_version="s3v4")
-            self.s3_client = boto3.client("s3", region_name=self.region, config=s3_config)
+            self.s3_client = aws_clients.get_client("s3", self.region, signature_version="s3v4")
             self._verify_bucket_access()
         except NoCredentialsError:
             current_app.logger.error("AWS credentials not found")
@@ -85,7 +96,7 @@ class S3Service:
                 return None, "S3 bucket name is not configured"
             file_storage.seek(0)  # Reset file pointer
             self.s3_client.upload_fileobj(
-                file_storage,  # type: ignore[arg-type]
+                file_storage,
                 self.bucket_name,
                 s3_key,
                 ExtraArgs={
@@ -148,7 +159,7 @@ class S3Service:
                 "get_object", Params={"Bucket": self.bucket_name, "Key": s3_key}, ExpiresIn=self.url_expiry
             )
             current_app.logger.info(f"Generated presigned URL for: {s3_key}")
-            return url
+            return str(url)
 
         except ClientError as e:
             current_app.logger.error(f"Failed to generate presigned URL: {str(e)}")
@@ -158,12 +169,29 @@ class S3Service:
             return None
 
 
+_shared_service: S3Service | None = None
+_shared_service_lock = threading.Lock()
+
+
 def get_s3_service() -> S3Service | None:
-    """Get S3 service instance if S3 is enabled."""
-    if current_app.config.get("S3_RECEIPTS_BUCKET"):
-        try:
-            return S3Service()
-        except Exception as e:
-            current_app.logger.error(f"Failed to initialize S3 service: {str(e)}")
-            return None
-    return None
+    """Get the process-wide S3 service if S3 is enabled.
+
+    The service and its client are reused across requests, so the bucket is only verified when
+    the service is built: on first use and whenever the S3 settings change. A service that fails
+    to build is not kept, and the next call tries again.
+    """
+    global _shared_service
+
+    if not current_app.config.get("S3_RECEIPTS_BUCKET"):
+        return None
+
+    with _shared_service_lock:
+        service = _shared_service
+        if service is None or service.settings != _s3_settings():
+            try:
+                service = S3Service()
+            except Exception as e:
+                current_app.logger.error(f"Failed to initialize S3 service: {str(e)}")
+                return None
+            _shared_service = service
+        return service
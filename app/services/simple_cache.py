@@ -3,6 +3,12 @@
 This module provides lightweight in-memory caching for Google Places API responses.
 No database persistence - keeps it simple and fast.
 
+The cache is bounded: it holds at most ``MAX_ENTRIES`` entries and roughly ``MAX_BYTES`` of
+response data, evicting the least recently used entries first. Every entry expires after the
+TTL of its namespace (search results go stale sooner than place details), and expired entries
+are dropped when they are read or when room is needed, so a long-lived worker does not grow
+without limit.
+
 Following TIGER principles:
 - Testing: Simple cache operations that are easy to test
 - Interfaces: Minimal cache interface with get/set operations
@@ -11,99 +17,207 @@ Following TIGER principles:
 - Refactoring: Single responsibility for simple caching logic
 """
 
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import sys
 import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any
+
+# Namespaces and how long their entries stay fresh
+SEARCH_NAMESPACE = "search"
+PLACE_NAMESPACE = "place"
+NAMESPACE_TTL_SECONDS = {
+    SEARCH_NAMESPACE: 3600,  # 1 hour
+    PLACE_NAMESPACE: 6 * 3600,  # 6 hours
+}
+_default_ttl = 3600  # 1 hour, for namespaces without their own TTL
+
+# Budget of the shared cache
+MAX_ENTRIES = 2000
+MAX_BYTES = 32 * 1024 * 1024  # 32 MiB
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory held by a cached value from its JSON size."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    size: int
+
+
+class BoundedTTLCache:
+    """Thread-safe LRU cache with an entry and byte budget and per-namespace TTLs.
+
+    Keys are ``"<namespace>:<key>"`` strings; the namespace selects the TTL.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MAX_ENTRIES,
+        max_bytes: int = MAX_BYTES,
+        ttls: dict[str, int] | None = None,
+        default_ttl: int = _default_ttl,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = dict(NAMESPACE_TTL_SECONDS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _ttl_for(self, cache_key: str) -> int:
+        namespace = cache_key.split(":", 1)[0]
+        return self.ttls.get(namespace, self.default_ttl)
+
+    def _remove(self, cache_key: str) -> None:
+        entry = self._entries.pop(cache_key)
+        self._bytes -= entry.size
+
+    def _drop_expired(self, now: float) -> int:
+        expired_keys = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired_keys:
+            self._remove(key)
+        self._expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def get(self, cache_key: str) -> Any | None:
+        """Get a fresh cached value, or None."""
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.time():
+                self._remove(cache_key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self._hits += 1
+            return entry.value
+
+    def set(self, cache_key: str, value: Any) -> bool:
+        """Cache a value, evicting expired and then least recently used entries to make room.
+
+        Returns:
+            False if the value alone exceeds the byte budget and was not cached
+        """
+        size = _estimate_size(value)
+        now = time.time()
+        with self._lock:
+            if cache_key in self._entries:
+                self._remove(cache_key)
+            if size > self.max_bytes:
+                return False
+
+            if len(self._entries) >= self.max_entries or self._bytes + size > self.max_bytes:
+                self._drop_expired(now)
+            while self._entries and (len(self._entries) >= self.max_entries or self._bytes + size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._evictions += 1
+
+            self._entries[cache_key] = _CacheEntry(value, now + self._ttl_for(cache_key), size)
+            self._bytes += size
+            return True
 
-# Global in-memory cache with thread-safety
-_cache: dict[str, Any] = {}
-_cache_ttl: dict[str, float] = {}
-_cache_lock = threading.Lock()  # Thread-safety for cache operations
-_default_ttl = 3600  # 1 hour
+    def clear_expired(self) -> int:
+        """Drop expired entries. Returns number of entries cleared."""
+        with self._lock:
+            return self._drop_expired(time.time())
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get entry, byte and hit/miss/eviction counts."""
+        now = time.time()
+        with self._lock:
+            namespaces: dict[str, int] = {}
+            for key in self._entries:
+                namespace = key.split(":", 1)[0]
+                namespaces[namespace] = namespaces.get(namespace, 0) + 1
+            return {
+                "total_entries": len(self._entries),
+                "expired_entries": sum(1 for entry in self._entries.values() if entry.expires_at <= now),
+                "total_bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "entries_by_namespace": namespaces,
+            }
+
+
+# Global in-memory cache shared by every GooglePlacesService in the process
+_cache = BoundedTTLCache()
 
 
 def _generate_search_key(query: str, location: tuple[float, float] | None, radius: float) -> str:
     """Generate cache key for search results."""
     if location:
-        return f"search:{query}|{location[0]:.4f},{location[1]:.4f}|{radius:.1f}"
-    return f"search:{query}|no_location|{radius:.1f}"
+        return f"{SEARCH_NAMESPACE}:{query}|{location[0]:.4f},{location[1]:.4f}|{radius:.1f}"
+    return f"{SEARCH_NAMESPACE}:{query}|no_location|{radius:.1f}"
 
 
 def _generate_place_key(place_id: str) -> str:
     """Generate cache key for place details."""
-    return f"place:{place_id}"
-
-
-def _is_expired(cache_key: str, ttl_seconds: int = _default_ttl) -> bool:
-    """Check if cache entry is expired."""
-    with _cache_lock:
-        if cache_key not in _cache:
-            return True
-
-        cached_time = _cache_ttl.get(cache_key, 0)
-        return (time.time() - cached_time) > ttl_seconds
+    return f"{PLACE_NAMESPACE}:{place_id}"
 
 
 def get_search_results(query: str, location: tuple[float, float] | None, radius: float) -> Any | None:
     """Get cached search results."""
-    cache_key = _generate_search_key(query, location, radius)
-    if _is_expired(cache_key):
-        return None
-
-    with _cache_lock:
-        return _cache.get(cache_key)
+    return _cache.get(_generate_search_key(query, location, radius))
 
 
 def cache_search_results(query: str, location: tuple[float, float] | None, radius: float, results: Any) -> None:
     """Cache search results."""
-    cache_key = _generate_search_key(query, location, radius)
-    with _cache_lock:
-        _cache[cache_key] = results
-        _cache_ttl[cache_key] = time.time()
+    _cache.set(_generate_search_key(query, location, radius), results)
 
 
 def get_place_details(place_id: str) -> Any | None:
     """Get cached place details."""
-    cache_key = _generate_place_key(place_id)
-    if _is_expired(cache_key):
-        return None
-
-    with _cache_lock:
-        return _cache.get(cache_key)
+    return _cache.get(_generate_place_key(place_id))
 
 
 def cache_place_details(place_id: str, data: Any) -> None:
     """Cache place details."""
-    cache_key = _generate_place_key(place_id)
-    with _cache_lock:
-        _cache[cache_key] = data
-        _cache_ttl[cache_key] = time.time()
+    _cache.set(_generate_place_key(place_id), data)
 
 
 def clear_expired_cache() -> int:
     """Clear expired cache entries. Returns number of entries cleared."""
-    current_time = time.time()
+    return _cache.clear_expired()
 
-    with _cache_lock:
-        expired_keys = [key for key, timestamp in _cache_ttl.items() if (current_time - timestamp) >= _default_ttl]
-        for key in expired_keys:
-            _cache.pop(key, None)
-            _cache_ttl.pop(key, None)
 
-    return len(expired_keys)
+def clear_cache() -> None:
+    """Clear every cache entry and reset the statistics."""
+    _cache.clear()
 
 
-def get_cache_stats() -> dict[str, int]:
+def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics."""
-    with _cache_lock:
-        cache_keys = list(_cache.keys())
-
-    expired_count = sum(1 for k in cache_keys if _is_expired(k))
-
-    return {
-        "total_entries": len(cache_keys),
-        "expired_entries": expired_count,
-    }
+    return _cache.stats()
 
 
 # Legacy compatibility - SimpleCache class for backward compatibility
@@ -0,0 +1,147 @@
+"""Streaming export helpers.
+
+Export services expose ``iter_*_for_export`` generators that read rows in batches of
+``EXPORT_YIELD_PER`` through a server-side cursor. The helpers here turn such a row iterator
+into a CSV, JSON or NDJSON response that is written while the rows are read, so memory stays
+flat however many rows a user has and the first bytes leave before the query finishes.
+"""
+
+from collections.abc import Iterable, Iterator
+import csv
+import io
+from itertools import chain
+import json
+from typing import Any
+
+from flask import Response, request, stream_with_context
+
+# Rows fetched per round trip by the export queries
+EXPORT_YIELD_PER = 500
+# Rows written into one chunk of a streamed response
+EXPORT_CHUNK_ROWS = 100
+
+STREAM_EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def wants_streaming_export(format_type: str) -> bool:
+    """Check whether the current export request asked for a streamed response.
+
+    NDJSON is always streamed; CSV and JSON are streamed with ``stream=true``.
+    """
+    return format_type == "ndjson" or request.args.get("stream", "false").lower() == "true"
+
+
+def peek_rows(rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]] | None:
+    """Check whether an export has any rows without consuming them.
+
+    Args:
+        rows: Export rows, typically a service generator
+
+    Returns:
+        An iterator over all rows, or None if there are none
+    """
+    iterator = iter(rows)
+    first = next(iterator, None)
+    if first is None:
+        return None
+    return chain([first], iterator)
+
+
+def _chunked(rows: Iterator[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
+    """Group rows into lists of at most ``EXPORT_CHUNK_ROWS``."""
+    chunk: list[dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= EXPORT_CHUNK_ROWS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_csv(rows: Iterable[dict[str, Any]], fieldnames: list[str] | None = None) -> Iterator[str]:
+    """Write export rows as CSV text chunks.
+
+    Args:
+        rows: Export rows
+        fieldnames: Columns to write; defaults to the keys of the first row. Keys not listed
+            are ignored.
+
+    Yields:
+        CSV text, starting with the header row
+    """
+    iterator = iter(rows)
+    first = next(iterator, None)
+    if fieldnames is None:
+        fieldnames = list(first.keys()) if first else []
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, quoting=csv.QUOTE_NONNUMERIC, extrasaction="ignore")
+    writer.writeheader()
+    if first is None:
+        yield buffer.getvalue()
+        return
+
+    for chunk in _chunked(chain([first], iterator)):
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+
+def iter_json_array(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Write export rows as chunks of one JSON array."""
+    yield "["
+    separator = "\n"
+    for chunk in _chunked(iter(rows)):
+        parts = []
+        for row in chunk:
+            parts.append(separator + json.dumps(row))
+            separator = ",\n"
+        yield "".join(parts)
+    yield "\n]\n"
+
+
+def iter_ndjson(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Write export rows as newline-delimited JSON, one object per line."""
+    for chunk in _chunked(iter(rows)):
+        yield "".join(json.dumps(row) + "\n" for row in chunk)
+
+
+def streaming_export_response(
+    rows: Iterable[dict[str, Any]],
+    format_type: str,
+    filename: str,
+    fieldnames: list[str] | None = None,
+) -> Response:
+    """Build an attachment response that streams export rows as they are read.
+
+    The request context (and so the database session the rows are read from) is kept
+    open until the last chunk is sent.
+
+    Args:
+        rows: Export rows, typically a service generator
+        format_type: One of ``STREAM_EXPORT_FORMATS``; anything else streams CSV
+        filename: Attachment name without extension
+        fieldnames: CSV columns; defaults to the keys of the first row
+
+    Returns:
+        Streaming response
+    """
+    if format_type not in STREAM_EXPORT_FORMATS:
+        format_type = "csv"
+
+    if format_type == "json":
+        chunks = iter_json_array(rows)
+    elif format_type == "ndjson":
+        chunks = iter_ndjson(rows)
+    else:
+        chunks = iter_csv(rows, fieldnames)
+
+    response = Response(stream_with_context(chunks), mimetype=STREAM_EXPORT_FORMATS[format_type])
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}.{format_type}"
+    return response
@@ -2,9 +2,15 @@
 Geographic utility functions for distance calculations and location-based operations.
 """
 
+from collections.abc import Iterable, Sequence
+import heapq
 import math
 from typing import Optional
 
+# Mean radius of Earth in kilometers
+EARTH_RADIUS_KM = 6371.0
+MILES_PER_KM = 0.621371
+
 
 def calculate_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -19,8 +25,7 @@ def calculate_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) ->
     Returns:
         Distance in kilometers
     """
-    # Radius of Earth in kilometers
-    R = 6371.0
+    R = EARTH_RADIUS_KM
 
     # Convert degrees to radians
     lat1_rad = math.radians(lat1)
@@ -39,6 +44,137 @@ def calculate_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) ->
     return distance
 
 
+def _calculate_distances_km_python(latitude: float, longitude: float, points: list[tuple[float, float]]) -> list[float]:
+    """Pure-Python batch Haversine, computing the center point's trigonometry once."""
+    lat1_rad = math.radians(latitude)
+    lon1_rad = math.radians(longitude)
+    cos_lat1 = math.cos(lat1_rad)
+
+    distances = []
+    for lat2, lon2 in points:
+        lat2_rad = math.radians(lat2)
+        a = (
+            math.sin((lat2_rad - lat1_rad) / 2) ** 2
+            + cos_lat1 * math.cos(lat2_rad) * math.sin((math.radians(lon2) - lon1_rad) / 2) ** 2
+        )
+        distances.append(EARTH_RADIUS_KM * 2 * math.asin(math.sqrt(min(a, 1.0))))
+    return distances
+
+
+def calculate_distances_km(latitude: float, longitude: float, points: Iterable[tuple[float, float]]) -> list[float]:
+    """
+    Calculate the Haversine distance from one point to each of a batch of points.
+
+    Equivalent to calling ``calculate_distance_km`` for every point, with the center point's
+    trigonometry computed once.
+
+    Args:
+        latitude: Latitude of the center point
+        longitude: Longitude of the center point
+        points: (latitude, longitude) pairs
+
+    Returns:
+        Distances in kilometers, in the order of ``points``
+    """
+    return _calculate_distances_km_python(latitude, longitude, list(points))
+
+
+def calculate_distance_matrix_km(
+    origins: Iterable[tuple[float, float]], points: Iterable[tuple[float, float]]
+) -> list[list[float]]:
+    """
+    Calculate the Haversine distance from each origin to each point.
+
+    Args:
+        origins: (latitude, longitude) pairs
+        points: (latitude, longitude) pairs
+
+    Returns:
+        One row per origin holding its distances in kilometers to every point
+    """
+    points = list(points)
+    return [_calculate_distances_km_python(latitude, longitude, points) for latitude, longitude in origins]
+
+
+def nearest_indexes(distances: Sequence[float], k: int, max_distance: float | None = None) -> list[int]:
+    """
+    Get the indexes of the ``k`` smallest distances, closest first.
+
+    Args:
+        distances: Distances, e.g. from ``calculate_distances_km``
+        k: Maximum number of indexes to return
+        max_distance: Ignore distances above this
+
+    Returns:
+        Indexes into ``distances``; equal distances keep their original order
+    """
+    if k <= 0:
+        return []
+    candidates: Iterable[int] = range(len(distances))
+    if max_distance is not None:
+        candidates = [index for index in candidates if distances[index] <= max_distance]
+    return heapq.nsmallest(k, candidates, key=distances.__getitem__)
+
+
+def nearest_neighbors(
+    origins: Iterable[tuple[float, float]], points: Iterable[tuple[float, float]], k: int = 1
+) -> list[list[int]]:
+    """
+    Get, for each origin, the indexes of its ``k`` nearest points, closest first.
+
+    Args:
+        origins: (latitude, longitude) pairs
+        points: (latitude, longitude) pairs
+        k: Number of neighbours per origin
+
+    Returns:
+        One list of indexes into ``points`` per origin
+    """
+    return [nearest_indexes(row, k) for row in calculate_distance_matrix_km(origins, points)]
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> tuple[float, float, list[tuple[float, float]]]:
+    """
+    Get the latitude/longitude box containing every point within a radius.
+
+    The box is a cheap, index-friendly prefilter: every point within ``radius_km`` is inside it,
+    but its corners are farther away, so candidates still need an exact distance check.
+
+    Args:
+        latitude: Latitude of the center point
+        longitude: Longitude of the center point
+        radius_km: Radius in kilometers
+
+    Returns:
+        (min_latitude, max_latitude, longitude_ranges). ``longitude_ranges`` holds one
+        (min, max) range, or two when the box crosses the antimeridian; it spans every
+        longitude when the radius reaches a pole.
+    """
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    lat_rad = math.radians(latitude)
+    min_lat_rad = lat_rad - angular_radius
+    max_lat_rad = lat_rad + angular_radius
+
+    if min_lat_rad <= -math.pi / 2 or max_lat_rad >= math.pi / 2:
+        # A pole is within the radius: every longitude can be reached
+        return (
+            math.degrees(max(min_lat_rad, -math.pi / 2)),
+            math.degrees(min(max_lat_rad, math.pi / 2)),
+            [(-180.0, 180.0)],
+        )
+
+    delta_lon = math.degrees(math.asin(min(math.sin(angular_radius) / math.cos(lat_rad), 1.0)))
+    min_lon = longitude - delta_lon
+    max_lon = longitude + delta_lon
+    if min_lon < -180:
+        lon_ranges = [(min_lon + 360, 180.0), (-180.0, max_lon)]
+    elif max_lon > 180:
+        lon_ranges = [(min_lon, 180.0), (-180.0, max_lon - 360)]
+    else:
+        lon_ranges = [(min_lon, max_lon)]
+    return math.degrees(min_lat_rad), math.degrees(max_lat_rad), lon_ranges
+
+
 def calculate_distance_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the distance between two points on Earth in miles.
@@ -53,7 +189,7 @@ def calculate_distance_miles(lat1: float, lon1: float, lat2: float, lon2: float)
         Distance in miles
     """
     distance_km = calculate_distance_km(lat1, lon1, lat2, lon2)
-    return distance_km * 0.621371  # Convert km to miles
+    return distance_km * MILES_PER_KM
 
 
 def is_within_radius(lat1: float, lon1: float, lat2: float, lon2: float, radius_km: float) -> bool:
@@ -103,7 +239,7 @@ def format_distance(distance_km: float, unit: str = "km") -> str:
         Formatted distance string
     """
     if unit.lower() == "miles":
-        distance = distance_km * 0.621371
+        distance = distance_km * MILES_PER_KM
         return f"{distance:.1f} mi"
     else:
         return f"{distance_km:.1f} km"
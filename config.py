@@ -61,11 +61,23 @@ class Config:
     S3_RECEIPTS_PREFIX: str = os.getenv("S3_RECEIPTS_PREFIX", "receipts/")
     S3_URL_EXPIRY: int = int(os.getenv("S3_URL_EXPIRY", "3600"))  # 1 hour default
 
+    # botocore settings of the process-wide AWS clients (app/services/aws_clients.py)
+    AWS_MAX_POOL_CONNECTIONS: int = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "10"))
+    AWS_RETRY_MODE: str = os.getenv("AWS_RETRY_MODE", "standard")  # "legacy", "standard" or "adaptive"
+    AWS_MAX_ATTEMPTS: int = int(os.getenv("AWS_MAX_ATTEMPTS", "3"))
+    AWS_CONNECT_TIMEOUT: int = int(os.getenv("AWS_CONNECT_TIMEOUT", "5"))
+    AWS_READ_TIMEOUT: int = int(os.getenv("AWS_READ_TIMEOUT", "60"))
+
     # OCR Configuration (AWS Textract)
     OCR_ENABLED: bool = os.getenv("OCR_ENABLED", "true").lower() == "true"
     OCR_CONFIDENCE_THRESHOLD: float = float(os.getenv("OCR_CONFIDENCE_THRESHOLD", "0.7"))
     TEXTRACT_REGION: str = os.getenv("TEXTRACT_REGION", os.getenv("AWS_REGION", "us-east-1"))
     TEXTRACT_ROLE_ARN: str | None = os.getenv("TEXTRACT_ROLE_ARN")  # Optional, for cross-account access
+    # Queue running async OCR jobs: "threads" (per-process worker pool), "inline" (in the request)
+    # or "sync" (none; async requests are processed synchronously). Lambda freezes worker threads
+    # after the response, so it defaults to "sync" and never builds the thread pool.
+    OCR_JOB_QUEUE: str = os.getenv("OCR_JOB_QUEUE", "sync" if os.getenv("AWS_LAMBDA_FUNCTION_NAME") else "threads")
+    OCR_JOB_WORKERS: int = int(os.getenv("OCR_JOB_WORKERS", "2"))
 
     # Notification configuration (AWS SNS)
     NOTIFICATIONS_ENABLED: bool = os.getenv("NOTIFICATIONS_ENABLED", "true").lower() == "true"
@@ -224,6 +236,7 @@ class UnitTestConfig(Config):  # noqa: D101
     SQLALCHEMY_DATABASE_URI: str = "sqlite:///:memory:"
     SESSION_COOKIE_SECURE: bool = False
     SESSION_COOKIE_HTTPONLY: bool = False
+    OCR_JOB_QUEUE: str = "inline"
 
 
 class ProductionConfig(Config):
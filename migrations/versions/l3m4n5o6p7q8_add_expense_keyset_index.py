@@ -0,0 +1,29 @@
+"""add expense keyset pagination index
+
+Revision ID: l3m4n5o6p7q8
+Revises: k2l3m4n5o6p
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "l3m4n5o6p7q8"
+down_revision = "k2l3m4n5o6p"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("expense", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_expense_user_date_created_id",
+            ["user_id", "date", "created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("expense", schema=None) as batch_op:
+        batch_op.drop_index("ix_expense_user_date_created_id")
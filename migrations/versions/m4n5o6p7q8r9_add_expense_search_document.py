@@ -0,0 +1,85 @@
+"""add expense search document and search index
+
+Revision ID: m4n5o6p7q8r9
+Revises: l3m4n5o6p7q8
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "m4n5o6p7q8r9"
+down_revision = "l3m4n5o6p7q8"
+branch_labels = None
+depends_on = None
+
+# Mirrors app.expenses.search.build_search_document (fields joined by a newline)
+BACKFILL_SEARCH_DOCUMENT = """
+UPDATE expense SET search_document =
+    coalesce((SELECT coalesce(r.name, '') || char(10) || coalesce(r.address_line_1, '') || char(10)
+                     || coalesce(r.address_line_2, '')
+              FROM restaurant r WHERE r.id = expense.restaurant_id), '')
+    || char(10) || coalesce(expense.notes, '')
+    || char(10) || coalesce(expense.meal_type, '')
+    || char(10) || coalesce(expense.order_type, '')
+    || char(10) || coalesce((SELECT c.name FROM category c WHERE c.id = expense.category_id), '')
+"""
+
+SQLITE_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS expense_search USING fts5("
+    "search_document, content='expense', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS expense_search_ai AFTER INSERT ON expense BEGIN "
+    "INSERT INTO expense_search(rowid, search_document) VALUES (new.id, new.search_document); END",
+    "CREATE TRIGGER IF NOT EXISTS expense_search_ad AFTER DELETE ON expense BEGIN "
+    "INSERT INTO expense_search(expense_search, rowid, search_document) "
+    "VALUES ('delete', old.id, old.search_document); END",
+    "CREATE TRIGGER IF NOT EXISTS expense_search_au AFTER UPDATE OF search_document ON expense BEGIN "
+    "INSERT INTO expense_search(expense_search, rowid, search_document) "
+    "VALUES ('delete', old.id, old.search_document); "
+    "INSERT INTO expense_search(rowid, search_document) VALUES (new.id, new.search_document); END",
+    "INSERT INTO expense_search(expense_search) VALUES ('rebuild')",
+)
+
+
+def upgrade():
+    with op.batch_alter_table("expense", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "search_document",
+                sa.Text(),
+                nullable=True,
+                comment="Restaurant, notes, meal/order type and category text backing indexed expense search",
+            )
+        )
+
+    dialect = op.get_bind().dialect.name
+    # PostgreSQL has chr() rather than char()
+    backfill = (
+        BACKFILL_SEARCH_DOCUMENT.replace("char(10)", "chr(10)") if dialect == "postgresql" else BACKFILL_SEARCH_DOCUMENT
+    )
+    op.execute(backfill)
+
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_expense_search_document_trgm "
+            "ON expense USING gin (search_document gin_trgm_ops)"
+        )
+    elif dialect == "sqlite":
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_expense_search_document_trgm")
+    elif dialect == "sqlite":
+        for trigger in ("expense_search_ai", "expense_search_ad", "expense_search_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS expense_search")
+
+    with op.batch_alter_table("expense", schema=None) as batch_op:
+        batch_op.drop_column("search_document")
@@ -0,0 +1,80 @@
+"""add stored restaurant statistics
+
+Revision ID: n5o6p7q8r9s0
+Revises: m4n5o6p7q8r9
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "n5o6p7q8r9s0"
+down_revision = "m4n5o6p7q8r9"
+branch_labels = None
+depends_on = None
+
+# Mirrors app.restaurants.stats.refresh_restaurant_statistics
+BACKFILL_RESTAURANT_STATISTICS = """
+UPDATE restaurant SET
+    visit_count = (SELECT count(e.id) FROM expense e
+                   WHERE e.restaurant_id = restaurant.id AND e.user_id = restaurant.user_id),
+    total_spent = (SELECT coalesce(sum(e.amount), 0) FROM expense e
+                   WHERE e.restaurant_id = restaurant.id AND e.user_id = restaurant.user_id),
+    last_visit = (SELECT max(e.date) FROM expense e
+                  WHERE e.restaurant_id = restaurant.id AND e.user_id = restaurant.user_id),
+    avg_price_per_person = (SELECT coalesce(CASE WHEN sum(e.party_size) > 0
+                                                 THEN CAST(sum(e.amount) AS FLOAT) / sum(e.party_size) END, 0)
+                            FROM expense e
+                            WHERE e.restaurant_id = restaurant.id AND e.user_id = restaurant.user_id)
+"""
+
+
+def upgrade():
+    with op.batch_alter_table("restaurant", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "visit_count",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+                comment="Number of expenses at this restaurant",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "total_spent",
+                sa.Numeric(precision=12, scale=2),
+                server_default="0",
+                nullable=False,
+                comment="Sum of expense amounts at this restaurant",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "last_visit",
+                sa.DateTime(timezone=True),
+                nullable=True,
+                comment="Date of the most recent expense at this restaurant",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "avg_price_per_person",
+                sa.Numeric(precision=10, scale=2),
+                server_default="0",
+                nullable=False,
+                comment="Total spent divided by total party size (0 when no party sizes are recorded)",
+            )
+        )
+
+    op.execute(BACKFILL_RESTAURANT_STATISTICS)
+
+
+def downgrade():
+    with op.batch_alter_table("restaurant", schema=None) as batch_op:
+        batch_op.drop_column("avg_price_per_person")
+        batch_op.drop_column("last_visit")
+        batch_op.drop_column("total_spent")
+        batch_op.drop_column("visit_count")
@@ -0,0 +1,83 @@
+"""add expense daily rollup table
+
+Revision ID: o6p7q8r9s0t1
+Revises: n5o6p7q8r9s0
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "o6p7q8r9s0t1"
+down_revision = "n5o6p7q8r9s0"
+branch_labels = None
+depends_on = None
+
+_ROLLUP_COLUMNS = (
+    "user_id, day, category_id, restaurant_id, meal_type, order_type, expense_count, total_amount, party_size_total"
+)
+
+# Mirrors app.expenses.rollup.rebuild_daily_rollups: days in the user's timezone (UTC if unset/unknown)
+BACKFILL_POSTGRESQL = f"""
+INSERT INTO expense_daily_rollup ({_ROLLUP_COLUMNS})
+SELECT e.user_id,
+       CAST(timezone(CASE WHEN u.timezone IN (SELECT name FROM pg_timezone_names) THEN u.timezone ELSE 'UTC' END,
+                     e.date) AS DATE),
+       e.category_id, e.restaurant_id, e.meal_type, e.order_type,
+       count(e.id), coalesce(sum(e.amount), 0), coalesce(sum(e.party_size), 0)
+FROM expense e
+JOIN "user" u ON u.id = e.user_id
+GROUP BY 1, 2, 3, 4, 5, 6
+"""
+
+# Other dialects (local development) have no timezone database; fall back to UTC days
+BACKFILL_UTC_DAYS = f"""
+INSERT INTO expense_daily_rollup ({_ROLLUP_COLUMNS})
+SELECT e.user_id, date(e.date), e.category_id, e.restaurant_id, e.meal_type, e.order_type,
+       count(e.id), coalesce(sum(e.amount), 0), coalesce(sum(e.party_size), 0)
+FROM expense e
+GROUP BY e.user_id, date(e.date), e.category_id, e.restaurant_id, e.meal_type, e.order_type
+"""
+
+
+def upgrade():
+    op.create_table(
+        "expense_daily_rollup",
+        sa.Column("user_id", sa.Integer(), nullable=False, comment="Reference to the user who made the expenses"),
+        sa.Column("day", sa.Date(), nullable=False, comment="Day of the expenses in the user's timezone"),
+        sa.Column("category_id", sa.Integer(), nullable=True, comment="Category of the expenses"),
+        sa.Column("restaurant_id", sa.Integer(), nullable=True, comment="Restaurant of the expenses"),
+        sa.Column("meal_type", sa.String(length=50), nullable=True, comment="Meal type of the expenses"),
+        sa.Column("order_type", sa.String(length=50), nullable=True, comment="Order type of the expenses"),
+        sa.Column("expense_count", sa.Integer(), nullable=False, comment="Number of expenses in the group"),
+        sa.Column(
+            "total_amount", sa.Numeric(precision=12, scale=2), nullable=False, comment="Sum of the expense amounts"
+        ),
+        sa.Column("party_size_total", sa.Integer(), nullable=False, comment="Sum of the recorded party sizes"),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["category_id"], ["category.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["restaurant_id"], ["restaurant.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Daily expense totals per category, restaurant, meal type and order type",
+    )
+    op.create_index("ix_expense_daily_rollup_user_day", "expense_daily_rollup", ["user_id", "day"], unique=False)
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ALTER TABLE IF EXISTS public.expense_daily_rollup ENABLE ROW LEVEL SECURITY")
+        op.execute(BACKFILL_POSTGRESQL)
+    else:
+        op.execute(BACKFILL_UTC_DAYS)
+
+
+def downgrade():
+    op.drop_index("ix_expense_daily_rollup_user_day", table_name="expense_daily_rollup")
+    op.drop_table("expense_daily_rollup")
@@ -0,0 +1,34 @@
+"""add user expense data version
+
+Revision ID: p7q8r9s0t1u2
+Revises: o6p7q8r9s0t1
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "p7q8r9s0t1u2"
+down_revision = "o6p7q8r9s0t1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "expense_data_version",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+                comment="Incremented on every expense or category write; validates cached per-user expense data",
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.drop_column("expense_data_version")
@@ -0,0 +1,34 @@
+"""add user receipt data version
+
+Revision ID: q8r9s0t1u2v3
+Revises: p7q8r9s0t1u2
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "q8r9s0t1u2v3"
+down_revision = "p7q8r9s0t1u2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "receipt_data_version",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+                comment="Incremented on every receipt or expense receipt link write; validates cached receipt data",
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        batch_op.drop_column("receipt_data_version")
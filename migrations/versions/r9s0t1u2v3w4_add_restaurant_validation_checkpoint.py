@@ -0,0 +1,73 @@
+"""add restaurant validation checkpoint
+
+Revision ID: r9s0t1u2v3w4
+Revises: q8r9s0t1u2v3
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "r9s0t1u2v3w4"
+down_revision = "q8r9s0t1u2v3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "restaurant_validation_checkpoint",
+        sa.Column("restaurant_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, comment="valid, invalid or error"),
+        sa.Column("has_mismatches", sa.Boolean(), nullable=False, comment="Mismatches with Google left unfixed"),
+        sa.Column(
+            "sections", sa.String(length=255), nullable=False, comment="Validation sections checked, empty for all"
+        ),
+        sa.Column(
+            "restaurant_fingerprint",
+            sa.String(length=64),
+            nullable=False,
+            comment="SHA-256 of the validated restaurant fields",
+        ),
+        sa.Column(
+            "google_fingerprint", sa.String(length=64), nullable=True, comment="SHA-256 of the Google data compared"
+        ),
+        sa.Column("validated_at", sa.DateTime(timezone=True), nullable=False, comment="When the validation ran"),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["restaurant_id"], ["restaurant.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Last Google validation result per restaurant, for resumable validation runs",
+    )
+    op.create_index(
+        op.f("ix_restaurant_validation_checkpoint_restaurant_id"),
+        "restaurant_validation_checkpoint",
+        ["restaurant_id"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_restaurant_validation_checkpoint_validated_at"),
+        "restaurant_validation_checkpoint",
+        ["validated_at"],
+        unique=False,
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ALTER TABLE IF EXISTS public.restaurant_validation_checkpoint ENABLE ROW LEVEL SECURITY")
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_restaurant_validation_checkpoint_validated_at"), table_name="restaurant_validation_checkpoint"
+    )
+    op.drop_index(
+        op.f("ix_restaurant_validation_checkpoint_restaurant_id"), table_name="restaurant_validation_checkpoint"
+    )
+    op.drop_table("restaurant_validation_checkpoint")
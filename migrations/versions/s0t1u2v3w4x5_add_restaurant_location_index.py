@@ -0,0 +1,25 @@
+"""add restaurant location index
+
+Revision ID: s0t1u2v3w4x5
+Revises: r9s0t1u2v3w4
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "s0t1u2v3w4x5"
+down_revision = "r9s0t1u2v3w4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("restaurant", schema=None) as batch_op:
+        batch_op.create_index("ix_restaurant_user_lat_lon", ["user_id", "latitude", "longitude"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("restaurant", schema=None) as batch_op:
+        batch_op.drop_index("ix_restaurant_user_lat_lon")
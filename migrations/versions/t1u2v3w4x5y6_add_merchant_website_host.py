@@ -0,0 +1,64 @@
+"""add merchant website host
+
+Revision ID: t1u2v3w4x5y6
+Revises: s0t1u2v3w4x5
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from urllib.parse import urlsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "t1u2v3w4x5y6"
+down_revision = "s0t1u2v3w4x5"
+branch_labels = None
+depends_on = None
+
+
+def _comparable_host(url: str | None) -> str | None:
+    """Mirrors app.utils.url_utils.extract_comparable_website_host (None instead of "")."""
+    if not url or not url.strip():
+        return None
+    try:
+        host = urlsplit(url.strip()).netloc.lower().strip()
+    except ValueError:
+        return None
+    if host.startswith("www."):
+        host = host[4:]
+    return host or None
+
+
+def upgrade():
+    with op.batch_alter_table("merchant", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "website_host",
+                sa.String(length=255),
+                nullable=True,
+                comment="Comparable website host (lowercase, without www.) used for merchant matching",
+            )
+        )
+        batch_op.create_index(batch_op.f("ix_merchant_website_host"), ["website_host"], unique=False)
+
+    merchant = sa.table(
+        "merchant", sa.column("id", sa.Integer), sa.column("website", sa.String), sa.column("website_host", sa.String)
+    )
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(merchant.c.id, merchant.c.website).where(merchant.c.website.isnot(None))).all()
+    updates = [{"merchant_id": row.id, "host": host} for row in rows if (host := _comparable_host(row.website))]
+    if updates:
+        connection.execute(
+            merchant.update()
+            .where(merchant.c.id == sa.bindparam("merchant_id"))
+            .values(website_host=sa.bindparam("host")),
+            updates,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("merchant", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_merchant_website_host"))
+        batch_op.drop_column("website_host")
@@ -93,6 +93,7 @@ class ReceiptData:
     tip: Decimal | None = None
     total: Decimal | None = None
     confidence_scores: dict[str, float] | None = None
+    field_sources: dict[str, str] | None = None  # Parser path ("section", "legacy", ...) per field
     raw_text: str = ""
 
     def __post_init__(self) -> None:
@@ -101,6 +102,8 @@ class ReceiptData:
             self.items = []
         if self.confidence_scores is None:
             self.confidence_scores = {}
+        if self.field_sources is None:
+            self.field_sources = {}
 
     def to_dict(self) -> dict[str, Any]:
         """Convert ReceiptData to dictionary with serializable values."""
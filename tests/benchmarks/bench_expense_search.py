@@ -0,0 +1,138 @@
+"""Benchmark expense search latency for a single user with a large history.
+
+Seeds one user with ``--expenses`` expenses (default 50,000) spread over a few hundred
+restaurants and categories, then times the expense-list search (page query plus header
+aggregates) through the indexed search document and through the previous per-column
+``ILIKE`` predicates across the restaurant/category outer joins.
+
+Run from the repository root::
+
+    python -m tests.benchmarks.bench_expense_search
+    DATABASE_URL=postgresql+pg8000://... python -m tests.benchmarks.bench_expense_search --config production
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+import statistics
+import time
+from typing import Any
+from unittest.mock import patch
+
+from sqlalchemy import func, insert, or_
+from werkzeug.datastructures import MultiDict
+
+from app import create_app
+from app.auth.models import User
+from app.expenses import search as expense_search, services as expense_services
+from app.expenses.models import Category, Expense
+from app.extensions import db
+from app.restaurants.models import Restaurant
+
+MEAL_TYPES = ("breakfast", "lunch", "dinner", "snacks", "drinks")
+NOTES = ("Team lunch", "Client dinner", "Quick coffee", "Birthday brunch", None, "Airport snack")
+SEARCH_TERMS = ("brunch", "Pasta House 42", "Main St", "drinks", "zzz-no-match")
+
+
+def _legacy_search_condition(term: str) -> Any:
+    """The per-column search predicate used before the search document existed."""
+    pattern = f"%{term}%"
+    return or_(
+        func.coalesce(Restaurant.name, "").ilike(pattern),
+        func.coalesce(Restaurant.address_line_1, "").ilike(pattern),
+        func.coalesce(Restaurant.address_line_2, "").ilike(pattern),
+        func.coalesce(Expense.notes, "").ilike(pattern),
+        func.coalesce(Expense.meal_type, "").ilike(pattern),
+        func.coalesce(Expense.order_type, "").ilike(pattern),
+        func.coalesce(Category.name, "").ilike(pattern),
+    )
+
+
+def seed(expense_count: int) -> int:
+    """Create a benchmark user with ``expense_count`` expenses and return the user id."""
+    user = User(username=f"bench_{int(time.time())}", email=f"bench_{int(time.time())}@example.com")
+    user.set_password("benchpass")
+    db.session.add(user)
+    db.session.flush()
+
+    restaurants = [
+        Restaurant(
+            name=f"Pasta House {index}" if index % 3 else f"Taqueria {index}",
+            address_line_1=f"{index} Main St" if index % 2 else f"{index} Oak Ave",
+            city="Benchmark City",
+            user_id=user.id,
+        )
+        for index in range(300)
+    ]
+    categories = [Category(name=f"Bench Category {index}", user_id=user.id) for index in range(12)]
+    db.session.add_all([*restaurants, *categories])
+    db.session.flush()
+    restaurant_ids = [restaurant.id for restaurant in restaurants]
+    category_ids = [category.id for category in categories]
+
+    start = datetime(2020, 1, 1, 12, 0, tzinfo=UTC)
+    rows = [
+        {
+            "user_id": user.id,
+            "amount": Decimal("5.00") + index % 90,
+            "date": start + timedelta(hours=index),
+            "meal_type": MEAL_TYPES[index % len(MEAL_TYPES)],
+            "notes": NOTES[index % len(NOTES)],
+            "restaurant_id": restaurant_ids[index % len(restaurant_ids)],
+            "category_id": category_ids[index % len(category_ids)] if index % 7 else None,
+            "party_size": 1 + index % 4,
+        }
+        for index in range(expense_count)
+    ]
+    for batch_start in range(0, len(rows), 5000):
+        db.session.execute(insert(Expense.__table__), rows[batch_start : batch_start + 5000])
+    # Core inserts bypass the ORM listeners, so build the documents with the bulk refresh path
+    expense_search.refresh_search_documents(db.session.connection(), Expense.__table__.c.user_id == user.id)
+    db.session.commit()
+    return user.id
+
+
+def time_search(user_id: int, term: str, repeat: int) -> list[float]:
+    """Return per-run latencies (ms) for one list-page search."""
+    filters = expense_services.get_expense_filters(type("Request", (), {"args": MultiDict({"q": term})})())
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        expense_services.get_user_expenses_paginated(user_id, filters, limit=25)
+        samples.append((time.perf_counter() - started) * 1000)
+        db.session.expire_all()
+    return samples
+
+
+def report(label: str, run: Callable[[str], list[float]]) -> None:
+    print(f"\n{label}")
+    for term in SEARCH_TERMS:
+        samples = run(term)
+        print(f"  {term!r:20} median {statistics.median(samples):8.2f} ms   max {max(samples):8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--expenses", type=int, default=50_000, help="expenses to seed for the benchmark user")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per search term")
+    parser.add_argument("--config", default="testing", help="app config name (testing = in-memory SQLite)")
+    args = parser.parse_args()
+
+    app = create_app(args.config)
+    with app.test_request_context("/expenses/"):
+        if args.config == "testing":
+            db.create_all()
+        started = time.perf_counter()
+        user_id = seed(args.expenses)
+        print(f"Seeded {args.expenses} expenses in {time.perf_counter() - started:.1f}s ({db.engine.dialect.name})")
+
+        report("Indexed search document", lambda term: time_search(user_id, term, args.repeat))
+        with patch.object(expense_search, "search_condition", _legacy_search_condition):
+            report("Legacy per-column ILIKE", lambda term: time_search(user_id, term, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark the batch distance calculations against the scalar Haversine.
+
+Times one origin against ``--points`` points (default 10,000) with the scalar
+``calculate_distance_km`` in a loop, ``calculate_distances_km``, and the top-k selection of
+``nearest_indexes``, plus a ``--origins`` x ``--points`` distance matrix.
+
+Run from the repository root::
+
+    python -m tests.benchmarks.bench_geo_distance
+    python -m tests.benchmarks.bench_geo_distance --points 100000 --origins 50
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import random
+import statistics
+import time
+from typing import Any
+
+from app.utils import geo_utils
+
+ORIGIN = (40.7128, -74.0060)
+
+
+def random_points(count: int, seed: int) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    return [(rng.uniform(-80, 80), rng.uniform(-180, 180)) for _ in range(count)]
+
+
+def time_call(run: Callable[[], Any], repeat: int) -> list[float]:
+    """Return per-run latencies (ms)."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def report(label: str, run: Callable[[], Any], repeat: int) -> None:
+    samples = time_call(run, repeat)
+    print(f"  {label:40} median {statistics.median(samples):9.2f} ms   max {max(samples):9.2f} ms")
+
+
+def run_suite(points: list[tuple[float, float]], origins: list[tuple[float, float]], repeat: int) -> None:
+    distances = geo_utils.calculate_distances_km(*ORIGIN, points)
+    report(
+        "scalar calculate_distance_km loop",
+        lambda: [geo_utils.calculate_distance_km(*ORIGIN, lat, lon) for lat, lon in points],
+        repeat,
+    )
+    report("calculate_distances_km", lambda: geo_utils.calculate_distances_km(*ORIGIN, points), repeat)
+    report("full sort, top 50", lambda: sorted(range(len(distances)), key=distances.__getitem__)[:50], repeat)
+    report("nearest_indexes, top 50", lambda: geo_utils.nearest_indexes(distances, 50), repeat)
+    report(
+        f"calculate_distance_matrix_km {len(origins)}x{len(points)}",
+        lambda: geo_utils.calculate_distance_matrix_km(origins, points),
+        repeat,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=10_000, help="points per batch")
+    parser.add_argument("--origins", type=int, default=20, help="origins of the distance matrix")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    args = parser.parse_args()
+
+    points = random_points(args.points, seed=1)
+    origins = random_points(args.origins, seed=2)
+
+    run_suite(points, origins, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Benchmark merchant matching by restaurant name and website against a large merchant table.
+
+Seeds ``--merchants`` merchants (default 50,000), then times ``find_merchant_for_restaurant_name``
+through the in-memory match index (cold build and warm lookups), ``find_merchant_for_website``
+through the indexed ``website_host`` column, and both through the previous full-table scan.
+
+Run from the repository root::
+
+    python -m tests.benchmarks.bench_merchant_match
+    DATABASE_URL=postgresql+pg8000://... python -m tests.benchmarks.bench_merchant_match --config production
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import statistics
+import time
+from typing import Any
+
+from sqlalchemy import insert, select
+
+from app import create_app
+from app.extensions import db
+from app.merchants import services as merchant_services
+from app.merchants.match_index import clear_merchant_match_index, normalize_for_name_match
+from app.merchants.models import Merchant
+from app.utils.url_utils import extract_comparable_website_host
+
+RESTAURANT_NAMES = ("Brand 4242 Grill - Downtown", "Brand 17 Airport", "Unknown Diner", "Brand 49999")
+WEBSITES = ("https://www.brand4242.example.com/locations", "https://nobody.example.org")
+
+
+def _legacy_find_merchant_for_restaurant_name(restaurant_name: str) -> Merchant | None:
+    """The full-table scan used before the match index existed."""
+    normalized_restaurant_name = normalize_for_name_match(restaurant_name)
+    if not normalized_restaurant_name:
+        return None
+
+    candidates: list[tuple[int, int, int, Merchant]] = []
+    for merchant in db.session.execute(select(Merchant)).scalars().all():
+        for is_short_name, raw_value in ((True, merchant.short_name), (False, merchant.name)):
+            value = normalize_for_name_match(raw_value)
+            if not value:
+                continue
+            is_exact = normalized_restaurant_name == value
+            if is_exact or normalized_restaurant_name.startswith(f"{value} "):
+                candidates.append((0 if is_short_name else 1, 0 if is_exact else 1, -len(value), merchant))
+
+    if not candidates:
+        return None
+    candidates.sort(key=lambda item: item[:3])
+    best_score = candidates[0][:3]
+    if len({candidate[3].id for candidate in candidates if candidate[:3] == best_score}) > 1:
+        return None
+    return candidates[0][3]
+
+
+def _legacy_find_merchant_for_website(website: str | None) -> Merchant | None:
+    comparable_host = extract_comparable_website_host(website)
+    if not comparable_host:
+        return None
+    merchants = db.session.execute(select(Merchant)).scalars().all()
+    matches = [m for m in merchants if extract_comparable_website_host(m.website) == comparable_host]
+    return matches[0] if len(matches) == 1 else None
+
+
+def seed(merchant_count: int) -> None:
+    rows = []
+    for index in range(merchant_count):
+        website = f"https://brand{index}.example.com/" if index % 2 == 0 else None
+        rows.append(
+            {
+                "name": f"Brand {index} Restaurant Group",
+                "short_name": f"Brand {index}",
+                "website": website,
+                # Core inserts skip the ORM listener that fills this column
+                "website_host": extract_comparable_website_host(website) or None,
+                "is_chain": False,
+            }
+        )
+    for batch_start in range(0, len(rows), 5000):
+        db.session.execute(insert(Merchant.__table__), rows[batch_start : batch_start + 5000])
+    db.session.commit()
+
+
+def time_call(run: Callable[[], Any], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+        db.session.expire_all()
+    return samples
+
+
+def report(label: str, run: Callable[[], Any], repeat: int) -> None:
+    samples = time_call(run, repeat)
+    print(f"  {label:46} median {statistics.median(samples):9.2f} ms   max {max(samples):9.2f} ms")
+
+
+def _lookup_all() -> None:
+    for name in RESTAURANT_NAMES:
+        merchant_services.find_merchant_for_restaurant_name(name)
+    for website in WEBSITES:
+        merchant_services.find_merchant_for_website(website)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--merchants", type=int, default=50_000, help="merchants to seed")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per lookup")
+    parser.add_argument("--config", default="testing", help="app config name (testing = in-memory SQLite)")
+    args = parser.parse_args()
+
+    app = create_app(args.config)
+    with app.app_context():
+        if args.config == "testing":
+            db.create_all()
+        started = time.perf_counter()
+        seed(args.merchants)
+        print(f"Seeded {args.merchants} merchants in {time.perf_counter() - started:.1f}s ({db.engine.dialect.name})")
+
+        print("\nMatch index")
+        report("cold build + lookup", lambda: (clear_merchant_match_index(), _lookup_all()), args.repeat)
+        report("warm lookups (all names and websites)", _lookup_all, args.repeat)
+
+        print("\nWebsite host column")
+        report(
+            "website lookups",
+            lambda: [merchant_services.find_merchant_for_website(website) for website in WEBSITES],
+            args.repeat,
+        )
+
+        print("\nLegacy full-table scan")
+        report(
+            "lookups (all names and websites)",
+            lambda: (
+                [_legacy_find_merchant_for_restaurant_name(name) for name in RESTAURANT_NAMES],
+                [_legacy_find_merchant_for_website(website) for website in WEBSITES],
+            ),
+            args.repeat,
+        )
+        report(
+            "website lookups",
+            lambda: [_legacy_find_merchant_for_website(website) for website in WEBSITES],
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
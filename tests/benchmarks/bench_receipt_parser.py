@@ -0,0 +1,239 @@
+"""Benchmark ``ReceiptParser`` over a synthetic corpus of OCR receipt texts.
+
+Generates ``--receipts`` receipts (default 500) mixing the layouts the parser handles (printed
+receipts with separators, emailed receipts with label and amount on separate lines, markdown
+tables, fragmented OCR amounts and bank statements), then reports the parse time per receipt.
+
+Run from the repository root::
+
+    python -m tests.benchmarks.bench_receipt_parser
+    python -m tests.benchmarks.bench_receipt_parser --receipts 2000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import statistics
+import time
+
+from app.services.ocr_service import ReceiptData
+from app.services.receipt_parser import ReceiptParser
+
+NAMES = (
+    "HAWAIIAN BROS 0033",
+    "Island Grill #41",
+    "Joe's Pizza - #12",
+    "THE COTTON PATCH CAFE",
+    "Luigi's Trattoria",
+    "Blue Door Kitchen",
+    "SUNRISE DINER 214",
+    "Taqueria El Sol",
+)
+STREETS = ("3300 W FM 544", "1200 Main Street", "45 Elm Ave Suite 200", "987 Commerce Blvd")
+CITIES = ("Wylie, TX 75098", "Austin, TX 78701", "Portland, OR 97205", "Denver CO 80202")
+ITEMS = (
+    "Classic - Mixed Plate",
+    "Chicken Katsu",
+    "Caesar Salad",
+    "Margherita Pizza",
+    "Fish Tacos",
+    "Barq's Root Beer",
+    "Iced Tea",
+    "Chocolate Cake",
+    "Garlic Knots",
+    "Pad Thai",
+)
+MODIFIERS = ("No Onions", "Extra Cheese", "Add Avocado", "Side Ranch")
+SERVERS = ("Madison P.", "Carlos", "Jenna", "Kiosk")
+CUSTOMERS = ("Morgan", "Taylor", "Avery")
+CARDS = ("VISA", "MASTERCARD", "AMEX")
+
+
+def _money(value: float) -> str:
+    return f"{value:.2f}"
+
+
+def _items(rng: random.Random) -> list[tuple[str, float]]:
+    return [(name, round(rng.uniform(2, 30), 2)) for name in rng.sample(ITEMS, rng.randint(2, 7))]
+
+
+def _date(rng: random.Random) -> str:
+    return f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{rng.choice(('2024', '2025', '25'))}"
+
+
+def _time(rng: random.Random) -> str:
+    return f"{rng.randint(1, 12)}:{rng.randint(0, 59):02d} {rng.choice(('AM', 'PM'))}"
+
+
+def _phone(rng: random.Random) -> str:
+    area, prefix, line = rng.randint(200, 989), rng.randint(200, 999), rng.randint(1000, 9999)
+    return rng.choice((f"({area}) {prefix}-{line}", f"{area}-{prefix}-{line}", f"{area}.{prefix}.{line}"))
+
+
+def _totals(rng: random.Random, items: list[tuple[str, float]]) -> tuple[float, float, float, float]:
+    subtotal = round(sum(price for _, price in items), 2)
+    tax = round(subtotal * 0.0825, 2)
+    tip = round(subtotal * rng.choice((0, 0.15, 0.2)), 2)
+    return subtotal, tax, tip, round(subtotal + tax + tip, 2)
+
+
+def printed_receipt(rng: random.Random) -> str:
+    items = _items(rng)
+    subtotal, tax, tip, total = _totals(rng, items)
+    lines = [rng.choice(NAMES), rng.choice(STREETS), rng.choice(CITIES), _phone(rng)]
+    if rng.random() < 0.5:
+        lines.append(f"www.{rng.choice(('islandgrill', 'joespizza', 'bluedoor'))}.com")
+    lines += [
+        f"{_date(rng)} {_time(rng)}",
+        f"Server: {rng.choice(SERVERS)}",
+        f"Check #{rng.randint(10, 99999)} {rng.choice(CUSTOMERS)}",
+        f"Table {rng.randint(1, 40)}",
+        rng.choice(("----------------", "================", "— ISLAND GRILL —")),
+    ]
+    for name, price in items:
+        lines.append(
+            f"{rng.randint(1, 3)}x {name} ${_money(price)}" if rng.random() < 0.3 else f"{name} ${_money(price)}"
+        )
+        if rng.random() < 0.3:
+            lines.append(f"  {rng.choice(MODIFIERS)}")
+    lines += [
+        "----------------",
+        f"Subtotal ${_money(subtotal)}",
+        f"Tax ${_money(tax)}",
+        f"Tip: ${_money(tip)}",
+        f"Total ${_money(total)}",
+        f"{rng.choice(CARDS)} ************{rng.randint(1000, 9999)}",
+        "Input Type: EMV Chip Read",
+        f"Approval Code {rng.randint(100000, 999999)}",
+        "----------------",
+        "Thank you for dining with us!",
+        "Please visit again",
+    ]
+    return "\n".join(lines)
+
+
+def emailed_receipt(rng: random.Random) -> str:
+    items = _items(rng)
+    subtotal, tax, tip, total = _totals(rng, items)
+    lines = [
+        "Outlook",
+        "From: receipts <no-reply@toasttab.com>",
+        "To: you@example.com",
+        f"Subject: Receipt from {rng.choice(NAMES)}",
+        rng.choice(NAMES),
+        rng.choice(STREETS),
+        rng.choice(CITIES),
+        f"Ordered: {_date(rng)} {_time(rng)}",
+        f"Check #{rng.randint(10, 999)}",
+        rng.choice(CUSTOMERS),
+        f"Served by {rng.choice(SERVERS)}",
+        "———",
+    ]
+    for name, price in items:
+        lines += [name, f"${_money(price)}"]
+    lines += [
+        "———",
+        "Subtotal",
+        f"${_money(subtotal)}",
+        "Tax",
+        f"${_money(tax)}",
+        "Gratuity",
+        f"${_money(tip)}",
+        "Total",
+        f"${_money(total)}",
+        f"{rng.choice(CARDS)} Credit Card",
+        "Trouble viewing this email?",
+        "Join our loyalty club",
+    ]
+    return "\n".join(lines)
+
+
+def table_receipt(rng: random.Random) -> str:
+    items = _items(rng)
+    subtotal, tax, tip, total = _totals(rng, items)
+    lines = [
+        rng.choice(NAMES),
+        f"{rng.choice(STREETS)}, {rng.choice(CITIES)}",
+        f"Date: {_date(rng)}  Time: {_time(rng)}",
+        "| Description | Qty | Price |",
+        "| --- | --- | --- |",
+    ]
+    lines += [f"| {name} | {rng.randint(1, 3)} | ${_money(price)} |" for name, price in items]
+    lines += [
+        f"| Subtotal | | ${_money(subtotal)} |",
+        f"| Tax | | ${_money(tax)} |",
+        f"| Tip | | ${_money(tip)} |",
+        f"| Total | | ${_money(total)} |",
+        f"Payment: {rng.choice(CARDS)}",
+        "Thank you!",
+    ]
+    return "\n".join(lines)
+
+
+def fragmented_receipt(rng: random.Random) -> str:
+    items = _items(rng)
+    _, _, _, total = _totals(rng, items)
+    dollars, cents = _money(total).split(".")
+    lines = [rng.choice(NAMES), rng.choice(CITIES), _date(rng), _time(rng)]
+    for name, price in items:
+        lines += [name.upper(), f"${int(price)}", f"{round(price % 1 * 100):02d}"]
+    lines += ["TOTAL", dollars.rjust(3, "8"), f".{cents}", "THANK YOU"]
+    return "\n".join(lines)
+
+
+def bank_statement(rng: random.Random) -> str:
+    lines = ["Account Statement", f"Account Number ****{rng.randint(1000, 9999)}", "Statement Period 09/01 - 09/30"]
+    lines.append("Date Description Amount Balance")
+    for _ in range(rng.randint(4, 12)):
+        merchant = rng.choice(("POS TAQUERIA EL SOL 4411", "DEBIT ISLAND GRILL", "ACH PAYROLL", "PUR SHELL OIL 5512"))
+        lines.append(f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d} {merchant} ${_money(rng.uniform(3, 250))}")
+    lines.append(f"Available Balance ${_money(rng.uniform(100, 5000))}")
+    return "\n".join(lines)
+
+
+LAYOUTS = (printed_receipt, printed_receipt, emailed_receipt, table_receipt, fragmented_receipt, bank_statement)
+
+
+def build_corpus(count: int, seed: int = 7) -> list[str]:
+    """Generate ``count`` receipt texts, deterministic for a given ``seed``."""
+    rng = random.Random(seed)
+    return [LAYOUTS[index % len(LAYOUTS)](rng) for index in range(count)]
+
+
+def parse_all(parser: ReceiptParser, corpus: list[str]) -> list[float]:
+    """Parse every receipt and return per-receipt latencies (ms)."""
+    samples = []
+    for text in corpus:
+        started = time.perf_counter()
+        parser.parse_receipt_data(text, ReceiptData())
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--receipts", type=int, default=500, help="receipts in the corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the corpus")
+    parser.add_argument("--seed", type=int, default=7, help="corpus seed")
+    args = parser.parse_args()
+    # Incomplete parses log a warning per receipt
+    logging.getLogger("app.services.receipt_parser").setLevel(logging.ERROR)
+
+    corpus = build_corpus(args.receipts, args.seed)
+    receipt_parser = ReceiptParser()
+    lines = sum(len(text.splitlines()) for text in corpus)
+    print(f"{len(corpus)} receipts, {lines / len(corpus):.1f} lines per receipt on average")
+
+    for run in range(1, args.repeat + 1):
+        samples = sorted(parse_all(receipt_parser, corpus))
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(
+            f"  pass {run}: median {statistics.median(samples):7.3f} ms   p95 {p95:7.3f} ms   "
+            f"max {samples[-1]:7.3f} ms   total {sum(samples):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
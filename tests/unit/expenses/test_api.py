@@ -176,6 +176,49 @@ class TestExpenseAPI:
         assert len(data) >= 1
         assert data[0]["notes"] == "Dinner at Test Restaurant"
 
+    def test_get_expenses_cursor_pagination(
+        self,
+        client: FlaskClient,
+        db: SQLAlchemy,
+        test_user: User,
+        test_restaurant: Restaurant,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test paging through expenses with the keyset cursor."""
+        for day in range(1, 6):
+            db.session.add(
+                Expense(
+                    amount=Decimal("10.00"),
+                    date=datetime(2025, 3, day, 12, 0, tzinfo=UTC),
+                    notes=f"Day {day}",
+                    restaurant_id=test_restaurant.id,
+                    user_id=test_user.id,
+                )
+            )
+        db.session.commit()
+
+        seen_notes: list[str] = []
+        cursor = None
+        for _ in range(3):
+            query = {"limit": "2"} if cursor is None else {"limit": "2", "cursor": cursor}
+            response = client.get("/api/v1/expenses", query_string=query, headers=auth_headers)
+            assert response.status_code == 200
+            payload = response.get_json()
+            seen_notes.extend(item["notes"] for item in payload["data"])
+            cursor = payload["meta"]["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen_notes == ["Day 5", "Day 4", "Day 3", "Day 2", "Day 1"]
+        assert payload["meta"]["has_more"] is False
+
+    def test_get_expenses_invalid_cursor(self, client: FlaskClient, auth_headers: dict[str, str]) -> None:
+        """Test a malformed cursor is rejected instead of restarting from the first page."""
+        response = client.get("/api/v1/expenses", query_string={"cursor": "not-a-cursor"}, headers=auth_headers)
+
+        assert response.status_code == 400
+        assert response.get_json()["message"] == "Invalid cursor"
+
     def test_get_expense(
         self,
         client: FlaskClient,
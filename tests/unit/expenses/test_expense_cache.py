@@ -0,0 +1,159 @@
+"""Tests for the per-user expense data caches."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from app.expenses import cache as expense_cache, services as expense_services
+from app.expenses.models import Expense
+from app.receipts.models import Receipt
+
+
+class TestExpenseFilterOptionsCache:
+    """Test cached filter options are reused until the user's data changes."""
+
+    def test_version_bumps_on_expense_and_category_writes(self, session, test_user, test_category) -> None:
+        """Test expense and category writes increment the user's version."""
+        version = expense_cache.get_expense_data_version(test_user.id)
+
+        expense = Expense(amount=Decimal("10.00"), date=datetime(2026, 3, 1, tzinfo=UTC), user_id=test_user.id)
+        session.add(expense)
+        session.commit()
+        assert expense_cache.get_expense_data_version(test_user.id) == version + 1
+
+        expense.notes = "No option changes"
+        session.commit()
+        assert expense_cache.get_expense_data_version(test_user.id) == version + 1
+
+        expense.meal_type = "lunch"
+        session.commit()
+        test_category.color = "#123456"
+        session.commit()
+        session.delete(expense)
+        session.commit()
+        assert expense_cache.get_expense_data_version(test_user.id) == version + 4
+
+    def test_options_are_cached_until_a_write(self, session, test_user, test_category) -> None:
+        """Test the option queries only rerun after the version changes."""
+        session.add(
+            Expense(
+                amount=Decimal("10.00"),
+                date=datetime(2026, 3, 1, tzinfo=UTC),
+                meal_type="lunch",
+                user_id=test_user.id,
+                category_id=test_category.id,
+            )
+        )
+        session.commit()
+
+        with patch.object(
+            expense_services, "get_filter_options", wraps=expense_services.get_filter_options
+        ) as mock_options:
+            first = expense_cache.get_cached_filter_options(test_user.id)
+            first["years"].append(1999)
+            second = expense_cache.get_cached_filter_options(test_user.id)
+            assert mock_options.call_count == 1
+            assert second["years"] == [2026]
+            assert second["meal_types"] == ["lunch"]
+            assert second["categories"] == [test_category.name]
+
+            session.add(Expense(amount=Decimal("5.00"), date=datetime(2025, 7, 1, tzinfo=UTC), user_id=test_user.id))
+            session.commit()
+            third = expense_cache.get_cached_filter_options(test_user.id)
+            assert mock_options.call_count == 2
+            assert third["years"] == [2025, 2026]
+
+    def test_timezone_change_invalidates_options(self, session, test_user) -> None:
+        """Test a timezone change re-buckets the cached year options."""
+        session.add(Expense(amount=Decimal("8.00"), date=datetime(2026, 1, 1, 3, tzinfo=UTC), user_id=test_user.id))
+        session.commit()
+        assert expense_cache.get_cached_filter_options(test_user.id)["years"] == [2026]
+
+        test_user.timezone = "America/Chicago"
+        session.commit()
+        assert expense_cache.get_cached_filter_options(test_user.id)["years"] == [2025]
+
+    def test_main_option_errors_fall_back_uncached(self, session, test_user) -> None:
+        """Test a failing main option query still serves the base options and is retried."""
+        with patch.object(expense_services, "get_main_filter_options", side_effect=RuntimeError("boom")) as mock_main:
+            options = expense_cache.get_cached_filter_options(test_user.id)
+            expense_cache.get_cached_filter_options(test_user.id)
+
+        assert "categories" in options
+        assert "meal_types" not in options
+        assert mock_main.call_count == 2
+
+
+class TestReceiptReconciliationCache:
+    """Test the receipts tab is loaded lazily behind a cached summary."""
+
+    def test_receipt_version_bumps_on_receipt_writes(self, session, test_user, test_expense) -> None:
+        """Test receipt rows and expense receipt links increment the receipt version."""
+        version = expense_cache.get_receipt_data_version(test_user.id)
+
+        test_expense.notes = "Not a receipt change"
+        session.commit()
+        assert expense_cache.get_receipt_data_version(test_user.id) == version
+
+        test_expense.receipt_image = "receipt.png"
+        session.commit()
+        receipt = Receipt(user_id=test_user.id, expense_id=test_expense.id, file_uri="receipt.png")
+        session.add(receipt)
+        session.commit()
+        session.delete(receipt)
+        session.commit()
+        assert expense_cache.get_receipt_data_version(test_user.id) == version + 3
+
+    def test_reconciliation_endpoint_caches_summary(self, app, client, auth, session, test_user, test_expense) -> None:
+        """Test the list page skips reconciliation and the endpoint caches its summary."""
+        test_expense.receipt_image = "missing-row.png"
+        session.commit()
+        auth.login("testuser_1", "testpass")
+
+        with patch.object(
+            expense_services, "get_receipt_reconciliation", wraps=expense_services.get_receipt_reconciliation
+        ) as mock_reconciliation:
+            response = client.get("/expenses/")
+            assert response.status_code == 200
+            assert mock_reconciliation.call_count == 0
+
+            response = client.get("/expenses/receipts/reconciliation")
+            assert response.status_code == 200
+            assert b"missing-row.png" in response.data
+            assert mock_reconciliation.call_count == 1
+
+        with app.app_context():
+            summary = expense_cache.get_cached_receipt_reconciliation_summary(test_user.id)
+            assert summary is not None and summary["missing_receipt_row"] == 1
+
+            expense = session.get(Expense, test_expense.id)
+            expense.receipt_image = None
+            session.commit()
+            assert expense_cache.get_cached_receipt_reconciliation_summary(test_user.id) is None
+
+    def test_reconciliation_rows_are_cached_until_a_receipt_write(
+        self, client, auth, session, test_user, test_expense
+    ) -> None:
+        """Test the endpoint reuses the cached rows until a shown receipt or expense detail changes."""
+        test_expense.receipt_image = "cached-row.png"
+        session.commit()
+        auth.login("testuser_1", "testpass")
+
+        with patch.object(
+            expense_services, "get_receipt_reconciliation", wraps=expense_services.get_receipt_reconciliation
+        ) as mock_reconciliation:
+            assert client.get("/expenses/receipts/reconciliation").status_code == 200
+            response = client.get("/expenses/receipts/reconciliation")
+            assert b"cached-row.png" in response.data
+            assert mock_reconciliation.call_count == 1
+
+            test_expense.notes = "Not shown in the reconciliation"
+            session.commit()
+            client.get("/expenses/receipts/reconciliation")
+            assert mock_reconciliation.call_count == 1
+
+            test_expense.amount = Decimal("77.70")
+            session.commit()
+            response = client.get("/expenses/receipts/reconciliation")
+            assert mock_reconciliation.call_count == 2
+            assert b"77.70" in response.data
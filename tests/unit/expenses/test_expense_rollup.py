@@ -0,0 +1,117 @@
+"""Tests for the daily expense rollups."""
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+from sqlalchemy import delete, select
+
+from app.expenses import rollup, services as expense_services
+from app.expenses.models import Expense, ExpenseDailyRollup
+
+
+def _rollups(session, user_id: int) -> list[tuple]:
+    rows = session.execute(
+        select(
+            ExpenseDailyRollup.day,
+            ExpenseDailyRollup.category_id,
+            ExpenseDailyRollup.restaurant_id,
+            ExpenseDailyRollup.meal_type,
+            ExpenseDailyRollup.expense_count,
+            ExpenseDailyRollup.total_amount,
+            ExpenseDailyRollup.party_size_total,
+        )
+        .where(ExpenseDailyRollup.user_id == user_id)
+        .order_by(ExpenseDailyRollup.day, ExpenseDailyRollup.meal_type)
+    ).all()
+    return [tuple(row) for row in rows]
+
+
+class TestExpenseDailyRollup:
+    """Test the rollups follow expense writes."""
+
+    def test_rollups_group_new_expenses(self, session, test_user, test_restaurant, test_category) -> None:
+        """Test expenses on the same day and dimensions share one rollup row."""
+        session.add_all(
+            [
+                Expense(
+                    amount=Decimal("10.00"),
+                    date=datetime(2026, 3, 1, 12, tzinfo=UTC),
+                    meal_type="lunch",
+                    party_size=2,
+                    user_id=test_user.id,
+                    restaurant_id=test_restaurant.id,
+                    category_id=test_category.id,
+                ),
+                Expense(
+                    amount=Decimal("5.50"),
+                    date=datetime(2026, 3, 1, 13, tzinfo=UTC),
+                    meal_type="lunch",
+                    user_id=test_user.id,
+                    restaurant_id=test_restaurant.id,
+                    category_id=test_category.id,
+                ),
+                Expense(
+                    amount=Decimal("20.00"),
+                    date=datetime(2026, 3, 2, 19, tzinfo=UTC),
+                    meal_type="dinner",
+                    party_size=3,
+                    user_id=test_user.id,
+                ),
+            ]
+        )
+        session.commit()
+
+        assert _rollups(session, test_user.id) == [
+            (date(2026, 3, 1), test_category.id, test_restaurant.id, "lunch", 2, Decimal("15.50"), 2),
+            (date(2026, 3, 2), None, None, "dinner", 1, Decimal("20.00"), 3),
+        ]
+
+    def test_rollups_follow_updates_and_deletes(self, session, test_user, test_category) -> None:
+        """Test moving an expense rebuilds its old and new day, and deleting removes it."""
+        expense = Expense(amount=Decimal("12.00"), date=datetime(2026, 3, 1, 12, tzinfo=UTC), user_id=test_user.id)
+        session.add(expense)
+        session.commit()
+
+        expense.date = datetime(2026, 3, 5, 12, tzinfo=UTC)
+        expense.category_id = test_category.id
+        expense.amount = Decimal("14.00")
+        session.commit()
+        assert _rollups(session, test_user.id) == [
+            (date(2026, 3, 5), test_category.id, None, None, 1, Decimal("14.00"), 0),
+        ]
+
+        session.delete(expense)
+        session.commit()
+        assert _rollups(session, test_user.id) == []
+
+    def test_moved_expense_reads_only_its_old_and_new_day(self) -> None:
+        """Test the rebuild ranges cover the touched days, not the span between them."""
+        assert rollup._day_runs({date(2026, 3, 1), date(2026, 3, 20)}) == [
+            (date(2026, 3, 1), date(2026, 3, 1)),
+            (date(2026, 3, 20), date(2026, 3, 20)),
+        ]
+        assert rollup._day_runs([date(2026, 3, 2), date(2026, 3, 1), date(2026, 3, 5)]) == [
+            (date(2026, 3, 1), date(2026, 3, 2)),
+            (date(2026, 3, 5), date(2026, 3, 5)),
+        ]
+
+    def test_rollup_days_use_the_user_timezone(self, session, test_user) -> None:
+        """Test days are local to the user's timezone and rebuilt when it changes."""
+        test_user.timezone = "America/Chicago"
+        session.add(Expense(amount=Decimal("8.00"), date=datetime(2026, 1, 2, 3, tzinfo=UTC), user_id=test_user.id))
+        session.commit()
+        assert [row[0] for row in _rollups(session, test_user.id)] == [date(2026, 1, 1)]
+
+        test_user.timezone = "UTC"
+        session.commit()
+        assert [row[0] for row in _rollups(session, test_user.id)] == [date(2026, 1, 2)]
+
+    def test_rebuild_expense_rollups(self, session, test_user) -> None:
+        """Test the repair path recreates rows removed outside the ORM."""
+        session.add(Expense(amount=Decimal("9.99"), date=datetime(2026, 2, 1, 12, tzinfo=UTC), user_id=test_user.id))
+        session.commit()
+        session.execute(delete(ExpenseDailyRollup))
+        session.commit()
+
+        assert expense_services.rebuild_expense_rollups(test_user.id) == 1
+        assert _rollups(session, test_user.id) == [(date(2026, 2, 1), None, None, None, 1, Decimal("9.99"), 0)]
@@ -4,6 +4,7 @@ import csv
 from datetime import UTC, datetime
 from decimal import Decimal
 import io
+import json
 
 from werkzeug.datastructures import FileStorage
 
@@ -46,6 +47,41 @@ class TestExpenseRoutesAdditional:
         assert response.status_code == 200
         assert b"Expenses" in response.data or response.headers.get("Content-Type") == "text/csv"
 
+    def test_export_expenses_streaming(self, client, auth, test_user, test_restaurant) -> None:
+        """Test streamed exports contain the same rows as the buffered export."""
+        for day in range(1, 4):
+            db.session.add(
+                Expense(
+                    amount=Decimal("10.00") + day,
+                    date=datetime(2026, 1, day, 12, tzinfo=UTC),
+                    user_id=test_user.id,
+                    restaurant_id=test_restaurant.id,
+                )
+            )
+        db.session.commit()
+        auth.login("testuser_1", "testpass")
+
+        buffered = client.get("/expenses/export", query_string={"format": "csv"}).get_data(as_text=True)
+        response = client.get("/expenses/export", query_string={"format": "csv", "stream": "true"})
+        assert response.is_streamed
+        assert response.headers["Content-Disposition"] == "attachment; filename=expenses.csv"
+        assert response.get_data(as_text=True) == buffered
+
+        response = client.get("/expenses/export", query_string={"format": "ndjson"})
+        assert response.is_streamed
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [row["date"] for row in rows] == ["2026-01-03", "2026-01-02", "2026-01-01"]
+
+        response = client.get("/expenses/export", query_string={"format": "json", "stream": "true"})
+        assert len(json.loads(response.get_data(as_text=True))) == 3
+
+    def test_export_expenses_streaming_without_expenses(self, client, auth, test_user) -> None:
+        """Test a streamed export with no rows redirects like the buffered one."""
+        auth.login("testuser_1", "testpass")
+        response = client.get("/expenses/export", query_string={"format": "ndjson"})
+        assert response.status_code == 302
+
     def test_import_expenses(self, client, auth, test_user) -> None:
         """Test importing expenses from CSV file."""
         auth.login("testuser_1", "testpass")
@@ -179,6 +215,58 @@ class TestExpenseRoutesAdditional:
             or len(response.data) < 500
         )
 
+    def test_expense_listing_infinite_scroll_uses_cursor(self, client, auth, app, test_user) -> None:
+        """Test the list sentinel carries a keyset cursor that loads the next chunk."""
+        auth.login("testuser_1", "testpass")
+        with app.app_context():
+            for day in range(1, 4):
+                db.session.add(
+                    Expense(
+                        amount=Decimal("12.00"),
+                        date=datetime(2025, 4, day, 12, 0, tzinfo=UTC),
+                        notes=f"Cursor expense {day}",
+                        user_id=test_user.id,
+                    )
+                )
+            db.session.commit()
+
+        response = client.get("/expenses/", query_string={"limit": "2"})
+        assert response.status_code == 200
+        assert b"cursor=" in response.data
+        assert b"offset=" not in response.data
+
+        html = response.data.decode()
+        cursor = html.split("cursor=", 1)[1].split("&", 1)[0].split('"', 1)[0]
+        chunk = client.get(
+            "/expenses/",
+            query_string={"cursor": cursor, "limit": "2"},
+            headers={"HX-Request": "true"},
+        )
+        assert chunk.status_code == 200
+        assert b"expense-chunk-buffer" in chunk.data
+        assert b"Cursor expense 1" in chunk.data
+        assert b"expense-load-more-sentinel" not in chunk.data
+
+    def test_expense_listing_invalid_cursor_ends_scroll(self, client, auth, app, test_user) -> None:
+        """Test a malformed cursor returns an empty chunk instead of repeating the first page."""
+        auth.login("testuser_1", "testpass")
+        with app.app_context():
+            db.session.add(
+                Expense(
+                    amount=Decimal("12.00"),
+                    date=datetime(2025, 4, 1, 12, 0, tzinfo=UTC),
+                    notes="First page expense",
+                    user_id=test_user.id,
+                )
+            )
+            db.session.commit()
+
+        chunk = client.get("/expenses/", query_string={"cursor": "not-a-cursor"}, headers={"HX-Request": "true"})
+
+        assert chunk.status_code == 200
+        assert b"First page expense" not in chunk.data
+        assert b"expense-load-more-sentinel" not in chunk.data
+
     def test_receipts_tab_renders_reconciliation_data(self, client, auth, app, test_user) -> None:
         """Test the receipts tab shows reconciliation content and linked records."""
         auth.login("testuser_1", "testpass")
@@ -223,6 +311,11 @@ class TestExpenseRoutesAdditional:
 
         response = client.get("/expenses", query_string={"view": "receipts"}, follow_redirects=True)
 
+        assert response.status_code == 200
+        # The tab content is loaded lazily from its own endpoint
+        assert b'hx-get="/expenses/receipts/reconciliation"' in response.data
+
+        response = client.get("/expenses/receipts/reconciliation")
         assert response.status_code == 200
         assert b"Receipt Reconciliation" in response.data
         assert b"receipts/receipt-route-test.png" in response.data
@@ -5,10 +5,12 @@ from decimal import Decimal
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
 from werkzeug.datastructures import MultiDict
 
 from app.expenses.models import Expense
 from app.expenses.services import (
+    InvalidCursorError,
     _combine_date_time_with_timezone,
     _parse_tags_json,
     _process_amount,
@@ -16,7 +18,13 @@ from app.expenses.services import (
     _sort_categories_by_default_order,
     _validate_tags_list,
     create_expense,
+    decode_expense_cursor,
+    encode_expense_cursor,
+    get_expense_filters,
     get_receipt_reconciliation,
+    get_user_expenses,
+    get_user_expenses_after_cursor,
+    get_user_expenses_paginated,
     prepare_expense_form,
     update_expense,
 )
@@ -546,6 +554,171 @@ class TestExpenseServicesAdditional:
             assert rows[0]["status"] == "missing_receipt_row"
             assert "Missing receipt DB row" in rows[0]["issues"]
 
+    def test_get_user_expenses_after_cursor_walks_all_pages(self, app, session, test_user, test_restaurant) -> None:
+        """Test keyset pagination returns every expense once, including same-date ties."""
+        with app.test_request_context("/expenses/"):
+            same_day = datetime(2025, 2, 1, 12, 0, tzinfo=UTC)
+            for index in range(7):
+                session.add(
+                    Expense(
+                        amount=Decimal("5.00"),
+                        date=same_day if index < 4 else datetime(2025, 1, index, 12, 0, tzinfo=UTC),
+                        user_id=test_user.id,
+                        restaurant_id=test_restaurant.id,
+                    )
+                )
+            session.commit()
+            filters = get_expense_filters(Mock(args=MultiDict()))
+
+            collected: list[int] = []
+            cursor = None
+            while True:
+                page, cursor = get_user_expenses_after_cursor(test_user.id, filters, cursor=cursor, limit=3)
+                collected.extend(expense.id for expense in page)
+                if cursor is None:
+                    break
+
+            all_ids = [expense.id for expense in get_user_expenses_after_cursor(test_user.id, filters, limit=50)[0]]
+            assert collected == all_ids
+            assert len(set(collected)) == 7
+
+    def test_get_user_expenses_after_cursor_survives_deleted_anchor(
+        self, app, session, test_user, test_restaurant
+    ) -> None:
+        """Test the cursor still seeks correctly after its anchor expense is deleted."""
+        with app.test_request_context("/expenses/"):
+            for day in range(1, 5):
+                session.add(
+                    Expense(
+                        amount=Decimal("5.00"),
+                        date=datetime(2025, 1, day, 12, 0, tzinfo=UTC),
+                        user_id=test_user.id,
+                        restaurant_id=test_restaurant.id,
+                    )
+                )
+            session.commit()
+            filters = get_expense_filters(Mock(args=MultiDict()))
+
+            first_page, cursor = get_user_expenses_after_cursor(test_user.id, filters, limit=2)
+            session.delete(first_page[-1])
+            session.commit()
+            second_page, next_cursor = get_user_expenses_after_cursor(test_user.id, filters, cursor=cursor, limit=2)
+
+            assert [expense.date.day for expense in second_page] == [2, 1]
+            assert next_cursor is None
+
+    def test_get_user_expenses_paginated_single_pass_aggregates(self, app, session, test_user, test_restaurant) -> None:
+        """Test the list header aggregates honour joined search filters and party sizes."""
+        with app.test_request_context("/expenses/"):
+            for amount, party_size in [("40.00", 4), ("30.00", 2), ("12.00", None), ("8.00", 0)]:
+                session.add(
+                    Expense(
+                        amount=Decimal(amount),
+                        party_size=party_size,
+                        date=datetime(2025, 1, 5, 12, 0, tzinfo=UTC),
+                        user_id=test_user.id,
+                        restaurant_id=test_restaurant.id,
+                    )
+                )
+            session.add(Expense(amount=Decimal("99.00"), date=datetime(2025, 1, 6, tzinfo=UTC), user_id=test_user.id))
+            session.commit()
+
+            filters = get_expense_filters(Mock(args=MultiDict({"q": test_restaurant.name})))
+            page, total_count, total_amount, avg_per_person = get_user_expenses_paginated(
+                test_user.id, filters, limit=2
+            )
+
+            assert len(page) == 2
+            assert total_count == 4
+            assert total_amount == 90.0
+            assert avg_per_person == 12.5
+
+            empty_page, count_past_end, _, _ = get_user_expenses_paginated(test_user.id, filters, offset=10)
+            assert empty_page == []
+            assert count_past_end == 4
+
+    def test_get_user_expenses_paginated_counts_flushed_expenses(self, app, session, test_user) -> None:
+        """Test the header aggregate runs on the request session and sees its uncommitted rows."""
+        with app.test_request_context("/expenses/"):
+            session.add(Expense(amount=Decimal("10.00"), date=datetime(2025, 1, 5, tzinfo=UTC), user_id=test_user.id))
+            session.flush()
+
+            filters = get_expense_filters(Mock(args=MultiDict()))
+            page, total_count, total_amount, _ = get_user_expenses_paginated(test_user.id, filters)
+
+            assert len(page) == 1
+            assert (total_count, total_amount) == (1, 10.0)
+
+    def test_search_matches_restaurant_notes_and_category(
+        self, app, session, test_user, test_restaurant, test_category
+    ) -> None:
+        """Test the indexed search matches every searchable field, including short terms."""
+        with app.test_request_context("/expenses/"):
+            session.add_all(
+                [
+                    Expense(
+                        amount=Decimal("10.00"),
+                        date=datetime(2025, 2, 1, tzinfo=UTC),
+                        notes="Birthday brunch",
+                        user_id=test_user.id,
+                        restaurant_id=test_restaurant.id,
+                    ),
+                    Expense(
+                        amount=Decimal("20.00"),
+                        date=datetime(2025, 2, 2, tzinfo=UTC),
+                        notes="Team lunch",
+                        user_id=test_user.id,
+                        category_id=test_category.id,
+                    ),
+                ]
+            )
+            session.commit()
+
+            def search(term: str) -> list[str | None]:
+                filters = get_expense_filters(Mock(args=MultiDict({"q": term})))
+                return [expense.notes for expense in get_user_expenses(test_user.id, filters)[0]]
+
+            assert search(test_restaurant.name.upper()) == ["Birthday brunch"]
+            assert search("brunch") == ["Birthday brunch"]
+            assert search(test_category.name) == ["Team lunch"]
+            assert sorted(search("un")) == ["Birthday brunch", "Team lunch"]
+            assert search("no such expense") == []
+
+    def test_search_document_follows_restaurant_rename(self, app, session, test_user, test_restaurant) -> None:
+        """Test renaming a restaurant refreshes its expenses' search documents without touching updated_at."""
+        with app.test_request_context("/expenses/"):
+            expense = Expense(
+                amount=Decimal("15.00"),
+                date=datetime(2025, 3, 1, tzinfo=UTC),
+                user_id=test_user.id,
+                restaurant_id=test_restaurant.id,
+            )
+            session.add(expense)
+            session.commit()
+            updated_at = expense.updated_at
+
+            test_restaurant.name = "Renamed Noodle House"
+            session.commit()
+
+            filters = get_expense_filters(Mock(args=MultiDict({"q": "noodle house"})))
+            assert [e.id for e in get_user_expenses(test_user.id, filters)[0]] == [expense.id]
+            session.refresh(expense)
+            assert expense.updated_at == updated_at
+
+    def test_decode_expense_cursor_round_trip_and_invalid(self, app, session, test_user, test_expense) -> None:
+        """Test cursor encoding round-trips and malformed cursors are rejected."""
+        position = decode_expense_cursor(encode_expense_cursor(test_expense))
+
+        assert position is not None
+        assert position[2] == test_expense.id
+        assert decode_expense_cursor("not-a-cursor") is None
+        assert decode_expense_cursor(None) is None
+
+        with app.test_request_context("/expenses/"):
+            filters = get_expense_filters(Mock(args=MultiDict()))
+            with pytest.raises(InvalidCursorError):
+                get_user_expenses_after_cursor(test_user.id, filters, cursor="not-a-cursor")
+
     def test_create_expense_creates_structured_receipt_row(
         self, app, session, test_user, test_restaurant, test_category
     ) -> None:
@@ -15,6 +15,7 @@ from app.expenses.cli import (
     backfill_receipts,
     category_cli,
     list_categories,
+    rebuild_rollups,
     receipt_cli,
     register_commands,
     reinit_categories,
@@ -82,6 +83,7 @@ class TestExpensesCLI:
         register_commands(app)
         assert "category" in [cmd.name for cmd in app.cli.commands.values()]
         assert "receipt" in [cmd.name for cmd in app.cli.commands.values()]
+        assert "expense" in [cmd.name for cmd in app.cli.commands.values()]
 
     def test_backfill_receipts_dry_run(self, app) -> None:
         """Test receipt backfill dry-run output."""
@@ -563,3 +565,23 @@ class TestExpensesCLI:
                         result = runner.invoke(list_categories, ["--username", "testuser"])
                         assert result.exit_code == 0
                         mock_get_users.assert_called_once_with(None, "testuser", False)
+
+    def test_rebuild_rollups_no_options(self, runner, app) -> None:
+        """Test rebuild-rollups requires a user selection."""
+        with app.app_context():
+            result = runner.invoke(rebuild_rollups, [])
+            assert result.exit_code == 0
+            assert "❌ Error: Must specify --user-id, --username, or --all-users" in result.output
+
+    def test_rebuild_rollups_success(self, runner, app, mock_user) -> None:
+        """Test rebuild-rollups rebuilds the rollups of each target user."""
+        with app.app_context():
+            with patch("app.expenses.cli._get_target_users") as mock_get_users:
+                with patch("app.expenses.services.rebuild_expense_rollups") as mock_rebuild:
+                    mock_get_users.return_value = [mock_user]
+                    mock_rebuild.return_value = 12
+
+                    result = runner.invoke(rebuild_rollups, ["--all-users"])
+                    assert result.exit_code == 0
+                    mock_rebuild.assert_called_once_with(1)
+                    assert "✅ Rebuilt 12 daily rollup rows for testuser" in result.output
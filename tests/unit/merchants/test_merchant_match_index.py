@@ -0,0 +1,156 @@
+"""Tests for the in-memory merchant match index and the persisted website host."""
+
+from unittest.mock import patch
+
+from app.extensions import db
+from app.merchants import match_index
+from app.merchants.match_index import MerchantMatchIndex, get_merchant_match_index
+from app.merchants.models import Merchant
+from app.merchants.services import (
+    find_merchant_for_restaurant_name,
+    find_merchant_for_website,
+    get_or_create_merchant_for_import_restaurant_name,
+)
+
+
+def _add_merchants(session, *merchants: Merchant) -> None:
+    session.add_all(merchants)
+    session.commit()
+
+
+class TestMerchantMatchIndex:
+    """Test the matching rules of the index itself."""
+
+    def test_match_name_ranks_matches(self) -> None:
+        index = MerchantMatchIndex()
+        index.add(1, "Joe's Pizza Company", "Joe's Pizza")
+        index.add(2, "Joe's", None)
+        index.add(3, "Joe's Pizza Downtown", None)
+
+        # Short name prefix beats the longer name exact match
+        assert index.match_name("Joe's Pizza - Downtown") == 1
+        assert index.match_name("JOE'S  pizza") == 1
+        assert index.match_name("Joe's Diner") == 2
+        # Only whole words match
+        assert index.match_name("Joes Pizza") is None
+        assert index.match_name("   ") is None
+
+    def test_ties_between_merchants_are_ambiguous(self) -> None:
+        index = MerchantMatchIndex()
+        index.add(1, "Taco Town", None)
+        index.add(2, "Taco Town", None)
+        index.add(3, "Burger Barn", None)
+
+        assert index.match_name("Taco Town Austin") is None
+        assert index.match_name("Burger Barn") == 3
+
+    def test_copy_is_independent(self) -> None:
+        index = MerchantMatchIndex()
+        index.add(1, "Taco Town", None)
+
+        extended = index.copy()
+        extended.add(2, "Taco Town", None)
+
+        assert index.match_name("Taco Town") == 1
+        assert extended.match_name("Taco Town") is None
+
+
+class TestWebsiteHost:
+    """Test matching by the persisted website host."""
+
+    def test_host_follows_website_writes(self, session) -> None:
+        merchant = Merchant(name="Taco Town", website="HTTPS://www.TacoTown.com/menu")
+        _add_merchants(session, merchant)
+        assert merchant.website_host == "tacotown.com"
+
+        merchant.website = "https://tacotown.co"
+        session.commit()
+        assert merchant.website_host == "tacotown.co"
+
+        merchant.website = None
+        session.commit()
+        assert merchant.website_host is None
+
+    def test_shared_host_is_ambiguous(self, session) -> None:
+        _add_merchants(
+            session,
+            Merchant(name="Taco Town", website="https://tacotown.com"),
+            Merchant(name="Taco Town Express", website="https://www.tacotown.com/express"),
+            burger_barn := Merchant(name="Burger Barn", website="https://burgerbarn.com"),
+        )
+
+        assert find_merchant_for_website("https://tacotown.com") is None
+        assert find_merchant_for_website("http://burgerbarn.com/locations") is burger_barn
+        assert find_merchant_for_website("not a url") is None
+
+
+class TestIndexFreshness:
+    """Test the shared index follows merchant writes."""
+
+    def test_services_match_through_index(self, session) -> None:
+        merchant = Merchant(name="Starbucks Coffee", short_name="Starbucks", website="https://www.starbucks.com/")
+        _add_merchants(session, merchant)
+
+        assert find_merchant_for_restaurant_name("Starbucks Reserve") is merchant
+        assert find_merchant_for_website("https://starbucks.com/store-locator") is merchant
+        assert find_merchant_for_restaurant_name("Dunkin") is None
+        assert find_merchant_for_website(None) is None
+
+    def test_lookups_skip_the_table_check_until_the_recheck_interval(self, session, monkeypatch) -> None:
+        _add_merchants(session, Merchant(name="Taco Town"))
+        get_merchant_match_index()
+
+        with patch.object(match_index, "_read_fingerprint", wraps=match_index._read_fingerprint) as read:
+            for _ in range(3):
+                assert find_merchant_for_restaurant_name("Taco Town").name == "Taco Town"
+            read.assert_not_called()
+
+            monkeypatch.setattr(match_index, "INDEX_RECHECK_SECONDS", 0.0)
+            match_index._expire_merchant_match_index()
+            find_merchant_for_restaurant_name("Taco Town")
+            read.assert_called_once()
+
+    def test_new_merchants_extend_the_index(self, session) -> None:
+        _add_merchants(session, Merchant(name="Taco Town"))
+        get_merchant_match_index()
+
+        with patch.object(match_index, "_select_rows", wraps=match_index._select_rows) as select_rows:
+            _add_merchants(session, Merchant(name="Burger Barn"))
+            assert find_merchant_for_restaurant_name("Burger Barn Downtown").name == "Burger Barn"
+
+        select_rows.assert_called_once()
+        assert select_rows.call_args.kwargs["min_id"] is not None
+
+    def test_renames_and_deletes_rebuild_the_index(self, session) -> None:
+        merchant = Merchant(name="Taco Town")
+        other = Merchant(name="Burger Barn")
+        _add_merchants(session, merchant, other)
+        assert find_merchant_for_restaurant_name("Taco Town") is merchant
+
+        merchant.name = "Taco City"
+        session.commit()
+        assert find_merchant_for_restaurant_name("Taco Town") is None
+        assert find_merchant_for_restaurant_name("Taco City") is merchant
+
+        session.delete(other)
+        session.commit()
+        assert find_merchant_for_restaurant_name("Burger Barn") is None
+
+    def test_rolled_back_rename_is_forgotten(self, session) -> None:
+        merchant = Merchant(name="Taco Town")
+        _add_merchants(session, merchant)
+
+        merchant.name = "Taco City"
+        session.flush()
+        assert find_merchant_for_restaurant_name("Taco City") is merchant
+        session.rollback()
+
+        assert find_merchant_for_restaurant_name("Taco Town") is merchant
+        assert find_merchant_for_restaurant_name("Taco City") is None
+
+    def test_import_finds_merchants_it_created(self, session) -> None:
+        created = get_or_create_merchant_for_import_restaurant_name("Pasta House - Main St")
+
+        assert get_or_create_merchant_for_import_restaurant_name("Pasta House Airport") is created
+        db.session.rollback()
+        assert find_merchant_for_restaurant_name("Pasta House") is None
@@ -2,6 +2,7 @@
 
 from datetime import date
 from decimal import Decimal
+import json
 
 from flask import url_for
 
@@ -73,6 +74,25 @@ def test_export_merchants_selected_ids(client, auth, test_user) -> None:
     assert payload[0].get("name") == "First Merchant"
 
 
+def test_export_merchants_streaming(client, auth, test_user) -> None:
+    """Streamed merchant exports keep the fixed CSV columns and support NDJSON."""
+    _enable_advanced_features(test_user)
+    _create_merchant("First Merchant")
+    _create_merchant("Second Merchant")
+    auth.login("testuser_1", "testpass")
+
+    response = client.get(url_for("merchants.export_merchants"), query_string={"stream": "true"})
+    assert response.is_streamed
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0].startswith('"name","short_name","website"')
+    assert "favicon_url" not in lines[0]
+    assert len(lines) == 3
+
+    response = client.get(url_for("merchants.export_merchants"), query_string={"format": "ndjson"})
+    names = [json.loads(line)["name"] for line in response.get_data(as_text=True).splitlines()]
+    assert names == ["First Merchant", "Second Merchant"]
+
+
 def test_import_merchants_page_loads(client, auth, test_user) -> None:
     """Merchant import page should render for advanced users."""
     _enable_advanced_features(test_user)
@@ -0,0 +1,125 @@
+"""Tests for the report aggregation services."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from flask import template_rendered
+
+from app.expenses.models import Expense
+from app.reports import services as report_services
+from app.restaurants.models import Restaurant
+
+
+class TestReportServices:
+    """Test the GROUP BY report helpers against a real database."""
+
+    def _add_expenses(self, session, test_user, test_restaurant, test_category) -> None:
+        now = datetime.now(UTC)
+        session.add_all(
+            [
+                Expense(
+                    amount=Decimal("40.00"),
+                    date=now - timedelta(days=1),
+                    meal_type="dinner",
+                    user_id=test_user.id,
+                    restaurant_id=test_restaurant.id,
+                    category_id=test_category.id,
+                ),
+                Expense(
+                    amount=Decimal("15.50"),
+                    date=now - timedelta(days=2),
+                    meal_type="lunch",
+                    user_id=test_user.id,
+                    restaurant_id=test_restaurant.id,
+                ),
+                Expense(amount=Decimal("4.50"), date=now - timedelta(days=3), user_id=test_user.id),
+                # Outside a 30-day window
+                Expense(amount=Decimal("99.00"), date=now - timedelta(days=90), user_id=test_user.id),
+            ]
+        )
+        session.commit()
+
+    def test_group_totals(self, app, session, test_user, test_restaurant, test_category) -> None:
+        """Test category, restaurant and meal type totals are grouped and ordered in SQL."""
+        self._add_expenses(session, test_user, test_restaurant, test_category)
+        start_date = datetime.now() - timedelta(days=30)
+
+        assert report_services.get_expense_summary(test_user.id, start_date) == (3, Decimal("60.00"))
+        assert report_services.get_category_totals(test_user.id, start_date) == [
+            report_services.GroupTotal(test_category.name, 1, Decimal("40.00")),
+            report_services.GroupTotal("Uncategorized", 2, Decimal("20.00")),
+        ]
+        assert report_services.get_restaurant_totals(test_user.id, start_date, order_by="count") == [
+            report_services.GroupTotal(test_restaurant.name, 2, Decimal("55.50")),
+        ]
+        assert [group.name for group in report_services.get_meal_type_totals(test_user.id, start_date)] == [
+            "dinner",
+            "lunch",
+            "Unknown",
+        ]
+        assert report_services.get_expense_summary(test_user.id)[0] == 4
+        assert report_services.count_restaurants(test_user.id) == 1
+
+    def test_monthly_totals_and_top_expenses(self, app, session, test_user, test_restaurant, test_category) -> None:
+        """Test monthly totals add up and top expenses come back largest first."""
+        self._add_expenses(session, test_user, test_restaurant, test_category)
+
+        monthly = report_services.get_monthly_totals(test_user.id)
+        assert list(monthly) == sorted(monthly)
+        assert sum(monthly.values()) == Decimal("159.00")
+
+        top = report_services.get_top_expenses(test_user.id, limit=2)
+        assert [expense.amount for expense in top] == [Decimal("99.00"), Decimal("40.00")]
+
+        rolling = report_services.get_rolling_month_totals(test_user.id, months=3)
+        assert len(rolling) == 3
+
+    def test_reports_pages_render(self, client, auth, session, test_user, test_restaurant, test_category) -> None:
+        """Test the report pages render from the aggregated data."""
+        self._add_expenses(session, test_user, test_restaurant, test_category)
+        auth.login("testuser_1", "testpass")
+
+        for url in ("/reports/", "/reports/expenses", "/reports/analytics", "/reports/expense-statistics"):
+            response = client.get(url, query_string={"days": "365"})
+            assert response.status_code == 200, url
+
+    def test_restaurant_report_is_paginated(self, app, client, auth, session, test_user) -> None:
+        """Test the restaurant report pages through restaurants sorted by total spent."""
+        restaurants = [Restaurant(name=f"Report Place {i}", city="Austin", user_id=test_user.id) for i in range(3)]
+        session.add_all(restaurants)
+        session.flush()
+        session.add_all(
+            Expense(amount=Decimal(10 * (i + 1)), date=datetime.now(UTC), user_id=test_user.id, restaurant_id=r.id)
+            for i, r in enumerate(restaurants)
+        )
+        session.commit()
+        auth.login("testuser_1", "testpass")
+
+        captured = []
+        with template_rendered.connected_to(lambda sender, template, context, **extra: captured.append(context)):
+            response = client.get("/reports/restaurants", query_string={"limit": "2"})
+            assert response.status_code == 200
+            response = client.get("/reports/restaurants", query_string={"limit": "2", "offset": "2"})
+            assert response.status_code == 200
+
+        first, second = captured
+        assert [r["name"] for r in first["restaurants"]] == ["Report Place 2", "Report Place 1"]
+        assert (first["total_restaurants"], first["prev_offset"], first["next_offset"]) == (3, None, 2)
+        assert first["restaurants"][0]["total_spent"] == 30.0
+        assert [r["name"] for r in second["restaurants"]] == ["Report Place 0"]
+        assert (second["prev_offset"], second["next_offset"]) == (0, None)
+
+    def test_restaurant_report_renders_sorted_pages(self, client, auth, session, test_user) -> None:
+        """Test the report table renders its rows, sort links and page links."""
+        session.add_all(Restaurant(name=f"Sorted Place {i}", city="Austin", user_id=test_user.id) for i in range(3))
+        session.commit()
+        auth.login("testuser_1", "testpass")
+
+        response = client.get("/reports/restaurants", query_string={"sort": "name", "order": "asc", "limit": "2"})
+
+        html = response.get_data(as_text=True)
+        assert response.status_code == 200
+        assert html.index("Sorted Place 0") < html.index("Sorted Place 1")
+        assert "Sorted Place 2" not in html
+        assert "sort=name&amp;order=desc" in html
+        assert "offset=2" in html
@@ -2,6 +2,7 @@
 
 import csv
 import io
+import json
 
 from flask import url_for
 from werkzeug.datastructures import FileStorage
@@ -424,6 +425,19 @@ def test_export_restaurants(client, test_restaurant, test_user) -> None:
         assert test_restaurant.city in response_text
 
 
+def test_export_restaurants_streaming(client, auth, test_restaurant, test_user) -> None:
+    """Test streaming restaurants as NDJSON."""
+    auth.login("testuser_1", "testpass")
+
+    response = client.get(url_for("restaurants.export_restaurants"), query_string={"format": "ndjson"})
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert "restaurants.ndjson" in response.headers["Content-Disposition"]
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row["name"] for row in rows] == [test_restaurant.name]
+
+
 # Test error cases
 def test_view_nonexistent_restaurant(client, auth, test_user) -> None:
     """Test viewing a restaurant that doesn't exist."""
@@ -1,5 +1,8 @@
 """Tests for restaurant CLI commands."""
 
+from datetime import UTC, datetime, timedelta
+import threading
+import time
 from unittest.mock import Mock, patch
 
 from click.testing import CliRunner
@@ -15,6 +18,8 @@ from app.restaurants.cli import (
     _display_summary,
     _display_user_restaurants,
     _display_validation_summary,
+    _filter_restaurants_to_resume,
+    _find_closest_match,
     _format_restaurant_detailed,
     _format_restaurant_simple,
     _get_restaurants_to_validate,
@@ -22,16 +27,21 @@ from app.restaurants.cli import (
     _get_target_users,
     _get_user_restaurants,
     _handle_service_level_updates,
+    _iter_with_prefetched_place_details,
     _process_restaurant_validation,
+    _record_validation_checkpoint,
+    _run_validation_loop,
     _suggest_service_level_from_restaurant_data,
+    _TokenBucket,
     _update_service_levels_for_restaurants,
     _validate_restaurant_with_google,
     list_restaurants,
+    recalculate_stats,
     register_commands,
     restaurant_cli,
     validate_restaurants,
 )
-from app.restaurants.models import Restaurant
+from app.restaurants.models import Restaurant, RestaurantValidationCheckpoint
 
 
 class TestRestaurantCLI:
@@ -493,6 +503,25 @@ class TestRestaurantCLI:
                         assert result.exit_code == 0
                         assert "🍽️  Restaurants for 1 user(s):" in result.output
 
+    def test_recalculate_stats_no_options(self, runner, app) -> None:
+        """Test recalculate-stats requires a user selection."""
+        with app.app_context():
+            result = runner.invoke(recalculate_stats, [])
+            assert result.exit_code == 0
+            assert "❌ Error: Must specify --user-id, --username, or --all-users" in result.output
+
+    def test_recalculate_stats_success(self, runner, app, mock_user) -> None:
+        """Test recalculate-stats runs the full recompute for each target user."""
+        with app.app_context():
+            with patch("app.restaurants.cli._get_target_users") as mock_get_users:
+                with patch("app.restaurants.services.recalculate_restaurant_statistics") as mock_recalculate:
+                    mock_get_users.return_value = [mock_user]
+
+                    result = runner.invoke(recalculate_stats, ["--all-users"])
+                    assert result.exit_code == 0
+                    mock_recalculate.assert_called_once_with(1)
+                    assert "✅ Recalculated restaurant statistics for testuser" in result.output
+
     def test_get_restaurants_to_validate_by_restaurant_id(self, app, mock_restaurant) -> None:
         """Test getting restaurants to validate by restaurant ID."""
         with app.app_context():
@@ -1288,3 +1317,217 @@ class TestRestaurantCLI:
                         result = runner.invoke(validate_restaurants, ["--user-id", "1"])
                         assert result.exit_code == 0
                         mock_validation.assert_called_once()
+
+
+class TestConcurrentValidation:
+    """Test prefetching place details for `flask restaurant validate --concurrency`."""
+
+    @staticmethod
+    def _restaurants(count: int) -> list[Mock]:
+        # The second restaurant has no Google Place ID to prefetch
+        return [Mock(id=index, google_place_id=None if index == 1 else f"place-{index}") for index in range(count)]
+
+    def test_prefetch_yields_in_order_from_worker_threads(self, app) -> None:
+        restaurants = self._restaurants(6)
+        fetch_threads = set()
+
+        def get_place_details(place_id, field_mask=None):
+            fetch_threads.add(threading.current_thread().name)
+            # Finish out of order
+            time.sleep(0.01 * (6 - int(place_id.split("-")[1])))
+            return {"id": place_id}
+
+        service = Mock()
+        service.get_place_details.side_effect = get_place_details
+        with (
+            app.app_context(),
+            patch("app.services.google_places_service.get_google_places_service", return_value=service),
+        ):
+            results = [
+                (restaurant.id, loader() if loader else None)
+                for restaurant, loader in _iter_with_prefetched_place_details(restaurants, None, 3, 1000)
+            ]
+
+        assert results == [
+            (0, {"id": "place-0"}),
+            (1, None),
+            (2, {"id": "place-2"}),
+            (3, {"id": "place-3"}),
+            (4, {"id": "place-4"}),
+            (5, {"id": "place-5"}),
+        ]
+        assert service.get_place_details.call_count == 5
+        assert threading.current_thread().name not in fetch_threads
+
+    def test_loop_processes_on_main_thread_with_prefetched_data(self, app) -> None:
+        restaurants = self._restaurants(4)
+        processed = []
+
+        def process(restaurant, *args, place_data_loader=None, **kwargs):
+            processed.append((restaurant.id, threading.current_thread().name, place_data_loader))
+            return "valid", False, False
+
+        service = Mock()
+        service.get_place_details.side_effect = lambda place_id, field_mask=None: {"id": place_id}
+        with (
+            app.app_context(),
+            patch("app.services.google_places_service.get_google_places_service", return_value=service),
+            patch("app.restaurants.cli._process_restaurant_validation_with_meta", side_effect=process),
+        ):
+            counts = _run_validation_loop(restaurants, False, False, None, True, False, False, concurrency=2)
+
+        assert counts == (4, 0, 0, 0, 0)
+        assert [restaurant_id for restaurant_id, _, _ in processed] == [0, 1, 2, 3]
+        assert {thread_name for _, thread_name, _ in processed} == {threading.current_thread().name}
+        assert processed[1][2] is None
+        assert processed[2][2]() == {"id": "place-2"}
+
+    def test_validate_uses_prefetched_place_data(self, app) -> None:
+        service = Mock()
+        service.extract_restaurant_data.return_value = {"name": "Test Restaurant"}
+        service.detect_service_level_from_data.return_value = ("casual_dining", 0.8)
+        loader = Mock(return_value={"displayName": {"text": "Test Restaurant"}})
+        with (
+            app.app_context(),
+            patch("app.services.google_places_service.get_google_places_service", return_value=service),
+        ):
+            result = _validate_restaurant_with_google(self._restaurants(1)[0], place_data_loader=loader)
+
+        loader.assert_called_once()
+        service.get_place_details.assert_not_called()
+        assert result["google_name"] == "Test Restaurant"
+
+    def test_token_bucket_limits_rate(self) -> None:
+        bucket = _TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+
+        # The first token is available immediately, the other five take 1/50 s each
+        assert time.monotonic() - start >= 0.09
+
+    def test_validate_command_passes_concurrency_options(self, app) -> None:
+        with (
+            app.app_context(),
+            patch(
+                "app.restaurants.cli._get_restaurants_to_validate",
+                return_value=(
+                    self._restaurants(1),
+                    {"total_restaurants": 1, "with_google_id": 1, "missing_google_id": 0},
+                ),
+            ),
+            patch("app.restaurants.cli._handle_service_level_updates", return_value=(0, 0)),
+            patch("app.restaurants.cli._handle_restaurant_validation") as mock_validation,
+        ):
+            result = CliRunner().invoke(
+                validate_restaurants, ["--user-id", "1", "--concurrency", "4", "--rate-limit", "2.5"]
+            )
+
+        assert result.exit_code == 0
+        assert mock_validation.call_args.kwargs["concurrency"] == 4
+        assert mock_validation.call_args.kwargs["rate_limit"] == 2.5
+
+    def test_validate_command_rejects_zero_rate_limit(self, app) -> None:
+        with app.app_context(), patch("app.restaurants.cli._get_restaurants_to_validate") as mock_restaurants:
+            result = CliRunner().invoke(validate_restaurants, ["--user-id", "1", "--rate-limit", "0"])
+
+        assert result.exit_code == 2
+        assert "--rate-limit" in result.output
+        mock_restaurants.assert_not_called()
+
+
+class TestResumableValidation:
+    """Test validation checkpoints and `flask restaurant validate --resume`."""
+
+    @pytest.fixture
+    def validated_restaurant(self, session, test_restaurant):
+        test_restaurant.google_place_id = "place-1"
+        session.commit()
+        _record_validation_checkpoint(
+            test_restaurant, {"valid": True, "google_name": "Google Name"}, "valid", False, None
+        )
+        return test_restaurant
+
+    def test_checkpoint_records_outcome(self, session, validated_restaurant) -> None:
+        checkpoint = validated_restaurant.validation_checkpoint
+
+        assert checkpoint.status == "valid"
+        assert checkpoint.sections == ""
+        assert checkpoint.google_fingerprint is not None
+        assert checkpoint.restaurant_fingerprint == RestaurantValidationCheckpoint.fingerprint_restaurant(
+            validated_restaurant
+        )
+
+    def test_resume_skips_only_current_checkpoints(self, session, validated_restaurant) -> None:
+        assert _filter_restaurants_to_resume([validated_restaurant], None, 30, False) == ([], 1)
+        # Other sections, stale checkpoints and unfixed mismatches when fixing are validated again
+        assert _filter_restaurants_to_resume([validated_restaurant], frozenset({"address"}), 30, False)[1] == 0
+
+        validated_restaurant.validation_checkpoint.validated_at = datetime.now(UTC) - timedelta(days=31)
+        session.commit()
+        assert _filter_restaurants_to_resume([validated_restaurant], None, 30, False)[1] == 0
+        assert _filter_restaurants_to_resume([validated_restaurant], None, 60, False)[1] == 1
+
+        validated_restaurant.validation_checkpoint.has_mismatches = True
+        session.commit()
+        assert _filter_restaurants_to_resume([validated_restaurant], None, 60, False)[1] == 1
+        assert _filter_restaurants_to_resume([validated_restaurant], None, 60, True)[1] == 0
+
+    def test_resume_validates_changed_restaurants(self, session, validated_restaurant) -> None:
+        validated_restaurant.website = "https://example.org"
+        session.commit()
+
+        assert _filter_restaurants_to_resume([validated_restaurant], None, 30, False) == ([validated_restaurant], 0)
+
+    def test_rerun_with_resume_skips_validated_restaurants(self, app, session, test_restaurant) -> None:
+        test_restaurant.google_place_id = "place-1"
+        session.commit()
+        runner = app.test_cli_runner()
+        args = ["--restaurant-id", str(test_restaurant.id), "--resume"]
+
+        with patch(
+            "app.restaurants.cli._validate_restaurant_with_google",
+            return_value={"valid": None, "errors": ["Timed out"]},
+        ) as mock_validate:
+            runner.invoke(validate_restaurants, args)
+            # Failed validations are retried
+            runner.invoke(validate_restaurants, args)
+        assert mock_validate.call_count == 2
+
+        with (
+            patch("app.restaurants.cli._process_validation_result", return_value=("valid", False, False)),
+            patch(
+                "app.restaurants.cli._validate_restaurant_with_google", return_value={"valid": True}
+            ) as mock_validate,
+        ):
+            runner.invoke(validate_restaurants, args)
+            result = runner.invoke(validate_restaurants, args)
+
+        mock_validate.assert_called_once()
+        assert "skipped 1 restaurants" in result.output
+
+
+def test_find_closest_match_breaks_address_ties_by_distance() -> None:
+    """Test equally scored matches are decided by distance to the restaurant."""
+    restaurant = Mock(city="Springfield", state="IL", latitude=39.80, longitude=-89.65)
+    other_state = {"id": "far", "formattedAddress": "1 Main St, Springfield, MO", "location": {}}
+    matches = [
+        {
+            "id": "north",
+            "formattedAddress": "9 Oak St, Springfield, IL",
+            "location": {"latitude": 39.90, "longitude": -89.65},
+        },
+        {"id": "no-location", "formattedAddress": "5 Elm St, Springfield, IL"},
+        {
+            "id": "near",
+            "formattedAddress": "2 Elm St, Springfield, IL",
+            "location": {"latitude": 39.80, "longitude": -89.64},
+        },
+        other_state,
+    ]
+
+    assert _find_closest_match(restaurant, matches)["id"] == "near"
+    # Without coordinates, the first best-scored match wins
+    restaurant.latitude = None
+    assert _find_closest_match(restaurant, matches)["id"] == "north"
+    assert _find_closest_match(restaurant, [other_state]) is other_state
@@ -14,6 +14,7 @@ from app.restaurants.routes import (
     _create_restaurant_from_form,
     _extract_location_from_query,
     _filter_place_by_criteria,
+    _filter_results_by_radius,
     _get_page_size_from_cookie,
     _handle_import_error,
     _handle_import_success,
@@ -955,3 +956,20 @@ class TestRestaurantsRoutes:
                     result, error = _create_restaurant_from_form(form)
                     assert error is not None
                     assert error[1] == 500
+
+
+def test_filter_results_by_radius_keeps_nearby_results_in_order() -> None:
+    """Test radius filtering drops distant and unlocated results without reordering."""
+    results = [
+        {"name": "Times Square", "latitude": 40.7580, "longitude": -73.9855},  # ~3.3 miles
+        {"name": "No location"},
+        {"name": "Los Angeles", "latitude": 34.0522, "longitude": -118.2437},
+        {"name": "Bad location", "latitude": "n/a", "longitude": -74.0},
+        {"name": "City Hall", "latitude": "40.7128", "longitude": "-74.0060"},
+    ]
+
+    filtered = _filter_results_by_radius(results, (40.7128, -74.0060), 5.0)
+
+    assert [result["name"] for result in filtered] == ["Times Square", "City Hall"]
+    assert _filter_results_by_radius(results, (40.7128, -74.0060), 3.0) == [results[4]]
+    assert _filter_results_by_radius(results, None, 5.0) is results
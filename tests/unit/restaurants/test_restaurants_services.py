@@ -478,6 +478,44 @@ class TestRestaurantServices:
             assert len(results) == 1
             assert results[0]["name"] == "Test Restaurant"
 
+    def test_search_restaurants_by_location_filters_sorts_and_limits(self, app, user) -> None:
+        """Test location search keeps nearby restaurants only, closest first."""
+        user_obj, user_id = user  # Unpack user and user_id
+        with app.app_context():
+            for name, latitude, longitude in [
+                ("Far", 40.80, -74.0060),  # ~9.8 km north
+                ("Near", 40.72, -74.0060),
+                ("Corner", 40.79, -73.90),  # Inside the bounding box but outside the radius
+                ("Other City", 34.0522, -118.2437),
+            ]:
+                db.session.add(
+                    Restaurant(name=name, city=name, user_id=user_id, latitude=latitude, longitude=longitude)
+                )
+            db.session.commit()
+
+            results = search_restaurants_by_location(
+                user_id=user_id, latitude=40.7128, longitude=-74.0060, radius_km=10.0
+            )
+            limited = search_restaurants_by_location(
+                user_id=user_id, latitude=40.7128, longitude=-74.0060, radius_km=10.0, limit=1
+            )
+
+            assert [result["name"] for result in results] == ["Near", "Far"]
+            assert [result["name"] for result in limited] == ["Near"]
+
+    def test_search_restaurants_by_location_across_antimeridian(self, app, user) -> None:
+        """Test location search finds restaurants on the other side of the antimeridian."""
+        user_obj, user_id = user  # Unpack user and user_id
+        with app.app_context():
+            db.session.add(
+                Restaurant(name="Fiji East", city="Taveuni", user_id=user_id, latitude=-16.8, longitude=-179.99)
+            )
+            db.session.commit()
+
+            results = search_restaurants_by_location(user_id=user_id, latitude=-16.8, longitude=179.99, radius_km=5.0)
+
+            assert [result["name"] for result in results] == ["Fiji East"]
+
     def test_recalculate_restaurant_statistics(self, app, user, restaurant) -> None:
         """Test recalculating restaurant statistics."""
         user_obj, user_id = user  # Unpack user and user_id
@@ -489,6 +527,54 @@ class TestRestaurantServices:
             # Verify the function completed successfully
             assert True  # If we get here, no exception was raised
 
+    def test_restaurant_statistics_follow_expense_writes(self, app, user, restaurant) -> None:
+        """Test expense writes refresh the old and new restaurant and leave others untouched."""
+        from datetime import UTC, datetime
+
+        from app.expenses.models import Expense
+        from app.expenses.services import create_expense_for_user, delete_expense_for_user, update_expense_for_user
+
+        user_obj, user_id = user  # Unpack user and user_id
+        restaurant_obj, restaurant_id = restaurant  # Unpack restaurant and restaurant_id
+        with app.app_context():
+            other = Restaurant(name="Other Restaurant", city="Test City", user_id=user_id, visit_count=99)
+            untouched = Restaurant(name="Untouched Restaurant", city="Test City", user_id=user_id, visit_count=7)
+            db.session.add_all([other, untouched])
+            db.session.commit()
+
+            first = create_expense_for_user(
+                user_id,
+                {"amount": Decimal("30.00"), "date": datetime(2025, 1, 1, tzinfo=UTC), "restaurant_id": restaurant_id},
+            )
+            first.party_size = 3
+            db.session.commit()
+            second = create_expense_for_user(
+                user_id,
+                {"amount": Decimal("20.00"), "date": datetime(2025, 2, 1, tzinfo=UTC), "restaurant_id": restaurant_id},
+            )
+            stats = db.session.get(Restaurant, restaurant_id)
+            assert stats.visit_count == 2
+            assert stats.total_spent == 50.0
+            assert stats.last_visit.date().isoformat() == "2025-02-01"
+            assert float(stats.avg_price_per_person) == pytest.approx(50.0 / 3, abs=0.01)
+
+            update_expense_for_user(second, {"restaurant_id": other.id})
+            assert db.session.get(Restaurant, restaurant_id).visit_count == 1
+            assert db.session.get(Restaurant, restaurant_id).total_spent == 30.0
+            assert db.session.get(Restaurant, other.id).visit_count == 1
+            assert db.session.get(Restaurant, other.id).total_spent == 20.0
+
+            delete_expense_for_user(db.session.get(Expense, first.id))
+            emptied = db.session.get(Restaurant, restaurant_id)
+            assert emptied.visit_count == 0
+            assert emptied.total_spent == 0.0
+            assert emptied.last_visit is None
+            assert db.session.get(Restaurant, untouched.id).visit_count == 7
+
+            recalculate_restaurant_statistics(user_id)
+            assert db.session.get(Restaurant, untouched.id).visit_count == 0
+            assert db.session.get(Restaurant, other.id).visit_count == 1
+
     def test_create_restaurant_with_form(self, app, user) -> None:
         """Test creating a restaurant with form data."""
         user_obj, user_id = user  # Unpack user and user_id
@@ -0,0 +1,112 @@
+"""Tests for the process-wide AWS client registry and the services sharing its clients."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from botocore.exceptions import ClientError
+import pytest
+
+from app.services import aws_clients, ocr_service, s3_service
+
+
+@pytest.fixture(autouse=True)
+def boto_session(app, monkeypatch):
+    """Replace the boto3 session so every client built is a distinct Mock."""
+    aws_clients.clear_clients()
+    monkeypatch.setattr(s3_service, "_shared_service", None)
+    monkeypatch.setattr(ocr_service, "_shared_service", None)
+    session = Mock()
+    session.client.side_effect = lambda *args, **kwargs: Mock()
+    with patch("app.services.aws_clients.boto3.session.Session", return_value=session):
+        yield session
+    aws_clients.clear_clients()
+
+
+class TestGetClient:
+    """Test lazy, shared client creation."""
+
+    def test_clients_are_built_once_and_shared(self, boto_session) -> None:
+        client = aws_clients.get_client("textract", "us-east-1")
+
+        assert aws_clients.get_client("textract", "us-east-1") is client
+        assert aws_clients.get_client("textract", "us-west-2") is not client
+        assert aws_clients.get_client("s3", "us-east-1", signature_version="s3v4") is not client
+        assert boto_session.client.call_count == 3
+
+    def test_concurrent_first_use_builds_one_client(self, app, boto_session) -> None:
+        def get(_: int) -> object:
+            with app.app_context():
+                return aws_clients.get_client("s3", "us-east-1")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = set(map(id, executor.map(get, range(32))))
+
+        assert len(clients) == 1
+        boto_session.client.assert_called_once()
+
+    def test_pooling_and_retries_come_from_config(self, app, boto_session) -> None:
+        app.config.update(AWS_MAX_POOL_CONNECTIONS=25, AWS_RETRY_MODE="adaptive", AWS_MAX_ATTEMPTS=5)
+
+        aws_clients.get_client("s3", "us-east-1", signature_version="s3v4")
+
+        config = boto_session.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 25
+        assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+        assert config.signature_version == "s3v4"
+
+    def test_changed_settings_build_a_new_client(self, app) -> None:
+        client = aws_clients.get_client("s3", "us-east-1")
+        app.config["AWS_MAX_ATTEMPTS"] = 10
+
+        assert aws_clients.get_client("s3", "us-east-1") is not client
+
+
+class TestSharedServices:
+    """Test get_s3_service and get_ocr_service reuse their service across requests."""
+
+    def test_s3_service_verifies_bucket_once(self, app, boto_session) -> None:
+        app.config["S3_RECEIPTS_BUCKET"] = "receipts"
+
+        service = s3_service.get_s3_service()
+
+        assert s3_service.get_s3_service() is service
+        service.s3_client.head_bucket.assert_called_once_with(Bucket="receipts")
+
+        app.config["S3_RECEIPTS_PREFIX"] = "other/"
+        assert s3_service.get_s3_service() is not service
+
+    def test_failed_s3_service_is_retried(self, app) -> None:
+        app.config["S3_RECEIPTS_BUCKET"] = "receipts"
+        client = aws_clients.get_client("s3", app.config["S3_REGION"], signature_version="s3v4")
+        client.head_bucket.side_effect = ClientError({"Error": {"Code": "403"}}, "HeadBucket")
+
+        assert s3_service.get_s3_service() is None
+
+        client.head_bucket.side_effect = None
+        assert s3_service.get_s3_service() is not None
+        assert client.head_bucket.call_count == 2
+
+    def test_s3_disabled(self, app) -> None:
+        app.config["S3_RECEIPTS_BUCKET"] = None
+
+        assert s3_service.get_s3_service() is None
+
+    def test_ocr_service_is_shared(self, app, boto_session) -> None:
+        service = ocr_service.get_ocr_service()
+
+        assert ocr_service.get_ocr_service() is service
+        assert boto_session.client.call_count == 1
+
+        app.config["TEXTRACT_REGION"] = "eu-west-1"
+        assert ocr_service.get_ocr_service() is not service
+
+    def test_failed_textract_client_is_retried(self, app, boto_session) -> None:
+        app.config["OCR_ENABLED"] = True
+        boto_session.client.side_effect = RuntimeError("endpoint unreachable")
+
+        assert ocr_service.get_ocr_service().enabled is False
+
+        boto_session.client.side_effect = lambda *args, **kwargs: Mock()
+        service = ocr_service.get_ocr_service()
+        assert service.enabled is True
+        assert ocr_service.get_ocr_service() is service
@@ -0,0 +1,111 @@
+"""Tests for the shared Google Places service and its HTTP session."""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from urllib3.response import HTTPResponse
+
+from app.services import google_places_service, simple_cache
+from app.services.google_places_service import GooglePlacesService, SingleFlight, get_google_places_service
+
+
+@pytest.fixture(autouse=True)
+def fresh_service_state():
+    google_places_service._shared_service = None
+    simple_cache.clear_cache()
+    yield
+    google_places_service._shared_service = None
+    simple_cache.clear_cache()
+
+
+class TestSharedService:
+    """Test the process-wide service instance."""
+
+    def test_instance_is_reused(self, app) -> None:
+        app.config["GOOGLE_MAPS_API_KEY"] = "key-1"
+        with app.app_context():
+            first = get_google_places_service()
+            assert get_google_places_service() is first
+
+            app.config["GOOGLE_MAPS_API_KEY"] = "key-2"
+            second = get_google_places_service()
+
+        assert second is not first
+        assert second.api_key == "key-2"
+
+    def test_session_pools_and_retries(self) -> None:
+        service = GooglePlacesService(api_key="key")
+        adapter = service._session.get_adapter("https://places.googleapis.com/v1/places")
+
+        assert adapter._pool_maxsize == google_places_service.HTTP_POOL_MAXSIZE
+        assert adapter.max_retries.status_forcelist == google_places_service.HTTP_RETRY_STATUS_CODES
+        assert "POST" in adapter.max_retries.allowed_methods
+        assert adapter.max_retries.respect_retry_after_header
+
+    def test_retry_after_wait_is_capped(self) -> None:
+        service = GooglePlacesService(api_key="key")
+        retry = service._session.get_adapter("https://places.googleapis.com").max_retries
+
+        assert retry.get_retry_after(HTTPResponse(status=429, headers={"Retry-After": "120"})) == (
+            google_places_service.HTTP_RETRY_AFTER_MAX_SECONDS
+        )
+        assert retry.get_retry_after(HTTPResponse(status=503, headers={"Retry-After": "1"})) == 1
+        assert retry.get_retry_after(HTTPResponse(status=503)) is None
+
+
+class TestRequests:
+    """Test requests go through the shared session and cache."""
+
+    def test_search_uses_session_and_shared_cache(self) -> None:
+        service = GooglePlacesService(api_key="key")
+        response = Mock(status_code=200, content=b"{}")
+        response.json.return_value = {"places": [{"id": "p1"}]}
+
+        with patch.object(service._session, "post", return_value=response) as mock_post:
+            assert service.search_places_by_text("tacos") == [{"id": "p1"}]
+            # A second service in the process is served from the shared cache
+            assert GooglePlacesService(api_key="key").search_places_by_text("tacos") == [{"id": "p1"}]
+
+        mock_post.assert_called_once()
+        headers = mock_post.call_args.kwargs["headers"]
+        assert headers["X-Goog-Api-Key"] == "key"
+        assert headers["X-Goog-FieldMask"] == google_places_service.FIELD_MASKS["search"]
+        # Request-specific headers do not leak into the shared ones
+        assert "X-Goog-FieldMask" not in service._get_headers()
+
+
+class TestSingleFlight:
+    """Test concurrent identical lookups share one upstream request."""
+
+    def test_concurrent_place_lookups_share_one_request(self) -> None:
+        service = GooglePlacesService(api_key="key")
+        flight = SingleFlight()
+        waiters = 3
+
+        def slow_request(*args, **kwargs):
+            # Hold the request open until every other caller is waiting on it
+            deadline = time.monotonic() + 5
+            while flight.coalesced < waiters and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return {"id": "p1"}
+
+        with (
+            patch.object(google_places_service, "_in_flight", flight),
+            patch.object(service, "_make_request", side_effect=slow_request) as mock_request,
+            ThreadPoolExecutor(max_workers=waiters + 1) as executor,
+        ):
+            results = list(executor.map(lambda _: service.get_place_details("p1"), range(waiters + 1)))
+
+        assert mock_request.call_count == 1
+        assert results == [{"id": "p1"}] * (waiters + 1)
+        assert flight.coalesced == waiters
+
+    def test_failed_call_is_not_remembered(self) -> None:
+        flight = SingleFlight()
+        with pytest.raises(ValueError):
+            flight.do("key", Mock(side_effect=ValueError("boom")))
+
+        # A later call starts a new request
+        assert flight.do("key", lambda: "ok") == "ok"
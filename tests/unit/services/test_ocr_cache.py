@@ -0,0 +1,155 @@
+"""Tests for the content-addressed receipt OCR cache."""
+
+from datetime import datetime
+from decimal import Decimal
+from io import BytesIO
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select, update
+from werkzeug.datastructures import FileStorage
+
+from app.expenses.cli import ocr_cache_command
+from app.extensions import db
+from app.models.api_cache import APICache
+from app.services import ocr_cache
+from app.services.ocr_service import OCRService, ReceiptData
+
+RECEIPT_TEXT = """HAWAIIAN BROS 0033
+3300 W FM 544
+Wylie, TX 75098
+10/05/2025 12:55 PM
+----------------
+Classic - Mixed Plate $12.50
+Chicken Katsu $11.25
+----------------
+Subtotal $23.75
+Tax $1.96
+Total $25.71
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_stats(app):
+    ocr_cache.reset_ocr_cache_stats()
+    yield
+    ocr_cache.reset_ocr_cache_stats()
+
+
+@pytest.fixture
+def service(app) -> OCRService:
+    with patch("app.services.aws_clients.get_client"):
+        return OCRService()
+
+
+def _upload(content: bytes = b"receipt image bytes", filename: str = "receipt.jpg") -> FileStorage:
+    return FileStorage(stream=BytesIO(content), filename=filename)
+
+
+def _age_entry(content: bytes, seconds: float) -> None:
+    db.session.execute(
+        update(APICache)
+        .where(APICache.key == ocr_cache.make_cache_key(ocr_cache.file_digest(content)))
+        .values(updated_at=time.time() - seconds)
+    )
+    db.session.commit()
+
+
+class TestReceiptDataCacheDict:
+    """Test the JSON round trip of ReceiptData."""
+
+    def test_round_trip(self) -> None:
+        data = ReceiptData(
+            amount=Decimal("25.71"),
+            total=Decimal("25.71"),
+            date=datetime(2025, 10, 5),
+            restaurant_name="Hawaiian Bros",
+            items=["Chicken Katsu"],
+            field_sources={"total": "legacy"},
+        )
+
+        assert ReceiptData.from_cache_dict(data.to_cache_dict()) == data
+
+    def test_ignores_unknown_keys(self) -> None:
+        assert ReceiptData.from_cache_dict({"total": "1.00", "retired_field": 1}).total == Decimal("1.00")
+
+
+class TestOCRServiceCache:
+    """Test OCRService.extract_receipt_data reads through the cache."""
+
+    def test_repeat_upload_skips_textract(self, service, session) -> None:
+        with patch.object(service, "_extract_text_with_textract", return_value=RECEIPT_TEXT) as textract:
+            first = service.extract_receipt_data(_upload())
+            second = service.extract_receipt_data(_upload())
+
+        textract.assert_called_once()
+        assert second == first
+        assert second.total == Decimal("25.71")
+        assert second.raw_text == RECEIPT_TEXT
+        stats = ocr_cache.get_ocr_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+
+    def test_different_files_are_cached_separately(self, service, session) -> None:
+        with patch.object(service, "_extract_text_with_textract", return_value=RECEIPT_TEXT) as textract:
+            service.extract_receipt_data(_upload(b"one"))
+            service.extract_receipt_data(_upload(b"two"))
+
+        assert textract.call_count == 2
+        assert session.scalar(select(func.count()).select_from(APICache)) == 2
+
+    def test_form_hints_apply_to_cached_results(self, service, session) -> None:
+        with patch.object(service, "_extract_text_with_textract", return_value=RECEIPT_TEXT):
+            service.extract_receipt_data(_upload())
+            hinted = service.extract_receipt_data(_upload(), form_hints={"amount": "23.75"})
+            plain = service.extract_receipt_data(_upload())
+
+        assert plain.total == Decimal("25.71")
+        assert hinted.amount == hinted.total
+
+    def test_parser_upgrade_reparses_without_textract(self, service, session) -> None:
+        with patch.object(service, "_extract_text_with_textract", return_value=RECEIPT_TEXT):
+            service.extract_receipt_data(_upload())
+
+        with (
+            patch("app.services.ocr_service.PARSER_VERSION", 999),
+            patch.object(service, "_extract_text_with_textract", side_effect=AssertionError) as textract,
+        ):
+            data = service.extract_receipt_data(_upload())
+            service.extract_receipt_data(_upload())
+
+        textract.assert_not_called()
+        assert data.restaurant_name == "Hawaiian Bros"
+        assert ocr_cache.load(ocr_cache.file_digest(b"receipt image bytes")).parser_version == 999
+        assert ocr_cache.get_ocr_cache_stats()["reparses"] == 1
+
+    def test_failed_ocr_is_not_cached(self, service, session) -> None:
+        with patch.object(service, "_extract_text_with_textract", side_effect=RuntimeError("throttled")):
+            with pytest.raises(RuntimeError):
+                service.extract_receipt_data(_upload())
+
+        assert session.scalar(select(func.count()).select_from(APICache)) == 0
+
+    def test_expired_entries_are_refetched_and_purged(self, service, session) -> None:
+        with patch.object(service, "_extract_text_with_textract", return_value=RECEIPT_TEXT) as textract:
+            service.extract_receipt_data(_upload(b"old"))
+            service.extract_receipt_data(_upload(b"new"))
+            _age_entry(b"old", ocr_cache.OCR_CACHE_MAX_AGE_SECONDS + 10)
+            _age_entry(b"new", ocr_cache.OCR_CACHE_MAX_AGE_SECONDS + 10)
+            service.extract_receipt_data(_upload(b"old"))
+
+        assert textract.call_count == 3
+        assert ocr_cache.clear_expired_ocr_cache() == 1
+        assert session.scalar(select(func.count()).select_from(APICache)) == 1
+
+
+def test_ocr_cache_command_reports_hit_ratio(app, session) -> None:
+    ocr_cache.store(ocr_cache.file_digest(b"x"), RECEIPT_TEXT, 1, {})
+    ocr_cache.load(ocr_cache.file_digest(b"x"))
+    ocr_cache.load(ocr_cache.file_digest(b"y"))
+
+    result = app.test_cli_runner().invoke(ocr_cache_command, ["--clear-expired"])
+
+    assert result.exit_code == 0
+    assert "Deleted 0 expired OCR cache entries" in result.output
+    assert "hit ratio 50.0%" in result.output
@@ -0,0 +1,173 @@
+"""Tests for asynchronous receipt OCR jobs and their API endpoints."""
+
+from io import BytesIO
+import threading
+from unittest.mock import patch
+
+from flask import current_app
+import pytest
+
+from app.services import ocr_jobs
+from app.services.ocr_jobs import (
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+    STATUS_SUCCEEDED,
+    InlineJobQueue,
+    OCRJobRequest,
+    ThreadPoolJobQueue,
+)
+from app.services.ocr_service import STAGE_EXTRACTING_TEXT, STAGE_PARSING, OCRService
+
+RECEIPT_TEXT = """HAWAIIAN BROS 0033
+3300 W FM 544
+Wylie, TX 75098
+10/05/2025 12:55 PM
+----------------
+Classic - Mixed Plate $12.50
+Chicken Katsu $11.25
+----------------
+Subtotal $23.75
+Tax $1.96
+Total $25.71
+"""
+
+
+@pytest.fixture(autouse=True)
+def stub_textract(app):
+    """Build OCR services without AWS and answer Textract calls with RECEIPT_TEXT."""
+    with (
+        patch("app.services.aws_clients.get_client"),
+        patch.object(OCRService, "_extract_text_with_textract", return_value=RECEIPT_TEXT) as textract,
+    ):
+        yield textract
+    ocr_jobs.set_job_queue(None)
+
+
+class TestOCRJobs:
+    """Test submitting and running jobs."""
+
+    def test_inline_job_runs_to_completion(self, session) -> None:
+        ocr_jobs.set_job_queue(InlineJobQueue())
+
+        job_id = ocr_jobs.submit_ocr_job(1, "receipt.jpg", b"image", form_hints={"amount": "25.71"}, restaurant_id=7)
+
+        job = ocr_jobs.get_ocr_job(job_id)
+        assert (job["status"], job["progress"], job["error"]) == (STATUS_SUCCEEDED, 100, None)
+        assert job["receipt"]["total"] == "25.71"
+        assert (job["user_id"], job["form_hints"], job["restaurant_id"]) == (1, {"amount": "25.71"}, 7)
+
+    def test_progress_is_recorded_per_stage(self, session) -> None:
+        ocr_jobs.set_job_queue(InlineJobQueue())
+        saved = []
+        save_job = ocr_jobs._save_job
+
+        def record(job_id: str, state: dict) -> None:
+            saved.append((state["status"], state["stage"], state["progress"]))
+            save_job(job_id, state)
+
+        with patch("app.services.ocr_jobs._save_job", side_effect=record):
+            ocr_jobs.submit_ocr_job(1, "receipt.jpg", b"image")
+
+        assert saved == [
+            (STATUS_QUEUED, None, 0),
+            (STATUS_RUNNING, None, 0),
+            (STATUS_RUNNING, STAGE_EXTRACTING_TEXT, ocr_jobs.STAGE_PROGRESS[STAGE_EXTRACTING_TEXT]),
+            (STATUS_RUNNING, STAGE_PARSING, ocr_jobs.STAGE_PROGRESS[STAGE_PARSING]),
+            (STATUS_SUCCEEDED, None, 100),
+        ]
+
+    def test_failed_ocr_is_recorded(self, session, stub_textract) -> None:
+        ocr_jobs.set_job_queue(InlineJobQueue())
+        stub_textract.side_effect = RuntimeError("Textract throttled")
+
+        job = ocr_jobs.get_ocr_job(ocr_jobs.submit_ocr_job(1, "receipt.jpg", b"image"))
+
+        assert (job["status"], job["progress"], job["receipt"]) == (STATUS_FAILED, 100, None)
+        assert "Textract throttled" in job["error"]
+
+    def test_unknown_job(self, session) -> None:
+        assert ocr_jobs.get_ocr_job("missing") is None
+
+    def test_thread_pool_runs_jobs_in_app_context(self, app) -> None:
+        ran = threading.Event()
+        contexts = []
+
+        def run(job: OCRJobRequest) -> None:
+            contexts.append((current_app.name, threading.current_thread().name))
+            ran.set()
+
+        queue = ThreadPoolJobQueue(max_workers=1)
+        with patch("app.services.ocr_jobs.run_ocr_job", side_effect=run):
+            queue.submit(OCRJobRequest("job", "receipt.jpg", b"image"))
+            assert ran.wait(5)
+
+        assert contexts[0][0] == app.name
+        assert contexts[0][1].startswith("ocr-job")
+
+    def test_queue_is_built_from_config(self, app, monkeypatch) -> None:
+        monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+        app.config["OCR_JOB_QUEUE"] = "threads"
+        assert isinstance(ocr_jobs.get_job_queue(), ThreadPoolJobQueue)
+
+        ocr_jobs.set_job_queue(None)
+        app.config["OCR_JOB_QUEUE"] = "sqs"
+        with pytest.raises(ValueError):
+            ocr_jobs.get_job_queue()
+
+    def test_no_thread_pool_on_lambda(self, app, monkeypatch) -> None:
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "meal-expense-tracker")
+        app.config["OCR_JOB_QUEUE"] = "threads"
+        assert ocr_jobs.get_job_queue() is None
+        assert not ocr_jobs.async_ocr_available()
+        with pytest.raises(RuntimeError):
+            ocr_jobs.submit_ocr_job(1, "receipt.jpg", b"image")
+
+        ocr_jobs.set_job_queue(InlineJobQueue())
+        assert ocr_jobs.async_ocr_available()
+
+
+class TestOCRJobEndpoints:
+    """Test the async mode of /receipts/ocr and the job status endpoint."""
+
+    def _upload(self, client, **form: str):
+        return client.post(
+            "/api/v1/receipts/ocr",
+            data={"receipt_file": (BytesIO(b"image"), "receipt.jpg"), "async": "true", **form},
+            content_type="multipart/form-data",
+        )
+
+    def test_async_upload_returns_job_and_result_is_polled(self, client, auth, test_user) -> None:
+        auth.login("testuser_1", "testpass")
+
+        response = self._upload(client, form_amount="25.71")
+
+        assert response.status_code == 202
+        queued = response.get_json()["data"]
+        assert queued["status"] == STATUS_QUEUED
+
+        response = client.get(queued["status_url"])
+
+        assert response.status_code == 200
+        job = response.get_json()["data"]
+        assert (job["job_id"], job["status"], job["progress"]) == (queued["job_id"], STATUS_SUCCEEDED, 100)
+        assert job["result"]["total"] == "25.71"
+        assert job["result"]["restaurant_name"] == "Hawaiian Bros"
+
+    def test_async_upload_runs_synchronously_without_a_queue(self, app, client, auth, test_user) -> None:
+        app.config["OCR_JOB_QUEUE"] = "sync"
+        auth.login("testuser_1", "testpass")
+
+        response = self._upload(client)
+
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert "job_id" not in data
+        assert data["total"] == "25.71"
+
+    def test_jobs_are_private_to_their_owner(self, client, auth, test_user) -> None:
+        job_id = ocr_jobs.submit_ocr_job(test_user.id + 1, "receipt.jpg", b"image")
+        auth.login("testuser_1", "testpass")
+
+        assert client.get(f"/api/v1/receipts/ocr/jobs/{job_id}").status_code == 404
+        assert client.get("/api/v1/receipts/ocr/jobs/missing").status_code == 404
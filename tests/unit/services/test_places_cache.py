@@ -0,0 +1,144 @@
+"""Tests for the database-backed Google Places cache."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app.extensions import db
+from app.models.api_cache import APICache
+from app.restaurants.cli import places_cache_command
+from app.services import places_cache, simple_cache
+from app.services.google_places_service import GooglePlacesService
+from app.services.simple_cache import PLACE_NAMESPACE, SEARCH_NAMESPACE
+
+
+@pytest.fixture(autouse=True)
+def reset_caches(app):
+    simple_cache.clear_cache()
+    places_cache.reset_places_cache_stats()
+    yield
+    simple_cache.clear_cache()
+    places_cache.reset_places_cache_stats()
+
+
+def _age_entry(namespace: str, raw_key: str, seconds: float) -> None:
+    db.session.execute(
+        update(APICache)
+        .where(APICache.key == places_cache.make_cache_key(namespace, raw_key))
+        .values(updated_at=time.time() - seconds)
+    )
+    db.session.commit()
+
+
+class TestFetchThrough:
+    """Test the L2 read-through and stale-while-revalidate behaviour."""
+
+    def test_stores_and_serves_from_database(self, session) -> None:
+        fetch = Mock(return_value={"id": "p1"})
+
+        assert places_cache.fetch_through(PLACE_NAMESPACE, "p1|mask", fetch) == {"id": "p1"}
+        assert places_cache.fetch_through(PLACE_NAMESPACE, "p1|mask", fetch) == {"id": "p1"}
+
+        fetch.assert_called_once()
+        stats = places_cache.get_places_cache_stats()["l2"]
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+        assert stats["hit_ratio"] == 0.5
+
+    def test_empty_results_are_not_stored(self, session) -> None:
+        places_cache.fetch_through(SEARCH_NAMESPACE, "nothing", Mock(return_value=[]))
+        assert session.scalar(select(func.count()).select_from(APICache)) == 0
+
+    def test_stale_entry_is_refreshed_by_one_caller(self, session) -> None:
+        places_cache.fetch_through(SEARCH_NAMESPACE, "tacos", Mock(return_value=["old"]))
+        _age_entry(SEARCH_NAMESPACE, "tacos", places_cache.L2_FRESH_SECONDS[SEARCH_NAMESPACE] + 10)
+
+        concurrent_results = []
+
+        def refresh() -> list[str]:
+            # A caller arriving while the refresh is in flight gets the stale copy without fetching
+            concurrent_results.append(
+                places_cache.fetch_through(SEARCH_NAMESPACE, "tacos", Mock(side_effect=AssertionError))
+            )
+            return ["new"]
+
+        assert places_cache.fetch_through(SEARCH_NAMESPACE, "tacos", refresh) == ["new"]
+        assert concurrent_results == [["old"]]
+        assert places_cache.fetch_through(SEARCH_NAMESPACE, "tacos", Mock(side_effect=AssertionError)) == ["new"]
+
+    def test_failed_refresh_serves_stale_entry(self, session) -> None:
+        places_cache.fetch_through(PLACE_NAMESPACE, "p1|mask", Mock(return_value={"id": "p1"}))
+        _age_entry(PLACE_NAMESPACE, "p1|mask", places_cache.L2_FRESH_SECONDS[PLACE_NAMESPACE] + 10)
+
+        assert places_cache.fetch_through(PLACE_NAMESPACE, "p1|mask", Mock(return_value={})) == {"id": "p1"}
+
+    def test_entries_past_max_age_are_refetched_and_purged(self, session) -> None:
+        places_cache.fetch_through(PLACE_NAMESPACE, "p1|mask", Mock(return_value={"id": "p1"}))
+        places_cache.fetch_through(PLACE_NAMESPACE, "p2|mask", Mock(return_value={"id": "p2"}))
+        _age_entry(PLACE_NAMESPACE, "p1|mask", places_cache.L2_MAX_AGE_SECONDS[PLACE_NAMESPACE] + 10)
+
+        assert places_cache.fetch_through(PLACE_NAMESPACE, "p1|mask", Mock(return_value={})) == {}
+        assert places_cache.clear_expired_places_cache() == 1
+        assert session.scalar(select(func.count()).select_from(APICache)) == 1
+
+
+class TestGooglePlacesServiceL2:
+    """Test the service reads through the database cache."""
+
+    def test_place_details_survive_a_cold_process_cache(self, session) -> None:
+        service = GooglePlacesService(api_key="key")
+        with patch.object(service, "_make_request", return_value={"id": "p1"}) as mock_request:
+            service.get_place_details("p1")
+            service.get_place_details("p1", field_mask="id")
+            simple_cache.clear_cache()
+            service.get_place_details("p1")
+
+        # One request per field mask; the cleared in-memory cache is refilled from the database
+        assert mock_request.call_count == 2
+        assert session.scalar(select(func.count()).select_from(APICache)) == 2
+
+    def test_error_results_are_not_cached(self, session) -> None:
+        service = GooglePlacesService(api_key="key")
+        with patch.object(service, "_make_request", return_value={"error": "API_KEY_REFERRER_RESTRICTED"}):
+            service.get_place_details("p1")
+            assert service.search_places_by_text("tacos") == []
+
+        assert session.scalar(select(func.count()).select_from(APICache)) == 0
+
+
+class TestAPICacheClearExpired:
+    """Test the batched purge of the api_cache table."""
+
+    def test_clear_expired_in_batches(self, session) -> None:
+        old = time.time() - 1000
+        session.add_all(APICache(key=f"k{index}", data="{}", created_at=old, updated_at=old) for index in range(5))
+        session.add(APICache.create_cache_entry("fresh", "{}"))
+        session.commit()
+
+        assert APICache.clear_expired(100, batch_size=2) == 5
+        assert session.scalars(select(APICache.key)).all() == ["fresh"]
+
+
+class TestAPICacheUpsert:
+    """Test the shared insert-or-replace of api_cache entries."""
+
+    def test_upsert_inserts_then_replaces(self, session) -> None:
+        with patch("time.time", return_value=100.0):
+            APICache.upsert("k", '{"v": 1}')
+        with patch("time.time", return_value=200.0):
+            APICache.upsert("k", '{"v": 2}')
+
+        rows = session.execute(select(APICache.key, APICache.data, APICache.created_at, APICache.updated_at)).all()
+        assert [tuple(row) for row in rows] == [("k", '{"v": 2}', 100.0, 200.0)]
+
+
+def test_places_cache_command_reports_hit_ratios(app, session) -> None:
+    places_cache.fetch_through(PLACE_NAMESPACE, "p1|mask", Mock(return_value={"id": "p1"}))
+    places_cache.fetch_through(PLACE_NAMESPACE, "p1|mask", Mock(return_value={"id": "p1"}))
+
+    result = app.test_cli_runner().invoke(places_cache_command, ["--clear-expired"])
+
+    assert result.exit_code == 0
+    assert "Deleted 0 expired Places cache entries" in result.output
+    assert "L2: hit ratio 50.0%" in result.output
@@ -0,0 +1,209 @@
+"""Tests for the receipt parser's line classifier and the extractors built on it."""
+
+from decimal import Decimal
+
+import pytest
+
+from app.services.ocr_service import ReceiptData
+from app.services.receipt_parser import (
+    FIELD_SOURCE_BANK_STATEMENT,
+    FIELD_SOURCE_LEGACY,
+    FIELD_SOURCE_SECTION,
+    ReceiptParser,
+    classify_line,
+    restaurant_name_candidate,
+)
+
+PRINTED_RECEIPT = """HAWAIIAN BROS 0033
+3300 W FM 544
+Wylie, TX 75098
+(972) 437-8440
+www.hawaiianbros.com
+10/05/2025 12:55 PM
+Server: Madison P.
+Check #32 Morgan
+Table 12
+----------------
+Classic - Mixed Plate $12.50
+Chicken Katsu $11.25
+----------------
+Subtotal $23.75
+Tax $1.96
+Total $25.71
+VISA ************1234
+Thank you for dining with us!
+"""
+
+
+class TestClassifyLine:
+    """Test the per-line classification shared by the extractors."""
+
+    @pytest.mark.parametrize(
+        ("line", "flag"),
+        [
+            ("$12.50", "is_price_only"),
+            ("1,200.00", "is_price_only"),
+            ("$12.50", "is_amount_only"),
+            ("10/05/2025", "is_date"),
+            ("12:55 pm", "is_time"),
+            ("10/05/2025 12:55 PM", "has_date_time"),
+            ("(972) 437-8440", "has_phone_number"),
+            ("972.437.8440", "has_phone_number"),
+            ("----------------", "is_separator"),
+            ("— ISLAND GRILL —", "is_separator"),
+            ("Classic - Mixed Plate", "starts_like_item_name"),
+            ("Sub Total", "has_totals_keyword"),
+            ("VISA ************1234", "has_payment_keyword"),
+            ("Thank you for dining with us!", "has_footer_keyword"),
+            ("Subject: Receipt from Joe's", "has_email_header_marker"),
+        ],
+    )
+    def test_flags(self, line: str, flag: str) -> None:
+        assert getattr(classify_line(line), flag) is True
+
+    def test_plain_text_has_no_shape_flags(self) -> None:
+        features = classify_line("  Chicken Katsu  ")
+
+        assert features.text == "Chicken Katsu"
+        assert features.words == frozenset({"chicken", "katsu"})
+        assert not features.is_price_only
+        assert not features.is_separator
+        assert not features.has_phone_number
+        assert features.website is None
+
+    def test_website_is_first_match_as_written(self) -> None:
+        assert classify_line("Visit WWW.IslandGrill.com today").website == "WWW.IslandGrill.com"
+        assert classify_line("https://order.joespizza.com/menu").website == "https://order.joespizza.com"
+
+    def test_memoized(self) -> None:
+        assert classify_line("Tax $1.96") is classify_line("Tax $1.96")
+
+
+class TestRestaurantNameCandidate:
+    """Test cleaning header lines into restaurant name candidates."""
+
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            ("HAWAIIAN BROS 0033", ("HAWAIIAN BROS", "0033", True)),
+            ("Island Grill #41", ("Island Grill", "#41", True)),
+            ("Joe's Pizza - #12", ("Joe's Pizza", "#12", True)),
+            ("Luigi's Trattoria", ("Luigi's Trattoria", None, False)),
+            ("Blue Door Kitchen 2024", ("Blue Door Kitchen 2024", None, True)),
+        ],
+    )
+    def test_candidates(self, line: str, expected: tuple[str, str | None, bool]) -> None:
+        assert restaurant_name_candidate(line) == expected
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "12:55 PM",
+            "10/05/2025",
+            "$25.71",
+            "3300 W FM 544",
+            "1200 Main Street",
+            "Wylie, TX 75098",
+            "From: receipts@toasttab.com",
+            "Served by Madison",
+            "Total $25.71",
+            "ab",
+        ],
+    )
+    def test_rejects_non_names(self, line: str) -> None:
+        assert restaurant_name_candidate(line) is None
+
+
+class TestReceiptParser:
+    """Test parsing whole receipts through the classified lines."""
+
+    def test_parses_printed_receipt(self) -> None:
+        data = ReceiptParser().parse_receipt_data(PRINTED_RECEIPT, ReceiptData())
+
+        assert data.restaurant_name == "Hawaiian Bros"
+        assert data.restaurant_location_number == "0033"
+        assert data.restaurant_phone == "(972) 437-8440"
+        assert data.restaurant_website == "https://www.hawaiianbros.com"
+        assert data.server_name == "Madison P."
+        assert data.table_number == "12"
+        assert data.total == Decimal("25.71")
+        prices = {item["name"]: item["price"] for item in data.items}
+        assert prices["Classic - Mixed Plate"] == Decimal("12.50")
+        assert prices["Chicken Katsu"] == Decimal("11.25")
+
+    def test_prefers_name_with_restaurant_indicator(self) -> None:
+        parser = ReceiptParser()
+
+        assert parser._extract_restaurant_name(["Welcome", "THE COTTON PATCH CAFE"]) == ("THE Cotton Patch Cafe", None)
+        assert parser._extract_restaurant_name(["Luigi's Trattoria", "Table 4"]) == ("Luigi's Trattoria", None)
+        assert parser._extract_restaurant_name(["10/05/2025", "$12.00"]) == (None, None)
+
+    def test_address_stops_at_menu_items(self) -> None:
+        lines = PRINTED_RECEIPT.splitlines()[:4] + ["2x Chicken Katsu $22.50", "1200 Main Street"]
+
+        assert ReceiptParser()._extract_restaurant_address(lines) == "3300 W FM 544 Wylie, TX 75098"
+
+    def test_separator_lines(self) -> None:
+        parser = ReceiptParser()
+
+        assert parser._is_separator_line("===========")
+        assert not parser._is_separator_line("Chicken Katsu $11.25")
+
+
+class TestFieldSources:
+    """Test the per-field provenance and the field-scoped legacy fallback."""
+
+    def test_records_which_path_filled_each_field(self) -> None:
+        data = ReceiptParser().parse_receipt_data(PRINTED_RECEIPT, ReceiptData())
+
+        assert data.field_sources["restaurant_name"] == FIELD_SOURCE_SECTION
+        assert data.field_sources["items"] == FIELD_SOURCE_SECTION
+        assert data.field_sources["total"] == FIELD_SOURCE_LEGACY
+        assert "tip" not in data.field_sources
+
+    def test_bank_statement_fields(self) -> None:
+        statement = "\n".join(
+            [
+                "Chase Bank Statement",
+                "Account Summary",
+                "Transaction Date Description Amount",
+                "10/02/2025 HAWAIIAN BROS WYLIE TX $25.71",
+                "10/03/2025 SHELL OIL 1234 $40.00",
+                "Beginning Balance $1,000.00",
+                "Ending Balance $934.29",
+            ]
+        )
+
+        data = ReceiptParser().parse_receipt_data(statement, ReceiptData())
+
+        assert data.field_sources
+        assert set(data.field_sources.values()) == {FIELD_SOURCE_BANK_STATEMENT}
+
+    def test_legacy_skips_header_scans_already_done(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        parser = ReceiptParser()
+        lines = PRINTED_RECEIPT.splitlines()
+
+        def fail(*args: object) -> None:
+            raise AssertionError("header extractor re-run over the same lines")
+
+        for name in (
+            "_extract_restaurant_name",
+            "_extract_restaurant_address",
+            "_extract_restaurant_phone",
+            "_extract_restaurant_phone_from_text",
+            "_extract_restaurant_website",
+        ):
+            monkeypatch.setattr(parser, name, fail)
+
+        data = parser._parse_receipt_data_legacy(PRINTED_RECEIPT, lines, ReceiptData(), {"header": lines})
+
+        assert data.restaurant_name is None
+        assert data.total == Decimal("25.71")
+
+    def test_legacy_scans_header_without_sections(self) -> None:
+        lines = PRINTED_RECEIPT.splitlines()
+
+        data = ReceiptParser()._parse_receipt_data_legacy(PRINTED_RECEIPT, lines, ReceiptData())
+
+        assert data.restaurant_name == "Hawaiian Bros"
+        assert data.restaurant_phone == "(972) 437-8440"
@@ -0,0 +1,75 @@
+"""Tests for the bounded Google API response cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services import simple_cache
+from app.services.simple_cache import BoundedTTLCache
+
+
+@pytest.fixture(autouse=True)
+def empty_shared_cache():
+    simple_cache.clear_cache()
+    yield
+    simple_cache.clear_cache()
+
+
+class TestBoundedTTLCache:
+    """Test eviction, expiry and statistics."""
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        cache = BoundedTTLCache(max_entries=2)
+        cache.set("search:a", [1])
+        cache.set("search:b", [2])
+        assert cache.get("search:a") == [1]
+
+        cache.set("search:c", [3])
+
+        assert cache.get("search:b") is None
+        assert cache.get("search:a") == [1]
+        assert cache.stats()["evictions"] == 1
+
+    def test_respects_byte_budget(self) -> None:
+        cache = BoundedTTLCache(max_bytes=30)
+        cache.set("place:a", "x" * 15)
+        cache.set("place:b", "y" * 15)
+
+        assert cache.stats()["total_entries"] == 1
+        assert cache.get("place:b") == "y" * 15
+        # A value larger than the whole budget is not cached
+        assert cache.set("place:c", "z" * 100) is False
+        assert cache.stats()["total_bytes"] <= 30
+
+    def test_namespaces_have_their_own_ttl(self) -> None:
+        cache = BoundedTTLCache(ttls={"search": 10, "place": 100})
+        with patch("app.services.simple_cache.time.time", return_value=1000.0):
+            cache.set("search:q", ["result"])
+            cache.set("place:p", {"id": "p"})
+
+        with patch("app.services.simple_cache.time.time", return_value=1050.0):
+            assert cache.get("search:q") is None
+            assert cache.get("place:p") == {"id": "p"}
+
+        with patch("app.services.simple_cache.time.time", return_value=1200.0):
+            assert cache.clear_expired() == 1
+
+        stats = cache.stats()
+        assert stats["total_entries"] == 0
+        assert stats["expirations"] == 2
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+class TestModuleApi:
+    """Test the module functions used by GooglePlacesService."""
+
+    def test_search_and_place_round_trip(self) -> None:
+        assert simple_cache.get_search_results("tacos", (1.0, 2.0), 500.0) is None
+        simple_cache.cache_search_results("tacos", (1.0, 2.0), 500.0, [{"id": "p1"}])
+        simple_cache.cache_place_details("p1", {"id": "p1"})
+
+        assert simple_cache.get_search_results("tacos", (1.0, 2.0), 500.0) == [{"id": "p1"}]
+        assert simple_cache.get_place_details("p1") == {"id": "p1"}
+        stats = simple_cache.get_cache_stats()
+        assert stats["entries_by_namespace"] == {"search": 1, "place": 1}
+        assert (stats["hits"], stats["misses"]) == (2, 1)
@@ -0,0 +1,59 @@
+"""Tests for the streaming export helpers."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from app.utils import export_utils
+from app.utils.export_utils import iter_csv, iter_json_array, iter_ndjson, peek_rows
+
+ROWS = [{"name": f"Row {index}", "amount": float(index)} for index in range(5)]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(export_utils, "EXPORT_CHUNK_ROWS", 2)
+
+
+class TestPeekRows:
+    """Tests for peek_rows."""
+
+    def test_empty_rows(self) -> None:
+        assert peek_rows(iter([])) is None
+
+    def test_keeps_first_row(self) -> None:
+        rows = peek_rows(row for row in ROWS)
+        assert rows is not None
+        assert list(rows) == ROWS
+
+
+class TestStreamedFormats:
+    """Tests for the chunked CSV, JSON and NDJSON writers."""
+
+    def test_csv_matches_buffered_writer(self) -> None:
+        chunks = list(iter_csv(iter(ROWS)))
+
+        expected = io.StringIO()
+        writer = csv.DictWriter(expected, fieldnames=list(ROWS[0].keys()), quoting=csv.QUOTE_NONNUMERIC)
+        writer.writeheader()
+        writer.writerows(ROWS)
+        # Three chunks of at most two rows, the first led by the header
+        assert len(chunks) == 3
+        assert "".join(chunks) == expected.getvalue()
+
+    def test_csv_fieldnames_ignore_extra_keys(self) -> None:
+        text = "".join(iter_csv(iter(ROWS[:1]), ["name"]))
+        assert text.splitlines() == ['"name"', '"Row 0"']
+
+    def test_csv_without_rows_writes_header(self) -> None:
+        assert "".join(iter_csv(iter([]), ["name"])).strip() == '"name"'
+
+    def test_json_array(self) -> None:
+        assert json.loads("".join(iter_json_array(iter(ROWS)))) == ROWS
+        assert json.loads("".join(iter_json_array(iter([])))) == []
+
+    def test_ndjson(self) -> None:
+        lines = "".join(iter_ndjson(iter(ROWS))).splitlines()
+        assert [json.loads(line) for line in lines] == ROWS
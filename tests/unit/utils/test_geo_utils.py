@@ -0,0 +1,106 @@
+"""Tests for geographic utilities."""
+
+import random
+
+import pytest
+
+from app.utils.geo_utils import (
+    bounding_box,
+    calculate_distance_km,
+    calculate_distance_matrix_km,
+    calculate_distances_km,
+    nearest_indexes,
+    nearest_neighbors,
+)
+
+NEW_YORK = (40.7128, -74.0060)
+
+
+def _random_points(count: int, seed: int = 7) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    return [(rng.uniform(-80, 80), rng.uniform(-180, 180)) for _ in range(count)]
+
+
+class TestBatchDistances:
+    """Test the batch Haversine functions agree with the scalar one."""
+
+    def test_distances_match_single_distance(self) -> None:
+        points = [NEW_YORK, (40.7580, -73.9855), (34.0522, -118.2437), (-33.8688, 151.2093)]
+
+        distances = calculate_distances_km(*NEW_YORK, points)
+
+        assert isinstance(distances, list)
+        assert distances == pytest.approx([calculate_distance_km(*NEW_YORK, lat, lon) for lat, lon in points])
+        assert distances[0] == 0.0
+
+    def test_empty_batch(self) -> None:
+        assert calculate_distances_km(0.0, 0.0, []) == []
+        assert calculate_distance_matrix_km([NEW_YORK], []) == [[]]
+        assert nearest_indexes([], 3) == []
+
+    def test_distance_matrix(self) -> None:
+        origins = _random_points(3, seed=1)
+        points = _random_points(5, seed=2)
+
+        matrix = calculate_distance_matrix_km(origins, points)
+
+        assert len(matrix) == 3
+        for origin, row in zip(origins, matrix, strict=True):
+            assert row == pytest.approx(calculate_distances_km(*origin, points))
+
+
+class TestNearest:
+    """Test top-k selection."""
+
+    def test_nearest_indexes_closest_first(self) -> None:
+        distances = [5.0, 1.0, 3.0, 1.0, 9.0]
+
+        assert nearest_indexes(distances, 3) == [1, 3, 2]
+        assert nearest_indexes(distances, 10, max_distance=3.0) == [1, 3, 2]
+        assert nearest_indexes(distances, 0) == []
+
+    def test_nearest_indexes_matches_full_sort(self) -> None:
+        distances = calculate_distances_km(*NEW_YORK, _random_points(200))
+
+        expected = sorted(range(len(distances)), key=distances.__getitem__)
+        assert nearest_indexes(distances, 10) == expected[:10]
+        assert nearest_indexes(distances, 500, max_distance=5000.0) == [
+            index for index in expected if distances[index] <= 5000.0
+        ]
+
+    def test_nearest_neighbors(self) -> None:
+        points = [(0.0, 0.0), (10.0, 10.0), (0.0, 1.0)]
+
+        assert nearest_neighbors([(0.0, 0.9), (9.0, 9.0)], points, k=2) == [[2, 0], [1, 2]]
+
+
+class TestBoundingBox:
+    """Test the search box contains the whole search circle."""
+
+    @staticmethod
+    def _contains(box, latitude: float, longitude: float) -> bool:
+        min_lat, max_lat, lon_ranges = box
+        return min_lat <= latitude <= max_lat and any(low <= longitude <= high for low, high in lon_ranges)
+
+    def test_contains_points_at_radius(self) -> None:
+        box = bounding_box(*NEW_YORK, 10.0)
+
+        # Points just inside the radius due north, east and west
+        assert self._contains(box, NEW_YORK[0] + 0.0898, NEW_YORK[1])
+        assert self._contains(box, NEW_YORK[0], NEW_YORK[1] + 0.1185)
+        assert self._contains(box, NEW_YORK[0], NEW_YORK[1] - 0.1185)
+        assert not self._contains(box, NEW_YORK[0] + 0.1, NEW_YORK[1])
+        assert len(box[2]) == 1
+
+    def test_splits_across_antimeridian(self) -> None:
+        box = bounding_box(0.0, 179.99, 10.0)
+
+        assert len(box[2]) == 2
+        assert self._contains(box, 0.0, -179.99)
+        assert calculate_distance_km(0.0, 179.99, 0.0, -179.99) < 10.0
+
+    def test_spans_all_longitudes_near_pole(self) -> None:
+        min_lat, max_lat, lon_ranges = bounding_box(89.99, 0.0, 10.0)
+
+        assert max_lat == 90.0
+        assert lon_ranges == [(-180.0, 180.0)]